@@ -15,6 +15,7 @@ from rich.console import Console
 
 from ptc_cli.api.constants import DEFAULT_BASE_URL, DEFAULT_TIMEOUT
 from ptc_cli.api.models import Message
+from ptc_cli.api.sse import SSEFramer
 
 console = Console()
 
@@ -116,13 +117,9 @@ class SSEStreamClient:
         Yields:
             Tuples of (event_type, event_data)
         """
-        buffer = ""
-        async for chunk in response.aiter_text():
-            buffer += chunk
-
-            while "\n\n" in buffer:
-                event_text, buffer = buffer.split("\n\n", 1)
-
+        framer = SSEFramer()
+        async for chunk in response.aiter_bytes():
+            for event_text in framer.feed(chunk):
                 if parsed := self._parse_sse_event(event_text):
                     event_type, event_data = parsed
 
@@ -0,0 +1,54 @@
+"""Incremental SSE framing for ptc-cli.
+
+Splits a byte stream into SSE event blocks (separated by a blank line).
+Bytes are only scanned once: each search resumes where the previous one
+stopped, and the consumed prefix is dropped in bulk rather than copying
+the remaining buffer for every event.
+"""
+
+_SEPARATOR = b"\n\n"
+
+# Drop consumed bytes once they exceed this many (and half the buffer)
+_COMPACT_THRESHOLD = 64 * 1024
+
+
+class SSEFramer:
+    """Incremental byte-oriented SSE event framer."""
+
+    def __init__(self) -> None:
+        """Initialize an empty framer."""
+        self._buffer = bytearray()
+        self._start = 0  # First byte of the pending (incomplete) event
+        self._scan_from = 0  # Bytes before this hold no separator
+
+    def feed(self, chunk: bytes) -> list[str]:
+        """Add bytes from the response and return the completed events.
+
+        Args:
+            chunk: Raw response bytes
+
+        Returns:
+            Event texts (without the trailing blank line), decoded as UTF-8
+        """
+        buffer = self._buffer
+        buffer += chunk
+        events: list[str] = []
+
+        while True:
+            end = buffer.find(_SEPARATOR, self._scan_from)
+            if end < 0:
+                # A separator may straddle the next chunk boundary
+                self._scan_from = max(self._start, len(buffer) - 1)
+                break
+            events.append(buffer[self._start:end].decode("utf-8", errors="replace"))
+            self._start = self._scan_from = end + len(_SEPARATOR)
+
+        if self._start >= _COMPACT_THRESHOLD and self._start * 2 >= len(buffer):
+            del buffer[:self._start]
+            self._scan_from -= self._start
+            self._start = 0
+        elif self._start == len(buffer):
+            buffer.clear()
+            self._start = self._scan_from = 0
+
+        return events
@@ -1,8 +1,82 @@
 """Tool call chunk buffering for streaming responses."""
 
 import json
+import re
 from typing import Any
 
+_STRING_SPECIAL = re.compile(r'["\\]')
+_STRUCTURAL = re.compile(r'["{}\[\]]')
+
+
+class JsonCompletenessScanner:
+    """Tracks string/bracket state of streamed JSON text.
+
+    Each chunk is scanned once, so callers can wait until the top-level
+    object or array has closed before joining and parsing the text.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scanner before any text."""
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._started = False
+        self._container = True
+        self._closed = False
+
+    @property
+    def may_be_complete(self) -> bool:
+        """Whether the text so far is worth parsing.
+
+        True once the top-level object/array has closed, and always for
+        scalar top-level values (whose end cannot be detected).
+        """
+        return self._started and (self._closed or not self._container)
+
+    def feed(self, text: str) -> None:
+        """Scan the next chunk of JSON text."""
+        i = 0
+        if not self._started:
+            stripped = text.lstrip()
+            if not stripped:
+                return
+            self._started = True
+            self._container = stripped[0] in "{["
+            i = len(text) - len(stripped)
+        if self._closed or not self._container:
+            return
+
+        n = len(text)
+        while i < n:
+            if self._escape:
+                self._escape = False
+                i += 1
+                continue
+            if self._in_string:
+                match = _STRING_SPECIAL.search(text, i)
+                if match is None:
+                    return
+                i = match.end()
+                if match.group() == "\\":
+                    self._escape = True
+                else:
+                    self._in_string = False
+                continue
+            match = _STRUCTURAL.search(text, i)
+            if match is None:
+                return
+            i = match.end()
+            char = match.group()
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._closed = True
+                    return
+
 
 class ToolCallChunkBuffer:
     """Buffers streaming tool call chunks until complete."""
@@ -32,7 +106,7 @@ class ToolCallChunkBuffer:
 
         buffer = self._buffers.setdefault(
             buffer_key,
-            {"name": None, "id": None, "args": None, "args_parts": []},
+            {"name": None, "id": None, "args": None, "args_parts": [], "scanner": None},
         )
 
         if chunk_name:
@@ -41,27 +115,34 @@ class ToolCallChunkBuffer:
             buffer["id"] = chunk_id
 
         # Handle args accumulation
+        # String args are only joined and parsed once the JSON value can be complete
         if isinstance(chunk_args, dict):
             buffer["args"] = chunk_args
             buffer["args_parts"] = []
+            buffer["scanner"] = None
         elif isinstance(chunk_args, str) and chunk_args:
-            parts = buffer.setdefault("args_parts", [])
+            parts = buffer["args_parts"]
             if not parts or chunk_args != parts[-1]:
+                if buffer["scanner"] is None:
+                    buffer["scanner"] = JsonCompletenessScanner()
                 parts.append(chunk_args)
-            buffer["args"] = "".join(parts)
-        elif chunk_args is not None:
+                buffer["scanner"].feed(chunk_args)
+            buffer["args"] = None
+        elif chunk_args is not None and not isinstance(chunk_args, str):
             buffer["args"] = chunk_args
+            buffer["args_parts"] = []
+            buffer["scanner"] = None
 
         # Check if complete
         if buffer.get("name") is None:
             return None
 
         parsed_args = buffer.get("args")
-        if isinstance(parsed_args, str):
-            if not parsed_args:
+        if buffer["args_parts"]:
+            if not buffer["scanner"].may_be_complete:
                 return None
             try:
-                parsed_args = json.loads(parsed_args)
+                parsed_args = json.loads("".join(buffer["args_parts"]))
             except json.JSONDecodeError:
                 return None
         elif parsed_args is None:
@@ -0,0 +1,57 @@
+"""Tests for SSEFramer from ptc_cli.api.sse."""
+
+
+from ptc_cli.api.sse import SSEFramer
+
+
+class TestSSEFramer:
+    """Tests for SSEFramer class."""
+
+    def test_single_chunk_with_multiple_events(self):
+        """Test a chunk holding several events yields each one."""
+        framer = SSEFramer()
+
+        events = framer.feed(b"id: 1\nevent: a\ndata: {}\n\nid: 2\nevent: b\ndata: {}\n\n")
+
+        assert events == ["id: 1\nevent: a\ndata: {}", "id: 2\nevent: b\ndata: {}"]
+
+    def test_event_split_across_chunks(self):
+        """Test an event is only returned once its blank line arrives."""
+        framer = SSEFramer()
+
+        assert framer.feed(b"id: 1\nevent: a\nda") == []
+        assert framer.feed(b'ta: {"x": 1}\n') == []
+        assert framer.feed(b"\nid: 2") == ['id: 1\nevent: a\ndata: {"x": 1}']
+        assert framer.feed(b"\n\n") == ["id: 2"]
+
+    def test_separator_split_byte_by_byte(self):
+        """Test feeding one byte at a time finds every separator."""
+        framer = SSEFramer()
+        stream = b"event: a\ndata: 1\n\nevent: b\ndata: 2\n\n"
+
+        events = []
+        for i in range(len(stream)):
+            events.extend(framer.feed(stream[i:i + 1]))
+
+        assert events == ["event: a\ndata: 1", "event: b\ndata: 2"]
+
+    def test_multibyte_utf8_split_across_chunks(self):
+        """Test UTF-8 characters split between chunks decode correctly."""
+        framer = SSEFramer()
+        payload = 'data: {"content": "股价 ✓"}\n\n'.encode()
+
+        assert framer.feed(payload[:17]) == []
+        assert framer.feed(payload[17:]) == ['data: {"content": "股价 ✓"}']
+
+    def test_large_stream_compacts_buffer(self):
+        """Test consumed bytes are dropped from long streams."""
+        framer = SSEFramer()
+        event = b"event: message_chunk\ndata: " + b"x" * 1000 + b"\n\n"
+
+        count = 0
+        for _ in range(200):
+            count += len(framer.feed(event[:500]))
+            count += len(framer.feed(event[500:]))
+
+        assert count == 200
+        assert len(framer._buffer) < 70 * 1024
@@ -1,7 +1,9 @@
 """Tests for ToolCallChunkBuffer from ptc_cli.streaming.tool_buffer."""
 
 
-from ptc_cli.streaming.tool_buffer import ToolCallChunkBuffer
+import json
+
+from ptc_cli.streaming.tool_buffer import JsonCompletenessScanner, ToolCallChunkBuffer
 
 
 class TestToolCallChunkBuffer:
@@ -344,3 +346,63 @@ class TestToolCallChunkBuffer:
 
         assert result is not None
         assert result["args"] == {"file_path": "/test.txt"}
+
+    def test_large_chunked_args_complete_only_at_end(self):
+        """Test large streamed args with JSON-like string content complete once."""
+        buffer = ToolCallChunkBuffer()
+        args = {"file_path": "/big.py", "content": 'x = {"a": [1, "}"]}\n\\' * 2000}
+        text = json.dumps(args)
+        pieces = [text[i:i + 7] for i in range(0, len(text), 7)]
+
+        results = [buffer.add_chunk({"name": "write_file", "id": "tool_1", "args": p}) for p in pieces]
+
+        assert all(r is None for r in results[:-1])
+        assert results[-1]["args"] == args
+
+
+class TestJsonCompletenessScanner:
+    """Tests for JsonCompletenessScanner class."""
+
+    def test_object_closes_after_nested_brackets(self):
+        """Test completeness is reported only when the top-level object closes."""
+        scanner = JsonCompletenessScanner()
+
+        scanner.feed('{"a": [1, {"b": ')
+        assert scanner.may_be_complete is False
+
+        scanner.feed("2}]")
+        assert scanner.may_be_complete is False
+
+        scanner.feed("}")
+        assert scanner.may_be_complete is True
+
+    def test_brackets_inside_strings_are_ignored(self):
+        """Test brackets and escaped quotes inside strings do not count."""
+        scanner = JsonCompletenessScanner()
+
+        scanner.feed('{"s": "}]\\"')
+        assert scanner.may_be_complete is False
+
+        scanner.feed(' {"}')
+        assert scanner.may_be_complete is True
+
+    def test_escape_split_across_chunks(self):
+        """Test a backslash at the end of a chunk escapes the next chunk's quote."""
+        scanner = JsonCompletenessScanner()
+
+        scanner.feed('{"s": "a\\')
+        scanner.feed('"}')
+        assert scanner.may_be_complete is False
+
+        scanner.feed('"}')
+        assert scanner.may_be_complete is True
+
+    def test_scalar_values_are_always_parse_candidates(self):
+        """Test scalar top-level values are left to the JSON parser."""
+        scanner = JsonCompletenessScanner()
+
+        scanner.feed("  ")
+        assert scanner.may_be_complete is False
+
+        scanner.feed("12")
+        assert scanner.may_be_complete is True
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark BackgroundTaskManager event throughput with concurrent workflows.
+
+Runs N synthetic workflows through the real manager (in-memory event
+storage, in-memory live fan-out). Each workflow streams token-sized SSE
+events to one live subscriber; workflows finish at staggered times and run
+a completion callback that sleeps to mimic database persistence. With a
+global manager lock that finalization stalled every other workflow's
+broadcasts; with per-thread lifecycle locks it should not.
+
+Reported per concurrency level:
+- events/sec: events delivered to subscribers across all workflows
+- p50/p99/max latency: time from the workflow yielding an event to the
+  subscriber receiving it
+
+Usage:
+    uv run python scripts/benchmarks/bench_background_tasks.py
+    uv run python scripts/benchmarks/bench_background_tasks.py --workflows 1 10 100 --events 2000 --finalize-ms 200
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# Load the app package first, as server.py does (services import it transitively)
+import src.server.app  # noqa: F401
+from src.server.services.background_task_manager import BackgroundTaskManager
+from src.server.services.event_fanout import create_event_fanout
+
+
+def _make_event(event_id: int, thread_id: str) -> str:
+    data = json.dumps({"thread_id": thread_id, "content": "tok", "ts": time.perf_counter()})
+    return f"id: {event_id}\nevent: message_chunk\ndata: {data}\n\n"
+
+
+async def _synthetic_workflow(thread_id: str, events: int):
+    """Yield token-sized SSE events, yielding to the loop between them."""
+    for i in range(1, events + 1):
+        yield _make_event(i, thread_id)
+        await asyncio.sleep(0)
+
+
+async def _subscriber(queue: asyncio.Queue, latencies: list) -> int:
+    received = 0
+    while True:
+        event = await queue.get()
+        if event is None:
+            return received
+        sent_at = json.loads(event.split("data: ", 1)[1])["ts"]
+        latencies.append((time.perf_counter() - sent_at) * 1000)
+        received += 1
+
+
+async def run_level(workflows: int, events: int, finalize_ms: float) -> dict:
+    """Run one concurrency level on a fresh manager."""
+    manager = BackgroundTaskManager()
+    manager.event_storage_backend = "memory"
+    manager.enable_storage = True
+    manager.max_concurrent = max(manager.max_concurrent, workflows)
+    manager.fanout = create_event_fanout("memory")
+
+    async def finalize():
+        await asyncio.sleep(finalize_ms / 1000)
+
+    latencies: list = []
+    subscribers = []
+    start = time.perf_counter()
+
+    for n in range(workflows):
+        thread_id = f"bench-{n}"
+        # Stagger run lengths so some workflows finalize while others stream
+        run_events = max(1, int(events * (0.5 + 0.5 * (n + 1) / workflows)))
+        queue: asyncio.Queue = asyncio.Queue(maxsize=run_events + 1)
+        await manager.fanout.subscribe(thread_id, queue)
+        subscribers.append(asyncio.create_task(_subscriber(queue, latencies)))
+        await manager.start_workflow(
+            thread_id,
+            _synthetic_workflow(thread_id, run_events),
+            completion_callback=finalize if finalize_ms > 0 else None,
+        )
+
+    received = sum(await asyncio.gather(*subscribers))
+    elapsed = time.perf_counter() - start
+    await asyncio.gather(
+        *(info.task for info in manager.tasks.values() if info.task),
+        return_exceptions=True,
+    )
+
+    latencies.sort()
+    return {
+        "workflows": workflows,
+        "events": received,
+        "elapsed_s": elapsed,
+        "events_per_sec": received / elapsed if elapsed else 0.0,
+        "p50_ms": statistics.median(latencies) if latencies else 0.0,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] if latencies else 0.0,
+        "max_ms": latencies[-1] if latencies else 0.0,
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    print(
+        f"events/workflow<={args.events}  finalize={args.finalize_ms}ms  "
+        f"backend=memory"
+    )
+    print(f"{'workflows':>9} {'events':>9} {'events/s':>11} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for workflows in args.workflows:
+        result = await run_level(workflows, args.events, args.finalize_ms)
+        print(
+            f"{result['workflows']:>9} {result['events']:>9} "
+            f"{result['events_per_sec']:>11,.0f} {result['p50_ms']:>8.3f} "
+            f"{result['p99_ms']:>8.3f} {result['max_ms']:>8.3f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workflows", type=int, nargs="+", default=[1, 10, 50, 100],
+                        help="Concurrency levels to run")
+    parser.add_argument("--events", type=int, default=1000,
+                        help="Events per workflow (longest run)")
+    parser.add_argument("--finalize-ms", type=float, default=100.0,
+                        help="Simulated completion persistence time per workflow")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
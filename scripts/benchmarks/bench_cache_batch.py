@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-key vs batched RedisCacheClient lookups.
+
+Seeds N intraday-sized cache entries in a real Redis, then times:
+- per-key: get_with_swr for every key via asyncio.gather (a GET and a TTL
+  call per key, as IntradayCacheService._get_batch used to do)
+- batched: one get_many_with_swr call (MGET + PTTLs in one pipeline)
+- per-key set vs one mset for the write-back path
+
+Reported per symbol count: p50/p99 latency in milliseconds over the
+iterations. Keys are written under a throwaway prefix and deleted at the
+end. The L1 tier is bypassed so every lookup reaches Redis.
+
+Requires a reachable Redis (REDIS_URL or --url).
+
+Usage:
+    uv run python scripts/benchmarks/bench_cache_batch.py
+    uv run python scripts/benchmarks/bench_cache_batch.py --symbols 10 50 200 --iterations 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.cache.redis_cache import RedisCacheClient
+
+TTL = 60
+
+
+def _bars(count: int) -> list:
+    """One intraday series: `count` OHLCV bars."""
+    return [
+        {"date": f"2025-01-02 09:{i % 60:02d}:00", "open": 100.0 + i, "high": 101.0 + i,
+         "low": 99.0 + i, "close": 100.5 + i, "volume": 1000 + i}
+        for i in range(count)
+    ]
+
+
+async def _time(fn, iterations: int) -> list:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples
+
+
+def _p(samples: list, pct: float) -> float:
+    return samples[max(0, int(len(samples) * pct) - 1)]
+
+
+async def run_level(cache: RedisCacheClient, prefix: str, symbols: int, iterations: int, bars: int) -> dict:
+    keys = [f"{prefix}:symbol=S{i}" for i in range(symbols)]
+    values = {key: _bars(bars) for key in keys}
+    await cache.mset(values, ttl=TTL)
+
+    async def per_key_read():
+        await asyncio.gather(*(cache.get_with_swr(k, TTL, 0.6) for k in keys))
+
+    async def batched_read():
+        await cache.get_many_with_swr(keys, TTL, 0.6)
+
+    async def per_key_write():
+        await asyncio.gather(*(cache.set(k, v, ttl=TTL) for k, v in values.items()))
+
+    async def batched_write():
+        await cache.mset(values, ttl=TTL)
+
+    per_key = await _time(per_key_read, iterations)
+    batched = await _time(batched_read, iterations)
+    per_key_set = await _time(per_key_write, max(1, iterations // 4))
+    batched_set = await _time(batched_write, max(1, iterations // 4))
+
+    return {
+        "symbols": symbols,
+        "read_per_key": (statistics.median(per_key), _p(per_key, 0.99)),
+        "read_batched": (statistics.median(batched), _p(batched, 0.99)),
+        "write_per_key": (statistics.median(per_key_set), _p(per_key_set, 0.99)),
+        "write_batched": (statistics.median(batched_set), _p(batched_set, 0.99)),
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    cache = RedisCacheClient(url=args.url, max_connections=args.max_connections)
+    cache.enabled = True
+    cache.l1 = None  # measure Redis round trips, not the in-process tier
+    await cache.connect()
+
+    prefix = f"bench:cache_batch:{uuid.uuid4().hex[:8]}"
+    print(f"redis={cache.url}  bars/symbol={args.bars}  iterations={args.iterations}  pool={args.max_connections}")
+    print(f"{'symbols':>7} | {'GET p50':>8} {'GET p99':>8} | {'MGET p50':>8} {'MGET p99':>8} | "
+          f"{'SET p50':>8} {'MSET p50':>8} | {'speedup':>7}")
+    try:
+        for symbols in args.symbols:
+            r = await run_level(cache, prefix, symbols, args.iterations, args.bars)
+            speedup = r["read_per_key"][0] / r["read_batched"][0] if r["read_batched"][0] else 0.0
+            print(
+                f"{symbols:>7} | {r['read_per_key'][0]:>8.2f} {r['read_per_key'][1]:>8.2f} | "
+                f"{r['read_batched'][0]:>8.2f} {r['read_batched'][1]:>8.2f} | "
+                f"{r['write_per_key'][0]:>8.2f} {r['write_batched'][0]:>8.2f} | {speedup:>6.1f}x"
+            )
+    finally:
+        await cache.delete_pattern(f"{prefix}:*")
+        await cache.disconnect()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--symbols", type=int, nargs="+", default=[10, 50, 200],
+                        help="Symbol counts to run")
+    parser.add_argument("--iterations", type=int, default=100,
+                        help="Timed lookups per symbol count")
+    parser.add_argument("--bars", type=int, default=390,
+                        help="Bars per cached series (390 = one trading day of 1min bars)")
+    parser.add_argument("--max-connections", type=int, default=10,
+                        help="Redis connection pool size")
+    parser.add_argument("--url", default=None,
+                        help="Redis URL (defaults to config / REDIS_URL)")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark ptc-cli SSE parsing and tool-call argument assembly.
+
+Builds the SSE byte stream of one large write_file tool call (default
+200 KB of arguments, streamed as tool_call_chunks events of a few
+characters each, as models emit them) and runs it through:
+- legacy: str buffer split on "\\n\\n" per event, and ToolCallChunkBuffer
+  re-joining all argument parts and calling json.loads on every chunk
+- current: ptc_cli.api.sse.SSEFramer and ToolCallChunkBuffer with the
+  JSON completeness scanner (one parse when the object closes)
+
+The stream is fed in network-sized byte chunks. Reported per stage:
+CPU milliseconds (process_time) for the framer and for the buffer, and
+whether both assembled the same arguments.
+
+Usage:
+    uv run python scripts/benchmarks/bench_cli_stream_parsing.py
+    uv run python scripts/benchmarks/bench_cli_stream_parsing.py --args-kb 500 --chunk-chars 4
+"""
+
+import argparse
+import codecs
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add ptc-cli to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "libs" / "ptc-cli"))
+
+from ptc_cli.api.sse import SSEFramer
+from ptc_cli.streaming.tool_buffer import ToolCallChunkBuffer
+
+
+def legacy_frame(chunks: List[bytes]) -> List[str]:
+    """SSE framing as it was: decoded text buffer split once per event."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")  # as httpx aiter_text
+    events = []
+    buffer = ""
+    for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        while "\n\n" in buffer:
+            event_text, buffer = buffer.split("\n\n", 1)
+            events.append(event_text)
+    return events
+
+
+class LegacyToolCallChunkBuffer:
+    """Argument assembly as it was: join and json.loads on every chunk."""
+
+    def __init__(self) -> None:
+        self._parts: List[str] = []
+        self._name: Optional[str] = None
+
+    def add_chunk(self, block: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if block.get("name"):
+            self._name = block["name"]
+        args = block.get("args")
+        if isinstance(args, str) and args and (not self._parts or args != self._parts[-1]):
+            self._parts.append(args)
+        if self._name is None or not self._parts:
+            return None
+        try:
+            parsed = json.loads("".join(self._parts))
+        except json.JSONDecodeError:
+            return None
+        return {"name": self._name, "args": parsed}
+
+
+def build_stream(args_kb: int, chunk_chars: int) -> tuple[bytes, Dict[str, Any]]:
+    """SSE bytes for one write_file call with ~args_kb KB of arguments."""
+    line = 'def handler(event): return {"status": "ok", "path": "C:\\\\tmp\\\\数据"}  # ✓\n'
+    content = line * max(1, args_kb * 1024 // len(line.encode("utf-8")))
+    args = {"file_path": "/home/daytona/results/app.py", "content": content}
+    text = json.dumps(args, ensure_ascii=False)
+
+    frames = []
+    for seq, start in enumerate(range(0, len(text), chunk_chars), start=1):
+        chunk = {"id": "call_1", "index": 0, "args": text[start:start + chunk_chars]}
+        if seq == 1:
+            chunk["name"] = "write_file"
+        data = {"thread_id": "bench", "agent": "ptc", "id": "run-1", "tool_call_chunks": [chunk]}
+        frames.append(f"id: {seq}\nevent: tool_call_chunks\ndata: {json.dumps(data, ensure_ascii=False)}\n\n")
+    return "".join(frames).encode("utf-8"), args
+
+
+def assemble(events: List[str], buffer) -> Optional[Dict[str, Any]]:
+    result = None
+    for event_text in events:
+        data_line = event_text.rsplit("\n", 1)[-1]
+        payload = json.loads(data_line[6:])
+        for block in payload["tool_call_chunks"]:
+            if (complete := buffer.add_chunk(block)) is not None:
+                result = complete
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--args-kb", type=int, default=200,
+                        help="Size of the streamed tool arguments in KB")
+    parser.add_argument("--chunk-chars", type=int, default=16,
+                        help="Argument characters per tool_call_chunks event")
+    parser.add_argument("--read-bytes", type=int, default=4096,
+                        help="Bytes per network read fed to the framer")
+    args = parser.parse_args()
+
+    stream, expected = build_stream(args.args_kb, args.chunk_chars)
+    reads = [stream[i:i + args.read_bytes] for i in range(0, len(stream), args.read_bytes)]
+
+    start = time.process_time()
+    legacy_events = legacy_frame(reads)
+    legacy_frame_ms = (time.process_time() - start) * 1000
+
+    start = time.process_time()
+    framer = SSEFramer()
+    events = [event for read in reads for event in framer.feed(read)]
+    frame_ms = (time.process_time() - start) * 1000
+
+    # Decode/parse of the SSE data lines is identical in both paths, so time it separately
+    start = time.process_time()
+    legacy_result = assemble(legacy_events, LegacyToolCallChunkBuffer())
+    legacy_assemble_ms = (time.process_time() - start) * 1000
+
+    start = time.process_time()
+    result = assemble(events, ToolCallChunkBuffer())
+    assemble_ms = (time.process_time() - start) * 1000
+
+    print(f"stream={len(stream) / 1024:.0f} KB  events={len(events)}  args={args.args_kb} KB  "
+          f"chunk_chars={args.chunk_chars}  read_bytes={args.read_bytes}")
+    print(f"{'':>8}  {'framing':>10}  {'assembly':>10}")
+    print(f"{'legacy':>8}  {legacy_frame_ms:>8.1f}ms  {legacy_assemble_ms:>8.1f}ms")
+    print(f"{'current':>8}  {frame_ms:>8.1f}ms  {assemble_ms:>8.1f}ms")
+    print(f"identical output: {legacy_events == events and legacy_result['args'] == result['args'] == expected}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Benchmark StreamEventAccumulator on a long token stream.
+
+Replays a stream of SSE payloads through:
+- legacy: the previous accumulator (deepcopy per event, f-string merge and
+  UTF-8 re-encode of the whole merged text per token, deepcopy on read)
+- current: StreamEventAccumulator from the streaming handler
+
+The stream is either a recording (JSONL of {"event": ..., "data": ...}
+lines, e.g. sse_events log output converted to JSON) or a synthetic
+50k-token stream shaped like an agent turn: reasoning, text answer and
+streamed tool-call arguments, with a few non-mergeable events in between.
+
+Reported: CPU microseconds per event (process_time) for add() plus the
+final get_events(), and whether both produce identical merged events.
+
+Usage:
+    uv run python scripts/benchmarks/bench_stream_accumulator.py
+    uv run python scripts/benchmarks/bench_stream_accumulator.py --tokens 50000 --max-bytes 65536
+    uv run python scripts/benchmarks/bench_stream_accumulator.py --recording stream.jsonl
+"""
+
+import argparse
+import copy
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# Add project root and src to path (the handler imports both src.* and ptc_agent.*)
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
+
+# Load the app package first, as server.py does (handlers import it transitively)
+import src.server.app  # noqa: F401
+from src.server.handlers.streaming_handler import StreamEventAccumulator
+
+WORDS = [
+    "the", "revenue", "growth", "margin", "quarter", "guidance", "analysts", "expect",
+    "股价", "earnings", "free", "cash", "flow", "✓", "valuation", "multiple", "data",
+]
+
+
+class LegacyStreamEventAccumulator:
+    """Accumulator as it was before the parts/byte-counter rewrite."""
+
+    def __init__(self, max_merged_bytes: int):
+        self._max_merged_bytes = max_merged_bytes
+        self._events: List[Dict[str, Any]] = []
+
+    def get_events(self) -> List[Dict[str, Any]]:
+        return copy.deepcopy(self._events)
+
+    def add(self, event_type: str, data: Dict[str, Any]) -> None:
+        incoming = copy.deepcopy(data)
+        if self._events and self._events[-1].get("event") == event_type:
+            prev = self._events[-1]
+            if event_type == "message_chunk" and self._merge_message(prev["data"], incoming):
+                return
+            if event_type == "tool_call_chunks" and self._merge_tool(prev["data"], incoming):
+                return
+        self._events.append({"event": event_type, "data": incoming})
+
+    def _merge_message(self, prev: Dict[str, Any], incoming: Dict[str, Any]) -> bool:
+        if "reasoning_signal" in (prev.get("content_type"), incoming.get("content_type")):
+            return False
+        if any(prev.get(k) != incoming.get(k) for k in ("thread_id", "agent", "id", "role", "content_type")):
+            return False
+        prev_content = prev.get("content") or ""
+        incoming_content = incoming.get("content") or ""
+        incoming_finish = incoming.get("finish_reason")
+        if incoming_content:
+            if len(prev_content.encode("utf-8")) + len(incoming_content.encode("utf-8")) > self._max_merged_bytes:
+                return False
+            prev["content"] = f"{prev_content}{incoming_content}"
+        if incoming_finish is not None:
+            prev["finish_reason"] = incoming_finish
+        return bool(incoming_content) or (incoming_finish is not None)
+
+    def _merge_tool(self, prev: Dict[str, Any], incoming: Dict[str, Any]) -> bool:
+        if any(prev.get(k) != incoming.get(k) for k in ("thread_id", "agent", "id")):
+            return False
+        if len(prev.get("tool_call_chunks") or ()) != 1 or len(incoming.get("tool_call_chunks") or ()) != 1:
+            return False
+        prev_chunk, incoming_chunk = prev["tool_call_chunks"][0], incoming["tool_call_chunks"][0]
+        if prev_chunk.get("id") is not None or incoming_chunk.get("id") is not None:
+            if prev_chunk.get("id") != incoming_chunk.get("id"):
+                return False
+        elif prev_chunk.get("index") != incoming_chunk.get("index"):
+            return False
+        prev_args = prev_chunk.get("args") or ""
+        incoming_args = incoming_chunk.get("args") or ""
+        if incoming_args:
+            if len(prev_args.encode("utf-8")) + len(incoming_args.encode("utf-8")) > self._max_merged_bytes:
+                return False
+            prev_chunk["args"] = f"{prev_args}{incoming_args}"
+        return bool(incoming_args)
+
+
+def synthetic_stream(tokens: int, seed: int = 7) -> List[Tuple[str, Dict[str, Any]]]:
+    """Agent-turn-shaped stream with `tokens` content/argument tokens."""
+    rng = random.Random(seed)
+    base = {"thread_id": "bench-thread", "agent": "ptc", "role": "assistant"}
+    stream: List[Tuple[str, Dict[str, Any]]] = []
+    emitted = 0
+    message = 0
+    while emitted < tokens:
+        message += 1
+        msg_id = f"run-{message}"
+        segment = min(tokens - emitted, rng.randint(2000, 12000))
+        for content_type, share in (("reasoning", 0.3), ("text", 0.5)):
+            if content_type == "reasoning":
+                stream.append(("message_chunk", {**base, "id": msg_id, "content": "start",
+                                                 "content_type": "reasoning_signal"}))
+            for _ in range(int(segment * share)):
+                stream.append(("message_chunk", {**base, "id": msg_id, "content_type": content_type,
+                                                 "content": rng.choice(WORDS) + " "}))
+            if content_type == "reasoning":
+                stream.append(("message_chunk", {**base, "id": msg_id, "content": "complete",
+                                                 "content_type": "reasoning_signal"}))
+        call_id = f"call_{message}"
+        stream.append(("tool_call_chunks", {**base, "id": msg_id, "tool_call_chunks": [
+            {"id": call_id, "index": 0, "name": "execute_code", "args": ""}]}))
+        for _ in range(segment - 2 * int(segment * 0.4)):
+            stream.append(("tool_call_chunks", {**base, "id": msg_id, "tool_call_chunks": [
+                {"id": call_id, "index": 0, "args": rng.choice(WORDS) + "_"}]}))
+        stream.append(("message_chunk", {**base, "id": msg_id, "content_type": "text", "finish_reason": "tool_calls"}))
+        stream.append(("tool_call_result", {**base, "id": f"result-{message}", "content": "ok"}))
+        emitted += segment
+    return stream
+
+
+def load_recording(path: Path) -> List[Tuple[str, Dict[str, Any]]]:
+    stream = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                stream.append((record["event"], record["data"]))
+    return stream
+
+
+def run(accumulator, stream: List[Tuple[str, Dict[str, Any]]]) -> Tuple[float, List[Dict[str, Any]]]:
+    start = time.process_time()
+    for event_type, data in stream:
+        accumulator.add(event_type, data)
+    events = accumulator.get_events()
+    return time.process_time() - start, events
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tokens", type=int, default=50_000,
+                        help="Tokens in the synthetic stream")
+    parser.add_argument("--recording", type=Path, default=None,
+                        help="JSONL recording of {event, data} payloads (overrides --tokens)")
+    parser.add_argument("--max-bytes", type=int, default=16 * 1024,
+                        help="Merged chunk byte cap")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Runs per implementation (best is reported)")
+    args = parser.parse_args()
+
+    stream = load_recording(args.recording) if args.recording else synthetic_stream(args.tokens)
+    print(f"events={len(stream)}  max_merged_bytes={args.max_bytes}  repeat={args.repeat}")
+
+    results = {}
+    for name, factory in (("legacy", LegacyStreamEventAccumulator), ("current", StreamEventAccumulator)):
+        best, events = min(
+            (run(factory(args.max_bytes), stream) for _ in range(args.repeat)),
+            key=lambda result: result[0],
+        )
+        results[name] = events
+        print(f"{name:>8}: {best * 1e6 / len(stream):>7.2f} us/event  "
+              f"total {best * 1000:>8.1f} ms  merged events {len(events)}")
+
+    print(f"identical output: {results['legacy'] == results['current']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark the graph/keepalive stream multiplexer.
+
+Streams N synthetic graph events (tuples shaped like graph.astream() output)
+through:
+- legacy: the previous multiplexer (a new task for every graph __anext__
+  plus asyncio.wait on a two-element set per event)
+- current: multiplex_streams from the streaming handler (one pump task
+  feeding a merged queue)
+
+A keepalive producer puts an event on the queue every --keepalive-ms
+while the stream runs, so both sources are exercised. --yield-every makes
+the fake graph await asyncio.sleep(0) every k events, as a real graph does
+between tokens.
+
+Reported per implementation: events/sec (wall clock), CPU microseconds
+per event (process_time) and tasks created per stream.
+
+Usage:
+    uv run python scripts/benchmarks/bench_stream_multiplexer.py
+    uv run python scripts/benchmarks/bench_stream_multiplexer.py --events 200000 --yield-every 1
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import AsyncGenerator
+
+# Add project root and src to path (the handler imports both src.* and ptc_agent.*)
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
+
+# Load the app package first, as server.py does (handlers import it transitively)
+import src.server.app  # noqa: F401
+from src.server.handlers.streaming_handler import multiplex_streams
+
+
+async def legacy_multiplex_streams(graph_stream: AsyncGenerator, keepalive_queue: asyncio.Queue):
+    """Multiplexer as it was before the merged-queue rewrite."""
+    graph_iterator = graph_stream.__aiter__()
+    graph_task = asyncio.ensure_future(graph_iterator.__anext__())
+    keepalive_task = asyncio.ensure_future(keepalive_queue.get())
+    try:
+        while True:
+            done, _ = await asyncio.wait({graph_task, keepalive_task}, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                try:
+                    if task == graph_task:
+                        yield ("graph", task.result())
+                        graph_task = asyncio.ensure_future(graph_iterator.__anext__())
+                    elif task == keepalive_task:
+                        yield ("keepalive", task.result())
+                        keepalive_task = asyncio.ensure_future(keepalive_queue.get())
+                except StopAsyncIteration:
+                    return
+    finally:
+        for task in (graph_task, keepalive_task):
+            if not task.done():
+                task.cancel()
+
+
+async def fake_graph(events: int, yield_every: int) -> AsyncGenerator:
+    chunk = ("ptc", "messages", ({"content": "token "}, {"langgraph_node": "model"}))
+    for i in range(events):
+        if yield_every and i % yield_every == 0:
+            await asyncio.sleep(0)
+        yield chunk
+
+
+async def keepalive_producer(queue: asyncio.Queue, interval: float, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        await asyncio.sleep(interval)
+        await queue.put("id: 0\nevent: keepalive\ndata: {}\n\n")
+
+
+async def run_once(multiplexer, events: int, yield_every: int, keepalive_s: float):
+    tasks_created = 0
+    loop = asyncio.get_running_loop()
+
+    def counting_factory(loop, coro, **kwargs):
+        nonlocal tasks_created
+        tasks_created += 1
+        return asyncio.Task(coro, loop=loop, **kwargs)
+
+    queue: asyncio.Queue = asyncio.Queue()
+    stop = asyncio.Event()
+    producer = asyncio.create_task(keepalive_producer(queue, keepalive_s, stop))
+
+    loop.set_task_factory(counting_factory)
+    graph_events = keepalives = 0
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        async for source, _ in multiplexer(fake_graph(events, yield_every), queue):
+            if source == "graph":
+                graph_events += 1
+            else:
+                keepalives += 1
+    finally:
+        loop.set_task_factory(None)
+    wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+    stop.set()
+    producer.cancel()
+    assert graph_events == events, f"lost graph events: {graph_events}/{events}"
+    return wall, cpu, tasks_created, keepalives
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--events", type=int, default=50_000,
+                        help="Graph events per stream")
+    parser.add_argument("--yield-every", type=int, default=4,
+                        help="Fake graph yields to the loop every k events (0 = never)")
+    parser.add_argument("--keepalive-ms", type=float, default=5.0,
+                        help="Keepalive producer interval")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Runs per implementation (best is reported)")
+    args = parser.parse_args()
+
+    print(f"events={args.events}  yield_every={args.yield_every}  keepalive={args.keepalive_ms}ms  "
+          f"repeat={args.repeat}")
+    for name, multiplexer in (("legacy", legacy_multiplex_streams), ("current", multiplex_streams)):
+        runs = [
+            asyncio.run(run_once(multiplexer, args.events, args.yield_every, args.keepalive_ms / 1000))
+            for _ in range(args.repeat)
+        ]
+        wall, cpu, tasks, keepalives = min(runs, key=lambda run: run[1])
+        print(f"{name:>8}: {args.events / wall:>10,.0f} events/s  {cpu * 1e6 / args.events:>6.2f} us CPU/event  "
+              f"{tasks:>7} tasks  {keepalives:>4} keepalives")
+
+
+if __name__ == "__main__":
+    main()
@@ -209,6 +209,50 @@ def get_sse_keepalive_interval(default: float = 15.0) -> float:
         return default
 
 
+def get_sse_serializer(default: str = "orjson") -> str:
+    """
+    Get the JSON serializer for SSE payloads from config.yaml.
+
+    Returns:
+        "json" or "orjson"
+    """
+    name = str(get_config('sse_serializer', default)).lower()
+    if name in ('json', 'orjson'):
+        return name
+    logger.warning(
+        f"Invalid sse_serializer value: {name}. "
+        f"Using default value {default}."
+    )
+    return default
+
+
+def get_sse_message_batch_ms(default: float = 0.0) -> float:
+    """
+    Get the message_chunk coalescing window in milliseconds from config.yaml.
+
+    Args:
+        default: Default window (0 disables coalescing)
+
+    Returns:
+        Configured window in milliseconds (0 = one SSE frame per token)
+    """
+    try:
+        window = float(get_config('sse_message_batch_ms', default))
+        if window >= 0:
+            return window
+        logger.warning(
+            f"sse_message_batch_ms value {window} is negative. "
+            f"Using default value {default}."
+        )
+        return default
+    except (ValueError, TypeError) as e:
+        logger.warning(
+            f"Invalid sse_message_batch_ms value: {e}. "
+            f"Using default value {default}."
+        )
+        return default
+
+
 # =============================================================================
 # Feature Flags
 # =============================================================================
@@ -450,6 +494,32 @@ def is_cache_invalidate_on_write_enabled() -> bool:
     return bool(get_nested_config('redis.cache_invalidate_on_write', True))
 
 
+def is_redis_l1_enabled() -> bool:
+    """Check if the in-process L1 cache in front of Redis is enabled."""
+    return bool(get_nested_config('redis.l1.enabled', False))
+
+
+def get_redis_l1_max_entries(default: int = 10000) -> int:
+    """Get the maximum number of entries held in the L1 cache."""
+    return int(get_nested_config('redis.l1.max_entries', default))
+
+
+def get_redis_l1_max_bytes(default_mb: int = 64) -> int:
+    """Get the L1 cache size budget in bytes (configured in MB)."""
+    return int(float(get_nested_config('redis.l1.max_size_mb', default_mb)) * 1024 * 1024)
+
+
+def get_redis_l1_ttl(default: float = 5.0) -> float:
+    """Get the maximum seconds a value is served from the L1 cache."""
+    return float(get_nested_config('redis.l1.ttl', default))
+
+
+def get_redis_l1_key_prefixes() -> List[str]:
+    """Get the key prefixes eligible for L1 caching (read-mostly namespaces)."""
+    prefixes = get_nested_config('redis.l1.key_prefixes', ["fmp:intraday:", "web_fetch:"])
+    return [str(p) for p in prefixes or []]
+
+
 
 # =============================================================================
 # Summarization Middleware Configuration (from agent_config.yaml)
@@ -543,16 +613,16 @@ def get_max_stored_messages_per_agent(default: int = 100) -> int:
 
 def get_event_storage_backend(default: str = "redis") -> str:
     """
-    Get event storage backend (redis or memory).
+    Get event storage backend (redis, redis_stream or memory).
 
     Args:
         default: Default backend if not configured
 
     Returns:
-        Event storage backend: "redis" or "memory"
+        Event storage backend: "redis" (list), "redis_stream" or "memory"
     """
     backend = str(get_nested_config('background_execution.event_storage_backend', default))
-    if backend not in ["redis", "memory"]:
+    if backend not in ["redis", "redis_stream", "memory"]:
         logger.warning(f"Invalid event_storage_backend: {backend}, using {default}")
         return default
     return backend
@@ -563,6 +633,82 @@ def is_event_storage_fallback_enabled() -> bool:
     return bool(get_nested_config('background_execution.event_storage_fallback_to_memory', True))
 
 
+def get_live_fanout_backend(default: str = "memory") -> str:
+    """
+    Get the live event fan-out backend.
+
+    Returns:
+        "memory" (single node) or "redis_pubsub" (subscribers on any replica)
+    """
+    backend = str(get_nested_config('background_execution.live_fanout_backend', default))
+    if backend not in ["memory", "redis_pubsub"]:
+        logger.warning(f"Invalid live_fanout_backend: {backend}, using {default}")
+        return default
+    return backend
+
+
+def get_event_stream_block_ms(default: int = 1000) -> int:
+    """Get the XREAD BLOCK timeout (ms) for live tailing with the redis_stream backend."""
+    try:
+        block_ms = int(get_nested_config('background_execution.event_stream_block_ms', default))
+        if block_ms > 0:
+            return block_ms
+        logger.warning(
+            f"event_stream_block_ms value {block_ms} is not positive. "
+            f"Using default value {default}."
+        )
+        return default
+    except (ValueError, TypeError) as e:
+        logger.warning(
+            f"Invalid event_stream_block_ms value: {e}. "
+            f"Using default value {default}."
+        )
+        return default
+
+
+def get_event_write_batch_window_ms(default: int = 20) -> int:
+    """
+    Get the Redis event write batching window in milliseconds.
+
+    Events buffered within this window are flushed to Redis in a single
+    pipeline. 0 flushes every event immediately.
+    """
+    try:
+        window = int(get_nested_config('background_execution.event_write_batch_window_ms', default))
+        if window >= 0:
+            return window
+        logger.warning(
+            f"event_write_batch_window_ms value {window} is negative. "
+            f"Using default value {default}."
+        )
+        return default
+    except (ValueError, TypeError) as e:
+        logger.warning(
+            f"Invalid event_write_batch_window_ms value: {e}. "
+            f"Using default value {default}."
+        )
+        return default
+
+
+def get_event_write_batch_max_size(default: int = 64) -> int:
+    """Get the maximum number of events per Redis write batch."""
+    try:
+        size = int(get_nested_config('background_execution.event_write_batch_max_size', default))
+        if size > 0:
+            return size
+        logger.warning(
+            f"event_write_batch_max_size value {size} is not positive. "
+            f"Using default value {default}."
+        )
+        return default
+    except (ValueError, TypeError) as e:
+        logger.warning(
+            f"Invalid event_write_batch_max_size value: {e}. "
+            f"Using default value {default}."
+        )
+        return default
+
+
 def get_redis_ttl_workflow_events(default: int = 86400) -> int:
     """
     Get Redis TTL for workflow event buffers (seconds).
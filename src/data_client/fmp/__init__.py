@@ -6,8 +6,22 @@ from typing import Optional
 import asyncio
 
 from .fmp_client import FMPClient
-
-__all__ = ["FMPClient", "get_fmp_client", "close_fmp_client"]
+from .rate_limiter import (
+    PRIORITY_BULK,
+    PRIORITY_DEFAULT,
+    PRIORITY_INTERACTIVE,
+    request_priority,
+)
+
+__all__ = [
+    "FMPClient",
+    "get_fmp_client",
+    "close_fmp_client",
+    "request_priority",
+    "PRIORITY_INTERACTIVE",
+    "PRIORITY_DEFAULT",
+    "PRIORITY_BULK",
+]
 
 # Async singleton for FMPClient
 _fmp_client: Optional[FMPClient] = None
@@ -36,10 +50,11 @@ async def close_fmp_client() -> None:
     Close the singleton FMPClient (call on shutdown).
 
     Should be called during application shutdown to properly close
-    the HTTP client and release resources.
+    the shared HTTP connection pool and release resources.
     """
     global _fmp_client
     async with _client_lock:
         if _fmp_client is not None:
             await _fmp_client.close()
             _fmp_client = None
+        await FMPClient.close_shared()
@@ -1,20 +1,123 @@
 """
 FMP (Financial Modeling Prep) API Client
 Central client for all FMP API calls with caching, rate limiting, and error handling
+
+All FMPClient instances in a process share one HTTP/2 connection pool and
+token-bucket rate limiter (per event loop), one bounded LRU response cache
+with per-endpoint TTLs, and coalesce identical in-flight requests. Instances are cheap handles:
+close() / ``async with`` leave the shared pool open; FMPClient.close_shared()
+releases it on shutdown.
 """
 
 import os
 import json
+import asyncio
+import weakref
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any, Union
-from datetime import datetime, timedelta
 import httpx
 
+from .rate_limiter import PLAN_RATE_LIMITS, TokenBucketLimiter
+from .response_cache import ResponseCache
+
+
+# Cache TTL (seconds) by first path segment of the endpoint; others use cache_ttl
+ENDPOINT_TTLS: Dict[str, int] = {
+    # Real-time prices
+    "quote": 5,
+    "aftermarket-quote": 5,
+    "stock-price-change": 60,
+    "market-capitalization": 60,
+    "biggest-gainers": 60,
+    "biggest-losers": 60,
+    "most-actives": 60,
+    "historical-chart": 15,  # Short: callers such as the intraday Redis cache refresh on their own
+    # Fundamentals change at most once per filing
+    "income-statement": 21600,
+    "income-statement-ttm": 21600,
+    "balance-sheet-statement": 21600,
+    "balance-sheet-statement-ttm": 21600,
+    "cash-flow-statement": 21600,
+    "cash-flow-statement-ttm": 21600,
+    "key-metrics": 21600,
+    "ratios": 21600,
+    "financial-growth": 21600,
+    "income-statement-growth": 21600,
+    "balance-sheet-growth": 21600,
+    "cash-flow-growth": 21600,
+    "enterprise-values": 21600,
+    "historical-discounted-cash-flow": 21600,
+    "revenue-product-segmentation": 21600,
+    "revenue-geographic-segmentation": 21600,
+    "analyst-estimates": 21600,
+    "stock_peers": 21600,
+    "earning-call-transcript": 86400,
+    # Slow-moving reference data
+    "profile": 3600,
+    "key-metrics-ttm": 3600,
+    "ratios-ttm": 3600,
+    "historical-market-capitalization": 3600,
+    "earnings": 3600,
+    "earning_call_transcript": 3600,
+    "historical": 3600,
+    "sec_filings": 3600,
+    "score": 3600,
+    "search": 3600,
+}
+
+
+def _plan_rate_limit() -> float:
+    """Requests per minute: FMP_RATE_LIMIT_PER_MIN, else the FMP_PLAN limit"""
+    override = os.getenv("FMP_RATE_LIMIT_PER_MIN")
+    if override:
+        return float(override)
+    return float(PLAN_RATE_LIMITS.get(os.getenv("FMP_PLAN", "starter").lower(), PLAN_RATE_LIMITS["starter"]))
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta seconds or HTTP date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class _LoopState:
+    """HTTP client, rate limiter and in-flight requests bound to one event loop"""
+
+    def __init__(self):
+        self.client: Optional[httpx.AsyncClient] = None
+        self.inflight: Dict[str, asyncio.Future] = {}
+        burst = os.getenv("FMP_RATE_LIMIT_BURST")
+        self.limiter = TokenBucketLimiter(_plan_rate_limit(), burst=int(burst) if burst else None)
+
 
 class FMPClient:
     """Central client for Financial Modeling Prep API (Async)"""
 
     BASE_URL = "https://financialmodelingprep.com/api"
     DEFAULT_VERSION = "v3"
+    MAX_THROTTLE_RETRIES = 3
+
+    # Process-wide state shared by all instances
+    _response_cache = ResponseCache(
+        max_entries=int(os.getenv("FMP_CACHE_MAX_ENTRIES", "2048")),
+        max_bytes=int(float(os.getenv("FMP_CACHE_MAX_MB", "128")) * 1024 * 1024),
+    )
+    _loop_states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = (
+        weakref.WeakKeyDictionary()
+    )
+    _coalesce_stats = {"requests": 0, "coalesced": 0}
 
     def __init__(self, api_key: Optional[str] = None, cache_ttl: int = 300):
         """
@@ -22,7 +125,8 @@ class FMPClient:
 
         Args:
             api_key: FMP API key (will use env var FMP_API_KEY if not provided)
-            cache_ttl: Cache time-to-live in seconds (default 5 minutes)
+            cache_ttl: Cache TTL in seconds for endpoints without an entry in
+                ENDPOINT_TTLS (default 5 minutes)
         """
         self.api_key = api_key or os.getenv("FMP_API_KEY")
         if not self.api_key:
@@ -31,24 +135,35 @@ class FMPClient:
             )
 
         self.cache_ttl = cache_ttl
-        self._client: Optional[httpx.AsyncClient] = None
-        self._cache: Dict[str, Any] = {}
-        self._cache_timestamps: Dict[str, datetime] = {}
+
+    @classmethod
+    def _loop_state(cls) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        state = cls._loop_states.get(loop)
+        if state is None:
+            state = cls._loop_states[loop] = _LoopState()
+        return state
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Lazy initialization of async client with HTTP/2"""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
+        """Get the shared HTTP/2 client for the running event loop"""
+        state = self._loop_state()
+        if state.client is None or state.client.is_closed:
+            state.client = httpx.AsyncClient(
                 http2=True,
                 timeout=30.0,
                 limits=httpx.Limits(max_keepalive_connections=10)
             )
-        return self._client
+        return state.client
 
     async def close(self):
-        """Close the HTTP client"""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        """Release this handle (the shared connection pool stays open)"""
+
+    @classmethod
+    async def close_shared(cls):
+        """Close the shared HTTP client of the running event loop (call on shutdown)"""
+        state = cls._loop_states.pop(asyncio.get_running_loop(), None)
+        if state is not None and state.client is not None and not state.client.is_closed:
+            await state.client.aclose()
 
     async def __aenter__(self):
         return self
@@ -68,13 +183,9 @@ class FMPClient:
         else:
             return f"{self.BASE_URL}/{version}{endpoint}"
 
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """Check if cached data is still valid"""
-        if cache_key not in self._cache_timestamps:
-            return False
-
-        cached_time = self._cache_timestamps[cache_key]
-        return (datetime.now() - cached_time).total_seconds() < self.cache_ttl
+    def _ttl_for(self, endpoint: str) -> int:
+        """Cache TTL for an endpoint"""
+        return ENDPOINT_TTLS.get(endpoint.lstrip("/").split("/", 1)[0], self.cache_ttl)
 
     async def _make_request(self,
                             endpoint: str,
@@ -84,6 +195,9 @@ class FMPClient:
         """
         Make API request with caching and error handling
 
+        Identical concurrent requests share one HTTP call. Cached responses
+        are shared across callers and must not be mutated.
+
         Args:
             endpoint: API endpoint path
             params: Query parameters
@@ -93,29 +207,79 @@ class FMPClient:
         Returns:
             API response data
         """
-        params = params or {}
-        params["apikey"] = self.api_key
+        params = dict(params or {})
 
-        # Create cache key
-        cache_key = f"{endpoint}:{json.dumps(params, sort_keys=True)}"
+        # Create cache key (the API key is left out so it never sits in cache keys)
+        version = version or self.DEFAULT_VERSION
+        cache_key = f"{version}:{endpoint}:{json.dumps(params, sort_keys=True, default=str)}"
 
         # Check cache
-        if use_cache and self._is_cache_valid(cache_key):
-            return self._cache[cache_key]
-
-        # Build URL and make request
+        if use_cache:
+            found, data = self._response_cache.get(cache_key)
+            if found:
+                return data
+
+        # Join an identical request already in flight
+        state = self._loop_state()
+        FMPClient._coalesce_stats["requests"] += 1
+        future = state.inflight.get(cache_key)
+        if future is not None:
+            FMPClient._coalesce_stats["coalesced"] += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Re-raise our own cancellation; retry if only the leader was cancelled
+                current = asyncio.current_task()
+                if not future.cancelled() or (current is not None and current.cancelling()):
+                    raise
+                return await self._make_request(endpoint, params, version, use_cache)
+
+        future = asyncio.get_running_loop().create_future()
+        state.inflight[cache_key] = future
+        try:
+            data = await self._fetch(endpoint, params, version, cache_key if use_cache else None)
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark retrieved so an exception nobody waited for is not logged
+                future.exception()
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            if state.inflight.get(cache_key) is future:
+                del state.inflight[cache_key]
+
+    async def _fetch(self,
+                     endpoint: str,
+                     params: Dict[str, Any],
+                     version: str,
+                     cache_key: Optional[str]) -> Union[Dict, List]:
+        """Perform the rate-limited HTTP call and cache a non-empty response under cache_key"""
         url = self._build_url(endpoint, version)
         client = await self._get_client()
+        limiter = self._loop_state().limiter
 
         try:
-            response = await client.get(url, params=params)
+            for attempt in range(self.MAX_THROTTLE_RETRIES + 1):
+                await limiter.acquire()
+                response = await client.get(url, params={**params, "apikey": self.api_key})
+                if response.status_code != 429 or attempt == self.MAX_THROTTLE_RETRIES:
+                    break
+                # Throttled: pause the shared bucket, then queue again
+                limiter.on_throttled(_parse_retry_after(response.headers.get("Retry-After")))
             response.raise_for_status()
+            limiter.on_success()
             data = response.json()
 
             # Cache successful response
-            if use_cache and data:
-                self._cache[cache_key] = data
-                self._cache_timestamps[cache_key] = datetime.now()
+            if cache_key is not None and data:
+                self._response_cache.set(
+                    cache_key, data, ttl=self._ttl_for(endpoint), size=len(response.content)
+                )
 
             return data
 
@@ -694,7 +858,7 @@ class FMPClient:
             yearLow, yearHigh, marketCap, priceAvg50, priceAvg200, volume, avgVolume,
             open, previousClose, eps, pe, earningsAnnouncement, sharesOutstanding, timestamp
         """
-        return await self._make_request(f"quote/{symbol}", use_cache=False)
+        return await self._make_request(f"quote/{symbol}")
 
     async def get_aftermarket_quote(self, symbol: str) -> List[Dict]:
         """
@@ -1208,15 +1372,42 @@ class FMPClient:
             use_cache=True  # Cache search results for better performance
         )
 
+    async def get_stock_list(self) -> List[Dict]:
+        """
+        Get the full list of traded symbols.
+
+        Large response (tens of thousands of rows), so it bypasses the
+        in-process response cache; callers keep their own copy.
+
+        Returns:
+            List of listings with:
+            - symbol: Ticker symbol
+            - name: Company name
+            - exchange: Exchange name
+            - exchangeShortName: Short exchange name
+            - type: Listing type (stock, etf, trust, fund)
+        """
+        return await self._make_request("stock/list", use_cache=False)
+
     # Utility Methods
     def clear_cache(self):
-        """Clear all cached data"""
-        self._cache = {}
-        self._cache_timestamps = {}
+        """Clear all cached data (shared by every client in the process)"""
+        self._response_cache.delete_matching()
 
     def clear_cache_for_symbol(self, symbol: str):
         """Clear cache for specific symbol"""
-        keys_to_remove = [k for k in self._cache.keys() if symbol in k]
-        for key in keys_to_remove:
-            del self._cache[key]
-            del self._cache_timestamps[key]
+        self._response_cache.delete_matching(symbol)
+
+    @classmethod
+    def get_rate_limit_stats(cls) -> Dict[str, Any]:
+        """Get rate limiter metrics (queue depth, waits, throttling) for the running event loop"""
+        return cls._loop_state().limiter.get_stats()
+
+    @classmethod
+    def get_cache_stats(cls) -> Dict[str, Any]:
+        """Get shared response cache and request coalescing statistics"""
+        return {
+            **cls._response_cache.get_stats(),
+            "inflight": sum(len(state.inflight) for state in list(cls._loop_states.values())),
+            **cls._coalesce_stats,
+        }
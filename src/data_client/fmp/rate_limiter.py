@@ -0,0 +1,252 @@
+"""
+Async token-bucket rate limiter for FMP API calls.
+
+Requests wait for a token from a bucket refilled at the API plan's
+per-minute limit. Waiters are served by priority lane first, then FIFO, so
+interactive UI requests go ahead of agent bulk pulls queued behind them.
+A 429 pauses the bucket (honouring Retry-After) and halves the effective
+rate, which then recovers additively with each successful response.
+
+The lane for a request comes from a context variable, set with
+``request_priority``; tasks created inside the block inherit it.
+
+Stdlib-only, since this package is also uploaded into sandboxes.
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_DEFAULT = 1
+PRIORITY_BULK = 2
+
+PRIORITY_NAMES = {
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_DEFAULT: "default",
+    PRIORITY_BULK: "bulk",
+}
+
+# Requests per minute by FMP plan
+PLAN_RATE_LIMITS = {
+    "basic": 60,
+    "starter": 300,
+    "premium": 750,
+    "ultimate": 3000,
+}
+
+_priority: contextvars.ContextVar[int] = contextvars.ContextVar("fmp_request_priority", default=PRIORITY_DEFAULT)
+
+
+@contextmanager
+def request_priority(priority: int) -> Iterator[None]:
+    """
+    Run FMP requests made inside the block in the given priority lane.
+
+    Example:
+        with request_priority(PRIORITY_BULK):
+            await asyncio.gather(*statement_pulls)
+    """
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> int:
+    """Get the priority lane of the current context"""
+    return _priority.get()
+
+
+class TokenBucketLimiter:
+    """
+    Token bucket with priority lanes and adaptive 429 backoff.
+
+    Bound to the event loop it is first awaited on (waiters are loop futures).
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        burst: Optional[int] = None,
+        min_rate_fraction: float = 0.1,
+        recovery_step: float = 0.05,
+        max_backoff: float = 60.0,
+    ):
+        """
+        Initialize limiter
+
+        Args:
+            rate_per_minute: Sustained request rate (the plan limit)
+            burst: Bucket capacity (default: one tenth of the per-minute rate)
+            min_rate_fraction: Floor for the adaptive rate after repeated 429s
+            recovery_step: Fraction of the full rate regained per success
+            max_backoff: Cap on a single pause in seconds
+        """
+        self.rate_per_minute = rate_per_minute
+        self.capacity = max(1, burst if burst is not None else int(rate_per_minute // 10))
+        self.min_rate_fraction = min_rate_fraction
+        self.recovery_step = recovery_step
+        self.max_backoff = max_backoff
+
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._rate_fraction = 1.0
+        self._paused_until = 0.0
+
+        # (priority, seq, enqueued_at, future)
+        self._waiters: List[Tuple[int, int, float, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+
+        self.stats: Dict[str, Dict[str, float]] = {
+            name: {"acquired": 0, "waited": 0, "wait_ms_total": 0.0, "wait_ms_max": 0.0}
+            for name in PRIORITY_NAMES.values()
+        }
+        self.throttled = 0
+
+    @property
+    def rate(self) -> float:
+        """Current effective rate in tokens per second"""
+        return self.rate_per_minute / 60.0 * self._rate_fraction
+
+    async def acquire(self, priority: Optional[int] = None) -> float:
+        """
+        Wait for a token
+
+        Args:
+            priority: Lane (defaults to the context's request_priority)
+
+        Returns:
+            Seconds spent waiting
+        """
+        if priority is None:
+            priority = current_priority()
+        lane = PRIORITY_NAMES.get(priority, "default")
+
+        # Fast path: nobody queued and a token is available
+        if not self._waiters and self._take():
+            self.stats[lane]["acquired"] += 1
+            return 0.0
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        enqueued_at = time.monotonic()
+        heapq.heappush(self._waiters, (priority, next(self._seq), enqueued_at, future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just as we were cancelled: hand the token back
+                self._tokens = min(self.capacity, self._tokens + 1)
+                self._dispatch()
+            raise
+
+        waited = time.monotonic() - enqueued_at
+        stats = self.stats[lane]
+        stats["acquired"] += 1
+        stats["waited"] += 1
+        stats["wait_ms_total"] += waited * 1000
+        stats["wait_ms_max"] = max(stats["wait_ms_max"], waited * 1000)
+        return waited
+
+    def on_success(self) -> None:
+        """Record a successful response (recovers the adaptive rate)"""
+        if self._rate_fraction < 1.0:
+            self._refill()
+            self._rate_fraction = min(1.0, self._rate_fraction + self.recovery_step)
+
+    def on_throttled(self, retry_after: Optional[float] = None) -> float:
+        """
+        Record a 429: pause the bucket and halve the effective rate
+
+        Args:
+            retry_after: Server-provided delay in seconds, if any
+
+        Returns:
+            Pause applied in seconds
+        """
+        self.throttled += 1
+        self._refill()
+        self._rate_fraction = max(self.min_rate_fraction, self._rate_fraction / 2)
+        delay = retry_after if retry_after is not None else 1.0 / self.rate
+        delay = min(self.max_backoff, max(0.0, delay))
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        self._tokens = 0.0
+        self._dispatch()
+        return delay
+
+    def get_stats(self) -> Dict[str, object]:
+        """Get queue depth, wait time and throttling metrics"""
+        self._refill()
+        depth = {name: 0 for name in PRIORITY_NAMES.values()}
+        for priority, _, _, future in self._waiters:
+            if not future.done():
+                depth[PRIORITY_NAMES.get(priority, "default")] += 1
+
+        lanes = {}
+        for name, stats in self.stats.items():
+            waited = stats["waited"]
+            lanes[name] = {
+                "acquired": int(stats["acquired"]),
+                "waited": int(waited),
+                "avg_wait_ms": round(stats["wait_ms_total"] / waited, 2) if waited else 0.0,
+                "max_wait_ms": round(stats["wait_ms_max"], 2),
+                "queue_depth": depth[name],
+            }
+        return {
+            "rate_per_minute": self.rate_per_minute,
+            "effective_rate_per_minute": round(self.rate * 60, 1),
+            "burst": self.capacity,
+            "tokens": round(self._tokens, 2),
+            "paused_for_s": round(max(0.0, self._paused_until - time.monotonic()), 2),
+            "queue_depth": sum(depth.values()),
+            "throttled": self.throttled,
+            "lanes": lanes,
+        }
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if now > self._updated:
+            start = max(self._updated, self._paused_until)
+            if now > start:
+                self._tokens = min(self.capacity, self._tokens + (now - start) * self.rate)
+            self._updated = now
+
+    def _take(self) -> bool:
+        self._refill()
+        if time.monotonic() < self._paused_until or self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def _dispatch(self) -> None:
+        """Grant tokens to queued waiters in priority order; schedule the next wakeup"""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+
+        while self._waiters:
+            future = self._waiters[0][3]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._take():
+                break
+            heapq.heappop(self._waiters)
+            future.set_result(None)
+
+        if self._waiters:
+            now = time.monotonic()
+            if now < self._paused_until:
+                delay = self._paused_until - now
+            else:
+                delay = max(0.0, (1 - self._tokens) / self.rate)
+            loop = self._waiters[0][3].get_loop()
+            self._wakeup = loop.call_later(delay, self._dispatch)
@@ -0,0 +1,117 @@
+"""
+Process-wide response cache for FMP API calls.
+
+Bounded LRU keyed by request (endpoint + version + params) with a TTL per
+entry and size-in-bytes accounting. Shared by every FMPClient handle in the
+process, so cached responses must be treated as read-only by callers.
+
+This package is also uploaded into sandboxes, so it only depends on the
+standard library.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class ResponseCache:
+    """Thread-safe LRU cache with per-entry TTL and a byte budget."""
+
+    def __init__(self, max_entries: int = 2048, max_bytes: int = 128 * 1024 * 1024):
+        """
+        Initialize response cache
+
+        Args:
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached responses (raw body bytes)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        # key -> (expires_at, size, data)
+        self._entries: "OrderedDict[str, Tuple[float, int, Any]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "sets": 0, "evictions": 0, "expirations": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Get a cached response, refreshing its LRU position
+
+        Returns:
+            Tuple of (found, data)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return False, None
+            if entry[0] <= time.monotonic():
+                self._remove(key)
+                self.stats["expirations"] += 1
+                self.stats["misses"] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return True, entry[2]
+
+    def set(self, key: str, data: Any, ttl: float, size: int) -> bool:
+        """
+        Store a response
+
+        Args:
+            key: Request key
+            data: Parsed response (shared with all readers)
+            ttl: Seconds the response stays fresh
+            size: Accounted size in bytes
+
+        Returns:
+            True if stored
+        """
+        if ttl <= 0 or size > self.max_bytes:
+            return False
+
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, size, data)
+            self._bytes += size
+            self.stats["sets"] += 1
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.stats["evictions"] += 1
+        return True
+
+    def delete_matching(self, substring: Optional[str] = None) -> int:
+        """Remove entries whose key contains substring (all entries if None)"""
+        with self._lock:
+            if substring is None:
+                count = len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+                return count
+            matched = [key for key in self._entries if substring in key]
+            for key in matched:
+                self._remove(key)
+            return len(matched)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss/eviction counters and current occupancy"""
+        total = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": round(self.stats["hits"] / total * 100, 2) if total else 0.0,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
@@ -29,6 +29,7 @@ from src.tools.market_data.tool import (
     get_company_overview,
     get_market_indices,
     get_sector_performance,
+    get_technical_indicators,
 )
 
 logger = structlog.get_logger(__name__)
@@ -109,6 +110,7 @@ class FlashAgent:
                 get_company_overview,
                 get_market_indices,
                 get_sector_performance,
+                get_technical_indicators,
             ]
         )
 
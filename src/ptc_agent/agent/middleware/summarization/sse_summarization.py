@@ -8,9 +8,11 @@ Based on LangChain's SummarizationMiddleware but modified to:
 This allows the frontend to distinguish summarization events from regular agent output.
 """
 
+import threading
 import uuid
 import warnings
 import logging
+from collections import OrderedDict
 from collections.abc import Callable, Iterable, Mapping
 from functools import partial
 from typing import Any, Literal, cast
@@ -19,6 +21,7 @@ import tiktoken
 
 from langchain_core.messages import (
     AnyMessage,
+    BaseMessage,
     MessageLikeRepresentation,
     RemoveMessage,
     ToolMessage,
@@ -231,22 +234,92 @@ def _extract_text_from_content(content: str | list) -> str:
     return " ".join(texts)
 
 
+# Per-message token counts, keyed by (message id, text length, text hash)
+_TOKEN_COUNT_CACHE_SIZE = 50_000
+
+# Below this many uncached messages, encode one by one (encode_batch starts a thread pool)
+_ENCODE_BATCH_MIN = 8
+
+
+class _MessageTokenCountCache:
+    """Bounded LRU of per-message token counts (thread-safe)."""
+
+    def __init__(self, maxsize: int = _TOKEN_COUNT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._counts: OrderedDict[tuple, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> int | None:
+        with self._lock:
+            count = self._counts.get(key)
+            if count is not None:
+                self._counts.move_to_end(key)
+            return count
+
+    def put_many(self, items: Iterable[tuple[tuple, int]]) -> None:
+        with self._lock:
+            for key, count in items:
+                self._counts[key] = count
+                self._counts.move_to_end(key)
+            while len(self._counts) > self.maxsize:
+                self._counts.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+_token_count_cache = _MessageTokenCountCache()
+
+
+def _message_text(msg: AnyMessage) -> str:
+    """Text counted for a message: content plus OpenAI reasoning (o1/o3 models)."""
+    # Extract from main content
+    text = _extract_text_from_content(msg.content)
+
+    # Also check additional_kwargs for OpenAI reasoning (o1/o3 models)
+    additional_kwargs = getattr(msg, "additional_kwargs", {}) or {}
+    reasoning = additional_kwargs.get("reasoning_content") or additional_kwargs.get("reasoning")
+    if reasoning:
+        reasoning_text = _extract_text_from_content(reasoning) if isinstance(reasoning, list) else str(reasoning)
+        text = f"{text} {reasoning_text}" if text else reasoning_text
+    return text
+
+
 def count_tokens_tiktoken(messages: Iterable[MessageLikeRepresentation]) -> int:
-    """Count tokens using tiktoken (accurate for all languages including CJK)."""
-    enc = _get_tiktoken_encoder()
+    """
+    Count tokens using tiktoken (accurate for all languages including CJK).
+
+    Per-message counts are cached by message id and text hash, so repeated
+    counts over a growing history only encode the new or changed messages
+    (batched with encode_batch when there are many).
+    """
+    messages = list(messages)
+    if not all(isinstance(msg, BaseMessage) for msg in messages):
+        messages = convert_to_messages(messages)
+
     total = 0
-    for msg in convert_to_messages(messages):
-        # Extract from main content
-        text = _extract_text_from_content(msg.content)
-
-        # Also check additional_kwargs for OpenAI reasoning (o1/o3 models)
-        additional_kwargs = getattr(msg, "additional_kwargs", {}) or {}
-        reasoning = additional_kwargs.get("reasoning_content") or additional_kwargs.get("reasoning")
-        if reasoning:
-            reasoning_text = _extract_text_from_content(reasoning) if isinstance(reasoning, list) else str(reasoning)
-            text = f"{text} {reasoning_text}" if text else reasoning_text
-
-        total += len(enc.encode(text)) + 3  # +3 for role/message overhead
+    missing_keys: list[tuple] = []
+    missing_texts: list[str] = []
+    for msg in messages:
+        text = _message_text(msg)
+        key = (msg.id, len(text), hash(text))
+        count = _token_count_cache.get(key)
+        if count is None:
+            missing_keys.append(key)
+            missing_texts.append(text)
+        else:
+            total += count
+
+    if missing_texts:
+        enc = _get_tiktoken_encoder()
+        if len(missing_texts) >= _ENCODE_BATCH_MIN:
+            encoded_lengths = [len(tokens) for tokens in enc.encode_batch(missing_texts)]
+        else:
+            encoded_lengths = [len(enc.encode(text)) for text in missing_texts]
+        counts = [length + 3 for length in encoded_lengths]  # +3 for role/message overhead
+        _token_count_cache.put_many(zip(missing_keys, counts))
+        total += sum(counts)
     return total
 
 
@@ -68,6 +68,11 @@ def create_execute_code_tool(sandbox: Any, mcp_registry: Any) -> BaseTool:
                     if files:
                         parts.append(f"Files created: {', '.join(files)}")
 
+                if getattr(result, "files_modified", None):
+                    parts.append(f"Files modified: {', '.join(result.files_modified)}")
+                if getattr(result, "files_deleted", None):
+                    parts.append(f"Files deleted: {', '.join(result.files_deleted)}")
+
                 # Upload images to cloud storage (if enabled via STORAGE_PROVIDER)
                 uploaded_images = []
 
@@ -1,7 +1,7 @@
 """Unified configuration package for Open PTC Agent.
 
 This package consolidates all configuration-related code:
-- core.py: Core infrastructure configs (Daytona, MCP, Filesystem, Security, Logging)
+- core.py: Core infrastructure configs (Daytona, Local sandbox, MCP, Filesystem, Security, Logging)
 - agent.py: Agent-specific configs (AgentConfig, LLMConfig, LLMDefinition)
 - loaders.py: File-based configuration loading
 - utils.py: Shared utilities for config parsing
@@ -35,6 +35,7 @@ from ptc_agent.config.core import (
     CoreConfig,
     DaytonaConfig,
     FilesystemConfig,
+    LocalSandboxConfig,
     LoggingConfig,
     MCPConfig,
     MCPServerConfig,
@@ -72,6 +73,7 @@ __all__ = [
     "FilesystemConfig",
     "LLMConfig",
     "LLMDefinition",
+    "LocalSandboxConfig",
     "LoggingConfig",
     "MCPConfig",
     "MCPServerConfig",
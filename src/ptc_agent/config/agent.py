@@ -17,6 +17,7 @@ from ptc_agent.config.core import (
     CoreConfig,
     DaytonaConfig,
     FilesystemConfig,
+    LocalSandboxConfig,
     LoggingConfig,
     MCPConfig,
     MCPServerConfig,
@@ -116,6 +117,7 @@ class AgentConfig(BaseModel):
     daytona: DaytonaConfig
     mcp: MCPConfig
     filesystem: FilesystemConfig
+    local_sandbox: LocalSandboxConfig = Field(default_factory=LocalSandboxConfig)
 
     # Skills configuration
     skills: SkillsConfig = Field(default_factory=SkillsConfig)
@@ -171,6 +173,11 @@ class AgentConfig(BaseModel):
             daytona_base_url: API URL (default: "https://app.daytona.io/api")
             python_version: Python version in sandbox (default: "3.12")
             auto_stop_interval: Seconds before auto-stop (default: 3600)
+            kernel_mode: Keep a warm Python kernel across executions (default: False)
+            kernel_memory_limit_mb: Kernel memory cap, 0 = unlimited (default: 0)
+
+        Optional - Local sandbox:
+            local_sandbox: LocalSandboxConfig(enabled=True) to run without Daytona
 
         Optional - MCP:
             mcp_servers: List[MCPServerConfig] for additional tools (default: [])
@@ -217,9 +224,12 @@ class AgentConfig(BaseModel):
         # Create LLM config (placeholder for file-based loading compatibility)
         llm_config = LLMConfig(name="custom")
 
+        # Create Local sandbox config (replaces Daytona when enabled)
+        local_sandbox_config = kwargs.pop("local_sandbox", None) or LocalSandboxConfig()
+
         # Create Daytona config with defaults
         api_key = daytona_api_key or os.getenv("DAYTONA_API_KEY", "")
-        if not api_key:
+        if not api_key and not local_sandbox_config.enabled:
             raise ValueError("DAYTONA_API_KEY must be provided or set in environment")
         daytona_config = DaytonaConfig(
             api_key=api_key,
@@ -231,6 +241,8 @@ class AgentConfig(BaseModel):
             snapshot_enabled=kwargs.pop("snapshot_enabled", True),
             snapshot_name=kwargs.pop("snapshot_name", None),
             snapshot_auto_create=kwargs.pop("snapshot_auto_create", True),
+            kernel_mode=kwargs.pop("kernel_mode", False),
+            kernel_memory_limit_mb=kwargs.pop("kernel_memory_limit_mb", 0),
         )
 
         # Create Security config with defaults
@@ -260,6 +272,7 @@ class AgentConfig(BaseModel):
             tool_discovery_enabled=kwargs.pop("tool_discovery_enabled", True),
             lazy_load=kwargs.pop("lazy_load", True),
             tool_exposure_mode=kwargs.pop("tool_exposure_mode", "summary"),
+            tool_sync_interval=kwargs.pop("tool_sync_interval", 300),
         )
 
         # Create Logging config
@@ -293,6 +306,7 @@ class AgentConfig(BaseModel):
             mcp=mcp_config,
             logging=logging_config,
             filesystem=filesystem_config,
+            local_sandbox=local_sandbox_config,
             skills=skills_config,
             enable_view_image=kwargs.pop("enable_view_image", True),
             subagents_enabled=kwargs.pop("subagents_enabled", ["general-purpose"]),
@@ -318,7 +332,7 @@ class AgentConfig(BaseModel):
         """
         missing_keys = []
 
-        if not self.daytona.api_key:
+        if not self.daytona.api_key and not self.local_sandbox.enabled:
             missing_keys.append("DAYTONA_API_KEY")
 
         if missing_keys:
@@ -361,6 +375,7 @@ class AgentConfig(BaseModel):
             mcp=self.mcp,
             logging=self.logging,
             filesystem=self.filesystem,
+            local_sandbox=self.local_sandbox,
         )
         core_config.config_file_dir = self.config_file_dir
         return core_config
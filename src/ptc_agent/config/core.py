@@ -2,6 +2,7 @@
 
 This module defines pure data classes for core configuration:
 - Daytona sandbox settings
+- Local sandbox backend settings
 - MCP server configurations
 - Filesystem access settings
 - Security settings
@@ -35,6 +36,25 @@ class DaytonaConfig(BaseModel):
     snapshot_name: str | None = None
     snapshot_auto_create: bool = True
 
+    # Warm Python kernel for execute(): keeps globals and imports across calls
+    kernel_mode: bool = False
+    kernel_memory_limit_mb: int = 0  # Address-space cap for the kernel process (0 = unlimited)
+
+
+class LocalSandboxConfig(BaseModel):
+    """Local-process sandbox backend (dev/CI, offline benchmarks).
+
+    When enabled, sessions use LocalSandbox instead of Daytona: each workspace
+    is a directory under root_dir and code runs in local subprocesses.
+    Not an isolation boundary - only use with trusted code.
+    """
+
+    enabled: bool = False
+    root_dir: str = "~/.ptc-agent/sandboxes"
+    python: str | None = None  # Interpreter for executions (default: current)
+    memory_limit_mb: int = 4096  # RLIMIT_AS per execution (0 = unlimited)
+    cpu_time_limit: int = 0  # RLIMIT_CPU seconds per execution (0 = unlimited)
+
 
 class SecurityConfig(BaseModel):
     """Security configuration for code execution.
@@ -85,6 +105,7 @@ class MCPConfig(BaseModel):
     lazy_load: bool = True
     cache_duration: int | None = None
     tool_exposure_mode: Literal["summary", "detailed"] = "summary"
+    tool_sync_interval: int = 300  # Seconds before an unchanged config is re-checked remotely (0 = always)
 
 
 class LoggingConfig(BaseModel):
@@ -123,6 +144,7 @@ class CoreConfig(BaseModel):
     mcp: MCPConfig
     logging: LoggingConfig
     filesystem: FilesystemConfig
+    local_sandbox: LocalSandboxConfig = Field(default_factory=LocalSandboxConfig)
     config_file_dir: Path | None = Field(default=None, exclude=True)
 
     def validate_api_keys(self) -> None:
@@ -133,7 +155,7 @@ class CoreConfig(BaseModel):
         """
         missing_keys = []
 
-        if not self.daytona.api_key:
+        if not self.daytona.api_key and not self.local_sandbox.enabled:
             missing_keys.append("DAYTONA_API_KEY")
 
         if missing_keys:
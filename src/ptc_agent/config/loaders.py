@@ -32,6 +32,7 @@ from ptc_agent.config.utils import (
     configure_logging,
     create_daytona_config,
     create_filesystem_config,
+    create_local_sandbox_config,
     create_logging_config,
     create_mcp_config,
     load_dotenv_async,
@@ -201,6 +202,7 @@ async def load_core_from_files(
     mcp_config = create_mcp_config(config_data["mcp"])
     logging_config = create_logging_config(config_data["logging"])
     filesystem_config = create_filesystem_config(config_data["filesystem"])
+    local_sandbox_config = create_local_sandbox_config(config_data.get("local_sandbox"))
 
     # Create config object
     core_config = CoreConfig(
@@ -209,6 +211,7 @@ async def load_core_from_files(
         mcp=mcp_config,
         logging=logging_config,
         filesystem=filesystem_config,
+        local_sandbox=local_sandbox_config,
     )
 
     # Store config file directory for path resolution
@@ -265,6 +268,7 @@ def load_from_dict(
     mcp_config = create_mcp_config(config_data["mcp"])
     logging_config = create_logging_config(config_data["logging"])
     filesystem_config = create_filesystem_config(config_data["filesystem"])
+    local_sandbox_config = create_local_sandbox_config(config_data.get("local_sandbox"))
 
     # Configure structlog to respect the log level from config
     configure_logging(logging_config.level)
@@ -305,6 +309,7 @@ def load_from_dict(
         daytona=daytona_config,
         mcp=mcp_config,
         filesystem=filesystem_config,
+        local_sandbox=local_sandbox_config,
         skills=skills_config,
         flash=flash_config,
         enable_view_image=enable_view_image,
@@ -17,6 +17,7 @@ if TYPE_CHECKING:
     from ptc_agent.config.core import (
         DaytonaConfig,
         FilesystemConfig,
+        LocalSandboxConfig,
         LoggingConfig,
         MCPConfig,
     )
@@ -122,6 +123,29 @@ def create_daytona_config(data: dict[str, Any]) -> DaytonaConfig:
         snapshot_enabled=data.get("snapshot_enabled", True),
         snapshot_name=data.get("snapshot_name"),
         snapshot_auto_create=data.get("snapshot_auto_create", True),
+        kernel_mode=data.get("kernel_mode", False),
+        kernel_memory_limit_mb=data.get("kernel_memory_limit_mb", 0),
+    )
+
+
+def create_local_sandbox_config(data: dict[str, Any] | None) -> LocalSandboxConfig:
+    """Create LocalSandboxConfig from config data dictionary.
+
+    Args:
+        data: Optional local_sandbox section from agent_config.yaml
+
+    Returns:
+        Configured LocalSandboxConfig object (disabled if section is missing)
+    """
+    from ptc_agent.config.core import LocalSandboxConfig
+
+    data = data or {}
+    return LocalSandboxConfig(
+        enabled=data.get("enabled", False),
+        root_dir=data.get("root_dir", "~/.ptc-agent/sandboxes"),
+        python=data.get("python"),
+        memory_limit_mb=data.get("memory_limit_mb", 4096),
+        cpu_time_limit=data.get("cpu_time_limit", 0),
     )
 
 
@@ -144,6 +168,7 @@ def create_mcp_config(data: dict[str, Any]) -> MCPConfig:
         lazy_load=data.get("lazy_load", True),
         cache_duration=data.get("cache_duration"),
         tool_exposure_mode=data.get("tool_exposure_mode", "summary"),
+        tool_sync_interval=data.get("tool_sync_interval", 300),
     )
 
 
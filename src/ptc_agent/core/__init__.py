@@ -5,6 +5,7 @@ where agents generate executable Python code to interact with MCP servers.
 
 This package provides the core infrastructure:
 - PTCSandbox: Daytona sandbox management
+- LocalSandbox: Local-process sandbox backend (dev/CI)
 - MCPRegistry: MCP server connections and tool discovery
 - ToolFunctionGenerator: Convert MCP schemas to Python functions
 - Session/SessionManager: Session lifecycle management
@@ -17,19 +18,22 @@ __version__ = "0.1.0"
 
 from ptc_agent.config.core import CoreConfig
 
+from .local_sandbox import LocalSandbox
 from .mcp_registry import MCPRegistry, MCPToolInfo
 from .sandbox import ChartData, ExecutionResult, PTCSandbox
-from .session import Session, SessionManager
+from .session import Session, SessionManager, create_sandbox
 from .tool_generator import ToolFunctionGenerator
 
 __all__ = [
     "ChartData",
     "CoreConfig",
     "ExecutionResult",
+    "LocalSandbox",
     "MCPRegistry",
     "MCPToolInfo",
     "PTCSandbox",
     "Session",
     "SessionManager",
     "ToolFunctionGenerator",
+    "create_sandbox",
 ]
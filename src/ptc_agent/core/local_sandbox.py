@@ -0,0 +1,673 @@
+"""Local Sandbox - PTCSandbox backend running in a local directory.
+
+Implements the PTCSandbox async API without Daytona: each sandbox is a
+directory under ``local_sandbox.root_dir`` and code runs in local subprocesses
+with resource limits. Intended for development, CI and measuring how much
+time goes to sandbox transport. It is not an isolation boundary.
+
+Paths keep the sandbox namespace: agents and tools still see
+``filesystem.working_directory`` (e.g. /home/daytona), which maps to the
+sandbox directory. Other allowed directories (e.g. /tmp) map to themselves.
+"""
+
+import asyncio
+import glob as globlib
+import hashlib
+import itertools
+import json
+import os
+import re
+import shutil
+import stat
+import sys
+import textwrap
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Callable
+
+import structlog
+
+from ptc_agent.config.core import CoreConfig
+
+from .mcp_registry import MCPRegistry
+from .sandbox import PTCSandbox, _RunOutput
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class LocalSandboxHandle:
+    """Stand-in for the Daytona SDK sandbox object."""
+
+    id: str
+    root: Path
+    state: str = "started"
+
+
+class LocalSandbox(PTCSandbox):
+    """PTCSandbox backed by a local directory and subprocesses."""
+
+    def __init__(
+        self, config: CoreConfig, mcp_registry: MCPRegistry | None = None
+    ) -> None:
+        """Initialize local sandbox.
+
+        Args:
+            config: Configuration object (uses config.local_sandbox)
+            mcp_registry: MCP registry with connected servers (can be None for reconnect)
+        """
+        super().__init__(config, mcp_registry)
+        self.base_dir = Path(config.local_sandbox.root_dir).expanduser().resolve()
+        self.root: Path | None = None
+
+    def _create_daytona_client(self) -> Any:
+        return None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def _attach(self, sandbox_id: str) -> None:
+        self.root = self.base_dir / sandbox_id
+        self.sandbox_id = sandbox_id
+        self.sandbox = LocalSandboxHandle(id=sandbox_id, root=self.root)
+        self._work_dir = str(self.root)
+        self.mcp_server_sessions: dict[str, Any] = {}
+
+    async def setup_sandbox_workspace(self) -> str | None:
+        """Create the sandbox directory and workspace structure.
+
+        Returns:
+            None (local sandboxes have no snapshots)
+        """
+        self._attach(f"local-{uuid.uuid4().hex[:12]}")
+        await self._setup_workspace()
+        logger.info("Local sandbox created", sandbox_id=self.sandbox_id, root=str(self.root))
+        return None
+
+    async def _setup_workspace(self) -> None:
+        """Create workspace directory structure."""
+        assert self.root is not None
+        root = self.root
+
+        def create() -> None:
+            for directory in ("tools/docs", "results", "data", "code", "mcp_servers"):
+                (root / directory).mkdir(parents=True, exist_ok=True)
+
+        await asyncio.to_thread(create)
+
+    async def setup_tools_and_mcp(self, snapshot_name: str | None) -> None:
+        """Write MCP server files and generated tool modules into the sandbox."""
+        fingerprint = self._compute_tool_sync_fingerprint()
+        await self._upload_mcp_server_files()
+        await self._install_tool_modules()
+        await self._start_internal_mcp_servers()
+        self._mark_tool_sync(fingerprint)
+        logger.info("Tools and MCP servers ready", sandbox_id=self.sandbox_id)
+
+    async def ensure_sandbox_ready(self) -> None:
+        if self.root is None or not self.root.is_dir():
+            raise RuntimeError(f"Local sandbox directory missing: {self.root}")
+
+    async def reconnect(self, sandbox_id: str) -> None:
+        """Attach to an existing local sandbox directory.
+
+        Raises:
+            RuntimeError: If the sandbox directory does not exist
+        """
+        root = self.base_dir / sandbox_id
+        if not root.is_dir():
+            raise RuntimeError(
+                f"Failed to find sandbox {sandbox_id}. It may have been deleted."
+            )
+        self.invalidate_tool_sync()
+        self._attach(sandbox_id)
+        await self._start_internal_mcp_servers()
+        logger.info("Attached to local sandbox", sandbox_id=sandbox_id)
+
+    async def stop_sandbox(self) -> None:
+        """No-op: local sandboxes have nothing running between executions."""
+
+    async def cleanup(self) -> None:
+        """Delete the sandbox directory."""
+        logger.info("Cleaning up local sandbox", sandbox_id=self.sandbox_id)
+        if self.root is not None:
+            await asyncio.to_thread(shutil.rmtree, self.root, True)
+        self.root = None
+        self.sandbox = None
+        self.sandbox_id = None
+
+    async def sync_tools(self) -> dict[str, Any]:
+        """Rewrite tool files when the local tool config changed."""
+        await self._wait_ready()
+
+        fingerprint = self._compute_tool_sync_fingerprint()
+        if fingerprint == self._tool_sync_fingerprint:
+            return {"success": True, "refreshed": False, "skipped": True}
+        return {**await self.refresh_tools(), "refreshed": True}
+
+    async def refresh_tools(self) -> dict[str, Any]:
+        """Rewrite MCP server files and tool modules."""
+        await self._wait_ready()
+
+        async with self._tool_refresh_lock:
+            fingerprint = self._compute_tool_sync_fingerprint()
+            await self._upload_mcp_server_files(force_refresh=True)
+            await self._install_tool_modules()
+            self._mark_tool_sync(fingerprint)
+        return {"success": True}
+
+    async def _upload_mcp_server_files(self, *, force_refresh: bool = False) -> bool:
+        """Copy local Python MCP server files into {root}/mcp_servers."""
+        assert self.root is not None
+        target_dir = self.root / "mcp_servers"
+        files = self._resolve_mcp_server_files()
+
+        def copy() -> None:
+            target_dir.mkdir(parents=True, exist_ok=True)
+            for _server_name, local_path in files:
+                shutil.copy2(local_path, target_dir / Path(local_path).name)
+
+        await asyncio.to_thread(copy)
+        return True
+
+    async def _install_tool_modules(self) -> None:
+        """Write generated tool modules and docs into {root}/tools."""
+        assert self.root is not None
+        files = self._build_tool_module_files(str(self.root))
+
+        def write() -> None:
+            for content, path, _log_info in files:
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+                Path(path).write_bytes(content)
+
+        await asyncio.to_thread(write)
+        logger.info("Tool modules installation complete", files=len(files))
+
+    async def sync_skills(
+        self,
+        local_skills_dirs: list[tuple[str, str]],
+        *,
+        reusing_sandbox: bool,
+        force_refresh: bool = False,
+        on_progress: Callable[[str], None] | None = None,
+    ) -> bool:
+        """Copy skills into the sandbox when the local manifest changed.
+
+        Returns:
+            True if skills were copied.
+        """
+        await self._wait_ready()
+
+        local_roots = [local_dir for local_dir, _ in local_skills_dirs]
+        local_manifest = await self._compute_skills_manifest(local_roots)
+        target_base = self._host_path(local_skills_dirs[-1][1].rstrip("/"))
+        manifest_path = target_base / self.SKILLS_MANIFEST_FILENAME
+
+        if not force_refresh and manifest_path.exists():
+            try:
+                existing = json.loads(await asyncio.to_thread(manifest_path.read_text))
+            except (OSError, ValueError):
+                existing = {}
+            if existing.get("version") == local_manifest.get("version"):
+                return False
+        if not local_manifest.get("files"):
+            return False
+
+        if on_progress:
+            on_progress("Copying skills...")
+
+        def copy() -> None:
+            shutil.rmtree(target_base, ignore_errors=True)
+            target_base.mkdir(parents=True, exist_ok=True)
+            for local_dir, _ in local_skills_dirs:
+                source = Path(local_dir).expanduser()
+                if source.is_dir():
+                    shutil.copytree(source, target_base, dirs_exist_ok=True)
+            manifest_path.write_text(json.dumps(local_manifest))
+
+        await asyncio.to_thread(copy)
+        return True
+
+    # ------------------------------------------------------------------
+    # Path mapping
+    # ------------------------------------------------------------------
+
+    def _host_path(self, path: str) -> Path:
+        """Map a sandbox path (virtual, relative or absolute) to a host path."""
+        assert self.root is not None
+        if path.startswith(str(self.root)):
+            return Path(path)
+        normalized = self.normalize_path(path)
+        work_dir = self.config.filesystem.working_directory
+        if normalized == work_dir:
+            return self.root
+        if normalized.startswith(work_dir + "/"):
+            return self.root / normalized[len(work_dir) + 1 :]
+        return Path(normalized)
+
+    def _sandbox_path(self, host_path: str) -> str:
+        """Map a host path back into the sandbox namespace."""
+        root = str(self.root)
+        if host_path == root:
+            return self.config.filesystem.working_directory
+        if host_path.startswith(root + "/"):
+            return self.config.filesystem.working_directory + host_path[len(root) :]
+        return host_path
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def _build_exec_env(self, work_dir: str) -> dict[str, str]:
+        exec_env = {**os.environ, **super()._build_exec_env(work_dir)}
+        # Expose the repo's src package directly instead of copying it to _internal
+        repo_root = getattr(self.config, "config_file_dir", None) or Path.cwd()
+        exec_env["PYTHONPATH"] = f"{exec_env['PYTHONPATH']}:{repo_root}"
+        exec_env["MPLBACKEND"] = "Agg"
+        return exec_env
+
+    def _set_limits(self) -> None:
+        """Apply resource limits in the child process (runs before exec)."""
+        try:
+            import resource
+        except ImportError:  # Non-POSIX platform
+            return
+        limits = self.config.local_sandbox
+        if limits.memory_limit_mb > 0:
+            memory = limits.memory_limit_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+        if limits.cpu_time_limit > 0:
+            resource.setrlimit(
+                resource.RLIMIT_CPU, (limits.cpu_time_limit, limits.cpu_time_limit)
+            )
+
+    async def _run_subprocess(
+        self, argv: list[str], cwd: Path, env: dict[str, str], timeout: int
+    ) -> tuple[int, str, str]:
+        """Run a command with resource limits; kill its process group on timeout.
+
+        Returns:
+            (exit_code, stdout, stderr); exit code 124 on timeout
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            cwd=str(cwd),
+            env=env,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
+            preexec_fn=self._set_limits if os.name == "posix" else None,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except TimeoutError:
+            try:
+                os.killpg(proc.pid, 9)
+            except ProcessLookupError:
+                pass
+            stdout, stderr = await proc.communicate()
+            message = f"Execution timed out after {timeout} seconds"
+            return 124, stdout.decode(errors="replace"), f"{stderr.decode(errors='replace')}{message}"
+        return (
+            proc.returncode if proc.returncode is not None else 1,
+            stdout.decode(errors="replace"),
+            stderr.decode(errors="replace"),
+        )
+
+    async def _run_in_process(
+        self,
+        code: str,
+        code_path: str,
+        exec_env: dict[str, str],
+        work_dir: str,
+        timeout: int,
+    ) -> _RunOutput:
+        """Run code in a local interpreter inside the execution envelope."""
+        script = self._envelope_call(
+            code, code_path, work_dir, kernel=False, collect_charts=True
+        )
+        python = self.config.local_sandbox.python or sys.executable
+        exit_code, stdout, stderr = await self._run_subprocess(
+            [python, "-c", script], Path(work_dir), exec_env, timeout
+        )
+        return self._parse_envelope(stdout, stderr, exit_code == 0)
+
+    async def _run_in_kernel(
+        self,
+        code: str,
+        code_path: str,
+        exec_env: dict[str, str],
+        work_dir: str,
+        timeout: int,
+    ) -> _RunOutput:
+        """Warm kernels are Daytona-only; run in a fresh local interpreter."""
+        return await self._run_in_process(code, code_path, exec_env, work_dir, timeout)
+
+    async def restart_kernel(self) -> None:
+        """No-op: local executions always use a fresh interpreter."""
+
+    async def _install_package(self, package: str) -> bool:
+        python = self.config.local_sandbox.python or sys.executable
+        logger.info(f"Auto-installing missing package: {package}")
+        exit_code, _, stderr = await self._run_subprocess(
+            [python, "-m", "pip", "install", "-q", package],
+            self.root or Path.cwd(),
+            dict(os.environ),
+            300,
+        )
+        if exit_code != 0:
+            logger.warning(f"Failed to install package: {package}", stderr=stderr[-500:])
+        return exit_code == 0
+
+    async def execute_bash_command(
+        self,
+        command: str,
+        working_dir: str = "/home/daytona",
+        timeout: int = 60,
+        *,
+        background: bool = False,
+    ) -> dict[str, Any]:
+        """Execute a bash command in the sandbox directory.
+
+        Returns:
+            Dictionary with success, stdout, stderr, exit_code, bash_id, command_hash
+        """
+        await self._wait_ready()
+
+        self.bash_execution_count += 1
+        bash_id = f"bash_{self.bash_execution_count:04d}"
+        command_hash = hashlib.sha256(command.encode()).hexdigest()[:16]
+        cwd = self._host_path(working_dir)
+
+        # Keep the same code/ log as the Daytona backend
+        assert self.root is not None
+        script = textwrap.dedent(f"""\
+            #!/bin/bash
+            # Bash Execution Log
+            # ID: {bash_id}
+            # Working Directory: {working_dir}
+            # Timestamp: {datetime.now(tz=UTC).isoformat()}
+            # Command Hash: {command_hash}
+
+            """) + command + "\n"
+        script_path = self.root / "code" / f"{bash_id}.sh"
+        await asyncio.to_thread(script_path.write_text, script)
+
+        logger.info(
+            "Executing bash command",
+            bash_id=bash_id,
+            command_hash=command_hash,
+            command=command[:100],
+            working_dir=working_dir,
+        )
+        try:
+            exit_code, stdout, stderr = await self._run_subprocess(
+                ["bash", "-c", command],
+                cwd,
+                self._build_exec_env(str(self.root)),
+                timeout,
+            )
+        except OSError as e:
+            return {
+                "success": False,
+                "stdout": "",
+                "stderr": f"Exception during bash execution: {e!s}",
+                "exit_code": -1,
+                "bash_id": bash_id,
+                "command_hash": command_hash,
+            }
+        return {
+            "success": exit_code == 0,
+            "stdout": stdout,
+            "stderr": stderr if exit_code == 0 else (stderr or stdout),
+            "exit_code": exit_code,
+            "bash_id": bash_id,
+            "command_hash": command_hash,
+        }
+
+    async def _list_result_files(self) -> list[str]:
+        assert self.root is not None
+        results_dir = self.root / "results"
+        if not results_dir.is_dir():
+            return []
+        return [f"results/{entry.name}" for entry in results_dir.iterdir()]
+
+    # ------------------------------------------------------------------
+    # Filesystem
+    # ------------------------------------------------------------------
+
+    async def adownload_file_bytes(self, filepath: str) -> bytes | None:
+        await self._wait_ready()
+        try:
+            return await asyncio.to_thread(self._host_path(filepath).read_bytes)
+        except OSError as e:
+            logger.debug("Failed to read file bytes", filepath=filepath, error=str(e))
+            return None
+
+    async def aread_file_range_bytes(
+        self, file_path: str, offset: int = 0, limit: int = 2000
+    ) -> bytes | None:
+        await self._wait_ready()
+
+        def read_lines() -> bytes:
+            with self._host_path(file_path).open("rb") as f:
+                return b"".join(
+                    itertools.islice(f, max(0, offset), max(0, offset) + max(0, limit))
+                )
+
+        try:
+            return await asyncio.to_thread(read_lines)
+        except OSError as e:
+            logger.debug("Failed to read file range", filepath=file_path, error=str(e))
+            return None
+
+    async def aread_bytes_range(
+        self, filepath: str, start: int, length: int
+    ) -> bytes | None:
+        await self._wait_ready()
+
+        def read_range() -> bytes:
+            with self._host_path(filepath).open("rb") as f:
+                f.seek(max(0, start))
+                return f.read(max(0, length))
+
+        try:
+            return await asyncio.to_thread(read_range)
+        except OSError as e:
+            logger.debug("Failed to read byte range", filepath=filepath, error=str(e))
+            return None
+
+    async def astat_file(self, filepath: str) -> dict[str, Any] | None:
+        await self._wait_ready()
+        try:
+            st = await asyncio.to_thread(self._host_path(filepath).stat)
+        except OSError:
+            return None
+        return {"size": st.st_size, "is_dir": stat.S_ISDIR(st.st_mode)}
+
+    async def aupload_file_bytes(self, filepath: str, content: bytes) -> bool:
+        await self._wait_ready()
+
+        normalized_path = self.normalize_path(filepath)
+        if self.config.filesystem.enable_path_validation and not self.validate_path(
+            normalized_path
+        ):
+            logger.error(f"Access denied: {filepath} is not in allowed directories")
+            return False
+
+        target = self._host_path(normalized_path)
+
+        def write() -> None:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(content)
+
+        try:
+            await asyncio.to_thread(write)
+            return True
+        except OSError as e:
+            logger.debug("Failed to write file bytes", filepath=filepath, error=str(e))
+            return False
+
+    async def als_directory(self, directory: str = ".") -> list[dict[str, Any]]:
+        await self._wait_ready()
+
+        if self.config.filesystem.enable_path_validation and not self.validate_path(
+            directory
+        ):
+            logger.error(f"Access denied: {directory} is not in allowed directories")
+            return []
+
+        host_dir = self._host_path(directory)
+
+        def list_entries() -> list[dict[str, Any]]:
+            return [
+                {
+                    "name": entry.name,
+                    "path": f"{directory}/{entry.name}" if directory != "." else entry.name,
+                    "is_dir": entry.is_dir(),
+                }
+                for entry in host_dir.iterdir()
+            ]
+
+        try:
+            return await asyncio.to_thread(list_entries)
+        except OSError as e:
+            logger.debug("Error listing directory", directory=directory, error=str(e))
+            return []
+
+    async def acreate_directory(self, dirpath: str) -> bool:
+        await self._wait_ready()
+
+        if self.config.filesystem.enable_path_validation and not self.validate_path(
+            dirpath
+        ):
+            logger.error(f"Access denied: {dirpath} is not in allowed directories")
+            return False
+        try:
+            await asyncio.to_thread(
+                self._host_path(dirpath).mkdir, parents=True, exist_ok=True
+            )
+            return True
+        except OSError as e:
+            logger.debug("Failed to create directory", dirpath=dirpath, error=str(e))
+            return False
+
+    async def aglob_files(
+        self, pattern: str, path: str = ".", *, allow_denied: bool = False
+    ) -> list[str]:
+        await self._wait_ready()
+
+        if self.config.filesystem.enable_path_validation:
+            is_allowed = (
+                self._validate_path_allow_denied(path)
+                if allow_denied
+                else self.validate_path(path)
+            )
+            if not is_allowed:
+                logger.error(f"Access denied: {path} is not in allowed directories")
+                return []
+
+        search_path = self._host_path(self._normalize_search_path(path))
+        if "**" not in pattern and "/" not in pattern:
+            pattern = f"**/{pattern}"
+
+        def run_glob() -> list[str]:
+            matches = globlib.glob(
+                os.path.join(search_path, pattern), recursive=True, include_hidden=True
+            )
+            files = []
+            for match in matches:
+                try:
+                    if os.path.isfile(match):
+                        files.append((match, os.path.getmtime(match)))
+                except OSError:
+                    continue
+            files.sort(key=lambda item: item[1], reverse=True)
+            return [self._sandbox_path(f) for f, _ in files]
+
+        return await asyncio.to_thread(run_glob)
+
+    async def agrep_content(
+        self,
+        pattern: str,
+        path: str = ".",
+        output_mode: str = "files_with_matches",
+        glob: str | None = None,
+        type: str | None = None,  # noqa: A002 - matches ripgrep's --type flag
+        *,
+        case_insensitive: bool = False,
+        show_line_numbers: bool = True,
+        lines_after: int | None = None,
+        lines_before: int | None = None,
+        lines_context: int | None = None,
+        multiline: bool = False,
+        head_limit: int | None = None,
+        offset: int = 0,
+    ) -> Any:
+        """Ripgrep over the sandbox directory; output paths are sandbox paths."""
+        await self._wait_ready()
+
+        if self.config.filesystem.enable_path_validation and not self.validate_path(
+            path
+        ):
+            logger.error(f"Access denied: {path} is not in allowed directories")
+            return []
+
+        search_path = str(self._host_path(self._normalize_search_path(path)))
+        if shutil.which("rg") is not None:
+            cmd = self._build_rg_command(
+                pattern,
+                search_path,
+                output_mode,
+                glob,
+                type,
+                case_insensitive=case_insensitive,
+                show_line_numbers=show_line_numbers,
+                lines_after=lines_after,
+                lines_before=lines_before,
+                lines_context=lines_context,
+                multiline=multiline,
+            )
+        else:
+            # GNU grep fallback (no --type or multiline support)
+            cmd = ["grep", "-rE"]
+            if output_mode == "files_with_matches":
+                cmd.append("-l")
+            elif output_mode == "count":
+                cmd.append("-c")
+            if case_insensitive:
+                cmd.append("-i")
+            if output_mode == "content" and show_line_numbers:
+                cmd.append("-n")
+            for flag, value in (
+                ("-B", lines_before),
+                ("-A", lines_after),
+                ("-C", lines_context),
+            ):
+                if value:
+                    cmd.extend([flag, str(value)])
+            if glob:
+                cmd.append(f"--include={glob}")
+            cmd.extend(["--", pattern, search_path])
+        try:
+            _, stdout, _ = await self._run_subprocess(
+                cmd, self.root or Path.cwd(), dict(os.environ), 60
+            )
+        except OSError as e:
+            logger.debug("Local grep failed", pattern=pattern, path=path, error=str(e))
+            return []
+
+        # Rewrite host paths at line starts back into the sandbox namespace
+        root = re.escape(str(self.root))
+        work_dir = self.config.filesystem.working_directory.replace("\\", "\\\\")
+        output = re.sub(rf"(?m)^{root}(?=/|$)", work_dir, stdout.strip())
+        if output_mode == "count":
+            # grep -c also lists files without matches
+            output = "\n".join(
+                line for line in output.split("\n") if not line.endswith(":0")
+            )
+        return self._parse_grep_output(output, output_mode, head_limit, offset)
+
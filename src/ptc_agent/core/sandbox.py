@@ -7,7 +7,7 @@ import json
 import shlex
 import textwrap
 import time
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -67,11 +67,123 @@ class ExecutionResult:
     execution_id: str
     code_hash: str
     charts: list[ChartData] = field(default_factory=list)
+    files_deleted: list[str] = field(default_factory=list)
+
+
+# Runs inside the sandbox around user code (see PTCSandbox._envelope_call).
+# Writes the code to code/, snapshots tracked directories before and after,
+# and prints one marker line carrying exit code, error, charts and file
+# changes, so execute() needs a single sandbox call.
+_EXECUTION_ENVELOPE = r'''
+def __ptc_snapshot(work_dir, tracked_dirs, limit=5000):
+    import os
+    snapshot = {}
+    for rel_dir in tracked_dirs:
+        for dirpath, _dirnames, filenames in os.walk(os.path.join(work_dir, rel_dir)):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                snapshot[os.path.relpath(path, work_dir)] = (st.st_mtime_ns, st.st_size)
+                if len(snapshot) >= limit:
+                    return snapshot
+    return snapshot
+
+
+def __ptc_collect_charts():
+    import sys
+    plt = sys.modules.get("matplotlib.pyplot")
+    if plt is None or not plt.get_fignums():
+        return []
+    import base64, io
+    charts = []
+    for num in plt.get_fignums():
+        fig = plt.figure(num)
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", bbox_inches="tight")
+        title = fig._suptitle.get_text() if fig._suptitle else ""
+        if not title and fig.axes:
+            title = fig.axes[0].get_title()
+        charts.append({"title": title, "png": base64.b64encode(buf.getvalue()).decode("ascii")})
+    plt.close("all")
+    return charts
+
+
+def __ptc_execute(code_b64, code_path, work_dir, tracked_dirs, namespace, collect_charts, marker):
+    import base64, json, os, sys, traceback
+    code = base64.b64decode(code_b64).decode("utf-8")
+    path = os.path.join(work_dir, code_path)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(code)
+    except OSError:
+        pass
+
+    if namespace is None:
+        namespace = {"__name__": "__main__", "__file__": path, "__builtins__": __builtins__}
+    before = __ptc_snapshot(work_dir, tracked_dirs)
+    exit_code, error = 0, None
+    try:
+        exec(compile(code, path, "exec"), namespace)
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            exit_code = e.code
+        elif e.code is not None:
+            print(e.code, file=sys.stderr)
+            exit_code = 1
+    except BaseException as e:
+        traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+        exit_code, error = 1, {"name": type(e).__name__, "value": str(e)}
+
+    charts = []
+    if collect_charts:
+        try:
+            charts = __ptc_collect_charts()
+        except Exception as e:
+            print(f"Failed to capture charts: {e}", file=sys.stderr)
+    after = __ptc_snapshot(work_dir, tracked_dirs)
+    payload = {
+        "exit_code": exit_code,
+        "error": error,
+        "charts": charts,
+        "created": sorted(p for p in after if p not in before),
+        "modified": sorted(p for p in after if p in before and after[p] != before[p]),
+        "deleted": sorted(p for p in before if p not in after),
+    }
+    sys.stderr.flush()
+    print("\n" + marker + json.dumps(payload), flush=True)
+    return exit_code
+'''
+
+
+@dataclass
+class _RunOutput:
+    """Outcome of one enveloped execution."""
+
+    stdout: str
+    stderr: str
+    success: bool
+    charts: list[ChartData] = field(default_factory=list)
+    files_created: list[str] = field(default_factory=list)
+    files_modified: list[str] = field(default_factory=list)
+    files_deleted: list[str] = field(default_factory=list)
 
 
 class PTCSandbox:
     """Manages Daytona sandbox for Programmatic Tool Calling (PTC) execution."""
 
+    # Workspace directories whose file changes execute() reports
+    EXECUTION_TRACKED_DIRS = ("results", "data")
+
+    # Bytes fetched per sandbox round trip by aiter_file_bytes
+    DOWNLOAD_CHUNK_BYTES = 2 * 1024 * 1024
+
+    # Prefix of the stdout line carrying the execution envelope payload
+    _ENVELOPE_MARKER = "__PTC_EXECUTION_RESULT__:"
+
     SNAPSHOT_PYTHON_VERSION = (
         "3.12"  # Intentionally pinned for stability/compatibility.
     )
@@ -107,11 +219,7 @@ class PTCSandbox:
         self.config = config
         self.mcp_registry = mcp_registry
 
-        # Initialize Daytona with proper config
-        daytona_config = DaytonaConfig(
-            api_key=config.daytona.api_key, api_url=config.daytona.base_url
-        )
-        self.daytona_client = AsyncDaytona(daytona_config)
+        self.daytona_client = self._create_daytona_client()
 
         # External Daytona SDK sandbox object - Any type is required since it's from external SDK
         self.sandbox: Any | None = None
@@ -124,6 +232,17 @@ class PTCSandbox:
         self._tool_refresh_lock = asyncio.Lock()
         self._reconnect_inflight: asyncio.Future[None] | None = None
 
+        # Tool sync throttling: fingerprint of the local tool config last
+        # synced to this sandbox, and when the sandbox was last checked
+        self._tool_sync_fingerprint: str | None = None
+        self._tool_sync_checked_at: float = 0.0
+
+        # Warm Python kernel (daytona.kernel_mode): interpreter context reused
+        # across execute() calls; executions in it are serialized
+        self._kernel_context: Any | None = None
+        self._kernel_lock = asyncio.Lock()
+        self._kernel_execution_count = 0
+
         # Lazy initialization support
         self._ready_event: asyncio.Event | None = None
         self._init_task: asyncio.Task[None] | None = None
@@ -131,6 +250,13 @@ class PTCSandbox:
 
         logger.info("Initialized PTCSandbox")
 
+    def _create_daytona_client(self) -> Any:
+        """Create the Daytona API client (overridden by non-Daytona backends)."""
+        daytona_config = DaytonaConfig(
+            api_key=self.config.daytona.api_key, api_url=self.config.daytona.base_url
+        )
+        return AsyncDaytona(daytona_config)
+
     async def _wait_ready(self) -> None:
         """Wait for sandbox to be ready. Call at start of methods needing sandbox."""
         if self._ready_event is None:
@@ -485,6 +611,7 @@ class PTCSandbox:
             snapshot_name: Snapshot name from setup_sandbox_workspace(), or None
         """
         logger.info("Setting up tools and MCP servers")
+        fingerprint = self._compute_tool_sync_fingerprint()
 
         # Upload custom Python MCP server files to sandbox
         await self._upload_mcp_server_files()
@@ -505,6 +632,7 @@ class PTCSandbox:
                 "MCP tools will not work without snapshot."
             )
 
+        self._mark_tool_sync(fingerprint)
         logger.info("Tools and MCP servers ready", sandbox_id=self.sandbox_id)
 
     async def ensure_sandbox_ready(self) -> None:
@@ -516,6 +644,43 @@ class PTCSandbox:
         )
         self._work_dir = work_dir
 
+    def _compute_tool_sync_fingerprint(self) -> str:
+        """Hash the local inputs of tool sync (no sandbox calls).
+
+        Covers the MCP config (servers, exposure modes) and the size/mtime of
+        local Python MCP server files, so edits to either change the result.
+        """
+        parts: list[Any] = [self.config.mcp.model_dump(mode="json")]
+        for server_name, local_path in self._resolve_mcp_server_files(
+            log_missing=False
+        ):
+            try:
+                stat = Path(local_path).stat()
+                parts.append([server_name, local_path, stat.st_size, stat.st_mtime_ns])
+            except OSError:
+                parts.append([server_name, local_path, None, None])
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _tool_sync_is_current(self, fingerprint: str) -> bool:
+        if fingerprint != self._tool_sync_fingerprint:
+            return False
+        interval = self.config.mcp.tool_sync_interval
+        return interval > 0 and time.monotonic() - self._tool_sync_checked_at < interval
+
+    def _mark_tool_sync(self, fingerprint: str) -> None:
+        self._tool_sync_fingerprint = fingerprint
+        self._tool_sync_checked_at = time.monotonic()
+
+    def invalidate_tool_sync(self) -> None:
+        """Force the next sync_tools() call to check the sandbox.
+
+        Call after changing MCP/tool config at runtime, or when the sandbox
+        may have been modified outside this process.
+        """
+        self._tool_sync_fingerprint = None
+        self._tool_sync_checked_at = 0.0
+
     async def refresh_tools(self) -> dict[str, Any]:
         """Rebuild sandbox tool modules and upload internal packages.
 
@@ -524,6 +689,7 @@ class PTCSandbox:
         await self._wait_ready()
 
         async with self._tool_refresh_lock:
+            fingerprint = self._compute_tool_sync_fingerprint()
             await self.ensure_sandbox_ready()
             await self._prune_disabled_tool_modules()
             await self._upload_mcp_server_files(force_refresh=True)
@@ -533,18 +699,33 @@ class PTCSandbox:
                 await self._start_internal_mcp_servers()
             except Exception as e:
                 logger.warning("Failed to refresh MCP servers", error=str(e))
+            self._mark_tool_sync(fingerprint)
 
         return {"success": True}
 
     async def sync_tools(self) -> dict[str, Any]:
-        """Refresh tool modules if MCP config changed."""
+        """Refresh tool modules if MCP config changed.
+
+        When the local tool config fingerprint matches the last sync and
+        ``mcp.tool_sync_interval`` has not elapsed, returns without any
+        sandbox calls.
+        """
         await self._wait_ready()
 
+        fingerprint = self._compute_tool_sync_fingerprint()
+        if self._tool_sync_is_current(fingerprint):
+            return {"success": True, "refreshed": False, "skipped": True}
+
         async with self._tool_refresh_lock:
+            # Another caller may have synced while we waited for the lock
+            if self._tool_sync_is_current(fingerprint):
+                return {"success": True, "refreshed": False, "skipped": True}
+
             await self.ensure_sandbox_ready()
             await self._prune_disabled_tool_modules()
             changed = await self._upload_mcp_server_files(force_refresh=False)
             if not changed:
+                self._mark_tool_sync(fingerprint)
                 return {"success": True, "refreshed": False}
 
             await self._upload_internal_packages()
@@ -553,6 +734,7 @@ class PTCSandbox:
                 await self._start_internal_mcp_servers()
             except Exception as e:
                 logger.warning("Failed to refresh MCP servers", error=str(e))
+            self._mark_tool_sync(fingerprint)
 
         return {"success": True, "refreshed": True}
 
@@ -581,6 +763,11 @@ class PTCSandbox:
         """
         logger.info("Reconnecting to stopped sandbox", sandbox_id=sandbox_id)
 
+        # Tool files were skipped on reconnect; verify them on next sync_tools()
+        self.invalidate_tool_sync()
+        # Interpreter contexts do not survive a sandbox restart
+        self._kernel_context = None
+
         # Get the existing sandbox from Daytona with error handling
         try:
             self.sandbox = await self._daytona_call(
@@ -673,6 +860,7 @@ class PTCSandbox:
 
         try:
             logger.info("Stopping sandbox", sandbox_id=self.sandbox_id)
+            self._kernel_context = None
             await self._daytona_call(
                 self.sandbox.stop,
                 timeout=60,
@@ -818,22 +1006,22 @@ class PTCSandbox:
         manifest_path = f"{mcp_servers_dir}/.mcp_manifest.json"
         await self.awrite_file_text(manifest_path, json.dumps(manifest))
 
-    async def _upload_mcp_server_files(self, *, force_refresh: bool = False) -> bool:
-        """Upload custom Python MCP server files to sandbox.
+    def _resolve_mcp_server_files(
+        self, *, log_missing: bool = True
+    ) -> list[tuple[str, str]]:
+        """Resolve local files of enabled Python MCP servers.
 
-        For Python MCP servers configured with 'uv run python mcp_servers/xxx.py',
-        this method uploads the Python files to the sandbox so they can be executed
-        as subprocesses inside the sandbox environment.
+        Handles servers configured as 'uv run python mcp_servers/xxx.py'.
+        Relative paths are resolved against the config file directory first,
+        then the current working directory.
+
+        Args:
+            log_missing: Log a warning for files that cannot be found
 
         Returns:
-            True if MCP files were refreshed.
+            List of (server_name, resolved_local_path)
         """
-        work_dir = getattr(self, "_work_dir", "/home/daytona")
-        mcp_servers_dir = f"{work_dir}/mcp_servers"
-
-        # Collect files to upload
-        files_to_upload = []
-        expected_files: set[str] = set()
+        resolved: list[tuple[str, str]] = []
 
         # Get config file directory
         config_dir = getattr(self.config, "config_file_dir", None)
@@ -873,13 +1061,8 @@ class PTCSandbox:
                         resolved_path = local_path
 
                     if resolved_path:
-                        filename = Path(resolved_path).name
-                        sandbox_path = f"{mcp_servers_dir}/{filename}"
-                        expected_files.add(filename)
-                        files_to_upload.append(
-                            (server.name, resolved_path, sandbox_path)
-                        )
-                    else:
+                        resolved.append((server.name, resolved_path))
+                    elif log_missing:
                         searched_paths = [local_path]
                         if config_dir:
                             searched_paths.append(str(config_dir / local_path))
@@ -889,6 +1072,31 @@ class PTCSandbox:
                             searched_paths=searched_paths,
                         )
 
+        return resolved
+
+    async def _upload_mcp_server_files(self, *, force_refresh: bool = False) -> bool:
+        """Upload custom Python MCP server files to sandbox.
+
+        For Python MCP servers configured with 'uv run python mcp_servers/xxx.py',
+        this method uploads the Python files to the sandbox so they can be executed
+        as subprocesses inside the sandbox environment.
+
+        Returns:
+            True if MCP files were refreshed.
+        """
+        work_dir = getattr(self, "_work_dir", "/home/daytona")
+        mcp_servers_dir = f"{work_dir}/mcp_servers"
+
+        # Collect files to upload
+        files_to_upload = []
+        expected_files: set[str] = set()
+
+        for server_name, resolved_path in self._resolve_mcp_server_files():
+            filename = Path(resolved_path).name
+            sandbox_path = f"{mcp_servers_dir}/{filename}"
+            expected_files.add(filename)
+            files_to_upload.append((server_name, resolved_path, sandbox_path))
+
         assert self.sandbox is not None
         sandbox = self.sandbox
 
@@ -1433,14 +1641,15 @@ class PTCSandbox:
             logger.error(f"Failed to install dependencies: {e}")
             raise
 
-    async def _install_tool_modules(self) -> None:
-        """Generate and install tool modules from MCP servers."""
-        logger.info("Installing tool modules")
-
-        # Get work directory (set by _setup_workspace)
-        work_dir = getattr(self, "_work_dir", "/home/daytona")
+    def _build_tool_module_files(
+        self, work_dir: str
+    ) -> list[tuple[bytes, str, tuple[str, dict[str, str]] | None]]:
+        """Generate tool module and documentation files from MCP servers.
 
-        # Collect all files to upload (content generation is CPU-bound, fast)
+        Returns:
+            List of (content, path, log_info) for files under {work_dir}/tools
+        """
+        # Content generation is CPU-bound and fast
         uploads: list[tuple[bytes, str, tuple[str, dict[str, str]] | None]] = []
 
         # 1. MCP client module
@@ -1461,16 +1670,6 @@ class PTCSandbox:
         assert self.mcp_registry is not None
         tools_by_server = self.mcp_registry.get_all_tools()
 
-        # Create per-server doc directories
-        assert self.sandbox is not None
-        for server_name in tools_by_server:
-            doc_dir = f"{work_dir}/tools/docs/{server_name}"
-            await self._daytona_call(
-                self.sandbox.process.exec,
-                f"mkdir -p {doc_dir}",
-                retry_policy=_DaytonaRetryPolicy.SAFE,
-            )
-
         for server_name, tools in tools_by_server.items():
             # Generate Python module
             module_code = self.tool_generator.generate_tool_module(server_name, tools)
@@ -1510,6 +1709,26 @@ class PTCSandbox:
             None,
         )
         uploads.append(init_item)
+        return uploads
+
+    async def _install_tool_modules(self) -> None:
+        """Generate and install tool modules from MCP servers."""
+        logger.info("Installing tool modules")
+
+        # Get work directory (set by _setup_workspace)
+        work_dir = getattr(self, "_work_dir", "/home/daytona")
+        uploads = self._build_tool_module_files(work_dir)
+
+        # Create per-server doc directories
+        assert self.sandbox is not None
+        assert self.mcp_registry is not None
+        for server_name in self.mcp_registry.get_all_tools():
+            doc_dir = f"{work_dir}/tools/docs/{server_name}"
+            await self._daytona_call(
+                self.sandbox.process.exec,
+                f"mkdir -p {doc_dir}",
+                retry_policy=_DaytonaRetryPolicy.SAFE,
+            )
 
         # Upload all files in parallel
         async def upload_file(
@@ -1668,6 +1887,344 @@ class PTCSandbox:
             logger.warning(f"Failed to install {package}: {e}")
             return False
 
+    def _build_exec_env(self, work_dir: str) -> dict[str, str]:
+        """Build the environment for code execution.
+
+        Sets PYTHONPATH to the working directory so code can import from tools/,
+        and adds environment variables from enabled MCP server configs.
+        """
+        import os
+
+        internal_dir = f"{work_dir}/_internal"
+        exec_env = {"PYTHONPATH": f"{work_dir}:{internal_dir}"}
+
+        for server in self.config.mcp.servers:
+            if not server.enabled:
+                continue
+            if hasattr(server, "env") and server.env:
+                for key, value in server.env.items():
+                    # Resolve ${VAR} placeholders from host environment
+                    if value.startswith("${") and value.endswith("}"):
+                        var_name = value[2:-1]
+                        resolved_value = os.getenv(var_name)
+                        if resolved_value:
+                            exec_env[key] = resolved_value
+                    else:
+                        exec_env[key] = value
+
+        return exec_env
+
+    def _kernel_bootstrap_code(self, work_dir: str) -> str:
+        """Code run once in a new kernel context before any user code."""
+        internal_dir = f"{work_dir}/_internal"
+        code = textwrap.dedent(f"""\
+            import os as _os
+            import sys as _sys
+
+            _os.chdir({work_dir!r})
+            for _p in ({internal_dir!r}, {work_dir!r}):
+                if _p not in _sys.path:
+                    _sys.path.insert(0, _p)
+            _os.environ["MPLBACKEND"] = "Agg"
+        """)
+        code += _EXECUTION_ENVELOPE
+
+        memory_limit = self.config.daytona.kernel_memory_limit_mb * 1024 * 1024
+        if memory_limit > 0:
+            code += textwrap.dedent(f"""\
+                import resource as _resource
+                _resource.setrlimit(_resource.RLIMIT_AS, ({memory_limit}, {memory_limit}))
+            """)
+        return code
+
+    async def _ensure_kernel(self, work_dir: str) -> Any:
+        """Return the warm kernel context, creating and bootstrapping it if needed."""
+        if self._kernel_context is not None:
+            return self._kernel_context
+
+        assert self.sandbox is not None
+        interpreter = self.sandbox.code_interpreter
+        context = await self._daytona_call(
+            interpreter.create_context,
+            cwd=work_dir,
+            retry_policy=_DaytonaRetryPolicy.SAFE,
+        )
+        result = await self._daytona_call(
+            interpreter.run_code,
+            self._kernel_bootstrap_code(work_dir),
+            context=context,
+            timeout=60,
+            retry_policy=_DaytonaRetryPolicy.UNSAFE,
+        )
+        if result.error:
+            await self._delete_kernel_context(context)
+            raise RuntimeError(
+                f"Kernel bootstrap failed: {result.error.name}: {result.error.value}"
+            )
+
+        self._kernel_context = context
+        self._kernel_execution_count = 0
+        logger.info(
+            "Started warm Python kernel",
+            sandbox_id=self.sandbox_id,
+            context_id=getattr(context, "id", None),
+        )
+        return context
+
+    async def _delete_kernel_context(self, context: Any) -> None:
+        if self.sandbox is None:
+            return
+        try:
+            await self._daytona_call(
+                self.sandbox.code_interpreter.delete_context,
+                context,
+                retry_policy=_DaytonaRetryPolicy.SAFE,
+                allow_reconnect=False,
+                retries=1,
+            )
+        except Exception as e:
+            logger.debug("Failed to delete kernel context", error=str(e))
+
+    async def restart_kernel(self) -> None:
+        """Shut down the warm kernel; the next kernel execution starts a fresh one.
+
+        Drops all variables and imported modules.
+        """
+        context, self._kernel_context = self._kernel_context, None
+        if context is not None:
+            logger.info(
+                "Restarting warm Python kernel",
+                sandbox_id=self.sandbox_id,
+                executions=self._kernel_execution_count,
+            )
+            await self._delete_kernel_context(context)
+
+    async def reset_kernel(self) -> bool:
+        """Clear user variables in the warm kernel without restarting it.
+
+        Imported modules stay loaded, so re-importing them afterwards is cheap.
+
+        Returns:
+            True if a running kernel was reset
+        """
+        await self._wait_ready()
+
+        async with self._kernel_lock:
+            if self._kernel_context is None:
+                return False
+            assert self.sandbox is not None
+            try:
+                result = await self._daytona_call(
+                    self.sandbox.code_interpreter.run_code,
+                    textwrap.dedent("""\
+                        for __name in [n for n in list(globals()) if not n.startswith("_")]:
+                            del globals()[__name]
+                        if "matplotlib.pyplot" in _sys.modules:
+                            _sys.modules["matplotlib.pyplot"].close("all")
+                    """),
+                    context=self._kernel_context,
+                    timeout=30,
+                    retry_policy=_DaytonaRetryPolicy.UNSAFE,
+                )
+            except Exception as e:
+                logger.warning("Kernel reset failed, restarting", error=str(e))
+                await self.restart_kernel()
+                return False
+
+            if result.error:
+                await self.restart_kernel()
+                return False
+            return True
+
+    def _envelope_call(
+        self,
+        code: str,
+        code_path: str,
+        work_dir: str,
+        *,
+        kernel: bool,
+        collect_charts: bool | None = None,
+    ) -> str:
+        """Build the call that runs user code inside the execution envelope.
+
+        Charts are collected by the envelope in kernel mode; process.code_run
+        captures them natively as artifacts.
+        """
+        if collect_charts is None:
+            collect_charts = kernel
+        code_b64 = base64.b64encode(code.encode("utf-8")).decode("ascii")
+        args = (
+            f"{code_b64!r}, {code_path!r}, {work_dir!r}, "
+            f"{self.EXECUTION_TRACKED_DIRS!r}, "
+            f"{'globals()' if kernel else 'None'}, {collect_charts!r}, "
+            f"{self._ENVELOPE_MARKER!r}"
+        )
+        if kernel:
+            # Envelope functions were defined by the kernel bootstrap
+            return f"__ptc_exit_code = __ptc_execute({args})\n"
+        return (
+            f"{_EXECUTION_ENVELOPE}\n"
+            f"import sys as _sys\n"
+            f"_sys.exit(__ptc_execute({args}))\n"
+        )
+
+    def _parse_envelope(self, stdout: str, stderr: str, success: bool) -> _RunOutput:
+        """Split the envelope payload line off stdout and apply it."""
+        output = _RunOutput(stdout=stdout, stderr=stderr, success=success)
+        marker = self._ENVELOPE_MARKER
+        if marker not in stdout:
+            # Code killed the interpreter (os._exit, signal) before the payload
+            return output
+
+        head, _, tail = stdout.rpartition(marker)
+        payload_line, _, rest = tail.partition("\n")
+        output.stdout = head[:-1] if head.endswith("\n") else head
+        output.stdout += rest
+        try:
+            payload = json.loads(payload_line)
+        except ValueError as e:
+            logger.warning("Failed to parse execution envelope", error=str(e))
+            return output
+
+        output.success = payload.get("exit_code", 1) == 0
+        output.files_created = payload.get("created", [])
+        output.files_modified = payload.get("modified", [])
+        output.files_deleted = payload.get("deleted", [])
+        output.charts = [
+            ChartData(
+                type="unknown",
+                title=chart.get("title", ""),
+                png_base64=chart.get("png"),
+            )
+            for chart in payload.get("charts", [])
+        ]
+
+        error = payload.get("error")
+        if error and f"{error['name']}: " not in output.stderr:
+            # Keep the "Name: value" line so _detect_missing_imports() matches
+            summary = f"{error['name']}: {error['value']}"
+            output.stderr = f"{output.stderr}\n{summary}" if output.stderr else summary
+        return output
+
+    async def _run_in_process(
+        self,
+        code: str,
+        code_path: str,
+        exec_env: dict[str, str],
+        work_dir: str,
+        timeout: int,
+    ) -> _RunOutput:
+        """Run code in a fresh interpreter via process.code_run()."""
+        # Use code_run() for native artifact support (captures matplotlib charts)
+        from daytona_sdk.common.process import CodeRunParams
+
+        assert self.sandbox is not None
+        result = await self._daytona_call(
+            self.sandbox.process.code_run,
+            self._envelope_call(code, code_path, work_dir, kernel=False),
+            params=CodeRunParams(env=exec_env),
+            timeout=timeout,
+            retry_policy=_DaytonaRetryPolicy.UNSAFE,
+        )
+
+        # Get stdout/stderr and exit code from Daytona ExecuteResponse
+        # The result object has: exit_code, result (stdout), artifacts
+        if hasattr(result, "result"):
+            # Daytona SDK ExecuteResponse.result contains the stdout
+            stdout = result.result or ""
+        elif hasattr(result, "stdout"):
+            stdout = result.stdout or ""
+        else:
+            stdout = ""
+
+        # Get stderr - check multiple possible locations
+        if hasattr(result, "stderr"):
+            stderr = result.stderr or ""
+        elif hasattr(result, "artifacts") and hasattr(result.artifacts, "stderr"):
+            stderr = result.artifacts.stderr or ""
+        else:
+            stderr = ""
+
+        exit_code = getattr(result, "exit_code", 1)
+        output = self._parse_envelope(stdout, stderr, exit_code == 0)
+
+        # Extract charts from artifacts (matplotlib captures)
+        if (
+            hasattr(result, "artifacts")
+            and result.artifacts
+            and hasattr(result.artifacts, "charts")
+            and result.artifacts.charts
+        ):
+            for chart in result.artifacts.charts:
+                chart_type = (
+                    chart.type.value
+                    if hasattr(chart.type, "value")
+                    else str(chart.type)
+                )
+                output.charts.append(
+                    ChartData(
+                        type=chart_type,
+                        title=chart.title if hasattr(chart, "title") else "",
+                        png_base64=chart.png if hasattr(chart, "png") else None,
+                        elements=chart.elements
+                        if hasattr(chart, "elements")
+                        else [],
+                    )
+                )
+
+        return output
+
+    async def _run_in_kernel(
+        self,
+        code: str,
+        code_path: str,
+        exec_env: dict[str, str],
+        work_dir: str,
+        timeout: int,
+    ) -> _RunOutput:
+        """Run code in the warm kernel context, keeping state across calls.
+
+        Executions are serialized since they share one namespace. The kernel is
+        restarted after a transport error or timeout (its state is unknown) and
+        after MemoryError.
+        """
+        assert self.sandbox is not None
+
+        async with self._kernel_lock:
+            context = await self._ensure_kernel(work_dir)
+            try:
+                result = await self._daytona_call(
+                    self.sandbox.code_interpreter.run_code,
+                    self._envelope_call(code, code_path, work_dir, kernel=True),
+                    context=context,
+                    envs=exec_env,
+                    timeout=timeout,
+                    retry_policy=_DaytonaRetryPolicy.UNSAFE,
+                )
+            except Exception:
+                await self.restart_kernel()
+                raise
+            self._kernel_execution_count += 1
+
+            output = self._parse_envelope(
+                result.stdout or "", result.stderr or "", result.error is None
+            )
+            if result.error is not None:
+                # The envelope itself failed (e.g. interrupted); report it
+                error = result.error
+                detail = error.traceback or f"{error.name}: {error.value}"
+                output.success = False
+                output.stderr = (
+                    f"{output.stderr}\n{detail}" if output.stderr else detail
+                )
+            if not output.success and "MemoryError" in output.stderr:
+                await self.restart_kernel()
+                output.stderr += (
+                    "\n[kernel restarted after MemoryError; variables were cleared]"
+                )
+
+        return output
+
     async def execute(
         self,
         code: str,
@@ -1675,6 +2232,7 @@ class PTCSandbox:
         *,
         auto_install: bool = True,
         max_retries: int = 2,
+        kernel: bool | None = None,
     ) -> ExecutionResult:
         """Execute Python code in the sandbox with optional auto-install for missing dependencies.
 
@@ -1683,12 +2241,17 @@ class PTCSandbox:
             timeout: Optional timeout in seconds
             auto_install: Whether to automatically install missing packages on ImportError (default: True)
             max_retries: Maximum number of retries after auto-installing packages (default: 2)
+            kernel: Run in the warm Python kernel, keeping variables and imports
+                across calls (default: ``daytona.kernel_mode``)
 
         Returns:
             ExecutionResult with execution details
         """
         await self._wait_ready()
 
+        if kernel is None:
+            kernel = self.config.daytona.kernel_mode
+
         self.execution_count += 1
         execution_id = f"exec_{self.execution_count:04d}"
         code_hash = hashlib.sha256(code.encode()).hexdigest()[:16]
@@ -1699,167 +2262,74 @@ class PTCSandbox:
             code_hash=code_hash,
             code_length=len(code),
             auto_install=auto_install,
+            kernel=kernel,
         )
 
         start_time = time.time()
 
         try:
-            # Write code to file
+            # Code is written to code/ by the envelope inside the sandbox
             code_path = f"code/{execution_id}.py"
-            await self._daytona_call(
-                self.sandbox.fs.upload_file,
-                code.encode("utf-8"),
-                code_path,
-                retry_policy=_DaytonaRetryPolicy.SAFE,
-            )
-
-            # Get list of files before execution
-            files_before = await self._list_result_files()
-
-            # Execute code
             timeout_val = timeout or self.config.security.max_execution_time
 
-            # Set PYTHONPATH to working directory so code can import from tools/
-            # Also pass MCP server environment variables
-            work_dir = await self._daytona_call(
-                self.sandbox.get_work_dir,
-                retry_policy=_DaytonaRetryPolicy.SAFE,
-            )
-
-            internal_dir = f"{work_dir}/_internal"
-            exec_env = {"PYTHONPATH": f"{work_dir}:{internal_dir}"}
-
-            # Add environment variables from MCP server configs (only enabled servers)
-            import os
-
-            for server in self.config.mcp.servers:
-                if not server.enabled:
-                    continue
-                if hasattr(server, "env") and server.env:
-                    for key, value in server.env.items():
-                        # Resolve ${VAR} placeholders from host environment
-                        if value.startswith("${") and value.endswith("}"):
-                            var_name = value[2:-1]
-                            resolved_value = os.getenv(var_name)
-                            if resolved_value:
-                                exec_env[key] = resolved_value
-                        else:
-                            exec_env[key] = value
-
-            # Use code_run() for native artifact support (captures matplotlib charts)
-            from daytona_sdk.common.process import CodeRunParams
-
-            result = await self._daytona_call(
-                self.sandbox.process.code_run,
-                code,
-                params=CodeRunParams(env=exec_env),
-                timeout=timeout_val,
-                retry_policy=_DaytonaRetryPolicy.UNSAFE,
-            )
-
-            # Get stdout/stderr and exit code from Daytona ExecuteResponse
-            # The result object has: exit_code, result (stdout), artifacts
-            if hasattr(result, "result"):
-                # Daytona SDK ExecuteResponse.result contains the stdout
-                stdout = result.result or ""
-            elif hasattr(result, "stdout"):
-                stdout = result.stdout or ""
-            else:
-                stdout = ""
-
-            # Get stderr - check multiple possible locations
-            if hasattr(result, "stderr"):
-                stderr = result.stderr or ""
-            elif hasattr(result, "artifacts") and hasattr(result.artifacts, "stderr"):
-                stderr = result.artifacts.stderr or ""
-            else:
-                stderr = ""
-
-            exit_code = getattr(result, "exit_code", 1)
-
-            # Determine success based on exit code
-            success = exit_code == 0
-
-            # Extract charts from artifacts (matplotlib captures)
-            charts = []
-            if (
-                hasattr(result, "artifacts")
-                and result.artifacts
-                and hasattr(result.artifacts, "charts")
-                and result.artifacts.charts
-            ):
-                for chart in result.artifacts.charts:
-                    chart_type = (
-                        chart.type.value
-                        if hasattr(chart.type, "value")
-                        else str(chart.type)
-                    )
-                    charts.append(
-                        ChartData(
-                            type=chart_type,
-                            title=chart.title if hasattr(chart, "title") else "",
-                            png_base64=chart.png if hasattr(chart, "png") else None,
-                            elements=chart.elements
-                            if hasattr(chart, "elements")
-                            else [],
-                        )
-                    )
-                logger.info(f"Captured {len(charts)} chart(s) from artifacts")
+            work_dir = getattr(self, "_work_dir", None)
+            if not work_dir:
+                work_dir = await self._daytona_call(
+                    self.sandbox.get_work_dir,
+                    retry_policy=_DaytonaRetryPolicy.SAFE,
+                )
+                self._work_dir = work_dir
+            exec_env = self._build_exec_env(work_dir)
+
+            run = self._run_in_kernel if kernel else self._run_in_process
+            retries_remaining = max_retries if auto_install else 0
+            while True:
+                output = await run(code, code_path, exec_env, work_dir, timeout_val)
+                if output.success or retries_remaining <= 0:
+                    break
 
-            # Get files after execution
-            files_after = await self._list_result_files()
+                # Auto-install missing packages and rerun the same envelope
+                missing_packages = self._detect_missing_imports(output.stderr)
+                if not missing_packages:
+                    break
+                logger.info(
+                    "Attempting auto-install and retry",
+                    execution_id=execution_id,
+                    missing_packages=missing_packages,
+                    retries_remaining=retries_remaining,
+                )
+                for package in missing_packages:
+                    await self._install_package(package)
+                retries_remaining -= 1
 
-            # Determine file changes
-            files_created = [f for f in files_after if f not in files_before]
-            files_modified: list[str] = []  # TODO: Implement modification tracking
+            if output.charts:
+                logger.info(f"Captured {len(output.charts)} chart(s) from artifacts")
 
             duration = time.time() - start_time
 
-            execution_result = ExecutionResult(
-                success=success,
-                stdout=stdout,
-                stderr=stderr,
-                duration=duration,
-                files_created=files_created,
-                files_modified=files_modified,
-                execution_id=execution_id,
-                code_hash=code_hash,
-                charts=charts,
-            )
-
-            # Auto-install missing packages and retry if enabled
-            if not success and auto_install and max_retries > 0:
-                missing_packages = self._detect_missing_imports(stderr)
-                if missing_packages:
-                    logger.info(
-                        "Attempting auto-install and retry",
-                        execution_id=execution_id,
-                        missing_packages=missing_packages,
-                        retries_remaining=max_retries,
-                    )
-
-                    # Install missing packages
-                    for package in missing_packages:
-                        await self._install_package(package)
-
-                    # Retry execution with decremented retry count
-                    return await self.execute(
-                        code=code,
-                        timeout=timeout,
-                        auto_install=auto_install,
-                        max_retries=max_retries - 1,
-                    )
-
             logger.info(
                 "Code execution completed",
                 execution_id=execution_id,
-                success=success,
+                success=output.success,
                 duration=duration,
-                files_created=len(files_created),
-                charts_captured=len(charts),
+                files_created=len(output.files_created),
+                files_modified=len(output.files_modified),
+                files_deleted=len(output.files_deleted),
+                charts_captured=len(output.charts),
             )
 
-            return execution_result
+            return ExecutionResult(
+                success=output.success,
+                stdout=output.stdout,
+                stderr=output.stderr,
+                duration=duration,
+                files_created=output.files_created,
+                files_modified=output.files_modified,
+                execution_id=execution_id,
+                code_hash=code_hash,
+                charts=output.charts,
+                files_deleted=output.files_deleted,
+            )
 
         except Exception as e:
             duration = time.time() - start_time
@@ -1978,7 +2448,8 @@ class PTCSandbox:
             """)
 
             # Execute via Python wrapper
-            result = await self.execute(python_wrapper)
+            # The wrapper calls sys.exit(), so keep it out of the warm kernel
+            result = await self.execute(python_wrapper, kernel=False)
 
             # Parse the result
             if result.success:
@@ -2145,14 +2616,169 @@ class PTCSandbox:
             offset: Line offset (0-indexed).
             limit: Maximum number of lines.
         """
-        content = await self.aread_file_text(file_path)
-        if content is None:
+        raw = await self.aread_file_range_bytes(file_path, offset, limit)
+        if raw is None:
+            return None
+        try:
+            return "\n".join(raw.decode("utf-8").splitlines())
+        except UnicodeDecodeError as e:
+            logger.debug(
+                "Failed to decode file as utf-8", filepath=file_path, error=str(e)
+            )
             return None
 
-        lines = content.splitlines()
-        start = max(0, offset)
-        end = start + limit
-        return "\n".join(lines[start:end])
+    async def aread_file_range_bytes(
+        self, file_path: str, offset: int = 0, limit: int = 2000
+    ) -> bytes | None:
+        """Read raw bytes of a range of lines, selected inside the sandbox.
+
+        Only the requested lines cross the wire; ``sed`` stops reading the
+        file once the last requested line has been printed.
+
+        Args:
+            file_path: Path to the file.
+            offset: Line offset (0-indexed).
+            limit: Maximum number of lines.
+
+        Returns:
+            The selected lines (newline-terminated as in the file), or None if
+            the file is missing.
+
+        Raises:
+            SandboxTransientError: If a transient sandbox transport error persists.
+        """
+        first = max(0, offset) + 1
+        last = first + max(0, limit) - 1
+        if last < first:
+            return b"" if await self.astat_file(file_path) is not None else None
+        return await self._exec_base64_output(
+            f"sed -n '{first},{last}p;{last}q' \"$f\"", file_path
+        )
+
+    async def aread_bytes_range(
+        self, filepath: str, start: int, length: int
+    ) -> bytes | None:
+        """Read ``length`` bytes starting at byte ``start`` of a sandbox file.
+
+        Returns fewer bytes at end of file, or None if the file is missing.
+
+        Raises:
+            SandboxTransientError: If a transient sandbox transport error persists.
+        """
+        if length <= 0:
+            return b"" if await self.astat_file(filepath) is not None else None
+        return await self._exec_base64_output(
+            f"tail -c +{max(0, start) + 1} \"$f\" | head -c {length}", filepath
+        )
+
+    async def aiter_file_bytes(
+        self,
+        filepath: str,
+        start: int = 0,
+        length: int | None = None,
+        *,
+        chunk_size: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream a byte range of a sandbox file in bounded chunks.
+
+        Each chunk is a separate, independently retried sandbox round trip,
+        so memory use is bounded by ``chunk_size`` regardless of file size.
+
+        Never yields more than ``length`` bytes. When ``length`` is given the
+        caller has usually advertised it (e.g. as Content-Length), so a file
+        that ends early raises instead of quietly producing a short body.
+
+        Args:
+            filepath: Path to the file.
+            start: First byte to yield.
+            length: Number of bytes to yield; defaults to the rest of the file.
+            chunk_size: Bytes per round trip (default ``DOWNLOAD_CHUNK_BYTES``).
+
+        Raises:
+            EOFError: If ``length`` was given and the file shrank (or vanished)
+                before that many bytes were read.
+        """
+        chunk_size = chunk_size or self.DOWNLOAD_CHUNK_BYTES
+        strict = length is not None
+        if length is None:
+            info = await self.astat_file(filepath)
+            if info is None:
+                return
+            length = max(0, info["size"] - start)
+
+        position = start
+        end = start + length
+        while position < end:
+            chunk = await self.aread_bytes_range(
+                filepath, position, min(chunk_size, end - position)
+            )
+            if not chunk:
+                # File shrank (or vanished) while streaming
+                if strict:
+                    raise EOFError(
+                        f"{filepath} ended at byte {position}, expected {end}"
+                    )
+                return
+            chunk = chunk[: end - position]
+            yield chunk
+            position += len(chunk)
+
+    async def astat_file(self, filepath: str) -> dict[str, Any] | None:
+        """Return ``{"size", "is_dir"}`` for a sandbox path, or None if missing.
+
+        Raises:
+            SandboxTransientError: If a transient sandbox transport error persists.
+        """
+        await self._wait_ready()
+
+        try:
+            assert self.sandbox is not None
+            info = await self._daytona_call(
+                self.sandbox.fs.get_file_info,
+                filepath,
+                retry_policy=_DaytonaRetryPolicy.SAFE,
+            )
+        except SandboxTransientError:
+            raise
+        except Exception as e:
+            logger.debug("Failed to stat file", filepath=filepath, error=str(e))
+            return None
+
+        return {
+            "size": int(getattr(info, "size", 0) or 0),
+            "is_dir": bool(getattr(info, "is_dir", False)),
+        }
+
+    async def _exec_base64_output(self, pipeline: str, filepath: str) -> bytes | None:
+        """Run ``pipeline`` against ``$f`` in the sandbox and return its stdout.
+
+        Output is base64-encoded in the sandbox so binary content survives
+        the text-only exec channel. Returns None if ``filepath`` is not a
+        regular file.
+        """
+        await self._wait_ready()
+
+        script = (
+            f"f={shlex.quote(filepath)}; [ -f \"$f\" ] || exit 3; "
+            f"{pipeline} 2>/dev/null | base64 -w0"
+        )
+        try:
+            assert self.sandbox is not None
+            result = await self._daytona_call(
+                self.sandbox.process.exec,
+                f"sh -c {shlex.quote(script)}",
+                timeout=60,
+                retry_policy=_DaytonaRetryPolicy.SAFE,
+            )
+        except SandboxTransientError:
+            raise
+        except Exception as e:
+            logger.debug("Ranged read failed", filepath=filepath, error=str(e))
+            return None
+
+        if getattr(result, "exit_code", 0) != 0:
+            return None
+        return base64.b64decode(getattr(result, "result", "") or "")
 
     def normalize_path(self, path: str) -> str:
         """Normalize virtual path to absolute sandbox path (input normalization).
@@ -2502,37 +3128,19 @@ class PTCSandbox:
                 logger.error(f"Access denied: {path} is not in allowed directories")
                 return []
 
-            cmd = ["rg"]
-            if output_mode == "files_with_matches":
-                cmd.append("-l")
-            elif output_mode == "count":
-                cmd.append("-c")
-
-            if case_insensitive:
-                cmd.append("-i")
-
-            if output_mode == "content" and show_line_numbers:
-                cmd.append("-n")
-
-            if lines_before:
-                cmd.extend(["-B", str(lines_before)])
-            if lines_after:
-                cmd.extend(["-A", str(lines_after)])
-            if lines_context:
-                cmd.extend(["-C", str(lines_context)])
-
-            if multiline:
-                cmd.extend(["-U", "--multiline-dotall"])
-
-            if glob:
-                cmd.extend(["--glob", glob])
-            if type:
-                cmd.extend(["--type", type])
-
-            cmd.append(pattern)
-            search_path = self._normalize_search_path(path)
-            cmd.append(search_path)
-
+            cmd = self._build_rg_command(
+                pattern,
+                self._normalize_search_path(path),
+                output_mode,
+                glob,
+                type,
+                case_insensitive=case_insensitive,
+                show_line_numbers=show_line_numbers,
+                lines_after=lines_after,
+                lines_before=lines_before,
+                lines_context=lines_context,
+                multiline=multiline,
+            )
             cmd_str = " ".join(f'"{c}"' if " " in c else c for c in cmd)
             assert self.sandbox is not None
             result = await self._daytona_call(
@@ -2543,38 +3151,92 @@ class PTCSandbox:
             )
 
             output = result.result.strip() if getattr(result, "result", None) else ""
-            if not output:
-                return []
+            return self._parse_grep_output(output, output_mode, head_limit, offset)
 
-            if output_mode == "count":
-                count_results: list[tuple[str, int]] = []
-                for line in output.split("\n"):
-                    if ":" in line:
-                        parts = line.rsplit(":", 1)
-                        if len(parts) == 2:
-                            try:
-                                count_results.append((parts[0], int(parts[1])))
-                            except ValueError:
-                                count_results.append((line, 0))
-                    else:
-                        count_results.append((line, 0))
+        except Exception as e:
+            logger.debug("Async grep failed", pattern=pattern, path=path, error=str(e))
+            return []
 
-                if offset > 0:
-                    count_results = count_results[offset:]
-                if head_limit:
-                    count_results = count_results[:head_limit]
-                return count_results
+    @staticmethod
+    def _build_rg_command(
+        pattern: str,
+        search_path: str,
+        output_mode: str,
+        glob: str | None,
+        type: str | None,  # noqa: A002 - matches ripgrep's --type flag
+        *,
+        case_insensitive: bool,
+        show_line_numbers: bool,
+        lines_after: int | None,
+        lines_before: int | None,
+        lines_context: int | None,
+        multiline: bool,
+    ) -> list[str]:
+        """Build ripgrep argv for agrep_content()."""
+        cmd = ["rg"]
+        if output_mode == "files_with_matches":
+            cmd.append("-l")
+        elif output_mode == "count":
+            cmd.append("-c")
+
+        if case_insensitive:
+            cmd.append("-i")
+
+        if output_mode == "content" and show_line_numbers:
+            cmd.append("-n")
+
+        if lines_before:
+            cmd.extend(["-B", str(lines_before)])
+        if lines_after:
+            cmd.extend(["-A", str(lines_after)])
+        if lines_context:
+            cmd.extend(["-C", str(lines_context)])
+
+        if multiline:
+            cmd.extend(["-U", "--multiline-dotall"])
+
+        if glob:
+            cmd.extend(["--glob", glob])
+        if type:
+            cmd.extend(["--type", type])
+
+        cmd.append(pattern)
+        cmd.append(search_path)
+        return cmd
+
+    @staticmethod
+    def _parse_grep_output(
+        output: str, output_mode: str, head_limit: int | None, offset: int
+    ) -> Any:
+        """Parse ripgrep output into agrep_content() results."""
+        if not output:
+            return []
+
+        if output_mode == "count":
+            count_results: list[tuple[str, int]] = []
+            for line in output.split("\n"):
+                if ":" in line:
+                    parts = line.rsplit(":", 1)
+                    if len(parts) == 2:
+                        try:
+                            count_results.append((parts[0], int(parts[1])))
+                        except ValueError:
+                            count_results.append((line, 0))
+                else:
+                    count_results.append((line, 0))
 
-            results_strs = output.split("\n")
             if offset > 0:
-                results_strs = results_strs[offset:]
+                count_results = count_results[offset:]
             if head_limit:
-                results_strs = results_strs[:head_limit]
-            return results_strs
+                count_results = count_results[:head_limit]
+            return count_results
 
-        except Exception as e:
-            logger.debug("Async grep failed", pattern=pattern, path=path, error=str(e))
-            return []
+        results_strs = output.split("\n")
+        if offset > 0:
+            results_strs = results_strs[offset:]
+        if head_limit:
+            results_strs = results_strs[:head_limit]
+        return results_strs
 
     async def cleanup(self) -> None:
         """Clean up and destroy the sandbox."""
@@ -2592,6 +3254,7 @@ class PTCSandbox:
 
         self.sandbox = None
         self.sandbox_id = None
+        self._kernel_context = None
 
         try:
             await self.daytona_client.close()
@@ -7,12 +7,22 @@ import structlog
 
 from ptc_agent.config.core import CoreConfig
 
+from .local_sandbox import LocalSandbox
 from .mcp_registry import MCPRegistry
 from .sandbox import PTCSandbox
 
 logger = structlog.get_logger(__name__)
 
 
+def create_sandbox(
+    config: CoreConfig, mcp_registry: MCPRegistry | None = None
+) -> PTCSandbox:
+    """Create the sandbox backend selected in config (Daytona or local)."""
+    if config.local_sandbox.enabled:
+        return LocalSandbox(config, mcp_registry)
+    return PTCSandbox(config, mcp_registry)
+
+
 class Session:
     """Represents a conversation session with a persistent sandbox."""
 
@@ -56,7 +66,7 @@ class Session:
             # RECONNECT MODE: Run MCP connections and sandbox start in parallel
 
             # Create sandbox instance without mcp_registry
-            self.sandbox = PTCSandbox(self.config, None)
+            self.sandbox = create_sandbox(self.config, None)
 
             # Run both operations in parallel
             await asyncio.gather(
@@ -73,7 +83,7 @@ class Session:
             )
         else:
             # NEW SANDBOX MODE: Run workspace setup and MCP connect concurrently
-            self.sandbox = PTCSandbox(self.config, None)
+            self.sandbox = create_sandbox(self.config, None)
 
             snapshot_name, _ = await asyncio.gather(
                 self.sandbox.setup_sandbox_workspace(),
@@ -114,7 +124,7 @@ class Session:
         await self.mcp_registry.connect_all()
 
         # Create sandbox and start lazy init
-        self.sandbox = PTCSandbox(self.config, self.mcp_registry)
+        self.sandbox = create_sandbox(self.config, self.mcp_registry)
         self.sandbox.start_lazy_init(sandbox_id)
 
         self._initialized = True
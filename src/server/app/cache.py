@@ -3,7 +3,7 @@ Cache management endpoints.
 
 This module handles:
 - Cache statistics retrieval
-- Cache invalidation (pattern-based or nuclear)
+- Cache invalidation (namespace, pattern-based or nuclear)
 """
 
 import logging
@@ -46,7 +46,8 @@ async def get_cache_stats():
 
 @router.post("/clear")
 async def clear_cache(
-    pattern: Optional[str] = Query(None, description="Cache key pattern to clear (e.g., 'workflow:*'). If not provided, clears ALL caches.")
+    pattern: Optional[str] = Query(None, description="Cache key pattern to clear (e.g., 'workflow:*'). If not provided, clears ALL caches."),
+    namespace: Optional[str] = Query(None, description="Invalidate all keys of a namespace (e.g., 'fmp:intraday'). Versioned namespaces are invalidated in O(1) by bumping their generation, others by pattern delete."),
 ):
     """
     Clear cache entries (admin endpoint).
@@ -56,14 +57,37 @@ async def clear_cache(
     try:
         invalidator = get_cache_invalidator()
 
-        if pattern:
+        if namespace:
+            result = await invalidator.invalidate_namespace(namespace)
+            if result["mode"] == "generation":
+                # O(1): advance the namespace generation, nothing is scanned
+                version = result["version"]
+                return {
+                    "message": f"Advanced cache namespace {namespace} to generation {version}",
+                    "namespace": namespace,
+                    "version": version,
+                    "success": version >= 0,
+                }
+            # Unversioned namespace: its keys have to be deleted
+            return {
+                "message": f"Cleared {result['deleted']} cache entries in namespace: {namespace}",
+                "namespace": namespace,
+                "deleted": result["deleted"],
+                "pattern": result["pattern"],
+                "elapsed_ms": result.get("elapsed_ms", 0.0),
+                "keys_per_sec": result.get("keys_per_sec", 0.0),
+                "success": result.get("error") is None,
+            }
+        elif pattern:
             # Clear specific pattern
-            results = await invalidator.invalidate_patterns([pattern])
-            total_deleted = sum(results.values())
+            report = (await invalidator.invalidate_patterns_with_report([pattern])).get(pattern, {})
+            total_deleted = report.get("deleted", 0)
             return {
                 "message": f"Cleared {total_deleted} cache entries matching pattern: {pattern}",
                 "deleted": total_deleted,
                 "pattern": pattern,
+                "elapsed_ms": report.get("elapsed_ms", 0.0),
+                "keys_per_sec": report.get("keys_per_sec", 0.0),
             }
         else:
             # Nuclear option - clear all
@@ -44,7 +44,8 @@ from src.server.services.background_task_manager import (
     TaskStatus,
 )
 from src.server.services.background_registry_store import BackgroundRegistryStore
-from src.server.services.workflow_tracker import WorkflowTracker
+from src.server.services.event_buffer_writer import parse_sse_event_id
+from src.server.services.workflow_tracker import WorkflowTracker, WorkflowStatus
 
 # Database persistence imports
 from src.server.database import conversation as qr_db
@@ -1272,7 +1273,21 @@ async def reconnect_to_workflow(
     task_info = await manager.get_task_info(thread_id)
     workflow_status = await tracker.get_status(thread_id)
 
-    if not task_info:
+    # With the redis_stream backend or a cross-node live fan-out, any replica
+    # can serve a workflow that is still tracked as running, even when it
+    # executes on another replica.
+    running_elsewhere = (
+        task_info is None
+        and workflow_status is not None
+        and workflow_status.get("status")
+        in [WorkflowStatus.ACTIVE, WorkflowStatus.DISCONNECTED]
+    )
+    serve_from_stream = manager.uses_redis_stream and (
+        task_info is not None or running_elsewhere
+    )
+    serve_remote_live = running_elsewhere and manager.fanout.cross_node
+
+    if not task_info and not serve_from_stream and not serve_remote_live:
         if workflow_status and workflow_status.get("status") == "completed":
             raise HTTPException(
                 status_code=410, detail="Workflow completed and results expired"
@@ -1281,50 +1296,76 @@ async def reconnect_to_workflow(
 
     async def stream_reconnection():
         try:
-            # Replay buffered events
-            buffered_events = await manager.get_buffered_events_redis(
-                thread_id,
-                from_beginning=True,
-                after_event_id=last_event_id,
-            )
-
-            logger.info(
-                f"[PTC_RECONNECT] Replaying {len(buffered_events)} events "
-                f"for {thread_id}"
-            )
-
-            for event in buffered_events:
-                yield event
+            if serve_from_stream:
+                # Replay from last_event_id (XRANGE) and tail live events (XREAD BLOCK)
+                if task_info:
+                    await manager.increment_connection(thread_id)
+                try:
+                    async for event in manager.iter_event_stream(
+                        thread_id, after_event_id=last_event_id, follow=True
+                    ):
+                        yield event
+                finally:
+                    if task_info:
+                        await manager.decrement_connection(thread_id)
+                return
+
+            # Subscribe before replaying so no event is lost between the
+            # replay read and the live attach; overlaps are skipped by ID below
+            live_queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
+            subscribed = False
+            if not await manager.is_workflow_finished(thread_id):
+                subscribed = await manager.subscribe_to_live_events(
+                    thread_id, live_queue
+                )
+            if subscribed and task_info:
+                await manager.increment_connection(thread_id)
 
-            # Attach to live stream if still running
-            status = await manager.get_task_status(thread_id)
+            try:
+                # Replay buffered events
+                buffered_events = await manager.get_buffered_events_redis(
+                    thread_id,
+                    from_beginning=True,
+                    after_event_id=last_event_id,
+                )
 
-            if status == TaskStatus.RUNNING:
-                live_queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
-                await manager.subscribe_to_live_events(thread_id, live_queue)
-                await manager.increment_connection(thread_id)
+                logger.info(
+                    f"[PTC_RECONNECT] Replaying {len(buffered_events)} events "
+                    f"for {thread_id}"
+                )
 
-                try:
-                    while True:
-                        try:
-                            event = await asyncio.wait_for(
-                                live_queue.get(), timeout=1.0
-                            )
-                            if event is None:
-                                break
-                            yield event
-                        except asyncio.TimeoutError:
-                            current_status = await manager.get_task_status(thread_id)
-                            if current_status in [
-                                TaskStatus.COMPLETED,
-                                TaskStatus.FAILED,
-                                TaskStatus.CANCELLED,
-                            ]:
-                                break
+                replayed_id = last_event_id
+                for event in buffered_events:
+                    event_id = parse_sse_event_id(event)
+                    if event_id is not None and (
+                        replayed_id is None or event_id > replayed_id
+                    ):
+                        replayed_id = event_id
+                    yield event
+
+                # Attach to live stream if still running
+                while subscribed:
+                    try:
+                        event = await asyncio.wait_for(live_queue.get(), timeout=1.0)
+                        if event is None:
+                            break
+                        event_id = parse_sse_event_id(event)
+                        if (
+                            replayed_id is not None
+                            and event_id is not None
+                            and event_id <= replayed_id
+                        ):
                             continue
-                finally:
+                        yield event
+                    except asyncio.TimeoutError:
+                        if await manager.is_workflow_finished(thread_id):
+                            break
+                        continue
+            finally:
+                if subscribed:
                     await manager.unsubscribe_from_live_events(thread_id, live_queue)
-                    await manager.decrement_connection(thread_id)
+                    if task_info:
+                        await manager.decrement_connection(thread_id)
 
         except Exception as e:
             logger.error(f"[PTC_RECONNECT] Error: {e}", exc_info=True)
@@ -1,10 +1,12 @@
 """
 FastAPI router for market data proxy endpoints.
 
-Provides cached access to FMP intraday data for stocks and indexes.
+Provides cached access to FMP intraday data for stocks and indexes, and
+technical indicators computed locally over the cached bars.
 """
 
 import logging
+from datetime import date
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query
@@ -18,14 +20,18 @@ from src.server.models.market_data import (
     BatchCacheStats,
     StockSearchResult,
     StockSearchResponse,
+    IndicatorsRequest,
+    IndicatorsResponse,
     STOCK_INTERVALS,
     INDEX_INTERVALS,
+    DAILY_INTERVAL,
 )
-from src.server.services.intraday_cache_service import (
-    IntradayCacheService,
-    IntradayCacheKeyBuilder,
-)
-from src.data_client.fmp.fmp_client import FMPClient
+from src.server.services.intraday_cache_service import IntradayCacheService
+from src.server.services.indicator_service import get_batch_indicators
+from src.server.services.symbol_search_service import SymbolSearchService
+from src.tools.market_data.indicators import DEFAULT_INDICATORS, parse_indicators
+from src.server.services.intraday_bar_store import IntradayBarStore
+from src.data_client.fmp import PRIORITY_INTERACTIVE, get_fmp_client, request_priority
 
 logger = logging.getLogger(__name__)
 
@@ -87,7 +93,7 @@ async def get_stock_intraday(
         if result.error:
             raise HTTPException(status_code=500, detail=result.error)
 
-        cache_key = IntradayCacheKeyBuilder.stock_key(symbol, interval, from_date, to_date)
+        cache_key = IntradayBarStore.series_key(symbol, is_index=False, interval=interval)
         data_points = _convert_data_points(result.data)
 
         return IntradayResponse(
@@ -198,7 +204,7 @@ async def get_index_intraday(
         if result.error:
             raise HTTPException(status_code=500, detail=result.error)
 
-        cache_key = IntradayCacheKeyBuilder.index_key(symbol, interval, from_date, to_date)
+        cache_key = IntradayBarStore.series_key(symbol, is_index=True, interval=interval)
         data_points = _convert_data_points(result.data)
 
         return IntradayResponse(
@@ -272,6 +278,74 @@ async def get_batch_indexes_intraday(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# =============================================================================
+# Technical Indicators
+# =============================================================================
+
+
+@router.post(
+    "/indicators",
+    response_model=IndicatorsResponse,
+    summary="Get technical indicators",
+    description="Compute technical indicators for multiple symbols (max 50) from cached OHLCV bars.",
+)
+async def get_indicators(
+    request: IndicatorsRequest,
+) -> IndicatorsResponse:
+    """Compute indicators for multiple stocks or indexes."""
+    is_index = request.asset_type == "index"
+    intervals = (DAILY_INTERVAL, *(INDEX_INTERVALS if is_index else STOCK_INTERVALS))
+    if request.interval not in intervals:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Invalid interval '{request.interval}' for {'indexes' if is_index else 'stocks'}. Supported: {', '.join(intervals)}"
+        )
+
+    try:
+        specs = parse_indicators(request.indicators or DEFAULT_INDICATORS)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    dates = {}
+    for field_name, value in (("from", request.from_date), ("to", request.to_date)):
+        if value is None:
+            continue
+        try:
+            dates[field_name] = date.fromisoformat(value)
+        except ValueError:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Invalid '{field_name}' date '{value}', expected YYYY-MM-DD"
+            )
+    if "from" in dates and "to" in dates and dates["from"] > dates["to"]:
+        raise HTTPException(status_code=422, detail="'from' date must not be after 'to' date")
+
+    try:
+        results, errors, cache_stats = await get_batch_indicators(
+            symbols=request.symbols,
+            is_index=is_index,
+            interval=request.interval,
+            specs=specs,
+            from_date=dates["from"].isoformat() if "from" in dates else None,
+            to_date=dates["to"].isoformat() if "to" in dates else None,
+            limit=request.limit,
+        )
+
+        return IndicatorsResponse(
+            interval=request.interval,
+            columns=[column for spec in specs for column in spec.columns],
+            results=results,
+            errors=errors,
+            cache_stats=BatchCacheStats(**cache_stats) if cache_stats else None,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error computing technical indicators: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # =============================================================================
 # Stock Search Endpoint
 # =============================================================================
@@ -287,12 +361,17 @@ async def search_stocks(
     query: str = Query(..., description="Search query (symbol or company name)", min_length=1),
     limit: int = Query(50, description="Maximum number of results to return", ge=1, le=100),
     exchange: list[str] = Query(default=[], description="Filter by exchange short names (e.g., NASDAQ, NYSE)"),
+    fuzzy: bool = Query(False, description="Fill remaining results with one-typo matches"),
 ) -> StockSearchResponse:
     """
     Search for stocks by keyword.
     
     Searches both ticker symbols and company names. Returns matching stocks
     with their symbols, names, and exchange information.
+
+    Served from the local symbol index; falls back to FMP's search endpoint
+    until the index has been loaded. Local results carry the currency of
+    their listing exchange, or null where the index does not know it.
     
     Example queries:
     - "AAPL" - Find by symbol
@@ -303,44 +382,46 @@ async def search_stocks(
         raise HTTPException(status_code=422, detail="Query parameter is required and cannot be empty")
     
     try:
-        # Create FMP client instance
-        fmp_client = FMPClient()
-        
-        try:
-            # Call FMP API search endpoint
-            raw_results = await fmp_client.search_stocks(query=query.strip(), limit=limit)
-            
-            # Convert raw results to Pydantic models
-            results = []
-            for item in raw_results:
-                # Handle different response formats from FMP API
-                result = StockSearchResult(
-                    symbol=item.get("symbol", ""),
-                    name=item.get("name", ""),
-                    currency=item.get("currency"),
-                    stockExchange=item.get("stockExchange"),
-                    exchangeShortName=item.get("exchangeShortName"),
-                )
-                results.append(result)
+        symbol_search = SymbolSearchService.get_instance()
+        raw_results = symbol_search.search(
+            query.strip(), limit=limit, exchanges=exchange, fuzzy=fuzzy
+        )
+
+        if raw_results is None:
+            # Shared FMP client (process-wide connection pool and response cache)
+            fmp_client = await get_fmp_client()
+
+            # Call FMP API search endpoint (interactive lane of the FMP rate limiter)
+            with request_priority(PRIORITY_INTERACTIVE):
+                raw_results = await fmp_client.search_stocks(query=query.strip(), limit=limit)
 
             # Filter by exchange if specified
             if exchange:
                 exchange_set = {e.upper() for e in exchange}
-                results = [
-                    r for r in results
-                    if r.exchangeShortName and r.exchangeShortName.upper() in exchange_set
+                raw_results = [
+                    item for item in raw_results
+                    if item.get("exchangeShortName") and item["exchangeShortName"].upper() in exchange_set
                 ]
-
-            return StockSearchResponse(
-                query=query.strip(),
-                results=results,
-                count=len(results),
+        
+        # Convert raw results to Pydantic models
+        results = []
+        for item in raw_results:
+            # Handle different response formats from FMP API
+            result = StockSearchResult(
+                symbol=item.get("symbol", ""),
+                name=item.get("name", ""),
+                currency=item.get("currency"),
+                stockExchange=item.get("stockExchange"),
+                exchangeShortName=item.get("exchangeShortName"),
             )
-            
-        finally:
-            # Always close the client
-            await fmp_client.close()
-            
+            results.append(result)
+
+        return StockSearchResponse(
+            query=query.strip(),
+            results=results,
+            count=len(results),
+        )
+
     except HTTPException:
         raise
     except Exception as e:
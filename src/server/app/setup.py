@@ -103,10 +103,18 @@ async def lifespan(app: FastAPI):
         logger.warning(f"Redis cache initialization failed: {e}")
         logger.warning("Server will continue without caching")
 
+    # Load the local symbol search index and start its refresh loop
+    try:
+        from src.server.services.symbol_search_service import SymbolSearchService
+        await SymbolSearchService.get_instance().start()
+    except Exception as e:
+        logger.warning(f"Failed to start symbol search index: {e}")
+
     # Start BackgroundTaskManager cleanup task
     try:
         manager = BackgroundTaskManager.get_instance()
         await manager.start_cleanup_task()
+        await manager.start_live_fanout()
     except Exception as e:
         logger.warning(
             f"Failed to start BackgroundTaskManager cleanup task: {e}")
@@ -215,6 +223,20 @@ async def lifespan(app: FastAPI):
         logger.warning(f"Error closing conversation database pool: {e}")
 
 
+    # Stop the symbol index refresh loop (uses the FMP client)
+    try:
+        from src.server.services.symbol_search_service import SymbolSearchService
+        await SymbolSearchService.get_instance().shutdown()
+    except Exception as e:
+        logger.warning(f"Error stopping symbol search index: {e}")
+
+    # Close the shared FMP HTTP connection pool
+    try:
+        from src.data_client.fmp import close_fmp_client
+        await close_fmp_client()
+    except Exception as e:
+        logger.warning(f"Error closing FMP client: {e}")
+
     # 3. FINALLY: Close Redis cache connection
     try:
         from src.utils.cache.redis_cache import close_cache
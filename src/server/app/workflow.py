@@ -456,6 +456,31 @@ async def soft_interrupt_workflow(thread_id: str):
         )
 
 
+@router.get("/stats")
+async def get_workflow_stats():
+    """
+    Get background workflow statistics for this server process.
+
+    Includes task counts by status, active connections, and Redis event
+    writer metrics (batch sizes and flush latency).
+
+    Returns:
+        Dict with background task manager statistics
+    """
+    try:
+        from src.server.services.background_task_manager import BackgroundTaskManager
+
+        manager = BackgroundTaskManager.get_instance()
+        return await manager.get_stats()
+
+    except Exception as e:
+        logger.exception(f"Error retrieving workflow stats: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to retrieve workflow stats: {str(e)}"
+        )
+
+
 @router.get("/{thread_id}/status")
 async def get_workflow_status(thread_id: str):
     """
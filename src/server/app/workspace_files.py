@@ -156,6 +156,52 @@ def _requested_system_ok(path: str) -> bool:
     )
 
 
+def _parse_byte_range(range_header: str | None, size: int) -> tuple[int, int] | None:
+    """Parse a single ``bytes=`` Range header into an inclusive (start, end).
+
+    Returns None when the header is absent, malformed, or requests multiple
+    ranges; the caller then serves the whole file, as RFC 9110 allows.
+    Raises 416 when the range cannot be satisfied.
+    """
+    if not range_header:
+        return None
+
+    unit, _, spec = range_header.strip().partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    first, sep, last = spec.strip().partition("-")
+    if not sep:
+        return None
+
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+        else:
+            # Suffix range: the final N bytes
+            suffix = int(last)
+            if suffix <= 0:
+                raise _range_not_satisfiable(size)
+            start, end = max(0, size - suffix), size - 1
+    except ValueError:
+        return None
+
+    if start >= size:
+        raise _range_not_satisfiable(size)
+    if end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+def _range_not_satisfiable(size: int) -> HTTPException:
+    return HTTPException(
+        status_code=416,
+        detail="Requested range not satisfiable",
+        headers={"Content-Range": f"bytes */{size}"},
+    )
+
+
 @router.get("/{workspace_id}/files")
 async def list_workspace_files(
     workspace_id: str,
@@ -253,35 +299,33 @@ async def read_workspace_file(
     if error:
         raise HTTPException(status_code=403, detail=error)
 
-    # Download raw bytes first to distinguish "not found" from "binary file"
-    raw_bytes = await sandbox.adownload_file_bytes(normalized)
-    if raw_bytes is None:
+    client_path = _to_client_path(sandbox, normalized)
+    if _is_always_hidden_path(client_path):
         raise HTTPException(status_code=404, detail="File not found")
 
-    # Check for known binary extensions
+    # Check for known binary extensions (stat only, to keep 404 for missing files)
     if _is_binary(normalized):
+        if await sandbox.astat_file(normalized) is None:
+            raise HTTPException(status_code=404, detail="File not found")
         raise HTTPException(
             status_code=415,
             detail="Cannot read binary file as text. Use GET /files/download instead.",
         )
 
+    # Select the line range inside the sandbox; only those lines are transferred
+    raw_bytes = await sandbox.aread_file_range_bytes(normalized, offset, limit)
+    if raw_bytes is None:
+        raise HTTPException(status_code=404, detail="File not found")
+
     # Try to decode as UTF-8
     try:
-        text_content = raw_bytes.decode("utf-8")
+        content = "\n".join(raw_bytes.decode("utf-8").splitlines())
     except UnicodeDecodeError:
         raise HTTPException(
             status_code=415,
             detail="File appears to be binary and cannot be read as text. Use GET /files/download instead.",
         )
 
-    # Apply line range
-    lines = text_content.splitlines()
-    content = "\n".join(lines[offset : offset + limit])
-
-    client_path = _to_client_path(sandbox, normalized)
-    if _is_always_hidden_path(client_path):
-        raise HTTPException(status_code=404, detail="File not found")
-
     mime, _enc = mimetypes.guess_type(client_path)
 
     return {
@@ -300,8 +344,11 @@ async def download_workspace_file(
     workspace_id: str,
     path: str = Query(..., description="File path (virtual or absolute)."),
     x_user_id: str = Header(..., alias="X-User-Id", description="User ID"),
+    range_header: str | None = Header(
+        None, alias="Range", description="Optional single byte range (bytes=start-end)."
+    ),
 ) -> Response:
-    """Download raw bytes from the workspace's live sandbox."""
+    """Stream raw bytes from the workspace's live sandbox (supports HTTP Range)."""
 
     workspace = await db_get_workspace(workspace_id)
     _require_workspace_owner(workspace, user_id=x_user_id, workspace_id=workspace_id)
@@ -317,21 +364,38 @@ async def download_workspace_file(
     if error:
         raise HTTPException(status_code=403, detail=error)
 
-    content = await sandbox.adownload_file_bytes(normalized)
-    if content is None:
-        raise HTTPException(status_code=404, detail="File not found")
-
     client_path = _to_client_path(sandbox, normalized)
     if _is_always_hidden_path(client_path):
         raise HTTPException(status_code=404, detail="File not found")
 
+    info = await sandbox.astat_file(normalized)
+    if info is None or info["is_dir"]:
+        raise HTTPException(status_code=404, detail="File not found")
+
+    size = info["size"]
+    byte_range = _parse_byte_range(range_header, size)
+    start, end = byte_range if byte_range else (0, size - 1)
+    length = max(0, end - start + 1)
+
     filename = client_path.split("/")[-1] if client_path else "download"
     mime, _enc = mimetypes.guess_type(filename)
 
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        "Accept-Ranges": "bytes",
+        "Content-Length": str(length),
+    }
+    if byte_range:
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    # Stream in bounded chunks pulled from the sandbox on demand. The body is
+    # capped at Content-Length; if the file shrinks meanwhile the iterator
+    # raises, which aborts the connection rather than ending the body short.
     return StreamingResponse(
-        iter([content]),
+        sandbox.aiter_file_bytes(normalized, start, length),
+        status_code=206 if byte_range else 200,
         media_type=mime or "application/octet-stream",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        headers=headers,
     )
 
 
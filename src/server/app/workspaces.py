@@ -7,6 +7,7 @@ has a dedicated Daytona sandbox (1:1 mapping).
 Endpoints:
 - POST /api/v1/workspaces - Create workspace
 - GET /api/v1/workspaces - List workspaces
+- GET /api/v1/workspaces/stats - Workspace manager stats (lock wait metrics)
 - GET /api/v1/workspaces/{workspace_id} - Get workspace details
 - PUT /api/v1/workspaces/{workspace_id} - Update workspace
 - POST /api/v1/workspaces/{workspace_id}/start - Start stopped workspace
@@ -136,6 +137,28 @@ async def list_workspaces(
         raise HTTPException(status_code=500, detail="Failed to list workspaces")
 
 
+@router.get("/stats")
+async def get_workspace_stats():
+    """
+    Get workspace manager statistics for this server process.
+
+    Includes cached sessions, in-flight session acquisitions and
+    per-workspace lock wait metrics.
+
+    Returns:
+        Dict with workspace manager statistics
+    """
+    try:
+        manager = WorkspaceManager.get_instance()
+        return manager.get_stats()
+    except ValueError:
+        # Manager not initialized
+        return {
+            "cached_sessions": 0,
+            "message": "Workspace Manager not initialized",
+        }
+
+
 @router.get("/{workspace_id}", response_model=WorkspaceResponse)
 async def get_workspace(workspace_id: str):
     """
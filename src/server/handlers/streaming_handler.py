@@ -15,10 +15,10 @@ Key responsibilities:
 """
 
 import asyncio
-import copy
 import json
 import logging
 import os
+import time
 from datetime import datetime, timezone
 from typing import Any, AsyncGenerator, Dict, List, Optional, Set, Tuple, cast
 
@@ -29,6 +29,7 @@ from src.server.utils.content_normalizer import (
     normalize_text_content,
     is_thinking_status_signal,
 )
+from src.server.utils.sse_serializer import format_sse_frame, get_sse_json_serializer
 from src.utils.tracking import ExecutionTracker
 
 logger = logging.getLogger(__name__)
@@ -40,6 +41,8 @@ sse_logger = logging.getLogger("sse_events")
 from src.config.settings import (
     get_workflow_timeout,
     get_sse_keepalive_interval,
+    get_sse_message_batch_ms,
+    get_sse_serializer,
     is_sse_event_log_enabled,
     is_background_execution_enabled,
 )
@@ -47,42 +50,112 @@ from src.config.settings import (
 WORKFLOW_TIMEOUT = get_workflow_timeout(default=900)  # seconds
 SSE_KEEPALIVE_INTERVAL = get_sse_keepalive_interval(default=15.0)  # seconds
 SSE_EVENT_LOG_ENABLED = is_sse_event_log_enabled()
+SSE_SERIALIZER = get_sse_serializer()
+SSE_MESSAGE_BATCH_MS = get_sse_message_batch_ms()
+
+# Queued on the keepalive queue when a message_chunk batch window elapses
+_FLUSH_MESSAGE_BATCH = object()
+
+# message_chunk fields that must match for tokens to share one coalesced frame
+_MESSAGE_BATCH_KEYS = ("thread_id", "agent", "id", "role", "content_type")
 
 MERGED_STREAM_CHUNK_MAX_BYTES_DEFAULT = 16 * 1024
 
 
+def _utf8_len(text: str) -> int:
+    """UTF-8 byte length without encoding ASCII text."""
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
 class StreamEventAccumulator:
-    """Accumulates and merges token-level SSE events for persistence."""
+    """
+    Accumulates and merges token-level SSE events for persistence.
+
+    Incoming payloads are shallow-copied (nested values are shared with the
+    caller and must not be mutated after emission). The text of the event
+    being merged into is kept as a list of parts with a running byte count
+    and joined once when the next event starts or get_events() is called,
+    so merging a long stream is linear in its length.
+    """
 
     def __init__(self, max_merged_bytes: int = MERGED_STREAM_CHUNK_MAX_BYTES_DEFAULT):
         self._max_merged_bytes = max_merged_bytes
         self._events: List[Dict[str, Any]] = []
+        # Unjoined text of the last event (None when it cannot be merged into)
+        self._tail_parts: Optional[List[str]] = None
+        self._tail_bytes = 0
+        self._tail_dirty = False
 
     def get_events(self) -> List[Dict[str, Any]]:
-        return copy.deepcopy(self._events)
+        """Merged events (read-only; the last one may still grow)."""
+        self._seal_tail()
+        return list(self._events)
 
     def add(self, event_type: str, data: Dict[str, Any]) -> None:
         if not isinstance(data, dict):
             return
 
-        incoming = copy.deepcopy(data)
+        incoming = dict(data)
 
-        if not self._events:
-            self._events.append({"event": event_type, "data": incoming})
-            return
+        if self._events and self._tail_parts is not None:
+            prev = self._events[-1]
+            if prev.get("event") == event_type:
+                if event_type == "message_chunk" and self._try_merge_message_chunk(prev, incoming):
+                    return
+                if event_type == "tool_call_chunks" and self._try_merge_tool_call_chunks(prev, incoming):
+                    return
 
-        prev = self._events[-1]
-        if prev.get("event") != event_type:
-            self._events.append({"event": event_type, "data": incoming})
+        self._seal_tail()
+        self._events.append({"event": event_type, "data": incoming})
+        self._open_tail(event_type, incoming)
+
+    def _open_tail(self, event_type: str, data: Dict[str, Any]) -> None:
+        """Start collecting parts for a newly appended event, if it can be merged into."""
+        self._tail_parts = None
+        self._tail_bytes = 0
+        self._tail_dirty = False
+
+        if event_type == "message_chunk":
+            text = data.get("content") or ""
+        elif event_type == "tool_call_chunks":
+            chunks = data.get("tool_call_chunks")
+            if not (isinstance(chunks, list) and len(chunks) == 1 and isinstance(chunks[0], dict)):
+                return
+            # The chunk's args are rewritten on seal, so it must not be the caller's dict
+            chunk = dict(chunks[0])
+            data["tool_call_chunks"] = [chunk]
+            text = chunk.get("args") or ""
+        else:
             return
 
-        if event_type == "message_chunk" and self._try_merge_message_chunk(prev, incoming):
+        if not isinstance(text, str):
             return
+        self._tail_parts = [text] if text else []
+        self._tail_bytes = _utf8_len(text)
 
-        if event_type == "tool_call_chunks" and self._try_merge_tool_call_chunks(prev, incoming):
+    def _seal_tail(self) -> None:
+        """Join the last event's parts back into its payload."""
+        if not self._tail_dirty:
             return
+        text = "".join(self._tail_parts)
+        self._tail_parts = [text]
+        self._tail_dirty = False
 
-        self._events.append({"event": event_type, "data": incoming})
+        tail = self._events[-1]
+        if tail["event"] == "message_chunk":
+            tail["data"]["content"] = text
+        else:
+            tail["data"]["tool_call_chunks"][0]["args"] = text
+
+    def _append_part(self, text: str) -> bool:
+        """Add text to the last event unless that would exceed the byte cap."""
+        size = _utf8_len(text)
+        if self._tail_bytes + size > self._max_merged_bytes:
+            return False
+        self._tail_parts.append(text)
+        self._tail_bytes += size
+        self._tail_dirty = True
+        return True
 
     def _try_merge_message_chunk(self, prev_event: Dict[str, Any], incoming: Dict[str, Any]) -> bool:
         prev_data = prev_event.get("data")
@@ -98,14 +171,12 @@ class StreamEventAccumulator:
         if any(prev_data.get(k) != incoming.get(k) for k in merge_keys):
             return False
 
-        prev_content = prev_data.get("content") or ""
         incoming_content = incoming.get("content") or ""
         incoming_finish = incoming.get("finish_reason")
 
         if incoming_content:
-            if len(prev_content.encode("utf-8")) + len(incoming_content.encode("utf-8")) > self._max_merged_bytes:
+            if not isinstance(incoming_content, str) or not self._append_part(incoming_content):
                 return False
-            prev_data["content"] = f"{prev_content}{incoming_content}"
 
         if incoming_finish is not None:
             prev_data["finish_reason"] = incoming_finish
@@ -121,16 +192,14 @@ class StreamEventAccumulator:
         if any(prev_data.get(k) != incoming.get(k) for k in merge_keys):
             return False
 
-        prev_chunks = prev_data.get("tool_call_chunks")
         incoming_chunks = incoming.get("tool_call_chunks")
-        if not (isinstance(prev_chunks, list) and isinstance(incoming_chunks, list)):
-            return False
-        if len(prev_chunks) != 1 or len(incoming_chunks) != 1:
+        if not isinstance(incoming_chunks, list) or len(incoming_chunks) != 1:
             return False
 
-        prev_chunk = prev_chunks[0]
+        # _open_tail only accepts a single dict chunk for the previous event
+        prev_chunk = prev_data["tool_call_chunks"][0]
         incoming_chunk = incoming_chunks[0]
-        if not (isinstance(prev_chunk, dict) and isinstance(incoming_chunk, dict)):
+        if not isinstance(incoming_chunk, dict):
             return False
 
         prev_call_id = prev_chunk.get("id")
@@ -142,19 +211,22 @@ class StreamEventAccumulator:
             if prev_chunk.get("index") != incoming_chunk.get("index"):
                 return False
 
-        prev_args = prev_chunk.get("args") or ""
         incoming_args = incoming_chunk.get("args") or ""
-        if not isinstance(prev_args, str) or not isinstance(incoming_args, str):
+        if not isinstance(incoming_args, str):
             return False
 
-        if incoming_args:
-            if len(prev_args.encode("utf-8")) + len(incoming_args.encode("utf-8")) > self._max_merged_bytes:
-                return False
-            prev_chunk["args"] = f"{prev_args}{incoming_args}"
+        if incoming_args and not self._append_part(incoming_args):
+            return False
 
         return bool(incoming_args)
 
 
+# Tags for items the graph pump puts on the merged queue
+_GRAPH_EVENT = object()
+_GRAPH_END = object()
+_GRAPH_ERROR = object()
+
+
 async def multiplex_streams(graph_stream: AsyncGenerator, keepalive_queue: asyncio.Queue):
     """
     Multiplex graph events and keepalive events into a single stream.
@@ -162,77 +234,71 @@ async def multiplex_streams(graph_stream: AsyncGenerator, keepalive_queue: async
     This ensures keepalive events are sent even when graph.astream() is blocked
     during long-running operations (LLM calls, tool execution, etc).
 
+    One pump task drains the graph stream into keepalive_queue, which then
+    carries both sources, so the consumer waits on a single queue instead of
+    creating a task per event. The pump only advances the graph after the
+    previous event has been consumed, as iterating the stream directly would.
+
     Args:
         graph_stream: AsyncGenerator from graph.astream()
-        keepalive_queue: Queue containing keepalive events
+        keepalive_queue: Queue containing keepalive events (graph events are merged into it)
 
     Yields:
         Tuple of (source, data) where:
         - source: "graph" or "keepalive"
         - data: Event data from that source
     """
-    graph_task = None
-    keepalive_task = None
-
-    try:
-        # Create initial tasks
-        graph_iterator = graph_stream.__aiter__()
-        graph_task = asyncio.ensure_future(graph_iterator.__anext__())
-        keepalive_task = asyncio.ensure_future(keepalive_queue.get())
+    queue = keepalive_queue
+    demand = asyncio.Event()
 
-        while True:
-            # Wait for whichever completes first
-            done, pending = await asyncio.wait(
-                {graph_task, keepalive_task},
-                return_when=asyncio.FIRST_COMPLETED
-            )
+    async def pump_graph() -> None:
+        # Always leave a terminal item, or the consumer would wait on
+        # keepalives forever (e.g. when the graph raises CancelledError)
+        terminal = (_GRAPH_END, None)
+        try:
+            async for graph_data in graph_stream:
+                demand.clear()
+                queue.put_nowait((_GRAPH_EVENT, graph_data))
+                await demand.wait()
+        except Exception as e:
+            terminal = (_GRAPH_ERROR, e)
+        except BaseException as e:
+            terminal = (_GRAPH_ERROR, e)
+            raise
+        finally:
+            queue.put_nowait(terminal)
 
-            # Process completed tasks
-            for task in done:
-                try:
-                    if task == graph_task:
-                        # Graph event received
-                        graph_data = task.result()
-                        yield ("graph", graph_data)
-                        # Create new graph task for next event
-                        graph_task = asyncio.ensure_future(graph_iterator.__anext__())
-
-                    elif task == keepalive_task:
-                        # Keepalive event received
-                        keepalive_data = task.result()
-                        yield ("keepalive", keepalive_data)
-                        # Create new keepalive task
-                        keepalive_task = asyncio.ensure_future(keepalive_queue.get())
-
-                except StopAsyncIteration:
-                    # Graph stream ended
-                    logger.debug("[MULTIPLEX] Graph stream ended")
-                    # Cancel keepalive task and exit
-                    if keepalive_task and not keepalive_task.done():
-                        keepalive_task.cancel()
-                    return
+    pump_task = asyncio.create_task(pump_graph())
 
-                except Exception as e:
-                    logger.error(f"[MULTIPLEX] Error processing task: {e}")
-                    raise
+    try:
+        while True:
+            item = await queue.get()
+            tag = item[0] if type(item) is tuple and len(item) == 2 else None
+
+            if tag is _GRAPH_EVENT:
+                yield ("graph", item[1])
+                # Consumer is ready for the next event
+                demand.set()
+            elif tag is _GRAPH_END:
+                # Graph stream ended
+                logger.debug("[MULTIPLEX] Graph stream ended")
+                return
+            elif tag is _GRAPH_ERROR:
+                if not isinstance(item[1], asyncio.CancelledError):
+                    logger.error(f"[MULTIPLEX] Error processing task: {item[1]}")
+                # A cancellation inside the graph propagates as cancellation
+                raise item[1]
+            else:
+                yield ("keepalive", item)
 
     except asyncio.CancelledError:
-        logger.debug("[MULTIPLEX] Multiplexer cancelled (client disconnected)")
-        # Clean up pending tasks
-        if graph_task and not graph_task.done():
-            graph_task.cancel()
-        if keepalive_task and not keepalive_task.done():
-            keepalive_task.cancel()
+        logger.debug("[MULTIPLEX] Multiplexer cancelled (client disconnected or graph cancelled)")
         raise
 
-    except Exception as e:
-        logger.error(f"[MULTIPLEX] Fatal error in multiplexer: {e}")
-        # Clean up
-        if graph_task and not graph_task.done():
-            graph_task.cancel()
-        if keepalive_task and not keepalive_task.done():
-            keepalive_task.cancel()
-        raise
+    finally:
+        # Clean up the pump (consumer stopped early, was cancelled or failed)
+        if not pump_task.done():
+            pump_task.cancel()
 
 
 class WorkflowStreamHandler:
@@ -256,6 +322,8 @@ class WorkflowStreamHandler:
         workflow_timeout: Optional[int] = None,
         background_registry: Optional[Any] = None,
         merged_stream_chunk_max_bytes: int = MERGED_STREAM_CHUNK_MAX_BYTES_DEFAULT,
+        serializer: Optional[str] = None,
+        message_batch_ms: Optional[float] = None,
     ):
         """
         Initialize the workflow stream handler.
@@ -269,6 +337,9 @@ class WorkflowStreamHandler:
             workflow_timeout: Maximum workflow execution time in seconds (default from env)
             background_registry: BackgroundTaskRegistry instance for background task status (optional)
             merged_stream_chunk_max_bytes: Max bytes per merged stored stream chunk
+            serializer: JSON serializer for SSE payloads, "json" or "orjson" (default from config)
+            message_batch_ms: Coalesce consecutive message_chunk tokens of one message
+                into one SSE frame per window (default from config, 0 = off)
         """
         self.thread_id = thread_id
         self.token_callback = token_callback
@@ -303,6 +374,18 @@ class WorkflowStreamHandler:
             max_merged_bytes=merged_stream_chunk_max_bytes
         )
 
+        # SSE payload serialization
+        self._dumps = get_sse_json_serializer(serializer or SSE_SERIALIZER)
+
+        # message_chunk coalescing (pending payload, its content parts and start time)
+        self._message_batch_s = (SSE_MESSAGE_BATCH_MS if message_batch_ms is None else message_batch_ms) / 1000
+        self._message_batch: Optional[Dict[str, Any]] = None
+        self._message_batch_parts: List[str] = []
+        self._message_batch_started = 0.0
+        # Frames flushed from a batch that must be yielded before the current event
+        self._flushed_frames: List[str] = []
+        self._keepalive_queue: Optional[asyncio.Queue] = None
+
         # Keepalive task management
         self._keepalive_task: Optional[asyncio.Task] = None
         self._keepalive_stop_event: asyncio.Event = asyncio.Event()
@@ -328,8 +411,6 @@ class WorkflowStreamHandler:
         Args:
             keepalive_queue: Queue to send keepalive events to
         """
-        import time
-
         try:
             while not self._keepalive_stop_event.is_set():
                 # Wait for keepalive_interval or until stop event
@@ -369,7 +450,7 @@ class WorkflowStreamHandler:
         """
         # Increment sequence for keepalive too (for proper event ordering)
         self.event_sequence += 1
-        return f"id: {self.event_sequence}\nevent: keepalive\ndata: {{\"status\": \"alive\"}}\n\n"
+        return format_sse_frame(self.event_sequence, "keepalive", '{"status": "alive"}')
 
     async def stream_workflow(
         self,
@@ -391,10 +472,33 @@ class WorkflowStreamHandler:
         Raises:
             asyncio.TimeoutError: If workflow exceeds configured timeout
         """
-        import time
+        try:
+            async for event in self._stream_workflow_events(graph, input_state, config):
+                # Coalesced message_chunk frames go out before the event that ended their batch
+                if self._flushed_frames:
+                    for frame in self._flushed_frames:
+                        yield frame
+                    self._flushed_frames.clear()
+                if event:
+                    yield event
+        except Exception:
+            if final_frame := self._flush_message_batch():
+                yield final_frame
+            raise
+
+        if final_frame := self._flush_message_batch():
+            yield final_frame
 
+    async def _stream_workflow_events(
+        self,
+        graph: Any,
+        input_state: Any,
+        config: dict,
+    ) -> AsyncGenerator[str, None]:
+        """Workflow SSE events; empty strings are message_chunk tokens held in a batch."""
         # Initialize keepalive queue and start background task
         keepalive_queue: asyncio.Queue = asyncio.Queue()
+        self._keepalive_queue = keepalive_queue
         self._keepalive_stop_event.clear()
         self._last_event_time = time.time()
         self._keepalive_task = asyncio.create_task(self._keepalive_loop(keepalive_queue))
@@ -425,6 +529,12 @@ class WorkflowStreamHandler:
                 # Update last event time
                 self._last_event_time = time.time()
 
+                # Batch window elapsed: emit the coalesced message_chunk frame
+                if data is _FLUSH_MESSAGE_BATCH:
+                    if frame := self._flush_message_batch():
+                        yield frame
+                    continue
+
                 # Handle keepalive events
                 if source == "keepalive":
                     # Directly yield keepalive event (already formatted)
@@ -1327,6 +1437,11 @@ class WorkflowStreamHandler:
         """
         Format data as SSE (Server-Sent Events) string with sequence numbering.
 
+        With message batching enabled, message_chunk tokens are held and
+        an empty string is returned; the coalesced frame is emitted when the
+        window elapses or a different event arrives (queued in _flushed_frames
+        so it keeps its place ahead of that event).
+
         Args:
             event_type: Type of SSE event
             data: Event data dictionary
@@ -1338,6 +1453,16 @@ class WorkflowStreamHandler:
         if data.get("content") == "":
             data.pop("content")
 
+        if self._message_batch_s > 0:
+            if event_type == "message_chunk" and self._add_to_message_batch(data):
+                return ""
+            if flushed := self._flush_message_batch():
+                self._flushed_frames.append(flushed)
+
+        return self._emit_sse_event(event_type, data)
+
+    def _emit_sse_event(self, event_type: str, data: dict[str, Any]) -> str:
+        """Assign the next sequence id, record the event for persistence and build its frame."""
         # Accumulate merged events for persistence (never break streaming)
         try:
             self._stream_event_accumulator.add(event_type, data)
@@ -1347,18 +1472,64 @@ class WorkflowStreamHandler:
         # Increment sequence number for this event
         self.event_sequence += 1
 
-        json_data = json.dumps(data, ensure_ascii=False)
-
         # Include sequence ID for reconnection support
         # Format: id: sequence_number\nevent: type\ndata: json\n\n
-        result = f"id: {self.event_sequence}\nevent: {event_type}\ndata: {json_data}\n\n"
+        result = format_sse_frame(self.event_sequence, event_type, self._dumps(data))
 
         # Log SSE events to dedicated logger if enabled
         if SSE_EVENT_LOG_ENABLED:
-            sse_logger.info(f"{result}")
+            sse_logger.info(result)
 
         return result
 
+    def _add_to_message_batch(self, data: dict[str, Any]) -> bool:
+        """
+        Hold a text/reasoning token for the current batch window.
+
+        Returns:
+            False if the token cannot be coalesced (signals, finish reasons,
+            non-string content) and must be emitted on its own
+        """
+        content = data.get("content")
+        if (
+            not isinstance(content, str)
+            or not content
+            or data.get("finish_reason") is not None
+            or data.get("content_type") == "reasoning_signal"
+        ):
+            return False
+
+        now = time.monotonic()
+        batch = self._message_batch
+        if batch is not None:
+            same_message = all(batch.get(k) == data.get(k) for k in _MESSAGE_BATCH_KEYS)
+            if same_message and now - self._message_batch_started < self._message_batch_s:
+                self._message_batch_parts.append(content)
+                return True
+            if flushed := self._flush_message_batch():
+                self._flushed_frames.append(flushed)
+
+        self._message_batch = dict(data)
+        self._message_batch_parts = [content]
+        self._message_batch_started = now
+        # Wake the stream loop when the window ends even if no other event arrives
+        if self._keepalive_queue is not None:
+            asyncio.get_running_loop().call_later(
+                self._message_batch_s, self._keepalive_queue.put_nowait, _FLUSH_MESSAGE_BATCH
+            )
+        return True
+
+    def _flush_message_batch(self) -> str:
+        """Emit the pending coalesced message_chunk, if any."""
+        batch = self._message_batch
+        if batch is None:
+            return ""
+        self._message_batch = None
+        if len(self._message_batch_parts) > 1:
+            batch["content"] = "".join(self._message_batch_parts)
+        self._message_batch_parts = []
+        return self._emit_sse_event("message_chunk", batch)
+
     def format_error_event(self, error_message: str) -> str:
         """
         Format an error event as SSE string.
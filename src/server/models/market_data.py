@@ -1,7 +1,8 @@
 """
 Pydantic models for market data endpoints.
 
-This module provides request and response models for FMP intraday data proxy endpoints.
+This module provides request and response models for FMP intraday data proxy
+endpoints and locally computed technical indicators.
 """
 
 from typing import Optional, List, Dict, Any, Literal
@@ -16,6 +17,9 @@ INDEX_INTERVALS = ("1min", "5min", "1hour")
 StockInterval = Literal["1min", "5min", "15min", "30min", "1hour", "4hour"]
 IndexInterval = Literal["1min", "5min", "1hour"]
 
+# Indicators accept daily bars on top of the intraday intervals
+DAILY_INTERVAL = "1day"
+
 
 class IntradayDataPoint(BaseModel):
     """Single OHLCV data point for intraday chart data."""
@@ -30,7 +34,7 @@ class IntradayDataPoint(BaseModel):
 class CacheMetadata(BaseModel):
     """Cache metadata for responses."""
     cached: bool = Field(..., description="Whether data was served from cache")
-    cache_key: Optional[str] = Field(None, description="Cache key used")
+    cache_key: Optional[str] = Field(None, description="Cache key prefix of the bar series")
     ttl_remaining: Optional[int] = Field(None, description="Remaining TTL in seconds")
     refreshed_in_background: bool = Field(False, description="Whether a background refresh was triggered")
 
@@ -61,7 +65,7 @@ class IntradayResponse(BaseModel):
                 "count": 1,
                 "cache": {
                     "cached": True,
-                    "cache_key": "fmp:intraday:stock:symbol=AAPL:interval=1min",
+                    "cache_key": "fmp:intraday:bars:stock:symbol=AAPL:interval=1min",
                     "ttl_remaining": 45,
                     "refreshed_in_background": False
                 }
@@ -206,3 +210,96 @@ class StockSearchResponse(BaseModel):
                 "count": 1
             }
         }
+
+
+class IndicatorsRequest(BaseModel):
+    """Request for technical indicators over cached OHLCV bars."""
+    symbols: List[str] = Field(
+        ...,
+        description="List of stock/index symbols (max 50)",
+        min_length=1,
+        max_length=50
+    )
+    indicators: Optional[List[str]] = Field(
+        None,
+        description=(
+            "Indicator specs as name[:param...]: sma:N, ema:N, rsi:N, macd:FAST:SLOW:SIGNAL, "
+            "bbands:N:K, atr:N, vwap, volatility:N, drawdown (default: a standard set)"
+        ),
+        min_length=1,
+        max_length=30
+    )
+    interval: str = Field(
+        "1day",
+        description="Bar interval: 1day, or an intraday interval supported for the asset type"
+    )
+    asset_type: Literal["stock", "index"] = Field("stock", description="Whether symbols are stocks or indexes")
+    from_date: Optional[str] = Field(
+        None,
+        alias="from",
+        description="First date to report (YYYY-MM-DD); earlier bars are loaded for warm-up"
+    )
+    to_date: Optional[str] = Field(
+        None,
+        alias="to",
+        description="Last date to report (YYYY-MM-DD)"
+    )
+    limit: Optional[int] = Field(
+        100,
+        description="Newest rows to return per symbol (null for the whole range)",
+        ge=1,
+        le=5000
+    )
+
+    class Config:
+        populate_by_name = True
+        json_schema_extra = {
+            "example": {
+                "symbols": ["AAPL", "MSFT"],
+                "indicators": ["sma:50", "rsi:14", "macd:12:26:9"],
+                "interval": "1day",
+                "asset_type": "stock",
+                "limit": 1
+            }
+        }
+
+
+class IndicatorsResponse(BaseModel):
+    """Response for technical indicators request."""
+    interval: str = Field(..., description="Bar interval used for the request")
+    columns: List[str] = Field(default_factory=list, description="Indicator output columns, in request order")
+    results: Dict[str, List[Dict[str, Any]]] = Field(
+        default_factory=dict,
+        description="Map of symbol to rows (newest first) with date, close and one value per column (null during warm-up)"
+    )
+    errors: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Map of symbol to error message for failed requests"
+    )
+    cache_stats: Optional[BatchCacheStats] = Field(
+        None,
+        description="Aggregated bar cache statistics (intraday intervals only)"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "interval": "1day",
+                "columns": ["sma_50", "rsi_14", "macd_12_26_9", "macd_12_26_9_signal", "macd_12_26_9_hist"],
+                "results": {
+                    "AAPL": [
+                        {
+                            "date": "2024-01-15",
+                            "close": 185.92,
+                            "sma_50": 189.31,
+                            "rsi_14": 44.72,
+                            "macd_12_26_9": -0.84,
+                            "macd_12_26_9_signal": 0.37,
+                            "macd_12_26_9_hist": -1.21
+                        }
+                    ]
+                },
+                "errors": {},
+                "cache_stats": None
+            }
+        }
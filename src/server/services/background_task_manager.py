@@ -9,7 +9,7 @@ Key Features:
 - Uses asyncio.shield() to protect tasks from client disconnect cancellation
 - Stores intermediate results during execution for reconnection support
 - Automatic cleanup of abandoned workflows
-- Thread-safe task registry with async locks
+- Task registry with per-thread lifecycle locks (no global lock on event paths)
 - Supports concurrent workflow executions
 
 Architecture:
@@ -44,7 +44,7 @@ from typing import Dict, Any, Optional, AsyncIterator, Callable, Coroutine
 from enum import Enum
 from dataclasses import dataclass, field
 from collections import deque
-from contextlib import suppress
+from contextlib import asynccontextmanager, suppress
 
 from src.config.settings import (
     get_max_concurrent_workflows,
@@ -56,8 +56,23 @@ from src.config.settings import (
     get_event_storage_backend,
     is_event_storage_fallback_enabled,
     get_redis_ttl_workflow_events,
+    get_event_write_batch_window_ms,
+    get_event_write_batch_max_size,
+    get_event_stream_block_ms,
+    get_live_fanout_backend,
 )
 from src.utils.cache.redis_cache import get_cache_client
+from src.server.services.event_buffer_writer import (
+    EventBufferWriter,
+    EventWriterStats,
+    parse_sse_event_id,
+    EVENTS_KEY_PREFIX,
+    STREAM_KEY_PREFIX,
+    META_KEY_PREFIX,
+    STREAM_EVENT_FIELD,
+    STREAM_END_FIELD,
+)
+from src.server.services.event_fanout import create_event_fanout
 from src.utils.tracking import serialize_agent_messages
 from src.server.utils.persistence_utils import (
     get_token_usage_from_callback,
@@ -110,12 +125,13 @@ class TaskInfo:
     # Result storage
     result_buffer: deque = field(default_factory=deque)  # Stores SSE events
     final_result: Optional[Any] = None
+    event_writer: Optional[EventBufferWriter] = None  # Batched Redis writer (redis backend)
 
     # Connection tracking
     active_connections: int = 0
 
-    # Live event broadcasting for reconnection support
-    live_queues: list = field(default_factory=list)  # List[asyncio.Queue]
+    # Per-thread lock for lifecycle transitions (completion/failure/cancel)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
 
     # Metadata
     metadata: Dict[str, Any] = field(default_factory=dict)
@@ -140,6 +156,16 @@ class BackgroundTaskManager:
     - Result buffering and streaming
     - Connection management
     - Automatic cleanup
+
+    Locking:
+    - ``task_lock`` guards membership of ``tasks`` (register, remove,
+      registry-wide scans). It is never held across an await, so it does not
+      serialize unrelated workflows.
+    - ``TaskInfo.lock`` serializes lifecycle transitions of one thread
+      (completion, failure, cancellation and their persistence).
+    - Per-event paths (buffering, broadcasting, lookups, connection counts)
+      take no lock: each run has a single writer, and the dict lookup and
+      field updates never yield to the event loop.
     """
 
     # Singleton instance
@@ -148,7 +174,7 @@ class BackgroundTaskManager:
     def __init__(self):
         """Initialize background task manager."""
         self.tasks: Dict[str, TaskInfo] = {}
-        self.task_lock = asyncio.Lock()
+        self.task_lock = asyncio.Lock()  # Registry lock (see class docstring)
 
         # Configuration
         self.max_concurrent = get_max_concurrent_workflows()
@@ -162,10 +188,27 @@ class BackgroundTaskManager:
         self.event_storage_backend = get_event_storage_backend()
         self.event_storage_fallback = is_event_storage_fallback_enabled()
         self.redis_event_ttl = get_redis_ttl_workflow_events()
+        self.event_write_window_ms = get_event_write_batch_window_ms()
+        self.event_write_max_batch = get_event_write_batch_max_size()
+        self.event_stream_block_ms = get_event_stream_block_ms()
+        self.event_writer_stats = EventWriterStats()
+
+        # Live event fan-out to connected SSE subscribers
+        self.fanout = create_event_fanout(get_live_fanout_backend())
 
         # Cleanup task
         self.cleanup_task: Optional[asyncio.Task] = None
 
+    @property
+    def uses_redis_events(self) -> bool:
+        """True if events are stored in Redis (list or stream backend)."""
+        return self.event_storage_backend in ("redis", "redis_stream")
+
+    @property
+    def uses_redis_stream(self) -> bool:
+        """True if events are stored in a Redis stream (resumable from any replica)."""
+        return self.event_storage_backend == "redis_stream"
+
     @classmethod
     def get_instance(cls) -> 'BackgroundTaskManager':
         """
@@ -178,20 +221,28 @@ class BackgroundTaskManager:
             cls._instance = cls()
         return cls._instance
 
-    async def _get_task_info_locked(self, thread_id: str) -> Optional[TaskInfo]:
+    @asynccontextmanager
+    async def _task_lifecycle(self, thread_id: str) -> AsyncIterator[Optional[TaskInfo]]:
         """
-        Acquire lock and get task info.
+        Hold a thread's lifecycle lock and yield its task info.
 
-        Helper method to reduce boilerplate of locking + dict lookup pattern.
+        Only this thread's lock is taken, so slow finalization work (state
+        snapshots, persistence, completion callbacks) never blocks event
+        buffering or lookups for other workflows.
 
         Args:
             thread_id: Workflow thread identifier
 
-        Returns:
+        Yields:
             TaskInfo or None if not found
         """
-        async with self.task_lock:
-            return self.tasks.get(thread_id)
+        task_info = self.tasks.get(thread_id)
+        if task_info is None:
+            yield None
+            return
+
+        async with task_info.lock:
+            yield task_info
 
     async def start_cleanup_task(self):
         """Start periodic cleanup background task."""
@@ -204,6 +255,10 @@ class BackgroundTaskManager:
                 f"abandoned_timeout={self.abandoned_timeout}s)"
             )
 
+    async def start_live_fanout(self):
+        """Start the live event fan-out (opens Pub/Sub for cross-replica delivery)."""
+        await self.fanout.start()
+
     async def stop_cleanup_task(self):
         """Stop periodic cleanup background task."""
         if self.cleanup_task and not self.cleanup_task.done():
@@ -226,8 +281,9 @@ class BackgroundTaskManager:
         """
         logger.info("[BackgroundTaskManager] Starting graceful shutdown...")
 
-        # Stop cleanup task first
+        # Stop cleanup task and live fan-out listener first
         await self.stop_cleanup_task()
+        await self.fanout.stop()
 
         # Get list of running workflows
         async with self.task_lock:
@@ -372,6 +428,13 @@ class BackgroundTaskManager:
             ValueError: If max concurrent workflows exceeded
             RuntimeError: If workflow already exists for thread_id
         """
+        # Let a previous run of this thread finish persisting its outcome
+        # before it is replaced (waits on this thread only)
+        previous = self.tasks.get(thread_id)
+        if previous is not None and previous.lock.locked():
+            async with previous.lock:
+                pass
+
         async with self.task_lock:
             # Check if already exists
             if thread_id in self.tasks:
@@ -455,10 +518,9 @@ class BackgroundTaskManager:
             async def consume_workflow():
                 """Consume workflow generator with cancellation/soft-interrupt checks."""
                 # Get cancellation + soft-interrupt event references
-                async with self.task_lock:
-                    task_info = self.tasks.get(thread_id)
-                    cancel_event = task_info.cancel_event if task_info else None
-                    soft_interrupt_event = task_info.soft_interrupt_event if task_info else None
+                task_info = self.tasks.get(thread_id)
+                cancel_event = task_info.cancel_event if task_info else None
+                soft_interrupt_event = task_info.soft_interrupt_event if task_info else None
 
                 if not cancel_event:
                     # Fallback if no event found (shouldn't happen)
@@ -492,13 +554,20 @@ class BackgroundTaskManager:
                     if self.enable_storage:
                         await self._buffer_event_redis(thread_id, event)
 
+            async def consume_and_flush():
+                """Run the consumer, then flush batched events before status changes."""
+                try:
+                    await consume_workflow()
+                finally:
+                    with suppress(Exception):
+                        await self._flush_event_writer(thread_id)
+
             # Create the inner task and store reference
-            inner_task = asyncio.create_task(consume_workflow())
+            inner_task = asyncio.create_task(consume_and_flush())
 
-            async with self.task_lock:
-                task_info = self.tasks.get(thread_id)
-                if task_info:
-                    task_info.inner_task = inner_task
+            task_info = self.tasks.get(thread_id)
+            if task_info:
+                task_info.inner_task = inner_task
 
             # ALWAYS use shield - cancellation handled cooperatively inside task
             await asyncio.shield(inner_task)
@@ -525,6 +594,12 @@ class BackgroundTaskManager:
             )
             await self._mark_failed(thread_id, str(e))
 
+        finally:
+            # Let stream tailers (possibly on other replicas) know the run ended
+            if self.uses_redis_stream:
+                with suppress(Exception):
+                    await self._write_stream_end_marker(thread_id)
+
     async def _flush_checkpoint(self, thread_id: str) -> None:
         """Force a checkpoint write for the current thread state.
 
@@ -532,9 +607,8 @@ class BackgroundTaskManager:
         If the user presses ESC mid-run, this explicit flush makes sure the
         latest available state is persisted so the next request can restore it.
         """
-        async with self.task_lock:
-            task_info = self.tasks.get(thread_id)
-            graph = task_info.graph if task_info else None
+        task_info = self.tasks.get(thread_id)
+        graph = task_info.graph if task_info else None
 
         if not graph:
             return
@@ -564,38 +638,19 @@ class BackgroundTaskManager:
             thread_id: Workflow thread identifier
             event: Event to buffer (SSE-formatted string)
         """
-        async with self.task_lock:
-            task_info = self.tasks.get(thread_id)
-            if not task_info:
-                return
-
-            # Add to buffer for later retrieval (disconnected clients)
-            task_info.result_buffer.append(event)
+        task_info = self.tasks.get(thread_id)
+        if not task_info:
+            return
 
-            # Limit buffer size
-            if len(task_info.result_buffer) > self.max_stored_messages:
-                task_info.result_buffer.popleft()
+        # Add to buffer for later retrieval (disconnected clients)
+        task_info.result_buffer.append(event)
 
-            # Broadcast to live subscribers (currently connected clients)
-            dead_queues = []
-            for queue in task_info.live_queues:
-                try:
-                    queue.put_nowait(event)
-                except asyncio.QueueFull:
-                    logger.warning(
-                        f"[BackgroundTaskManager] Queue full for subscriber "
-                        f"on {thread_id}, dropping event"
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"[BackgroundTaskManager] Error broadcasting to queue: {e}"
-                    )
-                    dead_queues.append(queue)
+        # Limit buffer size
+        if len(task_info.result_buffer) > self.max_stored_messages:
+            task_info.result_buffer.popleft()
 
-            # Remove dead queues
-            for queue in dead_queues:
-                if queue in task_info.live_queues:
-                    task_info.live_queues.remove(queue)
+        # Broadcast to live subscribers (currently connected clients)
+        await self.fanout.publish(thread_id, event)
 
     async def _buffer_event_redis(self, thread_id: str, event: str):
         """
@@ -605,167 +660,132 @@ class BackgroundTaskManager:
             thread_id: Workflow thread identifier
             event: SSE-formatted event string
         """
-        # First, broadcast to live subscribers (in-memory, unchanged)
-        async with self.task_lock:
-            task_info = self.tasks.get(thread_id)
-            if not task_info:
-                return
+        task_info = self.tasks.get(thread_id)
+        if not task_info:
+            return
 
-            # Broadcast to live queues
-            dead_queues = []
-            for queue in task_info.live_queues:
-                try:
-                    queue.put_nowait(event)
-                except asyncio.QueueFull:
-                    logger.warning(
-                        f"[BackgroundTaskManager] Queue full for subscriber "
-                        f"on {thread_id}, dropping event"
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"[BackgroundTaskManager] Error broadcasting to queue: {e}"
-                    )
-                    dead_queues.append(queue)
+        writer = (
+            self._ensure_event_writer(task_info)
+            if self.uses_redis_events
+            else None
+        )
 
-            # Remove dead queues
-            for queue in dead_queues:
-                if queue in task_info.live_queues:
-                    task_info.live_queues.remove(queue)
+        # First, broadcast to live subscribers (local and, if configured, other replicas)
+        try:
+            await self.fanout.publish(thread_id, event)
+        except Exception as e:
+            logger.error(f"[BackgroundTaskManager] Error broadcasting event for {thread_id}: {e}")
 
         # Store event to Redis (if configured) or fallback to in-memory
         try:
             cache = get_cache_client()
 
             # Check if Redis backend is enabled and Redis is available
-            use_redis = (
-                self.event_storage_backend == "redis"
-                and cache.enabled
-            )
+            use_redis = self.uses_redis_events and cache.enabled
 
             if not use_redis:
                 # Use in-memory storage
-                if self.event_storage_backend == "redis":
+                if self.uses_redis_events:
                     logger.warning(
                         f"[EventBuffer] Redis unavailable, using in-memory buffer for {thread_id}"
                     )
 
-                async with self.task_lock:
-                    task_info = self.tasks.get(thread_id)
-                    if task_info:
-                        task_info.result_buffer.append(event)
-                        if len(task_info.result_buffer) > self.max_stored_messages:
-                            task_info.result_buffer.popleft()
+                await self._append_to_memory_buffer(thread_id, [event])
                 return
 
-            # Redis storage path
-            events_key = f"workflow:events:{thread_id}"
-            meta_key = f"workflow:events:meta:{thread_id}"
+            # Redis storage path: hand off to the per-thread batched writer
+            await writer.append(event)
 
-            # Parse event ID from SSE format
-            event_id = None
-            try:
-                event_id_str = event.split("\n")[0].replace("id: ", "").strip()
-                event_id = int(event_id_str)
-            except (ValueError, IndexError):
-                logger.debug(f"[EventBuffer] Could not parse event ID from SSE string")
-
-            # Append to Redis list with automatic FIFO trimming
-            success = await cache.list_append(
-                events_key,
-                event,  # Store raw SSE string
-                max_size=self.max_stored_messages,
-                ttl=self.redis_event_ttl
+        except Exception as e:
+            logger.error(
+                f"[EventBuffer] Error buffering event to Redis for {thread_id}: {e}",
+                exc_info=True
             )
+            # Fallback to in-memory on error
+            if self.event_storage_fallback:
+                await self._append_to_memory_buffer(thread_id, [event])
 
-            # Check buffer size and warn if near capacity
-            if success:
-                buffer_size = await cache.list_length(events_key)
-                capacity_threshold = int(self.max_stored_messages * 0.9)  # 90% threshold
-
-                if buffer_size >= capacity_threshold:
-                    logger.warning(
-                        f"[EventBuffer] Buffer near capacity for {thread_id}: "
-                        f"{buffer_size}/{self.max_stored_messages} events. "
-                        f"Oldest events will be dropped (FIFO)."
-                    )
+    def _ensure_event_writer(self, task_info: TaskInfo) -> EventBufferWriter:
+        """
+        Get or create the batched Redis writer for a task.
 
-            if not success:
-                # Fallback to in-memory if Redis write fails
-                if self.event_storage_fallback:
-                    logger.warning(
-                        f"[EventBuffer] Failed to buffer event to Redis for {thread_id}, "
-                        f"falling back to in-memory"
-                    )
-                    async with self.task_lock:
-                        task_info = self.tasks.get(thread_id)
-                        if task_info:
-                            task_info.result_buffer.append(event)
-                            if len(task_info.result_buffer) > self.max_stored_messages:
-                                task_info.result_buffer.popleft()
-                else:
-                    logger.error(
-                        f"[EventBuffer] Failed to buffer event to Redis for {thread_id}, "
-                        f"fallback disabled"
-                    )
-                return
+        Args:
+            task_info: Task to attach the writer to
 
-            # Update metadata in Redis
-            now = datetime.now().isoformat()
-            meta_updates: dict[str, Any] = {
-                "updated_at": now,
-            }
+        Returns:
+            EventBufferWriter for the task's thread
+        """
+        if task_info.event_writer is None:
+            thread_id = task_info.thread_id
+            task_info.event_writer = EventBufferWriter(
+                thread_id,
+                max_size=self.max_stored_messages,
+                ttl=self.redis_event_ttl,
+                window_ms=self.event_write_window_ms,
+                max_batch_size=self.event_write_max_batch,
+                stats=self.event_writer_stats,
+                on_failure=lambda batch: self._handle_event_write_failure(thread_id, batch),
+                storage="stream" if self.uses_redis_stream else "list",
+            )
+        return task_info.event_writer
 
-            if event_id:
-                meta_updates["last_event_id"] = event_id
+    async def _handle_event_write_failure(self, thread_id: str, events: list) -> None:
+        """Move a batch that failed to reach Redis into the in-memory buffer."""
+        if self.event_storage_fallback:
+            logger.warning(
+                f"[EventBuffer] Failed to buffer {len(events)} events to Redis for {thread_id}, "
+                f"falling back to in-memory"
+            )
+            await self._append_to_memory_buffer(thread_id, events)
+        else:
+            logger.error(
+                f"[EventBuffer] Failed to buffer {len(events)} events to Redis for {thread_id}, "
+                f"fallback disabled"
+            )
 
-            # Check if this is first event
-            current_meta = await cache.hash_get_all(meta_key)
-            if not current_meta or "created_at" not in current_meta:
-                meta_updates["created_at"] = now
+    async def _append_to_memory_buffer(self, thread_id: str, events: list) -> None:
+        """Append events to the in-memory result buffer with FIFO trimming."""
+        task_info = self.tasks.get(thread_id)
+        if not task_info:
+            return
+        task_info.result_buffer.extend(events)
+        while len(task_info.result_buffer) > self.max_stored_messages:
+            task_info.result_buffer.popleft()
 
-            # Increment event count
-            current_count = int(current_meta.get("event_count", 0)) if current_meta else 0
-            meta_updates["event_count"] = current_count + 1
+    async def _flush_event_writer(self, thread_id: str) -> None:
+        """Flush pending batched events for a thread (no-op without a writer)."""
+        task_info = self.tasks.get(thread_id)
+        writer = task_info.event_writer if task_info else None
+        if writer is not None:
+            await writer.flush()
 
-            # Save all metadata fields
-            for field, value in meta_updates.items():
-                await cache.hash_set(meta_key, field, str(value), ttl=self.redis_event_ttl)
+    async def _write_stream_end_marker(self, thread_id: str) -> None:
+        """Append the terminal entry to the thread's event stream."""
+        task_info = self.tasks.get(thread_id)
+        if not task_info or task_info.event_writer is None:
+            return
+        await task_info.event_writer.write_end_marker(task_info.status.value)
 
-            logger.debug(
-                f"[EventBuffer] Buffered event to Redis: {thread_id} "
-                f"(id={event_id}, total={meta_updates['event_count']})"
-            )
+    # ========== Workflow Completion & Error Handlers ==========
 
+    async def _publish_end(self, thread_id: str) -> None:
+        """Send the completion sentinel (None) to all live subscribers."""
+        try:
+            await self.fanout.publish_end(thread_id)
         except Exception as e:
-            logger.error(
-                f"[EventBuffer] Error buffering event to Redis for {thread_id}: {e}",
-                exc_info=True
-            )
-            # Fallback to in-memory on error
-            if self.event_storage_fallback:
-                async with self.task_lock:
-                    task_info = self.tasks.get(thread_id)
-                    if task_info:
-                        task_info.result_buffer.append(event)
-                        if len(task_info.result_buffer) > self.max_stored_messages:
-                            task_info.result_buffer.popleft()
-
-    # ========== Workflow Completion & Error Handlers ==========
+            logger.error(f"Error sending completion signal: {e}")
 
     async def _mark_completed(self, thread_id: str):
         """Mark workflow as completed and notify live subscribers."""
-        async with self.task_lock:
-            task_info = self.tasks.get(thread_id)
+        callback_error: Optional[str] = None
+
+        async with self._task_lifecycle(thread_id) as task_info:
             if task_info:
                 task_info.status = TaskStatus.COMPLETED
                 task_info.completed_at = datetime.now()
 
-                # Send completion sentinel to all live subscribers
-                for queue in task_info.live_queues:
-                    try:
-                        queue.put_nowait(None)  # None signals completion
-                    except Exception as e:
-                        logger.error(f"Error sending completion signal: {e}")
+                # Send completion sentinel (None) to all live subscribers
+                await self._publish_end(thread_id)
 
                 # Check if workflow is truly completed or interrupted
                 # by examining LangGraph state (using per-task graph reference)
@@ -883,24 +903,23 @@ class BackgroundTaskManager:
                                 f"[BackgroundTaskManager] Completion callback failed for {thread_id}: {e}",
                                 exc_info=True
                             )
-                            # Update workflow status to error when callback fails
-                            await self._mark_failed(thread_id, f"Completion callback failed: {str(e)}")
+                            callback_error = f"Completion callback failed: {str(e)}"
+
+        # Update workflow status to error when callback fails (after releasing
+        # the task lock, which _mark_failed acquires itself)
+        if callback_error:
+            await self._mark_failed(thread_id, callback_error)
 
     async def _mark_failed(self, thread_id: str, error: str):
         """Mark workflow as failed and notify live subscribers."""
-        async with self.task_lock:
-            task_info = self.tasks.get(thread_id)
+        async with self._task_lifecycle(thread_id) as task_info:
             if task_info:
                 task_info.status = TaskStatus.FAILED
                 task_info.completed_at = datetime.now()
                 task_info.error = error
 
-                # Send completion sentinel to all live subscribers
-                for queue in task_info.live_queues:
-                    try:
-                        queue.put_nowait(None)  # None signals completion
-                    except Exception as e:
-                        logger.error(f"Error sending completion signal: {e}")
+                # Send completion sentinel (None) to all live subscribers
+                await self._publish_end(thread_id)
 
                 logger.error(
                     f"[BackgroundTaskManager] Workflow {thread_id} failed: {error}"
@@ -989,8 +1008,7 @@ class BackgroundTaskManager:
 
         Unlike `_mark_cancelled`, this does not persist a user cancellation.
         """
-        async with self.task_lock:
-            task_info = self.tasks.get(thread_id)
+        async with self._task_lifecycle(thread_id) as task_info:
             if not task_info:
                 return
 
@@ -998,9 +1016,7 @@ class BackgroundTaskManager:
             task_info.completed_at = datetime.now()
 
             # Notify all live subscribers that the workflow stream ended
-            for queue in task_info.live_queues:
-                with suppress(Exception):
-                    queue.put_nowait(None)
+            await self._publish_end(thread_id)
 
             logger.info(f"[BackgroundTaskManager] Marked as soft-interrupted: {thread_id}")
 
@@ -1076,17 +1092,12 @@ class BackgroundTaskManager:
                     )
 
     async def _mark_cancelled(self, thread_id: str):
-        async with self.task_lock:
-            task_info = self.tasks.get(thread_id)
+        async with self._task_lifecycle(thread_id) as task_info:
             if task_info:
                 task_info.status = TaskStatus.CANCELLED
                 task_info.completed_at = datetime.now()
 
-                for queue in task_info.live_queues:
-                    try:
-                        queue.put_nowait(None)
-                    except Exception as e:
-                        logger.error(f"Error sending completion signal: {e}")
+                await self._publish_end(thread_id)
 
                 logger.debug(f"[BackgroundTaskManager] Marked as cancelled: {thread_id}")
 
@@ -1173,7 +1184,7 @@ class BackgroundTaskManager:
         Returns:
             TaskStatus or None if not found
         """
-        task_info = await self._get_task_info_locked(thread_id)
+        task_info = self.tasks.get(thread_id)
         return task_info.status if task_info else None
 
     async def get_task_info(self, thread_id: str) -> Optional[TaskInfo]:
@@ -1186,12 +1197,11 @@ class BackgroundTaskManager:
         Returns:
             TaskInfo or None if not found
         """
-        async with self.task_lock:
-            task_info = self.tasks.get(thread_id)
-            if task_info:
-                # Update last access time
-                task_info.last_access_at = datetime.now()
-            return task_info
+        task_info = self.tasks.get(thread_id)
+        if task_info:
+            # Update last access time
+            task_info.last_access_at = datetime.now()
+        return task_info
 
     async def increment_connection(self, thread_id: str) -> bool:
         """
@@ -1203,17 +1213,16 @@ class BackgroundTaskManager:
         Returns:
             True if successful, False if task not found
         """
-        async with self.task_lock:
-            task_info = self.tasks.get(thread_id)
-            if task_info:
-                task_info.active_connections += 1
-                task_info.last_access_at = datetime.now()
-                logger.debug(
-                    f"[BackgroundTaskManager] Connection attached to {thread_id} "
-                    f"(active: {task_info.active_connections})"
-                )
-                return True
-            return False
+        task_info = self.tasks.get(thread_id)
+        if task_info:
+            task_info.active_connections += 1
+            task_info.last_access_at = datetime.now()
+            logger.debug(
+                f"[BackgroundTaskManager] Connection attached to {thread_id} "
+                f"(active: {task_info.active_connections})"
+            )
+            return True
+        return False
 
     async def decrement_connection(self, thread_id: str) -> bool:
         """
@@ -1225,16 +1234,15 @@ class BackgroundTaskManager:
         Returns:
             True if successful, False if task not found
         """
-        async with self.task_lock:
-            task_info = self.tasks.get(thread_id)
-            if task_info:
-                task_info.active_connections = max(0, task_info.active_connections - 1)
-                logger.debug(
-                    f"[BackgroundTaskManager] Connection detached from {thread_id} "
-                    f"(active: {task_info.active_connections})"
-                )
-                return True
-            return False
+        task_info = self.tasks.get(thread_id)
+        if task_info:
+            task_info.active_connections = max(0, task_info.active_connections - 1)
+            logger.debug(
+                f"[BackgroundTaskManager] Connection detached from {thread_id} "
+                f"(active: {task_info.active_connections})"
+            )
+            return True
+        return False
 
     async def get_buffered_events(
         self,
@@ -1252,16 +1260,15 @@ class BackgroundTaskManager:
         Returns:
             List of buffered events
         """
-        async with self.task_lock:
-            task_info = self.tasks.get(thread_id)
-            if not task_info or not task_info.result_buffer:
-                return []
+        task_info = self.tasks.get(thread_id)
+        if not task_info or not task_info.result_buffer:
+            return []
 
-            if from_beginning:
-                return list(task_info.result_buffer)
-            else:
-                # For now, return all (in future could track read position)
-                return list(task_info.result_buffer)
+        if from_beginning:
+            return list(task_info.result_buffer)
+        else:
+            # For now, return all (in future could track read position)
+            return list(task_info.result_buffer)
 
     async def get_buffered_events_redis(
         self,
@@ -1284,43 +1291,45 @@ class BackgroundTaskManager:
             cache = get_cache_client()
 
             # Check if Redis backend is enabled and Redis is available
-            use_redis = (
-                self.event_storage_backend == "redis"
-                and cache.enabled
-            )
+            use_redis = self.uses_redis_events and cache.enabled
 
             if not use_redis:
                 # Fallback to in-memory
-                if self.event_storage_backend == "redis":
+                if self.uses_redis_events:
                     logger.warning(
                         f"[EventBuffer] Redis unavailable, using in-memory buffer for {thread_id}"
                     )
 
-                async with self.task_lock:
-                    task_info = self.tasks.get(thread_id)
-                    if not task_info or not task_info.result_buffer:
-                        return []
+                task_info = self.tasks.get(thread_id)
+                if not task_info or not task_info.result_buffer:
+                    return []
 
-                    events = list(task_info.result_buffer)
+                events = list(task_info.result_buffer)
 
-                    # Filter by event ID if requested
-                    if after_event_id is not None:
-                        filtered_events = []
-                        for event in events:
-                            try:
-                                event_id_str = event.split("\n")[0].replace("id: ", "").strip()
-                                event_id = int(event_id_str)
-                                if event_id > after_event_id:
-                                    filtered_events.append(event)
-                            except (ValueError, IndexError):
-                                # Can't parse ID, include it to be safe
-                                filtered_events.append(event)
-                        return filtered_events
+                # Filter by event ID if requested
+                if after_event_id is not None:
+                    filtered_events = []
+                    for event in events:
+                        event_id = parse_sse_event_id(event)
+                        # Can't parse ID, include it to be safe
+                        if event_id is None or event_id > after_event_id:
+                            filtered_events.append(event)
+                    return filtered_events
+
+                return events
 
-                    return events
+            # Redis retrieval path: make pending batched events visible first
+            await self._flush_event_writer(thread_id)
+
+            if self.uses_redis_stream:
+                events, _, _ = await self._read_event_stream(thread_id, after_event_id)
+                logger.info(
+                    f"[EventBuffer] Retrieved {len(events)} stream events "
+                    f"(after_event_id={after_event_id}) for {thread_id}"
+                )
+                return events
 
-            # Redis retrieval path
-            events_key = f"workflow:events:{thread_id}"
+            events_key = f"{EVENTS_KEY_PREFIX}{thread_id}"
 
             # Get all events from list
             events = await cache.list_range(events_key, start=0, end=-1)
@@ -1333,16 +1342,9 @@ class BackgroundTaskManager:
             if after_event_id is not None:
                 filtered_events = []
                 for event in events:
-                    try:
-                        # Parse event ID from SSE format
-                        event_id_str = event.split("\n")[0].replace("id: ", "").strip()
-                        event_id = int(event_id_str)
-
-                        if event_id > after_event_id:
-                            filtered_events.append(event)
-
-                    except (ValueError, IndexError):
-                        # Can't parse ID, include it to be safe
+                    event_id = parse_sse_event_id(event)
+                    # Can't parse ID, include it to be safe
+                    if event_id is None or event_id > after_event_id:
                         filtered_events.append(event)
 
                 logger.info(
@@ -1362,11 +1364,10 @@ class BackgroundTaskManager:
 
             # Fallback to in-memory on error
             if self.event_storage_fallback:
-                async with self.task_lock:
-                    task_info = self.tasks.get(thread_id)
-                    if not task_info or not task_info.result_buffer:
-                        return []
-                    return list(task_info.result_buffer)
+                task_info = self.tasks.get(thread_id)
+                if not task_info or not task_info.result_buffer:
+                    return []
+                return list(task_info.result_buffer)
 
             return []
 
@@ -1383,23 +1384,28 @@ class BackgroundTaskManager:
         try:
             cache = get_cache_client()
 
+            # Drop batched events that have not reached Redis yet
+            task_info = self.tasks.get(thread_id)
+            if task_info and task_info.event_writer is not None:
+                task_info.event_writer.discard()
+
             # Clear Redis buffer if using Redis backend
-            if self.event_storage_backend == "redis" and cache.enabled:
-                events_key = f"workflow:events:{thread_id}"
-                meta_key = f"workflow:events:meta:{thread_id}"
+            if self.uses_redis_events and cache.enabled:
+                prefix = STREAM_KEY_PREFIX if self.uses_redis_stream else EVENTS_KEY_PREFIX
+                events_key = f"{prefix}{thread_id}"
+                meta_key = f"{META_KEY_PREFIX}{thread_id}"
 
-                # Delete both the event list and metadata
+                # Delete both the event list/stream and metadata
                 await cache.delete(events_key)
                 await cache.delete(meta_key)
 
                 logger.info(f"[EventBuffer] Cleared Redis event buffer for {thread_id}")
 
             # Also clear in-memory buffer (fallback or dual-mode)
-            async with self.task_lock:
-                task_info = self.tasks.get(thread_id)
-                if task_info and task_info.result_buffer:
-                    task_info.result_buffer.clear()
-                    logger.debug(f"[EventBuffer] Cleared in-memory buffer for {thread_id}")
+            task_info = self.tasks.get(thread_id)
+            if task_info and task_info.result_buffer:
+                task_info.result_buffer.clear()
+                logger.debug(f"[EventBuffer] Cleared in-memory buffer for {thread_id}")
 
         except Exception as e:
             logger.error(
@@ -1407,10 +1413,132 @@ class BackgroundTaskManager:
                 exc_info=True
             )
 
+    async def _read_event_stream(
+        self,
+        thread_id: str,
+        after_event_id: Optional[int] = None,
+    ) -> tuple:
+        """
+        Read buffered events from the thread's Redis stream (XRANGE).
+
+        Seeks directly to ``after_event_id`` instead of scanning the buffer.
+
+        Args:
+            thread_id: Workflow thread identifier
+            after_event_id: Return only events after this SSE sequence number
+
+        Returns:
+            Tuple of (events, last_entry_id, ended):
+            - events: SSE-formatted event strings
+            - last_entry_id: Stream ID of the last entry read (for tailing)
+            - ended: True if the run's end marker was read
+        """
+        cache = get_cache_client()
+        stream_key = f"{STREAM_KEY_PREFIX}{thread_id}"
+        min_id = f"({after_event_id}-0" if after_event_id is not None else "-"
+
+        entries = await cache.stream_range(stream_key, min_id=min_id)
+
+        events = []
+        last_entry_id = f"{after_event_id}-0" if after_event_id is not None else "0-0"
+        ended = False
+        for entry_id, fields in entries:
+            last_entry_id = entry_id
+            if STREAM_END_FIELD in fields:
+                ended = True
+                break
+            event = fields.get(STREAM_EVENT_FIELD)
+            if event is not None:
+                events.append(event)
+
+        return events, last_entry_id, ended
+
+    async def is_workflow_finished(self, thread_id: str) -> bool:
+        """
+        Check whether a workflow has stopped producing events.
+
+        Uses the local task when this replica runs the workflow, otherwise the
+        shared Redis workflow tracker.
+        """
+        task_info = self.tasks.get(thread_id)
+        if task_info:
+            return task_info.status not in [TaskStatus.QUEUED, TaskStatus.RUNNING]
+
+        from src.server.services.workflow_tracker import WorkflowTracker, WorkflowStatus
+
+        status = await WorkflowTracker.get_instance().get_status(thread_id)
+        if not status:
+            return True
+        return status.get("status") not in [WorkflowStatus.ACTIVE, WorkflowStatus.DISCONNECTED]
+
+    async def iter_event_stream(
+        self,
+        thread_id: str,
+        after_event_id: Optional[int] = None,
+        follow: bool = True,
+    ) -> AsyncIterator[str]:
+        """
+        Replay and tail workflow events from the Redis stream backend.
+
+        Replays buffered events with XRANGE from ``after_event_id``, then (if
+        ``follow``) tails new events with XREAD BLOCK until the run's end
+        marker is read or the workflow is no longer running. Works on any API
+        replica since it only depends on Redis.
+
+        Args:
+            thread_id: Workflow thread identifier
+            after_event_id: Resume after this SSE sequence number
+            follow: Keep tailing live events after the replay
+
+        Yields:
+            SSE-formatted event strings
+        """
+        await self._flush_event_writer(thread_id)
+
+        events, last_entry_id, ended = await self._read_event_stream(thread_id, after_event_id)
+        for event in events:
+            yield event
+
+        if ended or not follow:
+            return
+
+        cache = get_cache_client()
+        stream_key = f"{STREAM_KEY_PREFIX}{thread_id}"
+        block_seconds = self.event_stream_block_ms / 1000
+
+        while True:
+            started = time.monotonic()
+            entries = await cache.stream_read(
+                stream_key,
+                last_id=last_entry_id,
+                block_ms=self.event_stream_block_ms,
+                count=500,
+            )
+
+            if not entries:
+                if await self.is_workflow_finished(thread_id):
+                    return
+                # An empty result well before the block timeout means the read
+                # failed; back off instead of spinning on Redis errors
+                if time.monotonic() - started < block_seconds / 2:
+                    await asyncio.sleep(block_seconds)
+                continue
+
+            for entry_id, fields in entries:
+                last_entry_id = entry_id
+                if STREAM_END_FIELD in fields:
+                    return
+                event = fields.get(STREAM_EVENT_FIELD)
+                if event is not None:
+                    yield event
+
     async def subscribe_to_live_events(self, thread_id: str, event_queue: asyncio.Queue) -> bool:
         """
         Subscribe to live events from a running workflow.
 
+        With a cross-node fan-out backend, the workflow may run on another
+        replica; events then arrive through the fan-out transport.
+
         Args:
             thread_id: Workflow thread identifier
             event_queue: Queue to receive live events
@@ -1418,18 +1546,13 @@ class BackgroundTaskManager:
         Returns:
             True if subscribed successfully, False if workflow not found
         """
-        async with self.task_lock:
-            task_info = self.tasks.get(thread_id)
-            if not task_info:
+        task_info = self.tasks.get(thread_id)
+        if not task_info:
+            if not self.fanout.cross_node or await self.is_workflow_finished(thread_id):
                 return False
 
-            if event_queue not in task_info.live_queues:
-                task_info.live_queues.append(event_queue)
-                logger.debug(
-                    f"[BackgroundTaskManager] Subscribed to live events for {thread_id} "
-                    f"(subscribers: {len(task_info.live_queues)})"
-                )
-            return True
+        await self.fanout.subscribe(thread_id, event_queue)
+        return True
 
     async def unsubscribe_from_live_events(self, thread_id: str, event_queue: asyncio.Queue) -> bool:
         """
@@ -1440,20 +1563,9 @@ class BackgroundTaskManager:
             event_queue: Queue to unsubscribe
 
         Returns:
-            True if unsubscribed successfully, False if workflow not found
+            True if unsubscribed successfully, False if the queue was not subscribed
         """
-        async with self.task_lock:
-            task_info = self.tasks.get(thread_id)
-            if not task_info:
-                return False
-
-            if event_queue in task_info.live_queues:
-                task_info.live_queues.remove(event_queue)
-                logger.debug(
-                    f"[BackgroundTaskManager] Unsubscribed from live events for {thread_id} "
-                    f"(subscribers: {len(task_info.live_queues)})"
-                )
-            return True
+        return await self.fanout.unsubscribe(thread_id, event_queue)
 
     async def cancel_workflow(self, thread_id: str) -> bool:
         """
@@ -1468,26 +1580,25 @@ class BackgroundTaskManager:
         Returns:
             True if cancellation signaled, False if not found or already completed
         """
-        async with self.task_lock:
-            task_info = self.tasks.get(thread_id)
-            if not task_info:
-                logger.warning(
-                    f"[BackgroundTaskManager] Cannot cancel {thread_id}: "
-                    f"workflow not found"
-                )
-                return False
+        task_info = self.tasks.get(thread_id)
+        if not task_info:
+            logger.warning(
+                f"[BackgroundTaskManager] Cannot cancel {thread_id}: "
+                f"workflow not found"
+            )
+            return False
 
-            if task_info.status not in [TaskStatus.QUEUED, TaskStatus.RUNNING]:
-                logger.info(
-                    f"[BackgroundTaskManager] Cannot cancel {thread_id}: "
-                    f"status={task_info.status}"
-                )
-                return False
+        if task_info.status not in [TaskStatus.QUEUED, TaskStatus.RUNNING]:
+            logger.info(
+                f"[BackgroundTaskManager] Cannot cancel {thread_id}: "
+                f"status={task_info.status}"
+            )
+            return False
 
-            task_info.cancel_event.set()
-            task_info.explicit_cancel = True
-            logger.debug(f"[BackgroundTaskManager] Cancellation signaled: {thread_id}")
-            return True
+        task_info.cancel_event.set()
+        task_info.explicit_cancel = True
+        logger.debug(f"[BackgroundTaskManager] Cancellation signaled: {thread_id}")
+        return True
 
     async def soft_interrupt_workflow(self, thread_id: str) -> Dict[str, Any]:
         """
@@ -1504,50 +1615,30 @@ class BackgroundTaskManager:
         Returns:
             Dict with status, can_resume, and active_subagents
         """
-        async with self.task_lock:
-            task_info = self.tasks.get(thread_id)
-            if not task_info:
-                logger.warning(
-                    f"[BackgroundTaskManager] Cannot soft interrupt {thread_id}: "
-                    f"workflow not found"
-                )
-                return {
-                    "status": "not_found",
-                    "thread_id": thread_id,
-                    "can_resume": False,
-                    "background_tasks": [],
-                    "active_subagents": [],
-                    "completed_subagents": [],
-                }
-
-            if task_info.status not in [TaskStatus.QUEUED, TaskStatus.RUNNING]:
-                logger.info(
-                    f"[BackgroundTaskManager] Cannot soft interrupt {thread_id}: "
-                    f"status={task_info.status}"
-                )
-                return {
-                    "status": task_info.status.value,
-                    "thread_id": thread_id,
-                    "can_resume": False,
-                    # Backward-compatible key
-                    "background_tasks": list(task_info.active_subagents),
-                    # Preferred keys (used by CLI)
-                    "active_subagents": list(task_info.active_subagents),
-                    "completed_subagents": list(task_info.completed_subagents),
-                }
-
-            # Set soft interrupt flag (different from cancel)
-            task_info.soft_interrupt_event.set()
-            task_info.soft_interrupted = True
-            logger.info(
-                f"[BackgroundTaskManager] Soft interrupt signaled: {thread_id}, "
-                f"active_subagents={list(task_info.active_subagents)}"
+        task_info = self.tasks.get(thread_id)
+        if not task_info:
+            logger.warning(
+                f"[BackgroundTaskManager] Cannot soft interrupt {thread_id}: "
+                f"workflow not found"
             )
+            return {
+                "status": "not_found",
+                "thread_id": thread_id,
+                "can_resume": False,
+                "background_tasks": [],
+                "active_subagents": [],
+                "completed_subagents": [],
+            }
 
+        if task_info.status not in [TaskStatus.QUEUED, TaskStatus.RUNNING]:
+            logger.info(
+                f"[BackgroundTaskManager] Cannot soft interrupt {thread_id}: "
+                f"status={task_info.status}"
+            )
             return {
-                "status": "soft_interrupted",
+                "status": task_info.status.value,
                 "thread_id": thread_id,
-                "can_resume": True,
+                "can_resume": False,
                 # Backward-compatible key
                 "background_tasks": list(task_info.active_subagents),
                 # Preferred keys (used by CLI)
@@ -1555,6 +1646,25 @@ class BackgroundTaskManager:
                 "completed_subagents": list(task_info.completed_subagents),
             }
 
+        # Set soft interrupt flag (different from cancel)
+        task_info.soft_interrupt_event.set()
+        task_info.soft_interrupted = True
+        logger.info(
+            f"[BackgroundTaskManager] Soft interrupt signaled: {thread_id}, "
+            f"active_subagents={list(task_info.active_subagents)}"
+        )
+
+        return {
+            "status": "soft_interrupted",
+            "thread_id": thread_id,
+            "can_resume": True,
+            # Backward-compatible key
+            "background_tasks": list(task_info.active_subagents),
+            # Preferred keys (used by CLI)
+            "active_subagents": list(task_info.active_subagents),
+            "completed_subagents": list(task_info.completed_subagents),
+        }
+
     async def get_workflow_status(self, thread_id: str) -> Dict[str, Any]:
         """
         Get detailed workflow status including subagent information.
@@ -1565,26 +1675,26 @@ class BackgroundTaskManager:
         Returns:
             Dict with status, subagent info, timestamps
         """
-        async with self.task_lock:
-            task_info = self.tasks.get(thread_id)
-            if not task_info:
-                return {
-                    "status": "not_found",
-                    "thread_id": thread_id,
-                }
-
+        task_info = self.tasks.get(thread_id)
+        if not task_info:
             return {
-                "status": task_info.status.value,
+                "status": "not_found",
                 "thread_id": thread_id,
-                "soft_interrupted": task_info.soft_interrupted,
-                "active_subagents": list(task_info.active_subagents),
-                "completed_subagents": list(task_info.completed_subagents),
-                "created_at": task_info.created_at.isoformat() if task_info.created_at else None,
-                "started_at": task_info.started_at.isoformat() if task_info.started_at else None,
-                "completed_at": task_info.completed_at.isoformat() if task_info.completed_at else None,
-                "active_connections": task_info.active_connections,
             }
 
+        return {
+            "status": task_info.status.value,
+            "thread_id": thread_id,
+            "soft_interrupted": task_info.soft_interrupted,
+            "active_subagents": list(task_info.active_subagents),
+            "completed_subagents": list(task_info.completed_subagents),
+            "created_at": task_info.created_at.isoformat() if task_info.created_at else None,
+            "started_at": task_info.started_at.isoformat() if task_info.started_at else None,
+            "completed_at": task_info.completed_at.isoformat() if task_info.completed_at else None,
+            "active_connections": task_info.active_connections,
+            "live_subscribers": self.fanout.get_subscriber_stats(thread_id),
+        }
+
     async def wait_for_soft_interrupted(
         self,
         thread_id: str,
@@ -1603,22 +1713,21 @@ class BackgroundTaskManager:
         Returns:
             True if workflow completed (or wasn't running), False if timed out
         """
-        async with self.task_lock:
-            task_info = self.tasks.get(thread_id)
-            if not task_info:
-                return True  # No workflow to wait for
+        task_info = self.tasks.get(thread_id)
+        if not task_info:
+            return True  # No workflow to wait for
 
-            # Include SOFT_INTERRUPTED - the task may still be wrapping up
-            if task_info.status not in [TaskStatus.QUEUED, TaskStatus.RUNNING, TaskStatus.SOFT_INTERRUPTED]:
-                return True  # Already fully completed
+        # Include SOFT_INTERRUPTED - the task may still be wrapping up
+        if task_info.status not in [TaskStatus.QUEUED, TaskStatus.RUNNING, TaskStatus.SOFT_INTERRUPTED]:
+            return True  # Already fully completed
 
-            if not task_info.soft_interrupted and task_info.status != TaskStatus.SOFT_INTERRUPTED:
-                # Workflow is running but wasn't soft-interrupted
-                # This is an unexpected state - user might be trying to send
-                # concurrent messages. We'll wait briefly but not block too long.
-                timeout = min(timeout, 5.0)
+        if not task_info.soft_interrupted and task_info.status != TaskStatus.SOFT_INTERRUPTED:
+            # Workflow is running but wasn't soft-interrupted
+            # This is an unexpected state - user might be trying to send
+            # concurrent messages. We'll wait briefly but not block too long.
+            timeout = min(timeout, 5.0)
 
-            task = task_info.task
+        task = task_info.task
 
         if not task:
             return True
@@ -1710,5 +1819,7 @@ class BackgroundTaskManager:
                 "max_concurrent": self.max_concurrent,
                 "active_connections": sum(
                     t.active_connections for t in self.tasks.values()
-                )
+                ),
+                "event_writer": self.event_writer_stats.to_dict(),
+                "live_fanout": self.fanout.get_stats(),
             }
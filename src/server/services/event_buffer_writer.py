@@ -0,0 +1,411 @@
+"""
+Batched Redis Writer for Workflow Event Buffers
+
+Groups SSE events for one workflow thread into short time/size windows and
+flushes each window to Redis as a single MULTI/EXEC pipeline, instead of
+issuing several round trips per token chunk.
+
+Per flush (one round trip):
+- RPUSH + LTRIM (list mode) or XADD ... MAXLEN ~ (stream mode), EXPIRE
+- HSET updated_at/last_event_id, HSETNX created_at, HINCRBY event_count, EXPIRE
+- LLEN/XLEN for the near-capacity warning
+
+Storage modes:
+- "list" (event_storage_backend: redis): RPUSH + LTRIM on a Redis list
+- "stream" (event_storage_backend: redis_stream): XADD with the SSE sequence
+  number as the entry ID ("{seq}-0") and MAXLEN ~ trimming, so reconnects can
+  resume with XRANGE and tail with XREAD BLOCK. A terminal entry with an
+  "end" field marks the end of a run.
+
+Redis Key Structure:
+- workflow:events:{thread_id} -> list of raw SSE strings (list mode)
+- workflow:stream:{thread_id} -> stream of {"event": sse} entries (stream mode)
+- workflow:events:meta:{thread_id} -> hash (created_at, updated_at, last_event_id, event_count)
+
+Usage:
+    writer = EventBufferWriter(thread_id, max_size=1000, ttl=86400, stats=stats)
+    await writer.append(sse_event)
+    ...
+    await writer.flush()  # on workflow completion / before replay
+"""
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from src.utils.cache.redis_cache import get_cache_client
+
+logger = logging.getLogger(__name__)
+
+EVENTS_KEY_PREFIX = "workflow:events:"
+STREAM_KEY_PREFIX = "workflow:stream:"
+META_KEY_PREFIX = "workflow:events:meta:"
+
+STREAM_EVENT_FIELD = "event"
+STREAM_END_FIELD = "end"
+
+
+def parse_sse_event_id(event: str) -> Optional[int]:
+    """
+    Parse the numeric ``id:`` field from the first line of an SSE string.
+
+    Args:
+        event: SSE-formatted event string
+
+    Returns:
+        Event ID, or None if the event has no numeric ID line
+    """
+    first_line = event.split("\n", 1)[0]
+    if not first_line.startswith("id: "):
+        return None
+    try:
+        return int(first_line[4:].strip())
+    except ValueError:
+        return None
+
+
+@dataclass
+class EventWriterStats:
+    """Aggregated flush metrics shared by all event writers of a manager."""
+
+    flushes: int = 0
+    failed_flushes: int = 0
+    events_written: int = 0
+    events_failed: int = 0
+    max_batch_size: int = 0
+    total_flush_latency_ms: float = 0.0
+    max_flush_latency_ms: float = 0.0
+    last_flush_latency_ms: float = 0.0
+
+    def record_flush(self, batch_size: int, latency_ms: float, success: bool) -> None:
+        """Record the outcome of a single pipeline flush."""
+        if success:
+            self.flushes += 1
+            self.events_written += batch_size
+            self.max_batch_size = max(self.max_batch_size, batch_size)
+            self.total_flush_latency_ms += latency_ms
+            self.max_flush_latency_ms = max(self.max_flush_latency_ms, latency_ms)
+            self.last_flush_latency_ms = latency_ms
+        else:
+            self.failed_flushes += 1
+            self.events_failed += batch_size
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return stats including derived averages."""
+        avg_batch = self.events_written / self.flushes if self.flushes else 0.0
+        avg_latency = self.total_flush_latency_ms / self.flushes if self.flushes else 0.0
+        return {
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+            "events_written": self.events_written,
+            "events_failed": self.events_failed,
+            "avg_batch_size": round(avg_batch, 2),
+            "max_batch_size": self.max_batch_size,
+            "avg_flush_latency_ms": round(avg_latency, 3),
+            "max_flush_latency_ms": round(self.max_flush_latency_ms, 3),
+            "last_flush_latency_ms": round(self.last_flush_latency_ms, 3),
+        }
+
+
+class EventBufferWriter:
+    """
+    Per-thread buffered writer for workflow events.
+
+    One writer is created per workflow run. Events are held locally until
+    either ``max_batch_size`` events are pending or ``window_ms`` has
+    elapsed since the first pending event, then written in one pipeline. Flushes are serialized so batches land
+    in Redis in the order they were produced. When the pending batch is
+    full, ``append`` awaits the flush, which applies backpressure to the
+    producer instead of growing memory without bound.
+    """
+
+    def __init__(
+        self,
+        thread_id: str,
+        max_size: int,
+        ttl: Optional[int],
+        window_ms: int = 20,
+        max_batch_size: int = 64,
+        stats: Optional[EventWriterStats] = None,
+        on_failure: Optional[Callable[[List[str]], Awaitable[None]]] = None,
+        storage: str = "list",
+    ):
+        """
+        Initialize event writer.
+
+        Args:
+            thread_id: Workflow thread identifier
+            max_size: Max events kept in the Redis list (FIFO trim)
+            ttl: TTL for the event list and metadata hash (seconds)
+            window_ms: Max time an event waits before its batch is flushed
+            max_batch_size: Flush immediately once this many events are pending
+            stats: Shared stats object to record flush metrics into
+            on_failure: Called with the batch when a Redis write fails
+            storage: "list" or "stream"; stream mode resets the stream on
+                the first flush since SSE sequence numbers restart every run
+        """
+        if storage not in ("list", "stream"):
+            raise ValueError(f"Unsupported event storage mode: {storage}")
+
+        self.thread_id = thread_id
+        self.storage = storage
+        prefix = STREAM_KEY_PREFIX if storage == "stream" else EVENTS_KEY_PREFIX
+        self.events_key = f"{prefix}{thread_id}"
+        self.meta_key = f"{META_KEY_PREFIX}{thread_id}"
+        self.max_size = max_size
+        self.ttl = ttl
+        self.window_ms = window_ms
+        self.max_batch_size = max(1, max_batch_size)
+        self.stats = stats or EventWriterStats()
+        self.on_failure = on_failure
+
+        self._pending: List[str] = []
+        self._flush_lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+        self._capacity_warned = False
+
+        # Stream mode state: last entry ID written as (ms, seq)
+        self._last_stream_id = (0, 0)
+        self._reset_stream = storage == "stream"
+        self._ended = False
+
+    @property
+    def pending_count(self) -> int:
+        """Number of events waiting for the next flush."""
+        return len(self._pending)
+
+    async def append(self, event: str) -> None:
+        """
+        Queue an event for the next batch.
+
+        Args:
+            event: SSE-formatted event string
+        """
+        self._pending.append(event)
+
+        if self.window_ms <= 0 or len(self._pending) >= self.max_batch_size:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after_window())
+
+    async def _flush_after_window(self) -> None:
+        """Flush pending events once the batching window elapses."""
+        try:
+            await asyncio.sleep(self.window_ms / 1000)
+            await self.flush()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(
+                f"[EventWriter] Windowed flush failed for {self.thread_id}: {e}",
+                exc_info=True
+            )
+
+    def _cancel_timer(self) -> None:
+        timer = self._timer
+        self._timer = None
+        if timer is not None and timer is not asyncio.current_task() and not timer.done():
+            timer.cancel()
+
+    async def flush(self) -> bool:
+        """
+        Write all pending events to Redis in one pipeline.
+
+        Returns:
+            True if nothing was pending or the write succeeded, False otherwise
+        """
+        self._cancel_timer()
+
+        async with self._flush_lock:
+            if not self._pending:
+                return True
+            batch, self._pending = self._pending, []
+            return await self._write_batch(batch)
+
+    def discard(self) -> int:
+        """
+        Drop pending events without writing them.
+
+        Used when the thread's event buffer is being cleared.
+
+        Returns:
+            Number of events discarded
+        """
+        self._cancel_timer()
+        dropped = len(self._pending)
+        self._pending = []
+        self._capacity_warned = False
+        return dropped
+
+    async def close(self) -> bool:
+        """Flush remaining events and stop the window timer."""
+        return await self.flush()
+
+    async def write_end_marker(self, status: str) -> bool:
+        """
+        Flush pending events and append a terminal entry (stream mode only).
+
+        Live tailers stop when they read this entry, including tailers on
+        other API replicas that have no local TaskInfo for the thread.
+
+        Args:
+            status: Final workflow status recorded in the marker
+
+        Returns:
+            True if written (or not applicable), False on Redis failure
+        """
+        flushed = await self.flush()
+        if self.storage != "stream" or self._ended:
+            return flushed
+
+        async with self._flush_lock:
+            cache = get_cache_client()
+            pipe = cache.pipeline(transaction=True)
+            if pipe is None:
+                return False
+            # Stream state only advances once the pipeline has been applied
+            saved_state = (self._reset_stream, self._last_stream_id)
+            try:
+                if self._reset_stream:
+                    pipe.delete(self.events_key)
+                pipe.xadd(
+                    self.events_key,
+                    {STREAM_END_FIELD: status},
+                    id=self._next_stream_id(None),
+                    maxlen=self.max_size or None,
+                    approximate=True,
+                )
+                if self.ttl:
+                    pipe.expire(self.events_key, self.ttl)
+                await pipe.execute()
+                self._reset_stream = False
+            except Exception as e:
+                self._reset_stream, self._last_stream_id = saved_state
+                logger.warning(
+                    f"[EventWriter] Failed to write end marker for {self.thread_id}: {e}"
+                )
+                cache.stats["errors"] += 1
+                return False
+
+        self._ended = True
+        return flushed
+
+    def _next_stream_id(self, event_id: Optional[int]) -> str:
+        """
+        Compute the next stream entry ID.
+
+        Events carrying an SSE sequence number use "{seq}-0". Events without
+        one (or with a non-increasing number) reuse the last sequence and bump
+        the sub-ID, keeping IDs strictly increasing as XADD requires.
+        """
+        if event_id is not None and (event_id, 0) > self._last_stream_id:
+            self._last_stream_id = (event_id, 0)
+        else:
+            ms, seq = self._last_stream_id
+            self._last_stream_id = (ms, seq + 1)
+        ms, seq = self._last_stream_id
+        return f"{ms}-{seq}"
+
+    async def _write_batch(self, batch: List[str]) -> bool:
+        cache = get_cache_client()
+        pipe = cache.pipeline(transaction=True)
+
+        if pipe is None:
+            self.stats.record_flush(len(batch), 0.0, success=False)
+            await self._handle_failure(batch, "Redis unavailable")
+            return False
+
+        last_event_id = None
+        for event in reversed(batch):
+            last_event_id = parse_sse_event_id(event)
+            if last_event_id is not None:
+                break
+
+        # Metadata values are JSON-encoded to stay readable via hash_get_all
+        now = json.dumps(datetime.now().isoformat())
+        meta_updates: Dict[str, Any] = {"updated_at": now}
+        if last_event_id is not None:
+            meta_updates["last_event_id"] = last_event_id
+
+        # A failed pipeline must leave the stream state for the retry: the
+        # previous run's entries still need deleting and the IDs reusing
+        saved_state = (self._reset_stream, self._last_stream_id)
+        start = time.perf_counter()
+        try:
+            if self.storage == "stream":
+                if self._reset_stream:
+                    # New run: drop the previous run's entries (IDs restart at 1)
+                    pipe.delete(self.events_key)
+                for event in batch:
+                    pipe.xadd(
+                        self.events_key,
+                        {STREAM_EVENT_FIELD: event},
+                        id=self._next_stream_id(parse_sse_event_id(event)),
+                        maxlen=self.max_size or None,
+                        approximate=True,
+                    )
+            else:
+                pipe.rpush(self.events_key, *batch)
+                if self.max_size:
+                    pipe.ltrim(self.events_key, -self.max_size, -1)
+            if self.ttl:
+                pipe.expire(self.events_key, self.ttl)
+
+            pipe.hset(self.meta_key, mapping=meta_updates)
+            pipe.hsetnx(self.meta_key, "created_at", now)
+            pipe.hincrby(self.meta_key, "event_count", len(batch))
+            if self.ttl:
+                pipe.expire(self.meta_key, self.ttl)
+
+            if self.storage == "stream":
+                pipe.xlen(self.events_key)
+            else:
+                pipe.llen(self.events_key)
+
+            results = await pipe.execute()
+            self._reset_stream = False
+        except Exception as e:
+            self._reset_stream, self._last_stream_id = saved_state
+            latency_ms = (time.perf_counter() - start) * 1000
+            self.stats.record_flush(len(batch), latency_ms, success=False)
+            cache.stats["errors"] += 1
+            await self._handle_failure(batch, str(e))
+            return False
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        self.stats.record_flush(len(batch), latency_ms, success=True)
+        cache.stats["sets"] += len(batch)
+
+        buffer_size = results[-1] if results else 0
+        capacity_threshold = int(self.max_size * 0.9) if self.max_size else 0
+        if capacity_threshold and buffer_size >= capacity_threshold and not self._capacity_warned:
+            self._capacity_warned = True
+            logger.warning(
+                f"[EventBuffer] Buffer near capacity for {self.thread_id}: "
+                f"{buffer_size}/{self.max_size} events. "
+                f"Oldest events will be dropped (FIFO)."
+            )
+
+        logger.debug(
+            f"[EventWriter] Flushed {len(batch)} events for {self.thread_id} "
+            f"(last_id={last_event_id}, {latency_ms:.2f}ms)"
+        )
+        return True
+
+    async def _handle_failure(self, batch: List[str], reason: str) -> None:
+        logger.warning(
+            f"[EventWriter] Failed to flush {len(batch)} events to Redis "
+            f"for {self.thread_id}: {reason}"
+        )
+        if self.on_failure:
+            try:
+                await self.on_failure(batch)
+            except Exception as e:
+                logger.error(
+                    f"[EventWriter] Failure handler raised for {self.thread_id}: {e}",
+                    exc_info=True
+                )
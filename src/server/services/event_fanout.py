@@ -0,0 +1,477 @@
+"""
+Live Event Fan-out
+
+Delivers live workflow events to connected SSE subscribers. Subscription is
+decoupled from the process that runs the workflow, so a client can attach to
+a workflow running on another API replica.
+
+Backends:
+- memory: In-process delivery only (single-node deployments)
+- redis_pubsub: Local subscribers are served in-process; events are also
+  published to ``workflow:live:{thread_id}`` so subscribers on other API
+  replicas receive them through one shared Pub/Sub connection per process.
+  Remote publishes go through a bounded outbox drained by one task that
+  sends them in pipelined batches, so the workflow never waits on Redis.
+
+Each subscriber tracks delivery, drop and queue-depth metrics so slow
+consumers show up as backpressure/lag numbers instead of log spam.
+
+Usage:
+    fanout = create_event_fanout("redis_pubsub")
+    await fanout.start()
+
+    subscriber = await fanout.subscribe(thread_id, queue)
+    await fanout.publish(thread_id, sse_event)
+    await fanout.publish_end(thread_id)  # Delivers None sentinel
+    await fanout.unsubscribe(thread_id, queue)
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.utils.cache.redis_cache import get_cache_client
+
+logger = logging.getLogger(__name__)
+
+LIVE_CHANNEL_PREFIX = "workflow:live:"
+
+
+@dataclass
+class LiveSubscriber:
+    """A live event subscriber with backpressure and lag metrics."""
+
+    thread_id: str
+    queue: asyncio.Queue
+    subscribed_at: float = field(default_factory=time.time)
+
+    delivered: int = 0
+    dropped: int = 0
+    max_queue_depth: int = 0
+    last_delivered_at: Optional[float] = None
+    last_dropped_at: Optional[float] = None
+
+    def offer(self, event: Optional[str]) -> bool:
+        """
+        Deliver an event without blocking the publisher.
+
+        Args:
+            event: SSE event string, or None for the completion sentinel
+
+        Returns:
+            True if queued, False if dropped because the queue is full
+        """
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            self.last_dropped_at = time.time()
+            return False
+
+        self.delivered += 1
+        self.last_delivered_at = time.time()
+        depth = self.queue.qsize()
+        if depth > self.max_queue_depth:
+            self.max_queue_depth = depth
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return subscriber metrics."""
+        maxsize = self.queue.maxsize
+        depth = self.queue.qsize()
+        return {
+            "thread_id": self.thread_id,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "queue_depth": depth,
+            "queue_capacity": maxsize,
+            "queue_utilization": round(depth / maxsize, 3) if maxsize else None,
+            "max_queue_depth": self.max_queue_depth,
+            "connected_seconds": round(time.time() - self.subscribed_at, 1),
+            "last_delivered_at": self.last_delivered_at,
+            "last_dropped_at": self.last_dropped_at,
+        }
+
+
+class EventFanout:
+    """
+    In-memory live event fan-out (single-node).
+
+    Subclasses add cross-replica transport by overriding ``publish`` /
+    ``publish_end`` and the subscription hooks.
+    """
+
+    #: Whether subscribers can receive events from workflows on other replicas
+    cross_node: bool = False
+
+    def __init__(self):
+        """Initialize fan-out with no subscribers."""
+        self._subscribers: Dict[str, List[LiveSubscriber]] = {}
+        self.stats = {
+            "published": 0,
+            "delivered": 0,
+            "dropped": 0,
+        }
+
+    async def start(self) -> None:
+        """Start background resources (no-op for in-memory fan-out)."""
+
+    async def stop(self) -> None:
+        """Release background resources (no-op for in-memory fan-out)."""
+
+    async def subscribe(self, thread_id: str, queue: asyncio.Queue) -> LiveSubscriber:
+        """
+        Attach a queue to a thread's live events.
+
+        Args:
+            thread_id: Workflow thread identifier
+            queue: Queue that receives SSE strings and a final None sentinel
+
+        Returns:
+            LiveSubscriber tracking the queue
+        """
+        subscribers = self._subscribers.setdefault(thread_id, [])
+        for subscriber in subscribers:
+            if subscriber.queue is queue:
+                return subscriber
+
+        subscriber = LiveSubscriber(thread_id=thread_id, queue=queue)
+        subscribers.append(subscriber)
+        if len(subscribers) == 1:
+            await self._on_first_subscriber(thread_id)
+
+        logger.debug(
+            f"[EventFanout] Subscribed to live events for {thread_id} "
+            f"(subscribers: {len(subscribers)})"
+        )
+        return subscriber
+
+    async def unsubscribe(self, thread_id: str, queue: asyncio.Queue) -> bool:
+        """
+        Detach a queue from a thread's live events.
+
+        Args:
+            thread_id: Workflow thread identifier
+            queue: Queue previously passed to subscribe()
+
+        Returns:
+            True if the queue was subscribed
+        """
+        subscribers = self._subscribers.get(thread_id)
+        if not subscribers:
+            return False
+
+        remaining = [s for s in subscribers if s.queue is not queue]
+        if len(remaining) == len(subscribers):
+            return False
+
+        if remaining:
+            self._subscribers[thread_id] = remaining
+        else:
+            del self._subscribers[thread_id]
+            await self._on_last_unsubscribe(thread_id)
+
+        logger.debug(
+            f"[EventFanout] Unsubscribed from live events for {thread_id} "
+            f"(subscribers: {len(remaining)})"
+        )
+        return True
+
+    async def publish(self, thread_id: str, event: str) -> None:
+        """
+        Publish a live event to all subscribers of a thread.
+
+        Args:
+            thread_id: Workflow thread identifier
+            event: SSE-formatted event string
+        """
+        self.stats["published"] += 1
+        self._deliver_local(thread_id, event)
+
+    async def publish_end(self, thread_id: str) -> None:
+        """
+        Signal workflow completion (None sentinel) to all subscribers.
+
+        Args:
+            thread_id: Workflow thread identifier
+        """
+        self._deliver_local(thread_id, None)
+
+    def _deliver_local(self, thread_id: str, event: Optional[str]) -> None:
+        for subscriber in self._subscribers.get(thread_id, ()):
+            if subscriber.offer(event):
+                self.stats["delivered"] += 1
+                continue
+
+            self.stats["dropped"] += 1
+            # Log the first drop per subscriber; the rest are counted in metrics
+            if subscriber.dropped == 1:
+                logger.warning(
+                    f"[EventFanout] Subscriber on {thread_id} is falling behind "
+                    f"(queue full at {subscriber.queue.maxsize}), dropping events"
+                )
+
+    async def _on_first_subscriber(self, thread_id: str) -> None:
+        """Hook called when a thread gains its first local subscriber."""
+
+    async def _on_last_unsubscribe(self, thread_id: str) -> None:
+        """Hook called when a thread loses its last local subscriber."""
+
+    def get_subscriber_stats(self, thread_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get per-subscriber metrics.
+
+        Args:
+            thread_id: Limit to one thread (all threads if None)
+
+        Returns:
+            List of subscriber metric dicts
+        """
+        if thread_id is not None:
+            subscribers = self._subscribers.get(thread_id, [])
+        else:
+            subscribers = [s for subs in self._subscribers.values() for s in subs]
+        return [s.to_dict() for s in subscribers]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get aggregate fan-out metrics including lagging subscribers."""
+        subscribers = [s for subs in self._subscribers.values() for s in subs]
+        lagging = [
+            s.to_dict() for s in subscribers
+            if s.queue.maxsize and s.queue.qsize() >= s.queue.maxsize * 0.5
+        ]
+        return {
+            "backend": self.backend_name,
+            "cross_node": self.cross_node,
+            **self.stats,
+            "threads": len(self._subscribers),
+            "subscribers": len(subscribers),
+            "max_queue_depth": max((s.queue.qsize() for s in subscribers), default=0),
+            "lagging_subscribers": lagging,
+        }
+
+    @property
+    def backend_name(self) -> str:
+        return "memory"
+
+
+class RedisPubSubEventFanout(EventFanout):
+    """
+    Live event fan-out across API replicas using Redis Pub/Sub.
+
+    Local subscribers are served directly. Every event is also published
+    to the thread's channel tagged with this process's node ID; a single
+    listener task per process relays messages from other nodes to local
+    subscribers and ignores its own.
+
+    Remote publishes are queued in a bounded outbox and sent by one
+    publisher task, up to ``publish_batch_size`` PUBLISH commands per
+    pipeline round trip. When the outbox is full, events are dropped for
+    remote subscribers only (counted in ``publish_dropped``); completion
+    sentinels wait for room so remote subscribers always see the end.
+    """
+
+    cross_node = True
+
+    def __init__(self, outbox_size: int = 10_000, publish_batch_size: int = 256):
+        """
+        Initialize Pub/Sub fan-out (connection is opened in start()).
+
+        Args:
+            outbox_size: Max remote publishes waiting to be sent
+            publish_batch_size: Max PUBLISH commands per pipeline
+        """
+        super().__init__()
+        self.node_id = uuid.uuid4().hex
+        self.publish_batch_size = max(1, publish_batch_size)
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+        self._outbox: asyncio.Queue = asyncio.Queue(maxsize=outbox_size)
+        self._publisher: Optional[asyncio.Task] = None
+        self.stats.update({
+            "remote_published": 0,
+            "remote_received": 0,
+            "publish_errors": 0,
+            "publish_dropped": 0,
+            "publish_batches": 0,
+        })
+
+    @property
+    def backend_name(self) -> str:
+        return "redis_pubsub"
+
+    @staticmethod
+    def _channel(thread_id: str) -> str:
+        return f"{LIVE_CHANNEL_PREFIX}{thread_id}"
+
+    async def start(self) -> None:
+        """Open the shared Pub/Sub connection and start the listener task."""
+        cache = get_cache_client()
+        if not cache.enabled or not cache.client:
+            logger.warning("[EventFanout] Redis unavailable, live fan-out is local only")
+            return
+
+        if self._pubsub is None:
+            self._pubsub = cache.client.pubsub(ignore_subscribe_messages=True)
+
+        if self._publisher is None or self._publisher.done():
+            self._publisher = asyncio.create_task(self._publish_loop())
+
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+            logger.info(f"[EventFanout] Redis Pub/Sub fan-out started (node={self.node_id[:8]})")
+
+    async def stop(self, drain_timeout: float = 1.0) -> None:
+        """
+        Stop the publisher and listener and close the Pub/Sub connection.
+
+        Args:
+            drain_timeout: Seconds to wait for queued remote publishes
+        """
+        if self._publisher and not self._publisher.done():
+            try:
+                await asyncio.wait_for(self._outbox.join(), timeout=drain_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"[EventFanout] Dropping {self._outbox.qsize()} unsent remote events on stop"
+                )
+            self._publisher.cancel()
+            try:
+                await self._publisher
+            except asyncio.CancelledError:
+                pass
+        self._publisher = None
+
+        if self._listener and not self._listener.done():
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+        self._listener = None
+
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.aclose()
+            except Exception as e:
+                logger.debug(f"[EventFanout] Error closing Pub/Sub: {e}")
+            self._pubsub = None
+
+    async def publish(self, thread_id: str, event: str) -> None:
+        await super().publish(thread_id, event)
+        if self._publisher is None:
+            return
+        try:
+            self._outbox.put_nowait((thread_id, event))
+        except asyncio.QueueFull:
+            self.stats["publish_dropped"] += 1
+            # Log the first drop; the rest are counted in metrics
+            if self.stats["publish_dropped"] == 1:
+                logger.warning(
+                    f"[EventFanout] Remote publish outbox full ({self._outbox.maxsize}), "
+                    f"dropping events for remote subscribers of {thread_id}"
+                )
+
+    async def publish_end(self, thread_id: str) -> None:
+        await super().publish_end(thread_id)
+        if self._publisher is not None:
+            await self._outbox.put((thread_id, None))
+
+    async def _publish_loop(self) -> None:
+        """Send queued remote publishes in pipelined batches."""
+        outbox = self._outbox
+        while True:
+            batch = [await outbox.get()]
+            while len(batch) < self.publish_batch_size and not outbox.empty():
+                batch.append(outbox.get_nowait())
+            try:
+                await self._publish_remote(batch)
+            except Exception as e:
+                logger.error(f"[EventFanout] Remote publisher error: {e}")
+            finally:
+                for _ in batch:
+                    outbox.task_done()
+
+    async def _publish_remote(self, batch: List[Tuple[str, Optional[str]]]) -> None:
+        cache = get_cache_client()
+        if not cache.enabled or not cache.client:
+            return
+
+        pipe = cache.client.pipeline(transaction=False)
+        for thread_id, event in batch:
+            payload = json.dumps({"node": self.node_id, "event": event}, ensure_ascii=False)
+            pipe.publish(self._channel(thread_id), payload)
+        try:
+            await pipe.execute()
+            self.stats["remote_published"] += len(batch)
+            self.stats["publish_batches"] += 1
+        except Exception as e:
+            self.stats["publish_errors"] += len(batch)
+            logger.debug(f"[EventFanout] Publish of {len(batch)} events failed: {e}")
+
+    async def _on_first_subscriber(self, thread_id: str) -> None:
+        if self._pubsub is None:
+            return
+        try:
+            await self._pubsub.subscribe(self._channel(thread_id))
+        except Exception as e:
+            logger.warning(f"[EventFanout] Failed to subscribe channel for {thread_id}: {e}")
+
+    async def _on_last_unsubscribe(self, thread_id: str) -> None:
+        if self._pubsub is None:
+            return
+        try:
+            await self._pubsub.unsubscribe(self._channel(thread_id))
+        except Exception as e:
+            logger.debug(f"[EventFanout] Failed to unsubscribe channel for {thread_id}: {e}")
+
+    async def _listen(self) -> None:
+        """Relay messages published by other nodes to local subscribers."""
+        while True:
+            try:
+                if not self._pubsub or not self._pubsub.subscribed:
+                    await asyncio.sleep(0.1)
+                    continue
+
+                message = await self._pubsub.get_message(timeout=1.0)
+                if not message or message.get("type") != "message":
+                    continue
+
+                channel = message["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode("utf-8")
+                data = message["data"]
+                if isinstance(data, bytes):
+                    data = data.decode("utf-8")
+
+                payload = json.loads(data)
+                if payload.get("node") == self.node_id:
+                    continue
+
+                self.stats["remote_received"] += 1
+                self._deliver_local(channel[len(LIVE_CHANNEL_PREFIX):], payload.get("event"))
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"[EventFanout] Pub/Sub listener error: {e}")
+                await asyncio.sleep(1.0)
+
+
+def create_event_fanout(backend: str) -> EventFanout:
+    """
+    Create a live event fan-out for the configured backend.
+
+    Args:
+        backend: "memory" or "redis_pubsub"
+
+    Returns:
+        EventFanout instance
+    """
+    if backend == "redis_pubsub":
+        return RedisPubSubEventFanout()
+    return EventFanout()
@@ -0,0 +1,99 @@
+"""
+Technical indicators over cached OHLCV bars.
+
+Intraday bars come from IntradayCacheService (Redis bar store), daily bars
+from the shared FMP client's response cache; indicators are then computed
+locally for every symbol in one vectorized pass (see
+src/tools/market_data/indicators.py) instead of one FMP indicator request
+per symbol and indicator.
+"""
+
+import asyncio
+import logging
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.data_client.fmp import PRIORITY_INTERACTIVE, get_fmp_client, request_priority
+from src.server.services.intraday_cache_service import IntradayCacheService
+from src.tools.market_data.indicators import IndicatorSpec, compute_indicators, warmup_days
+
+logger = logging.getLogger(__name__)
+
+
+async def _get_daily_bars(
+    symbols: List[str], is_index: bool, from_date: str, to_date: Optional[str]
+) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, str]]:
+    """Fetch daily bars for several symbols (FMP response cache first)."""
+    fmp_client = await get_fmp_client()
+
+    async def fetch(symbol: str) -> List[Dict[str, Any]]:
+        api_symbol = f"^{symbol}" if is_index else symbol
+        return await fmp_client.get_stock_price(symbol=api_symbol, from_date=from_date, to_date=to_date)
+
+    with request_priority(PRIORITY_INTERACTIVE):
+        fetched = await asyncio.gather(*(fetch(symbol) for symbol in symbols), return_exceptions=True)
+
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    errors: Dict[str, str] = {}
+    for symbol, result in zip(symbols, fetched):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to fetch daily bars for {symbol}: {result}")
+            errors[symbol] = str(result)
+        else:
+            results[symbol] = result or []
+    return results, errors
+
+
+async def get_batch_indicators(
+    symbols: List[str],
+    is_index: bool,
+    interval: str,
+    specs: Sequence[IndicatorSpec],
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, str], Optional[Dict[str, Any]]]:
+    """
+    Compute indicators for several symbols from cached bars.
+
+    History before from_date is loaded so indicators are warmed up at the
+    first reported bar; open-ended intraday requests use the bar store's
+    default window as is.
+
+    Args:
+        symbols: Stock or index symbols
+        is_index: Whether symbols are indexes
+        interval: "1day" or an intraday interval
+        specs: Parsed indicator specs
+        from_date: First date to report (YYYY-MM-DD)
+        to_date: Last date to report (YYYY-MM-DD)
+        limit: Newest rows to report per symbol
+
+    Returns:
+        Tuple of (symbol -> rows newest first, errors dict, intraday cache
+        stats or None for daily bars)
+    """
+    normalized = list(dict.fromkeys(symbol.lstrip("^").upper() for symbol in symbols))
+    cache_stats = None
+
+    if interval == "1day":
+        end = date.fromisoformat(to_date) if to_date else datetime.now().date()
+        first = date.fromisoformat(from_date) if from_date else end
+        fetch_from = first - timedelta(days=warmup_days(specs, interval, 0 if from_date else (limit or 0)))
+        bars, errors = await _get_daily_bars(normalized, is_index, fetch_from.isoformat(), to_date)
+    else:
+        fetch_from = None
+        if from_date:
+            fetch_from = date.fromisoformat(from_date) - timedelta(days=warmup_days(specs, interval))
+        service = IntradayCacheService.get_instance()
+        get_batch = service.get_batch_indexes if is_index else service.get_batch_stocks
+        bars, errors, cache_stats = await get_batch(
+            symbols=normalized,
+            interval=interval,
+            from_date=fetch_from.isoformat() if fetch_from else None,
+            to_date=to_date,
+        )
+
+    # Off the event loop: a large batch takes tens of milliseconds of pandas work
+    results = await asyncio.to_thread(compute_indicators, bars, specs, from_date, limit)
+    return results, errors, cache_stats
@@ -0,0 +1,415 @@
+"""
+Incremental intraday bar store.
+
+Keeps FMP intraday bars per (symbol, interval) in Redis, segmented by
+trading day, so overlapping chart windows (today, last 5 days, ...) share
+storage and refreshes only fetch what changed:
+- Closed trading days are fetched once and served by slicing
+- The open trading day is re-fetched when stale and merged into the stored
+  bars (stored bars older than the first fresh bar are kept)
+- Requests without a start date reuse the number of trading days FMP
+  returned for the first open-ended request of the series
+
+FMP's historical-chart endpoint only takes date bounds, so the smallest
+refresh is the open trading day rather than individual bars.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
+
+from src.utils.cache.cache_keys import INTRADAY_NAMESPACE, CacheKeyBuilder
+from src.utils.cache.local_cache import SingleFlight
+from src.utils.cache.redis_cache import get_cache_client
+
+logger = logging.getLogger(__name__)
+
+# Trading days (and "today") follow the US market calendar
+MARKET_TZ = ZoneInfo("America/New_York")
+
+# Trading days remembered per series for open-ended windows
+MAX_TRACKED_DAYS = 366
+
+# fetch(symbol, from_date, to_date, interactive) -> bars in any order
+FetchFn = Callable[[str, Optional[str], Optional[str], bool], Awaitable[List[Dict[str, Any]]]]
+
+
+@dataclass
+class BarSeriesResult:
+    """Bars for one symbol (newest first) with freshness metadata."""
+    symbol: str
+    bars: List[Dict[str, Any]]
+    cached: bool
+    ttl_remaining: Optional[int]
+    background_refresh_triggered: bool
+    error: Optional[str] = None
+
+
+@dataclass
+class _Plan:
+    """What one series needs before it can be served."""
+    window: Optional[List[date]]  # None: no history yet, fetch FMP's default range
+    fetch_days: List[date]  # Missing or expired segments (fetched before serving)
+    refresh_days: List[date]  # Soft-stale open segments (refreshed in background)
+    open_age: Optional[float]  # Age of the oldest open-day segment in the window
+
+
+def _parse_day(value: Optional[str]) -> Optional[date]:
+    return date.fromisoformat(value[:10]) if value else None
+
+
+def _weekdays(start: date, end: date) -> List[date]:
+    days = []
+    day = start
+    while day <= end:
+        if day.weekday() < 5:
+            days.append(day)
+        day += timedelta(days=1)
+    return days
+
+
+def _merge_bars(stored: List[Dict[str, Any]], fresh: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Append fresh bars (ascending) to stored ones, replacing any overlap."""
+    if not fresh:
+        return stored
+    first = fresh[0].get("date", "")
+    kept = [bar for bar in stored if bar.get("date", "") < first]
+    return kept + fresh
+
+
+class IntradayBarStore:
+    """
+    Day-segmented intraday bar storage with incremental refresh.
+
+    Redis layout (values go through the cache client's codec; ``{series}``
+    carries the ``fmp:intraday`` namespace generation):
+    - ``{series}:day=YYYY-MM-DD`` -> {"bars": [...ascending], "complete": bool, "checked_at": epoch}
+    - ``{series}:meta`` -> {"days": [trading days with bars], "window": day count of
+      FMP's default range, or None until an open-ended request was served}
+    """
+
+    KEYS = CacheKeyBuilder(INTRADAY_NAMESPACE)
+
+    def __init__(self, refresh_ttl: int, soft_ttl_ratio: float, history_ttl: int, open_day_ttl: int):
+        """
+        Initialize bar store.
+
+        Args:
+            refresh_ttl: Seconds before the open day's bars must be re-fetched
+            soft_ttl_ratio: Fraction of refresh_ttl after which the open day
+                is refreshed in the background while stored bars are served
+            history_ttl: Redis TTL for closed trading days and series metadata
+            open_day_ttl: Redis TTL for the open trading day's segment
+        """
+        self.refresh_ttl = refresh_ttl
+        self.soft_ttl_ratio = soft_ttl_ratio
+        self.history_ttl = history_ttl
+        self.open_day_ttl = open_day_ttl
+
+        self._flights = SingleFlight()
+        self._refreshing: Set[str] = set()
+
+    @classmethod
+    def series_key(cls, symbol: str, is_index: bool, interval: str, version: Optional[int] = None) -> str:
+        """Build the key prefix for one (symbol, interval) series at a namespace generation."""
+        asset = "index" if is_index else "stock"
+        return cls.KEYS.build(
+            f"bars:{asset}:symbol={symbol.lstrip('^').upper()}:interval={interval}", version=version
+        )
+
+    async def get_many(
+        self,
+        symbols: List[str],
+        is_index: bool,
+        interval: str,
+        from_date: Optional[str],
+        to_date: Optional[str],
+        fetch: FetchFn,
+    ) -> Dict[str, BarSeriesResult]:
+        """
+        Serve a date window for several symbols.
+
+        Stored segments for every symbol are read with one MGET; missing or
+        expired days are fetched per symbol, and all new segments are written
+        back with one MSET per TTL class.
+
+        Args:
+            symbols: Symbols (normalized: upper case, no ^ prefix)
+            is_index: Whether symbols are indexes
+            interval: Bar interval
+            from_date: Start date (YYYY-MM-DD), None for the series' default window
+            to_date: End date (YYYY-MM-DD), None for today
+            fetch: Upstream fetcher
+
+        Returns:
+            Dict of symbol -> BarSeriesResult
+        """
+        cache = get_cache_client()
+        today = datetime.now(MARKET_TZ).date()
+        end_day = min(_parse_day(to_date) or today, today)
+        start_day = _parse_day(from_date)
+        version = await cache.get_namespace_version(INTRADAY_NAMESPACE)
+        series = {symbol: self.series_key(symbol, is_index, interval, version) for symbol in symbols}
+
+        # Phase 1: stored metas and segments. Explicit ranges need one MGET;
+        # open-ended ones read the meta first to learn their trading days.
+        meta_keys = [f"{series[s]}:meta" for s in symbols]
+        windows: Dict[str, Optional[List[date]]] = {}
+        if start_day is not None:
+            for symbol in symbols:
+                windows[symbol] = _weekdays(start_day, end_day)
+            segment_keys = self._segment_keys(series, windows)
+            values = await cache.mget(meta_keys + segment_keys)
+            metas = dict(zip(symbols, values[:len(symbols)]))
+            segments = dict(zip(segment_keys, values[len(symbols):]))
+        else:
+            metas = dict(zip(symbols, await cache.mget(meta_keys)))
+            for symbol in symbols:
+                windows[symbol] = self._default_window(metas[symbol], end_day)
+            segment_keys = self._segment_keys(series, windows)
+            segments = dict(zip(segment_keys, await cache.mget(segment_keys))) if segment_keys else {}
+
+        # Phase 2: fetch what is missing or expired
+        now = time.time()
+        plans = {
+            symbol: self._plan(series[symbol], windows[symbol], segments, today, now)
+            for symbol in symbols
+        }
+
+        fetched: Set[str] = set()
+        writes: Dict[str, Dict[str, Any]] = {}
+        meta_writes: Dict[str, Dict[str, Any]] = {}
+        errors: Dict[str, str] = {}
+
+        async def load(symbol: str) -> None:
+            plan = plans[symbol]
+            if plan.window is not None and not plan.fetch_days:
+                return
+            try:
+                new_segments, new_meta = await self._flights.do(
+                    f"{series[symbol]}:{plan.fetch_days[0] if plan.fetch_days else '*'}"
+                    f":{plan.fetch_days[-1] if plan.fetch_days else end_day.isoformat()}",
+                    lambda: self._fetch_segments(
+                        symbol, series[symbol], plan, segments, metas[symbol], today, fetch, True,
+                        end_day=end_day,
+                    ),
+                )
+            except Exception as e:
+                logger.error(f"Failed to fetch intraday bars for {symbol}: {e}")
+                errors[symbol] = str(e)
+                return
+            fetched.add(symbol)
+            if plan.window is None:
+                days = sorted(date.fromisoformat(key.rsplit("=", 1)[1]) for key in new_segments)
+                plan.window = [day for day in days if day <= end_day]
+            segments.update(new_segments)
+            writes.update(new_segments)
+            if new_meta is not None:
+                meta_writes[f"{series[symbol]}:meta"] = new_meta
+
+        await asyncio.gather(*(load(symbol) for symbol in symbols))
+        await self._write(writes, meta_writes)
+
+        # Phase 3: assemble (newest first, as FMP returns bars) and schedule soft refreshes
+        results: Dict[str, BarSeriesResult] = {}
+        for symbol in symbols:
+            plan = plans[symbol]
+            bars: List[Dict[str, Any]] = []
+            for day in plan.window or []:
+                segment = segments.get(f"{series[symbol]}:day={day.isoformat()}")
+                if segment:
+                    bars.extend(segment["bars"])
+            bars.reverse()
+
+            was_fetched = symbol in fetched
+            refresh_triggered = False
+            if not was_fetched and plan.refresh_days and series[symbol] not in self._refreshing:
+                refresh_triggered = True
+                self._refreshing.add(series[symbol])
+                asyncio.create_task(
+                    self._background_refresh(symbol, series[symbol], plan, segments, today, fetch)
+                )
+
+            if was_fetched:
+                ttl_remaining = self.refresh_ttl
+            elif plan.open_age is not None:
+                ttl_remaining = max(0, int(self.refresh_ttl - plan.open_age))
+            else:
+                ttl_remaining = None
+
+            error = errors.get(symbol)
+            results[symbol] = BarSeriesResult(
+                symbol=symbol,
+                bars=bars,
+                cached=not was_fetched,
+                ttl_remaining=ttl_remaining,
+                background_refresh_triggered=refresh_triggered,
+                # Stored bars are still served when a refresh fails
+                error=error if error and not bars else None,
+            )
+        return results
+
+    @staticmethod
+    def _segment_keys(series: Dict[str, str], windows: Dict[str, Optional[List[date]]]) -> List[str]:
+        return [
+            f"{series[symbol]}:day={day.isoformat()}"
+            for symbol, window in windows.items() if window for day in window
+        ]
+
+    def _default_window(self, meta: Optional[Dict[str, Any]], end_day: date) -> Optional[List[date]]:
+        """
+        Trading days of an open-ended request, or None if they have to be fetched.
+
+        None is returned before the first open-ended request was served, and
+        when the known trading days do not cover a full window ending at
+        end_day (e.g. a request with only an older ``to``).
+        """
+        if not meta or not meta.get("window") or not meta.get("days"):
+            return None
+        size = int(meta["window"])
+        known = [day for day in map(date.fromisoformat, meta["days"]) if day <= end_day]
+        if len(known) < size:
+            return None
+        window = known[-size:]
+        if known[-1] < end_day:
+            # Trading days since the last one with bars (possibly still empty)
+            since = _weekdays(known[-1] + timedelta(days=1), end_day)
+            if len(since) >= size:
+                return None
+            window += since
+        return window
+
+    def _plan(
+        self,
+        series: str,
+        window: Optional[List[date]],
+        segments: Dict[str, Any],
+        today: date,
+        now: float,
+    ) -> _Plan:
+        if window is None:
+            return _Plan(window=None, fetch_days=[], refresh_days=[], open_age=None)
+
+        fetch_days: List[date] = []
+        refresh_days: List[date] = []
+        open_age: Optional[float] = None
+        for day in window:
+            segment = segments.get(f"{series}:day={day.isoformat()}")
+            if segment is None:
+                fetch_days.append(day)
+                continue
+            if segment["complete"]:
+                continue
+            age = now - segment["checked_at"]
+            if age >= self.refresh_ttl or (day < today and segment["bars"]):
+                # Expired, or the day closed since its bars were stored: final bars needed
+                fetch_days.append(day)
+            else:
+                if age >= self.refresh_ttl * self.soft_ttl_ratio:
+                    refresh_days.append(day)
+                open_age = age if open_age is None else max(open_age, age)
+        return _Plan(window=window, fetch_days=fetch_days, refresh_days=refresh_days, open_age=open_age)
+
+    async def _fetch_segments(
+        self,
+        symbol: str,
+        series: str,
+        plan: _Plan,
+        segments: Dict[str, Any],
+        meta: Optional[Dict[str, Any]],
+        today: date,
+        fetch: FetchFn,
+        interactive: bool,
+        end_day: Optional[date] = None,
+    ) -> Tuple[Dict[str, Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Fetch the plan's days in one upstream call and build updated segments.
+
+        Args:
+            end_day: Last day of an open-ended request (plan.window is None);
+                FMP's default range then ends at this day
+
+        Returns:
+            Tuple of (segment key -> segment, updated meta or None if unchanged)
+        """
+        if plan.window is None:
+            # Open-ended request: FMP's default range (ending at end_day) defines the window
+            to_date = end_day.isoformat() if end_day is not None and end_day < today else None
+            bars = await fetch(symbol, None, to_date, interactive)
+            wanted: List[date] = []
+        else:
+            days = plan.fetch_days or plan.refresh_days
+            bars = await fetch(symbol, days[0].isoformat(), days[-1].isoformat(), interactive)
+            wanted = days
+
+        by_day: Dict[date, List[Dict[str, Any]]] = {}
+        for bar in sorted(bars or [], key=lambda b: b.get("date", "")):
+            stamp = bar.get("date")
+            if stamp:
+                by_day.setdefault(date.fromisoformat(stamp[:10]), []).append(bar)
+
+        # A past day is final once it has bars, or when FMP returned bars for a
+        # later day (no trading that day). An empty day without that evidence
+        # may just not be published yet, so it keeps the open-day TTL and is
+        # re-checked after refresh_ttl.
+        last_with_bars = max(by_day) if by_day else None
+        checked_at = time.time()
+        new_segments: Dict[str, Dict[str, Any]] = {}
+        for day in sorted(set(wanted) | set(by_day)):
+            key = f"{series}:day={day.isoformat()}"
+            fresh = by_day.get(day, [])
+            stored = segments.get(key)
+            if stored and not stored["complete"]:
+                fresh = _merge_bars(stored["bars"], fresh)
+            closed = bool(fresh) or (last_with_bars is not None and day < last_with_bars)
+            new_segments[key] = {"bars": fresh, "complete": day < today and closed, "checked_at": checked_at}
+
+        # Track trading days with bars; an open-ended first fetch also sets the window
+        known = set(meta.get("days", [])) if meta else set()
+        added = {day.isoformat() for day in by_day} - known
+        window = meta.get("window") if meta else None
+        if plan.window is None and by_day:
+            window = len(by_day)
+        elif not added:
+            return new_segments, None
+        return new_segments, {"days": sorted(known | added)[-MAX_TRACKED_DAYS:], "window": window}
+
+    async def _background_refresh(
+        self,
+        symbol: str,
+        series: str,
+        plan: _Plan,
+        segments: Dict[str, Any],
+        today: date,
+        fetch: FetchFn,
+    ) -> None:
+        """Refresh soft-stale open-day segments without blocking the request."""
+        try:
+            meta = await get_cache_client().get(f"{series}:meta")
+            refresh_plan = _Plan(window=plan.window, fetch_days=[], refresh_days=plan.refresh_days, open_age=None)
+            new_segments, new_meta = await self._fetch_segments(
+                symbol, series, refresh_plan, segments, meta, today, fetch, False
+            )
+            await self._write(new_segments, {f"{series}:meta": new_meta} if new_meta else {})
+            logger.debug(f"Background refresh completed for {series}")
+        except Exception as e:
+            logger.warning(f"Background refresh failed for {series}: {e}")
+        finally:
+            self._refreshing.discard(series)
+
+    async def _write(self, segments: Dict[str, Dict[str, Any]], metas: Dict[str, Dict[str, Any]]) -> None:
+        """Write segments and metas with one MSET per TTL class."""
+        history: Dict[str, Any] = dict(metas)
+        open_days: Dict[str, Any] = {}
+        for key, segment in segments.items():
+            (history if segment["complete"] else open_days)[key] = segment
+
+        cache = get_cache_client()
+        if history:
+            await cache.mset(history, ttl=self.history_ttl)
+        if open_days:
+            await cache.mset(open_days, ttl=self.open_day_ttl)
@@ -0,0 +1,348 @@
+"""
+In-memory symbol search index.
+
+Built once from FMP's stock list and then queried without any I/O:
+- A prefix trie on tickers
+- A prefix trie and exact-token postings on company-name tokens
+- Optional fuzzy matching (one edit, including transpositions) on tickers
+  and name tokens
+
+Entries are ranked statically (major US exchanges first, then stocks
+before funds, primary listings before suffixed ones; then shorter tickers
+for ticker matches and shorter company names for name matches). Every trie
+node keeps its best matches as a short pre-ranked id list, so a query only
+merges a few lists instead of scoring the universe.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+# Ranked ids kept per trie node (the search endpoint returns at most 100)
+NODE_TOP_K = 100
+
+# Fuzzy matching only for terms at least this long (shorter ones match too much)
+FUZZY_MIN_LENGTH = 3
+
+MAJOR_EXCHANGES = {"NASDAQ", "NYSE", "AMEX"}
+TYPE_RANKS = {"stock": 0, "etf": 1}
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case alphanumeric tokens of a company name or query."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """Whether a and b differ by at most one insertion, deletion, substitution or transposition."""
+    if abs(len(a) - len(b)) > 1:
+        return False
+    i = 0
+    shortest = min(len(a), len(b))
+    while i < shortest and a[i] == b[i]:
+        i += 1
+    if i == shortest:
+        return True
+    if len(a) == len(b):
+        return (
+            a[i + 1:] == b[i + 1:]  # substitution
+            or (a[i] == b[i + 1] and a[i + 1] == b[i] and a[i + 2:] == b[i + 2:])  # transposition
+        )
+    if len(a) > len(b):
+        return a[i + 1:] == b[i:]
+    return a[i:] == b[i + 1:]
+
+
+class _TrieNode:
+    __slots__ = ("children", "ids", "count", "last", "terminal")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.ids: List[int] = []  # Best NODE_TOP_K ids under this prefix, in rank order
+        self.count = 0  # Ids under this prefix (ids is truncated when count > NODE_TOP_K)
+        self.last = -1  # Last id inserted (an entry can reach a node through several tokens)
+        self.terminal: Optional[List[int]] = None  # Ids whose key ends at this node
+
+
+class _Trie:
+    """Prefix trie whose nodes keep their best-ranked ids."""
+
+    def __init__(self, rank: List[int]) -> None:
+        """
+        Args:
+            rank: Position of each id in this trie's ranking
+        """
+        self.root = _TrieNode()
+        self.rank = rank
+
+    def insert(self, key: str, entry_id: int) -> None:
+        """Insert a key; ids must be inserted in rank order."""
+        node = self.root
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _TrieNode()
+            node = child
+            if node.last == entry_id:
+                continue
+            node.last = entry_id
+            if node.count < NODE_TOP_K:
+                node.ids.append(entry_id)
+            node.count += 1
+        if node.terminal is None:
+            node.terminal = []
+        node.terminal.append(entry_id)
+
+    def find(self, prefix: str) -> Optional[_TrieNode]:
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def collect(self, node: _TrieNode) -> List[int]:
+        """All ids under a node, in rank order."""
+        if node.count <= len(node.ids):
+            return node.ids
+        ids: Set[int] = set()
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.count <= len(current.ids):
+                ids.update(current.ids)
+                continue
+            if current.terminal:
+                ids.update(current.terminal)
+            stack.extend(current.children.values())
+        return sorted(ids, key=self.rank.__getitem__)
+
+
+@dataclass
+class SymbolEntry:
+    """One listing in the symbol universe."""
+    symbol: str
+    name: str
+    exchange: Optional[str] = None
+    exchange_short_name: Optional[str] = None
+    type: Optional[str] = None
+    currency: Optional[str] = None
+    tokens: Tuple[str, ...] = field(default=(), repr=False)
+
+    def _listing_rank(self) -> Tuple[int, int, int]:
+        exchange_rank = 0 if (self.exchange_short_name or "").upper() in MAJOR_EXCHANGES else 1
+        type_rank = TYPE_RANKS.get((self.type or "").lower(), 2)
+        return exchange_rank, type_rank, "." in self.symbol
+
+    def ticker_rank_key(self) -> Tuple[Any, ...]:
+        return *self._listing_rank(), len(self.symbol), self.symbol
+
+    def name_rank_key(self) -> Tuple[Any, ...]:
+        return *self._listing_rank(), len(self.tokens), len(self.symbol), self.symbol
+
+    def to_result(self) -> Dict[str, Any]:
+        """Search result in the shape of FMP's search endpoint."""
+        return {
+            "symbol": self.symbol,
+            "name": self.name,
+            "currency": self.currency,
+            "stockExchange": self.exchange,
+            "exchangeShortName": self.exchange_short_name,
+        }
+
+
+class SymbolIndex:
+    """Immutable search index over a symbol universe."""
+
+    def __init__(self, entries: Iterable[SymbolEntry]):
+        """
+        Build the index.
+
+        Args:
+            entries: Listings (duplicates by symbol keep the first occurrence)
+        """
+        unique: Dict[str, SymbolEntry] = {}
+        for entry in entries:
+            symbol = (entry.symbol or "").strip().upper()
+            if symbol and symbol not in unique:
+                entry.symbol = symbol
+                entry.name = (entry.name or "").strip()
+                entry.tokens = tuple(dict.fromkeys(tokenize(entry.name)))
+                unique[symbol] = entry
+
+        # Ids follow the ticker ranking; name_rank orders name matches
+        self.entries: List[SymbolEntry] = sorted(unique.values(), key=SymbolEntry.ticker_rank_key)
+        self.results: List[Dict[str, Any]] = [entry.to_result() for entry in self.entries]
+        self.exchanges: List[str] = [(entry.exchange_short_name or "").upper() for entry in self.entries]
+        self.by_symbol: Dict[str, int] = {entry.symbol: i for i, entry in enumerate(self.entries)}
+
+        by_name = sorted(range(len(self.entries)), key=lambda i: self.entries[i].name_rank_key())
+        self.name_rank: List[int] = [0] * len(self.entries)
+        for position, entry_id in enumerate(by_name):
+            self.name_rank[entry_id] = position
+
+        self._tickers = _Trie(list(range(len(self.entries))))
+        self._tokens = _Trie(self.name_rank)
+        self._postings: Dict[str, List[int]] = {}
+        # (first char, length) -> terms, for fuzzy lookups
+        self._fuzzy_terms: Dict[Tuple[str, int], List[str]] = {}
+        fuzzy_ids: Dict[str, List[int]] = {}
+
+        for entry_id, entry in enumerate(self.entries):
+            self._tickers.insert(entry.symbol, entry_id)
+            for term in {entry.symbol.lower(), *entry.tokens}:
+                fuzzy_ids.setdefault(term, []).append(entry_id)
+        for entry_id in by_name:
+            for token in self.entries[entry_id].tokens:
+                self._tokens.insert(token, entry_id)
+                self._postings.setdefault(token, []).append(entry_id)
+
+        for term in fuzzy_ids:
+            if len(term) >= FUZZY_MIN_LENGTH:
+                self._fuzzy_terms.setdefault((term[0], len(term)), []).append(term)
+        self._fuzzy_ids = fuzzy_ids
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 50,
+        exchanges: Optional[Sequence[str]] = None,
+        fuzzy: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Ranked search over tickers and company names.
+
+        Result order: exact ticker, ticker prefix, company names starting
+        with the query, other company-name word matches, then (if fuzzy)
+        matches within one edit; static rank within each group.
+
+        Args:
+            query: Ticker or company name fragment
+            limit: Maximum number of results
+            exchanges: Only return listings on these exchange short names
+            fuzzy: Fill remaining slots with one-edit matches
+
+        Returns:
+            Result dicts (shared, must not be mutated)
+        """
+        query = query.strip()
+        if not query or limit <= 0:
+            return []
+        allowed = {e.upper() for e in exchanges} if exchanges else None
+
+        picked: List[int] = []
+        seen: Set[int] = set()
+
+        def take(ids: Iterable[int]) -> bool:
+            """Add ids in order; True once limit is reached."""
+            for entry_id in ids:
+                if entry_id in seen:
+                    continue
+                if allowed is not None and self.exchanges[entry_id] not in allowed:
+                    continue
+                seen.add(entry_id)
+                picked.append(entry_id)
+                if len(picked) >= limit:
+                    return True
+            return False
+
+        def take_prefix(trie: _Trie, prefix: str) -> bool:
+            node = trie.find(prefix)
+            if node is None:
+                return False
+            if take(node.ids):
+                return True
+            # Filtered queries may need more than the node's pre-ranked top ids
+            return allowed is not None and node.count > len(node.ids) and take(trie.collect(node))
+
+        ticker = query.upper()
+        exact = self.by_symbol.get(ticker)
+        if exact is not None and take([exact]):
+            return self._results(picked)
+        if take_prefix(self._tickers, ticker):
+            return self._results(picked)
+
+        tokens = tokenize(query)
+        if not tokens:
+            return self._results(picked)
+        if len(tokens) == 1:
+            node = self._tokens.find(tokens[0])
+            matches = self._tokens.collect(node) if node is not None and allowed is not None else (
+                node.ids if node is not None else []
+            )
+        else:
+            matches = self._name_matches(tokens)
+        leading = [i for i in matches if self._name_starts_with(self.entries[i].tokens, tokens)]
+        if take(leading) or take(matches):
+            return self._results(picked)
+
+        if fuzzy:
+            take(self._fuzzy_matches(ticker.lower(), tokens))
+        return self._results(picked)
+
+    def _results(self, ids: List[int]) -> List[Dict[str, Any]]:
+        return [self.results[i] for i in ids]
+
+    @staticmethod
+    def _name_starts_with(name_tokens: Tuple[str, ...], tokens: List[str]) -> bool:
+        """Whether the name begins with the query words (the last one as a prefix)."""
+        if len(name_tokens) < len(tokens):
+            return False
+        *head, last = tokens
+        return list(name_tokens[:len(head)]) == head and name_tokens[len(head)].startswith(last)
+
+    def _name_matches(self, tokens: List[str]) -> List[int]:
+        """Entries whose name has every query word (each as a prefix), in name rank order."""
+        # Drive from the query word with the fewest candidates, then verify the others
+        driver: Optional[List[int]] = None
+        driver_node: Optional[_TrieNode] = None
+        for position, token in enumerate(tokens):
+            exact = self._postings.get(token) if position < len(tokens) - 1 else None
+            if exact is not None:
+                if driver is None or len(exact) < (driver_node.count if driver_node else len(driver)):
+                    driver, driver_node = exact, None
+                continue
+            node = self._tokens.find(token)
+            if node is None:
+                return []
+            if driver is None or node.count < (driver_node.count if driver_node else len(driver)):
+                driver, driver_node = None, node
+        candidates = self._tokens.collect(driver_node) if driver_node is not None else driver
+
+        return [
+            entry_id for entry_id in candidates
+            if all(any(t.startswith(token) for t in self.entries[entry_id].tokens) for token in tokens)
+        ]
+
+    def _fuzzy_matches(self, ticker: str, tokens: List[str]) -> List[int]:
+        """Entries with a ticker or name token within one edit of a query term."""
+        terms = {ticker, *tokens}
+        ids: Set[int] = set()
+        for term in terms:
+            if len(term) < FUZZY_MIN_LENGTH:
+                continue
+            for length in (len(term) - 1, len(term), len(term) + 1):
+                for candidate in self._fuzzy_terms.get((term[0], length), ()):
+                    if _within_one_edit(term, candidate):
+                        ids.update(self._fuzzy_ids[candidate])
+        return sorted(ids)
+
+    @classmethod
+    def from_fmp(cls, rows: Iterable[Dict[str, Any]]) -> "SymbolIndex":
+        """Build from FMP stock-list rows (symbol, name, exchange, exchangeShortName, type)."""
+        return cls(
+            SymbolEntry(
+                symbol=row.get("symbol") or "",
+                name=row.get("name") or row.get("companyName") or "",
+                exchange=row.get("exchange") or row.get("stockExchange"),
+                exchange_short_name=row.get("exchangeShortName"),
+                type=row.get("type"),
+                currency=row.get("currency"),
+            )
+            for row in rows
+        )
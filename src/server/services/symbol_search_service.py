@@ -0,0 +1,236 @@
+"""
+Local symbol search backed by an in-memory index of FMP's stock list.
+
+The symbol universe is loaded from a snapshot on disk at startup and
+refreshed from FMP in the background every symbol_search.refresh_interval
+seconds, so /search/stocks needs no network at query time. Until the first
+snapshot exists, callers fall back to FMP's remote search.
+
+FMP's stock list has no currency column. Currencies are filled in when
+the index is built, from the listing exchange (EXCHANGE_CURRENCIES) or a
+currency already recorded for the symbol in an earlier snapshot; symbols
+on exchanges without a single trading currency are served without one.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.config.core import get_default_config_dir
+from src.config.settings import get_nested_config
+from src.data_client.fmp import PRIORITY_BULK, get_fmp_client, request_priority
+from src.server.services.symbol_index import SymbolIndex
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 2
+SNAPSHOT_FIELDS = ("symbol", "name", "exchange", "exchangeShortName", "type", "currency")
+
+# Trading currency by FMP exchangeShortName. Only exchanges where listings
+# trade in a single currency; e.g. LSE mixes GBp and USD lines.
+EXCHANGE_CURRENCIES = {
+    "NASDAQ": "USD",
+    "NYSE": "USD",
+    "AMEX": "USD",
+    "OTC": "USD",
+    "PNK": "USD",
+    "CBOE": "USD",
+    "BATS": "USD",
+    "TSX": "CAD",
+    "TSXV": "CAD",
+    "NEO": "CAD",
+    "CNQ": "CAD",
+    "XETRA": "EUR",
+    "EURONEXT": "EUR",
+    "JPX": "JPY",
+    "HKSE": "HKD",
+    "NSE": "INR",
+    "BSE": "INR",
+    "ASX": "AUD",
+    "SIX": "CHF",
+    "KSC": "KRW",
+    "KOE": "KRW",
+    "SHH": "CNY",
+    "SHZ": "CNY",
+    "TAI": "TWD",
+    "TWO": "TWD",
+    "SAO": "BRL",
+}
+
+# Delay before retrying a failed refresh (capped by the refresh interval)
+RETRY_INTERVAL = 900
+
+
+class SymbolSearchService:
+    """
+    Singleton owning the symbol index and its refresh loop.
+
+    Index swaps are a single reference assignment, so searches never see a
+    partially built index.
+    """
+
+    _instance: Optional["SymbolSearchService"] = None
+
+    def __init__(self):
+        self.enabled = bool(get_nested_config("symbol_search.enabled", True))
+        self.refresh_interval = int(get_nested_config("symbol_search.refresh_interval", 86400))
+        cache_path = get_nested_config("symbol_search.cache_path", "") or ""
+        self.cache_path = (
+            Path(cache_path).expanduser() if cache_path
+            else get_default_config_dir() / "cache" / "symbol_universe.json"
+        )
+
+        self._index: Optional[SymbolIndex] = None
+        self._fetched_at = 0.0
+        # symbol -> currency recorded in snapshots
+        self._currencies: Dict[str, str] = {}
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def get_instance(cls) -> "SymbolSearchService":
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @property
+    def ready(self) -> bool:
+        """Whether an index is loaded"""
+        return self._index is not None
+
+    def search(
+        self,
+        query: str,
+        limit: int = 50,
+        exchanges: Optional[Sequence[str]] = None,
+        fuzzy: bool = False,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Search the local index.
+
+        Returns:
+            Ranked result dicts, or None if no index is loaded yet
+        """
+        index = self._index
+        if index is None:
+            return None
+        return index.search(query, limit=limit, exchanges=exchanges, fuzzy=fuzzy)
+
+    async def start(self) -> None:
+        """Load the on-disk snapshot and start the refresh loop."""
+        if not self.enabled or self._refresh_task is not None:
+            return
+
+        try:
+            rows, fetched_at = await asyncio.to_thread(self._read_snapshot)
+            if rows:
+                await self._install(rows, fetched_at)
+                logger.info(f"Symbol index loaded from {self.cache_path} ({len(self._index)} symbols)")
+        except Exception as e:
+            logger.warning(f"Failed to load symbol snapshot {self.cache_path}: {e}")
+
+        self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def shutdown(self) -> None:
+        """Stop the refresh loop."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    async def refresh(self) -> int:
+        """
+        Fetch the stock list from FMP, rebuild the index and persist it.
+
+        Returns:
+            Number of symbols indexed
+        """
+        fmp_client = await get_fmp_client()
+        with request_priority(PRIORITY_BULK):
+            listings = await fmp_client.get_stock_list()
+        if not listings:
+            raise ValueError("FMP returned an empty stock list")
+
+        rows = [
+            [item.get(name) for name in SNAPSHOT_FIELDS]
+            for item in listings if item.get("symbol")
+        ]
+        self._fill_currencies(rows)
+        fetched_at = time.time()
+        await self._install(rows, fetched_at)
+        try:
+            await asyncio.to_thread(self._write_snapshot, rows, fetched_at)
+        except OSError as e:
+            logger.warning(f"Failed to write symbol snapshot {self.cache_path}: {e}")
+        return len(self._index)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index size and freshness"""
+        return {
+            "enabled": self.enabled,
+            "ready": self.ready,
+            "symbols": len(self._index) if self._index is not None else 0,
+            "age_s": round(time.time() - self._fetched_at, 1) if self._fetched_at else None,
+            "cache_path": str(self.cache_path),
+        }
+
+    def _fill_currencies(self, rows: List[List[Any]]) -> None:
+        currency_col = SNAPSHOT_FIELDS.index("currency")
+        exchange_col = SNAPSHOT_FIELDS.index("exchangeShortName")
+        for row in rows:
+            if row[currency_col] is None:
+                row[currency_col] = (
+                    self._currencies.get(str(row[0]).upper())
+                    or EXCHANGE_CURRENCIES.get(str(row[exchange_col] or "").upper())
+                )
+
+    async def _install(self, rows: List[List[Any]], fetched_at: float) -> None:
+        # Snapshots written before the exchange map existed may lack currencies
+        self._fill_currencies(rows)
+        # Building takes a moment for the full universe; keep it off the event loop
+        index = await asyncio.to_thread(
+            SymbolIndex.from_fmp, (dict(zip(SNAPSHOT_FIELDS, row)) for row in rows)
+        )
+        currency_col = SNAPSHOT_FIELDS.index("currency")
+        for row in rows:
+            if row[currency_col]:
+                self._currencies.setdefault(str(row[0]).upper(), row[currency_col])
+        self._index = index
+        self._fetched_at = fetched_at
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            due_in = self._fetched_at + self.refresh_interval - time.time()
+            if self._index is not None and due_in > 0:
+                await asyncio.sleep(due_in)
+            try:
+                count = await self.refresh()
+                logger.info(f"Symbol index refreshed from FMP ({count} symbols)")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Symbol index refresh failed: {e}")
+                await asyncio.sleep(min(RETRY_INTERVAL, self.refresh_interval))
+
+    def _read_snapshot(self):
+        if not self.cache_path.exists():
+            return [], 0.0
+        with open(self.cache_path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            return [], 0.0
+        return snapshot.get("rows", []), float(snapshot.get("fetched_at", 0.0))
+
+    def _write_snapshot(self, rows: List[List[Any]], fetched_at: float) -> None:
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": SNAPSHOT_VERSION, "fetched_at": fetched_at, "rows": rows}, f)
+        os.replace(tmp_path, self.cache_path)
@@ -5,12 +5,21 @@ Manages workspace lifecycle with database persistence and sandbox integration:
 - Creates workspaces with dedicated Daytona sandboxes (1:1 mapping)
 - Stops sandboxes when idle (preserves data for quick restart)
 - Handles sandbox reconnection for stopped workspaces
+- Serializes operations per workspace (keyed locks), so a slow sandbox
+  restart for one workspace never blocks requests for another
+
+Concurrent session requests for the same workspace are single-flight: the
+first caller runs the acquisition (DB read, sandbox readiness, tool/user
+data sync or restart) and later callers await the same in-flight result.
 """
 
 import asyncio
 import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 from ptc_agent.config import AgentConfig
 from ptc_agent.core.session import Session, SessionManager
@@ -29,6 +38,39 @@ from src.server.services.sync_user_data import sync_user_data_to_sandbox
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class WorkspaceLockStats:
+    """Lock wait metrics for a single workspace."""
+
+    acquisitions: int = 0
+    contended: int = 0
+    shared_sessions: int = 0  # Callers that joined an in-flight session acquisition
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+    last_wait_ms: float = 0.0
+
+    def record_wait(self, wait_ms: float, contended: bool) -> None:
+        """Record one lock acquisition."""
+        self.acquisitions += 1
+        if contended:
+            self.contended += 1
+        self.total_wait_ms += wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+        self.last_wait_ms = wait_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return stats including the average wait."""
+        avg_wait = self.total_wait_ms / self.acquisitions if self.acquisitions else 0.0
+        return {
+            "acquisitions": self.acquisitions,
+            "contended": self.contended,
+            "shared_sessions": self.shared_sessions,
+            "avg_wait_ms": round(avg_wait, 3),
+            "max_wait_ms": round(self.max_wait_ms, 3),
+            "last_wait_ms": round(self.last_wait_ms, 3),
+        }
+
+
 class WorkspaceManager:
     """
     Manages workspace lifecycle with database persistence.
@@ -38,7 +80,6 @@ class WorkspaceManager:
     """
 
     _instance: Optional["WorkspaceManager"] = None
-    _lock = asyncio.Lock()
 
     def __init__(
         self,
@@ -68,6 +109,13 @@ class WorkspaceManager:
         # Once sandbox is ready and sync completes, workspace is removed from this set
         self._pending_lazy_sync: set[str] = set()
 
+        # Per-workspace locks (workspace_id -> Lock) and their wait metrics
+        self._workspace_locks: Dict[str, asyncio.Lock] = {}
+        self._lock_stats: Dict[str, WorkspaceLockStats] = {}
+
+        # In-flight session acquisitions (workspace_id -> Task) for single-flight
+        self._session_inflight: Dict[str, asyncio.Task] = {}
+
         # Cleanup task
         self._cleanup_task: Optional[asyncio.Task] = None
         self._shutdown = False
@@ -107,6 +155,28 @@ class WorkspaceManager:
         """Reset singleton instance (for testing)."""
         cls._instance = None
 
+    @asynccontextmanager
+    async def _workspace_lock(self, workspace_id: str) -> AsyncIterator[None]:
+        """
+        Hold the lock for a single workspace, recording how long it took.
+
+        Args:
+            workspace_id: Workspace ID
+        """
+        lock = self._workspace_locks.setdefault(workspace_id, asyncio.Lock())
+        stats = self._lock_stats.setdefault(workspace_id, WorkspaceLockStats())
+        contended = lock.locked()
+
+        start = time.perf_counter()
+        async with lock:
+            wait_ms = (time.perf_counter() - start) * 1000
+            stats.record_wait(wait_ms, contended)
+            if contended:
+                logger.debug(
+                    f"Waited {wait_ms:.1f}ms for workspace lock {workspace_id}"
+                )
+            yield
+
     async def _sync_user_data_if_needed(
         self,
         workspace_id: str,
@@ -195,16 +265,16 @@ class WorkspaceManager:
         Returns:
             Created workspace record
         """
-        async with self._lock:
-            # 1. Create DB record (status='creating')
-            workspace = await db_create_workspace(
-                user_id=user_id,
-                name=name,
-                description=description,
-                config=config,
-            )
-            workspace_id = str(workspace["workspace_id"])
+        # 1. Create DB record (status='creating')
+        workspace = await db_create_workspace(
+            user_id=user_id,
+            name=name,
+            description=description,
+            config=config,
+        )
+        workspace_id = str(workspace["workspace_id"])
 
+        async with self._workspace_lock(workspace_id):
             logger.info(f"Creating workspace {workspace_id} for user {user_id}")
 
             try:
@@ -268,7 +338,44 @@ class WorkspaceManager:
             ValueError: If workspace not found
             RuntimeError: If workspace is in error/deleted state
         """
-        async with self._lock:
+        inflight = self._session_inflight.get(workspace_id)
+        if inflight is not None and not inflight.done():
+            # Join the acquisition already running for this workspace
+            self._lock_stats.setdefault(workspace_id, WorkspaceLockStats()).shared_sessions += 1
+            logger.debug(f"Joining in-flight session acquisition for {workspace_id}")
+            return await asyncio.shield(inflight)
+
+        task = asyncio.create_task(self._acquire_session(workspace_id, user_id))
+        self._session_inflight[workspace_id] = task
+
+        def _clear_inflight(done: asyncio.Task) -> None:
+            if self._session_inflight.get(workspace_id) is done:
+                del self._session_inflight[workspace_id]
+            # Mark the exception retrieved in case every caller went away
+            if not done.cancelled():
+                done.exception()
+
+        task.add_done_callback(_clear_inflight)
+
+        # Shield so one caller disconnecting does not cancel the shared acquisition
+        return await asyncio.shield(task)
+
+    async def _acquire_session(
+        self,
+        workspace_id: str,
+        user_id: str | None,
+    ) -> Session:
+        """
+        Resolve a usable session for a workspace under its workspace lock.
+
+        Args:
+            workspace_id: Workspace UUID
+            user_id: Optional user ID for syncing user data to sandbox
+
+        Returns:
+            Initialized Session instance
+        """
+        async with self._workspace_lock(workspace_id):
             logger.info(
                 f"get_session_for_workspace called: workspace_id={workspace_id}, user_id={user_id}, "
                 f"in_cache={workspace_id in self._sessions}, already_synced={workspace_id in self._user_data_synced}"
@@ -313,9 +420,8 @@ class WorkspaceManager:
                     await update_workspace_activity(workspace_id)
                     return session
                 else:
-                    # Sandbox ready - perform sync operations
-                    await session.sandbox.ensure_sandbox_ready()
-
+                    # Sandbox ready - perform sync operations. Liveness is
+                    # checked by sync_tools() when its throttle window expires.
                     # Complete deferred sync for lazy-initialized workspaces
                     if workspace_id in self._pending_lazy_sync:
                         logger.info(f"Completing deferred sync for lazy-init workspace {workspace_id}")
@@ -376,7 +482,6 @@ class WorkspaceManager:
                             )
                 else:
                     if session.sandbox:
-                        await session.sandbox.ensure_sandbox_ready()
                         try:
                             await session.sandbox.sync_tools()
                         except Exception as e:
@@ -508,7 +613,7 @@ class WorkspaceManager:
         Returns:
             Updated workspace record
         """
-        async with self._lock:
+        async with self._workspace_lock(workspace_id):
             workspace = await db_get_workspace(workspace_id)
             if not workspace:
                 raise ValueError(f"Workspace {workspace_id} not found")
@@ -574,7 +679,7 @@ class WorkspaceManager:
         Returns:
             True if deleted successfully
         """
-        async with self._lock:
+        async with self._workspace_lock(workspace_id):
             workspace = await db_get_workspace(workspace_id)
             if not workspace:
                 raise ValueError(f"Workspace {workspace_id} not found")
@@ -604,6 +709,11 @@ class WorkspaceManager:
                 # Soft delete in DB
                 await db_delete_workspace(workspace_id)
 
+                # Drop lock bookkeeping; late waiters on the old lock will
+                # observe the deleted status
+                self._workspace_locks.pop(workspace_id, None)
+                self._lock_stats.pop(workspace_id, None)
+
                 logger.info(f"Workspace {workspace_id} deleted successfully")
                 return True
 
@@ -699,14 +809,49 @@ class WorkspaceManager:
         self._sessions.clear()
         self._user_data_synced.clear()
         self._pending_lazy_sync.clear()
+        self._session_inflight.clear()
 
         logger.info("WorkspaceManager shutdown complete")
 
+    def invalidate_tool_sync(self, workspace_id: Optional[str] = None) -> int:
+        """Force the next session lookup to re-check sandbox tools.
+
+        Call after MCP/tool config changes so cached sessions don't wait out
+        ``mcp.tool_sync_interval``.
+
+        Args:
+            workspace_id: Workspace to invalidate, or None for all cached sessions
+
+        Returns:
+            Number of sandboxes invalidated
+        """
+        if workspace_id is not None:
+            session = self._sessions.get(workspace_id)
+            sessions = [session] if session else []
+        else:
+            sessions = list(self._sessions.values())
+
+        count = 0
+        for session in sessions:
+            if session.sandbox:
+                session.sandbox.invalidate_tool_sync()
+                count += 1
+        return count
+
     def get_stats(self) -> Dict[str, Any]:
-        """Get service statistics."""
+        """Get service statistics, including per-workspace lock wait metrics."""
         return {
             "cached_sessions": len(self._sessions),
             "idle_timeout": self.idle_timeout,
             "cleanup_interval": self.cleanup_interval,
             "cached_workspace_ids": list(self._sessions.keys()),
+            "inflight_session_acquisitions": len(self._session_inflight),
+            "workspace_locks": {
+                workspace_id: {
+                    "locked": workspace_id in self._workspace_locks
+                    and self._workspace_locks[workspace_id].locked(),
+                    **stats.to_dict(),
+                }
+                for workspace_id, stats in self._lock_stats.items()
+            },
         }
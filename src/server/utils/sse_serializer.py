@@ -0,0 +1,77 @@
+"""
+SSE Frame Serialization
+
+JSON serializers and frame building for Server-Sent Events:
+- json: stdlib json.dumps(ensure_ascii=False)
+- orjson: orjson.dumps (falls back to json for values orjson rejects)
+
+Frames are assembled from per-event-type prefixes built once, so each event
+only pays for its JSON payload and sequence id.
+"""
+
+import json
+import logging
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+SSE_SERIALIZERS = ("json", "orjson")
+
+# "\nevent: <type>\ndata: " per event type
+_FRAME_PREFIXES: Dict[str, str] = {}
+
+
+def _json_dumps(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False)
+
+
+def _orjson_dumps(data: Any) -> str:
+    try:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    except TypeError:
+        # e.g. integers above 64 bits or unsupported types; keep stdlib behavior
+        return _json_dumps(data)
+
+
+def get_sse_json_serializer(name: str = "orjson") -> Callable[[Any], str]:
+    """
+    Get the JSON serializer for SSE payloads.
+
+    Args:
+        name: "json" or "orjson" (uses json if orjson is not installed)
+
+    Returns:
+        Function serializing a payload to a JSON string
+    """
+    if name not in SSE_SERIALIZERS:
+        logger.warning(f"Unknown SSE serializer '{name}', using json")
+        return _json_dumps
+    if name == "orjson":
+        if orjson is None:
+            logger.warning("orjson is not installed, SSE serializer falls back to json")
+            return _json_dumps
+        return _orjson_dumps
+    return _json_dumps
+
+
+def format_sse_frame(event_id: int, event_type: str, json_data: str) -> str:
+    """
+    Build an SSE frame.
+
+    Args:
+        event_id: Sequence id for reconnection
+        event_type: SSE event type
+        json_data: Serialized payload
+
+    Returns:
+        SSE-formatted string (id: seq\\nevent: type\\ndata: json\\n\\n)
+    """
+    prefix = _FRAME_PREFIXES.get(event_type)
+    if prefix is None:
+        prefix = _FRAME_PREFIXES[event_type] = f"\nevent: {event_type}\ndata: "
+    return f"id: {event_id}{prefix}{json_data}\n\n"
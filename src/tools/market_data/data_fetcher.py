@@ -4,32 +4,65 @@ FMP Intraday Data Fetcher (Async)
 
 Fetches intraday OHLCV data from Financial Modeling Prep API
 with support for multiple intervals and date ranges.
+
+Long ranges are split into calendar-aligned chunks fetched concurrently
+(bulk lane of the shared FMP rate limiter). Chunks that lie entirely in
+the past are cached in Redis and reused by later requests.
 """
 
+import asyncio
 import pandas as pd
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any, cast
+from datetime import date, datetime, timedelta
+from typing import Optional, List, Dict, Any, Tuple, cast
 import logging
+from zoneinfo import ZoneInfo
 
-from src.data_client.fmp import FMPClient
+from src.config.settings import get_nested_config
+from src.data_client.fmp import PRIORITY_BULK, FMPClient, request_priority
+from src.utils.cache.cache_keys import INTRADAY_NAMESPACE, CacheKeyBuilder
 
 logger = logging.getLogger(__name__)
 
+CHUNK_CACHE_KEYS = CacheKeyBuilder(INTRADAY_NAMESPACE)
+
+# Whether a chunk is closed follows the US market calendar, not the server's
+MARKET_TZ = ZoneInfo("America/New_York")
+
+
+async def _get_cache_client():
+    """Get and connect cache client if available."""
+    try:
+        from src.utils.cache import get_cache_client
+        cache = get_cache_client()
+        if not cache.client:
+            await cache.connect()
+        return cache
+    except Exception as e:
+        logger.debug(f"Cache not available: {e}")
+        return None
+
 
 class IntradayDataFetcher:
     """Fetches intraday stock data from FMP API (Async)"""
 
     VALID_INTERVALS = ["1min", "5min", "15min", "30min", "1hour", "4hour"]
+    MAX_CONCURRENT_CHUNKS = 4
+    CHUNK_RETRIES = 2
+    CHUNK_RETRY_BACKOFF = 0.5  # seconds, doubled per attempt
 
-    def __init__(self, fmp_client: Optional[FMPClient] = None):
+    def __init__(self, fmp_client: Optional[FMPClient] = None, max_concurrent_chunks: Optional[int] = None):
         """
         Initialize data fetcher
 
         Args:
             fmp_client: FMP client instance (creates new if not provided)
+            max_concurrent_chunks: Chunk requests in flight at once for long ranges
+                (default MAX_CONCURRENT_CHUNKS; all requests also pass the
+                shared FMP rate limiter)
         """
         self.client = fmp_client or FMPClient()
         self._owns_client = fmp_client is None
+        self.max_concurrent_chunks = max_concurrent_chunks or self.MAX_CONCURRENT_CHUNKS
 
     async def fetch_intraday_data(
         self, ticker: str, interval: str, start_date: str, end_date: str
@@ -125,46 +158,98 @@ class IntradayDataFetcher:
         end_dt: datetime,
         chunk_days: int,
     ) -> pd.DataFrame:
-        """Fetch data in chunks when date range is too large"""
-        all_data = []
-        current_start = start_dt
-
-        while current_start < end_dt:
-            current_end = min(current_start + timedelta(days=chunk_days), end_dt)
-
-            try:
-                chunk_data = await self._fetch_from_fmp(
-                    ticker,
-                    interval,
-                    current_start.strftime("%Y-%m-%d"),
-                    current_end.strftime("%Y-%m-%d"),
-                )
-
-                if chunk_data:
-                    all_data.extend(chunk_data)
-
-                logger.info(
-                    f"Fetched chunk: {current_start.date()} to {current_end.date()} "
-                    f"({len(chunk_data)} records)"
-                )
-
-            except Exception as e:
-                logger.error(f"Error fetching chunk {current_start.date()}: {e}")
+        """
+        Fetch data in chunks when date range is too large
 
-            current_start = current_end + timedelta(days=1)
+        Chunks are aligned to a fixed calendar grid of chunk_days so that
+        overlapping requests share (cached) chunks; the edges are trimmed to
+        the requested range after assembly.
+        """
+        today = datetime.now(MARKET_TZ).date()
+        chunks = self._aligned_chunks(start_dt.date(), min(end_dt.date(), today), chunk_days, today)
+
+        # Reuse closed chunks from the cache (one round trip)
+        cache = await _get_cache_client()
+        version = await cache.get_namespace_version(INTRADAY_NAMESPACE) if cache else None
+        keys = [
+            CHUNK_CACHE_KEYS.build(
+                f"chunk:symbol={ticker.upper()}:interval={interval}:from={s}:to={e}", version=version
+            )
+            for s, e in chunks
+        ]
+        cached = await cache.mget(keys) if cache else [None] * len(chunks)
+
+        semaphore = asyncio.Semaphore(self.max_concurrent_chunks)
+
+        async def fetch_chunk(chunk_start: date, chunk_end: date) -> Optional[List[Dict[str, Any]]]:
+            async with semaphore:
+                return await self._fetch_chunk_with_retry(ticker, interval, chunk_start, chunk_end)
+
+        missing = [i for i, rows in enumerate(cached) if rows is None]
+        with request_priority(PRIORITY_BULK):
+            fetched = await asyncio.gather(*(fetch_chunk(*chunks[i]) for i in missing))
+
+        # Cache chunks that can no longer change; an empty chunk may just not
+        # be published yet, so it is fetched again next time
+        closed: Dict[str, List[Dict[str, Any]]] = {}
+        for i, rows in zip(missing, fetched):
+            cached[i] = rows
+            if rows and chunks[i][1] < today:
+                closed[keys[i]] = rows
+        if cache and closed:
+            await cache.mset(closed, ttl=get_nested_config("redis.ttl.intraday_bars_history", 604800))
+
+        logger.info(
+            f"Fetched {len(chunks)} chunks for {ticker} {interval} "
+            f"({len(chunks) - len(missing)} cached, {sum(rows is None for rows in fetched)} failed)"
+        )
 
-        if not all_data:
+        frames = [pd.DataFrame.from_records(rows) for rows in cached if rows]
+        if not frames:
             return pd.DataFrame()
 
         # Convert to DataFrame and process
-        df = pd.DataFrame(all_data)
+        df = pd.concat(frames, ignore_index=True)
         df = self._process_dataframe(df)
 
-        # Remove duplicates that might occur at chunk boundaries
+        # Remove duplicates that might occur at chunk boundaries, then trim the aligned edges
         df = cast(pd.DataFrame, df.loc[~df.index.duplicated(keep="first"), :])
+        df = df.loc[(df.index >= start_dt) & (df.index < end_dt + timedelta(days=1))]
 
         return df
 
+    @staticmethod
+    def _aligned_chunks(start: date, end: date, chunk_days: int, latest: date) -> List[Tuple[date, date]]:
+        """Cover [start, end] with chunk_days-long chunks on a fixed calendar grid (capped at latest)"""
+        chunks = []
+        ordinal = start.toordinal() - start.toordinal() % chunk_days
+        while ordinal <= end.toordinal():
+            chunk_start = date.fromordinal(ordinal)
+            chunk_end = min(date.fromordinal(ordinal + chunk_days - 1), latest)
+            chunks.append((chunk_start, chunk_end))
+            ordinal += chunk_days
+        return chunks
+
+    async def _fetch_chunk_with_retry(
+        self, ticker: str, interval: str, chunk_start: date, chunk_end: date
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Fetch one chunk, retrying with backoff; None if every attempt failed"""
+        for attempt in range(self.CHUNK_RETRIES + 1):
+            try:
+                return await self._fetch_from_fmp(
+                    ticker, interval, chunk_start.isoformat(), chunk_end.isoformat()
+                )
+            except Exception as e:
+                if attempt == self.CHUNK_RETRIES:
+                    logger.error(f"Error fetching chunk {chunk_start} to {chunk_end}: {e}")
+                    return None
+                delay = self.CHUNK_RETRY_BACKOFF * 2 ** attempt
+                logger.warning(
+                    f"Chunk {chunk_start} to {chunk_end} failed ({e}), retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+        return None
+
     def _process_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """Process and clean the DataFrame"""
         if df.empty:
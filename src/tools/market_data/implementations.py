@@ -11,7 +11,15 @@ import logging
 import asyncio
 
 from .utils import format_number, format_percentage, get_market_session
-from src.data_client.fmp import get_fmp_client
+from .indicators import (
+    DEFAULT_INDICATORS,
+    INTRADAY_BARS_PER_DAY,
+    compute_indicators,
+    parse_indicators,
+    price_statistics,
+    warmup_days,
+)
+from src.data_client.fmp import PRIORITY_BULK, get_fmp_client, request_priority
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +36,7 @@ FILING_DATE_TOLERANCE_DAYS = (
     5  # Allow 5 days difference when matching filings to earnings
 )
 DAYS_PER_QUARTER = 90  # Approximate days per fiscal quarter
+MAX_INDICATOR_SYMBOLS = 20
 
 
 def _build_fiscal_period_lookup(income_stmt: List[Dict]) -> Dict[str, str]:
@@ -384,92 +393,40 @@ def _calculate_price_statistics(data: List[Dict[str, Any]]) -> Dict[str, Any]:
     Returns:
         Dictionary containing aggregated statistics
     """
-    if not data or len(data) == 0:
+    if not data:
         return {}
 
-    # Sort to have oldest first for calculations
-    sorted_data = sorted(data, key=lambda x: x.get("date", ""), reverse=False)
-
-    # Extract closing prices for calculations
-    closes = [d.get("close") for d in sorted_data if d.get("close") is not None]
-    if not closes:
-        return {}
+    symbol = data[0].get("symbol", "N/A")
+    return price_statistics({symbol: data}).get(symbol, {})
 
-    # Aggregated OHLC
-    first_day = sorted_data[0]
-    last_day = sorted_data[-1]
-
-    stats = {
-        "symbol": data[0].get("symbol", "N/A"),
-        "period_days": len(data),
-        "start_date": first_day.get("date", "N/A"),
-        "end_date": last_day.get("date", "N/A"),
-        # Aggregated OHLC
-        "period_open": first_day.get("open"),
-        "period_close": last_day.get("close"),
-        "period_high": max(
-            d.get("high") for d in sorted_data if d.get("high") is not None
-        ),
-        "period_low": min(
-            d.get("low") for d in sorted_data if d.get("low") is not None
-        ),
-        # Price range
-        "min_close": min(closes),
-        "max_close": max(closes),
-        # Period performance
-        "period_change": None,
-        "period_change_pct": None,
-    }
 
-    # Calculate period performance
-    if stats["period_open"] and stats["period_close"]:
-        stats["period_change"] = stats["period_close"] - stats["period_open"]
-        stats["period_change_pct"] = (
-            stats["period_change"] / stats["period_open"]
-        ) * 100
-
-    # Moving averages (only calculate if enough data)
-    stats["ma_20"] = None
-    stats["ma_50"] = None
-    stats["ma_200"] = None
-
-    if len(closes) >= 20:
-        stats["ma_20"] = sum(closes[-20:]) / 20
-    if len(closes) >= 50:
-        stats["ma_50"] = sum(closes[-50:]) / 50
-    if len(closes) >= 200:
-        stats["ma_200"] = sum(closes[-200:]) / 200
-
-    # Volatility (standard deviation of daily returns)
-    if len(closes) >= 2:
-        daily_returns = []
-        for i in range(1, len(closes)):
-            if closes[i - 1] != 0:
-                ret = ((closes[i] - closes[i - 1]) / closes[i - 1]) * 100
-                daily_returns.append(ret)
-
-        if daily_returns:
-            # Calculate standard deviation
-            mean_return = sum(daily_returns) / len(daily_returns)
-            variance = sum((r - mean_return) ** 2 for r in daily_returns) / len(
-                daily_returns
-            )
-            stats["volatility"] = variance**0.5  # Standard deviation
-        else:
-            stats["volatility"] = None
-    else:
-        stats["volatility"] = None
+def _format_indicators_as_table(
+    symbol: str, rows: List[Dict[str, Any]], columns: List[str]
+) -> str:
+    """
+    Format indicator rows for one symbol as a markdown table.
 
-    # Volume statistics
-    volumes = [d.get("volume") for d in sorted_data if d.get("volume") is not None]
-    if volumes:
-        stats["avg_volume"] = sum(volumes) / len(volumes)
-        stats["total_volume"] = sum(volumes)
-    else:
-        stats["avg_volume"] = None
-        stats["total_volume"] = None
+    Args:
+        symbol: Ticker symbol
+        rows: Indicator rows (newest first) from compute_indicators
+        columns: Indicator output columns to show
 
-    return stats
+    Returns:
+        Markdown-formatted table string
+    """
+    lines = [f"### {symbol}", ""]
+    if not rows:
+        lines.append("No price data available.")
+        return "\n".join(lines)
+
+    lines.append("| Date | Close | " + " | ".join(columns) + " |")
+    lines.append("|" + "---|" * (len(columns) + 2))
+    for row in rows:
+        close = row.get("close")
+        values = [f"{row[c]:.2f}" if row.get(c) is not None else "N/A" for c in columns]
+        close_str = f"${close:.2f}" if close is not None else "N/A"
+        lines.append(f"| {row.get('date', 'N/A')} | {close_str} | " + " | ".join(values) + " |")
+    return "\n".join(lines)
 
 
 def _format_price_summary(stats: Dict[str, Any]) -> str:
@@ -605,13 +562,15 @@ def _format_indices_summary(
     lines.append(f"**Period:** {start_date} to {end_date} ({num_days} trading days)")
     lines.append("")
 
+    # Statistics for every index in one vectorized pass
+    all_stats = price_statistics(indices_data)
+
     # Process each index
     for i, (symbol, data) in enumerate(indices_data.items()):
         if not data:
             continue
 
-        # Calculate statistics for this index using existing helper
-        stats = _calculate_price_statistics(data)
+        stats = all_stats.get(symbol)
 
         if not stats:
             continue
@@ -814,6 +773,112 @@ No price data available for the specified period."""
 Error retrieving price data: {str(e)}"""
 
 
+async def fetch_technical_indicators(
+    symbols: List[str],
+    indicators: Optional[List[str]] = None,
+    interval: str = "1day",
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    limit: int = 5,
+) -> str:
+    """
+    Compute technical indicators locally from OHLCV bars.
+
+    Bars come from the FMP client (one price request per symbol, served from
+    its response cache when warm) and every indicator for every symbol is
+    computed in one vectorized pass, instead of one FMP indicator call each.
+    Extra history before start_date is fetched so indicators are warmed up.
+
+    Args:
+        symbols: Ticker symbols (max 20)
+        indicators: Indicator specs (e.g. "sma:50", "rsi:14", "macd:12:26:9");
+            defaults to DEFAULT_INDICATORS
+        interval: "1day" or an intraday interval (1min, 5min, 15min, 30min, 1hour, 4hour)
+        start_date: First date to report (YYYY-MM-DD)
+        end_date: Last date to report (YYYY-MM-DD, default today)
+        limit: Newest rows to report per symbol (within start_date..end_date)
+
+    Returns:
+        Markdown report with one indicator table per symbol
+    """
+    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+    symbols = list(dict.fromkeys(s.strip().upper() for s in symbols if s and s.strip()))
+
+    def error_report(message: str) -> str:
+        return f"""## Technical Indicators
+**Retrieved:** {timestamp}
+**Status:** Error
+
+{message}"""
+
+    if not symbols:
+        return error_report("No symbols provided.")
+    if len(symbols) > MAX_INDICATOR_SYMBOLS:
+        return error_report(f"Too many symbols ({len(symbols)}); maximum is {MAX_INDICATOR_SYMBOLS}.")
+    if interval != "1day" and interval not in INTRADAY_BARS_PER_DAY:
+        return error_report(
+            f"Invalid interval '{interval}'. Supported: 1day, {', '.join(INTRADAY_BARS_PER_DAY)}"
+        )
+    try:
+        specs = parse_indicators(indicators or DEFAULT_INDICATORS)
+    except ValueError as e:
+        return error_report(str(e))
+
+    # History covering the reported rows plus indicator warm-up
+    limit = max(1, limit)
+    end = datetime.strptime(end_date, "%Y-%m-%d").date() if end_date else datetime.now().date()
+    first = datetime.strptime(start_date, "%Y-%m-%d").date() if start_date else end
+    extra_rows = 0 if start_date else limit
+    fetch_start = (first - timedelta(days=warmup_days(specs, interval, extra_rows))).isoformat()
+
+    try:
+        fmp_client = await get_fmp_client()
+
+        async def fetch_bars(symbol: str) -> List[Dict[str, Any]]:
+            if interval == "1day":
+                return await fmp_client.get_stock_price(
+                    symbol=symbol, from_date=fetch_start, to_date=end.isoformat()
+                )
+            return await fmp_client.get_intraday_chart(
+                symbol, interval, from_date=fetch_start, to_date=end.isoformat()
+            )
+
+        with request_priority(PRIORITY_BULK):
+            fetched = await asyncio.gather(
+                *(fetch_bars(symbol) for symbol in symbols), return_exceptions=True
+            )
+
+        bars_by_symbol = {}
+        errors = {}
+        for symbol, result in zip(symbols, fetched):
+            if isinstance(result, Exception):
+                logger.warning(f"Error fetching bars for {symbol}: {result}")
+                errors[symbol] = str(result)
+            else:
+                bars_by_symbol[symbol] = result or []
+
+        rows_by_symbol = compute_indicators(bars_by_symbol, specs, start=start_date, limit=limit)
+    except Exception as e:
+        logger.error(f"Error computing technical indicators for {symbols}: {e}")
+        return error_report(f"Error computing technical indicators: {str(e)}")
+
+    columns = [column for spec in specs for column in spec.columns]
+    lines = [
+        "## Technical Indicators",
+        f"**Retrieved:** {timestamp}",
+        f"**Interval:** {interval}",
+        f"**Indicators:** {', '.join(spec.label for spec in specs)}",
+        "",
+    ]
+    for symbol in symbols:
+        if symbol in errors:
+            lines.extend([f"### {symbol}", "", f"Error retrieving price data: {errors[symbol]}", ""])
+            continue
+        lines.append(_format_indicators_as_table(symbol, rows_by_symbol.get(symbol, []), columns))
+        lines.append("")
+    return "\n".join(lines).rstrip() + "\n"
+
+
 async def fetch_company_overview(symbol: str) -> str:
     """
     Fetch comprehensive investment analysis overview for a company.
@@ -869,43 +934,44 @@ No data found for symbol {symbol}"""
         output_lines.append("")
 
         # === PARALLEL DATA FETCH ===
-        # Fetch all data in parallel for performance optimization
-        (
-            income_stmt_result,
-            earnings_calendar_result,
-            price_change_result,
-            key_metrics_result,
-            ratios_result,
-            filings_10q_result,
-            filings_10k_result,
-            price_target_consensus_result,
-            grades_summary_result,
-            stock_grades_result,
-            price_target_summary_result,
-            product_data_result,
-            geo_data_result,
-            quote_result,
-        ) = await asyncio.gather(
-            fmp_client.get_income_statement(symbol, period="quarter", limit=8),
-            fmp_client.get_historical_earnings_calendar(symbol, limit=10),
-            fmp_client.get_stock_price_change(symbol),
-            fmp_client.get_key_metrics_ttm(symbol),
-            fmp_client.get_ratios_ttm(symbol),
-            fmp_client.get_sec_filings(symbol, filing_type="10-Q", limit=3),
-            fmp_client.get_sec_filings(symbol, filing_type="10-K", limit=2),
-            fmp_client.get_price_target_consensus(symbol),
-            fmp_client.get_grades_summary(symbol),
-            fmp_client.get_stock_grades(symbol, limit=10),
-            fmp_client.get_price_target_summary(symbol),
-            fmp_client.get_revenue_product_segmentation(
-                symbol, period="quarter", structure="flat"
-            ),
-            fmp_client.get_revenue_geographic_segmentation(
-                symbol, period="quarter", structure="flat"
-            ),
-            fmp_client.get_quote(symbol),
-            return_exceptions=True,
-        )
+        # Fetch all data in parallel; bulk lane so interactive UI requests go first
+        with request_priority(PRIORITY_BULK):
+            (
+                income_stmt_result,
+                earnings_calendar_result,
+                price_change_result,
+                key_metrics_result,
+                ratios_result,
+                filings_10q_result,
+                filings_10k_result,
+                price_target_consensus_result,
+                grades_summary_result,
+                stock_grades_result,
+                price_target_summary_result,
+                product_data_result,
+                geo_data_result,
+                quote_result,
+            ) = await asyncio.gather(
+                fmp_client.get_income_statement(symbol, period="quarter", limit=8),
+                fmp_client.get_historical_earnings_calendar(symbol, limit=10),
+                fmp_client.get_stock_price_change(symbol),
+                fmp_client.get_key_metrics_ttm(symbol),
+                fmp_client.get_ratios_ttm(symbol),
+                fmp_client.get_sec_filings(symbol, filing_type="10-Q", limit=3),
+                fmp_client.get_sec_filings(symbol, filing_type="10-K", limit=2),
+                fmp_client.get_price_target_consensus(symbol),
+                fmp_client.get_grades_summary(symbol),
+                fmp_client.get_stock_grades(symbol, limit=10),
+                fmp_client.get_price_target_summary(symbol),
+                fmp_client.get_revenue_product_segmentation(
+                    symbol, period="quarter", structure="flat"
+                ),
+                fmp_client.get_revenue_geographic_segmentation(
+                    symbol, period="quarter", structure="flat"
+                ),
+                fmp_client.get_quote(symbol),
+                return_exceptions=True,
+            )
 
         # Extract safe results
         income_stmt = _safe_result(income_stmt_result, [])
@@ -1614,8 +1680,9 @@ async def fetch_market_indices(
                 logger.warning(f"Error fetching data for index {index_symbol}: {e}")
                 return (index_symbol, None)
 
-        # Fetch all indices in parallel
-        results = await asyncio.gather(*[fetch_single_index(sym) for sym in indices])
+        # Fetch all indices in parallel (bulk lane of the FMP rate limiter)
+        with request_priority(PRIORITY_BULK):
+            results = await asyncio.gather(*[fetch_single_index(sym) for sym in indices])
 
         # Process results
         indices_data = {}
@@ -0,0 +1,392 @@
+"""
+Vectorized technical indicators over OHLCV bars.
+
+Bars for any number of symbols are stacked into one pandas frame (sorted by
+symbol, then time) and every requested indicator is computed column-wise
+with grouped rolling/EWM operations, so a request for N indicators over M
+symbols is a handful of vectorized passes instead of M * N Python loops or
+remote indicator calls.
+
+Indicator specs are strings: a name optionally followed by ``:``-separated
+parameters, e.g. ``"sma:50"``, ``"macd:12:26:9"``, ``"bbands:20:2"``.
+Omitted parameters take the defaults in ``INDICATOR_DEFAULTS``.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+# Indicator name -> default parameters
+INDICATOR_DEFAULTS: Dict[str, Tuple[float, ...]] = {
+    "sma": (20,),  # window
+    "ema": (20,),  # span
+    "rsi": (14,),  # period (Wilder smoothing)
+    "macd": (12, 26, 9),  # fast span, slow span, signal span
+    "bbands": (20, 2),  # window, standard deviations
+    "atr": (14,),  # period (Wilder smoothing)
+    "vwap": (),  # anchored to the session for intraday bars, else to the first bar
+    "volatility": (20,),  # window of % returns (population std, in %)
+    "drawdown": (),  # % below the running peak close
+}
+
+DEFAULT_INDICATORS = ("sma:20", "sma:50", "ema:20", "rsi:14", "macd", "bbands", "atr:14", "volatility:20", "drawdown")
+
+# Exponential indicators need a few spans of history before they settle
+_EWM_WARMUP_FACTOR = 3
+
+# Regular-session bars per trading day, used to size warm-up windows
+INTRADAY_BARS_PER_DAY = {
+    "1min": 390,
+    "5min": 78,
+    "15min": 26,
+    "30min": 13,
+    "1hour": 7,
+    "4hour": 2,
+}
+
+
+@dataclass(frozen=True)
+class IndicatorSpec:
+    """A parsed indicator request."""
+    name: str
+    params: Tuple[float, ...]
+
+    @property
+    def label(self) -> str:
+        """Output column prefix, e.g. ``sma_50`` or ``macd_12_26_9``."""
+        return "_".join([self.name, *(_format_param(p) for p in self.params)])
+
+    @property
+    def columns(self) -> List[str]:
+        """Output column names."""
+        if self.name == "macd":
+            return [self.label, f"{self.label}_signal", f"{self.label}_hist"]
+        if self.name == "bbands":
+            return [f"{self.label}_upper", f"{self.label}_middle", f"{self.label}_lower"]
+        return [self.label]
+
+    @property
+    def lookback(self) -> int:
+        """Bars of history needed before the first settled value."""
+        if self.name in ("sma", "bbands", "volatility"):
+            return int(self.params[0])
+        if self.name in ("ema", "rsi", "atr"):
+            return int(self.params[0]) * _EWM_WARMUP_FACTOR
+        if self.name == "macd":
+            return int(self.params[1] + self.params[2]) * _EWM_WARMUP_FACTOR
+        return 0
+
+
+def _format_param(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else str(value)
+
+
+def parse_indicator(spec: Union[str, IndicatorSpec]) -> IndicatorSpec:
+    """
+    Parse an indicator spec string (parsed specs are passed through).
+
+    Raises:
+        ValueError: Unknown indicator, too many or invalid parameters
+    """
+    if isinstance(spec, IndicatorSpec):
+        return spec
+    name, *raw_params = [part.strip() for part in spec.strip().lower().split(":")]
+    if name not in INDICATOR_DEFAULTS:
+        raise ValueError(
+            f"Unknown indicator '{name}'. Supported: {', '.join(INDICATOR_DEFAULTS)}"
+        )
+    defaults = INDICATOR_DEFAULTS[name]
+    if len(raw_params) > len(defaults):
+        raise ValueError(f"Indicator '{name}' takes at most {len(defaults)} parameter(s), got '{spec}'")
+
+    params = list(defaults)
+    for i, raw in enumerate(raw_params):
+        try:
+            value = float(raw)
+        except ValueError:
+            raise ValueError(f"Invalid parameter '{raw}' in indicator '{spec}'")
+        # Everything but the Bollinger band width is a bar count
+        is_width = name == "bbands" and i == 1
+        if value <= 0 or not math.isfinite(value) or (not is_width and not value.is_integer()):
+            raise ValueError(f"Invalid parameter '{raw}' in indicator '{spec}'")
+        params[i] = value
+    return IndicatorSpec(name=name, params=tuple(params))
+
+
+def parse_indicators(specs: Sequence[Union[str, IndicatorSpec]]) -> List[IndicatorSpec]:
+    """Parse and de-duplicate indicator specs, keeping request order."""
+    return list(dict.fromkeys(parse_indicator(spec) for spec in specs))
+
+
+def warmup_days(specs: Sequence[IndicatorSpec], interval: str, extra_bars: int = 0) -> int:
+    """
+    Calendar days of history to load before the first reported bar.
+
+    Args:
+        specs: Requested indicators
+        interval: "1day" or an intraday interval
+        extra_bars: Additional bars wanted on top of the warm-up (e.g. a row limit)
+    """
+    bars = max((spec.lookback for spec in specs), default=0) + extra_bars
+    bars_per_day = INTRADAY_BARS_PER_DAY.get(interval, 1)
+    # ~1.5 calendar days per trading day, plus a margin for holidays
+    return math.ceil(bars / bars_per_day * 1.5) + 5
+
+
+def bars_to_frame(bars_by_symbol: Mapping[str, Sequence[Mapping[str, Any]]]) -> pd.DataFrame:
+    """
+    Stack OHLCV bars (FMP-style dicts, any order) for several symbols into one frame.
+
+    Returns:
+        Frame with columns symbol, date (original string), ts (parsed
+        timestamp) and float OHLCV, sorted by symbol (input order) then ts,
+        with a fresh RangeIndex
+    """
+    series = [(symbol, bars) for symbol, bars in bars_by_symbol.items() if bars]
+    rows = [bar for _, bars in series for bar in bars]
+    lengths = [len(bars) for _, bars in series]
+    columns: Dict[str, Any] = {
+        "symbol": np.repeat([symbol for symbol, _ in series], lengths),
+        "_order": np.repeat(np.arange(len(series)), lengths),
+        "date": pd.array([bar.get("date") for bar in rows], dtype="string"),
+    }
+    columns["ts"] = pd.to_datetime(columns["date"], errors="coerce", format="ISO8601")
+    for column in OHLCV_COLUMNS:
+        columns[column] = pd.to_numeric(
+            pd.Series([bar.get(column) for bar in rows], dtype=object), errors="coerce"
+        ).astype(float)
+    frame = pd.DataFrame(columns).sort_values(["_order", "ts"], kind="stable", na_position="first")
+    return frame.drop(columns="_order").reset_index(drop=True)
+
+
+def _ungroup(result: pd.Series) -> pd.Series:
+    """Drop the group level a grouped rolling/EWM result adds to the index."""
+    return result.reset_index(level=0, drop=True)
+
+
+def _ewm(series: pd.Series, keys: pd.Series, **kwargs: Any) -> pd.Series:
+    return _ungroup(series.groupby(keys, sort=False).ewm(adjust=False, **kwargs).mean())
+
+
+def _wilder(series: pd.Series, keys: pd.Series, period: int) -> pd.Series:
+    return _ewm(series, keys, alpha=1.0 / period, min_periods=period)
+
+
+def compute_indicator_frame(frame: pd.DataFrame, specs: Sequence[IndicatorSpec]) -> pd.DataFrame:
+    """
+    Compute indicators over a stacked frame from ``bars_to_frame``.
+
+    Returns:
+        The input frame with one column per indicator output appended
+    """
+    if frame.empty:
+        return frame.reindex(columns=[*frame.columns, *(c for s in specs for c in s.columns)])
+
+    keys = frame["symbol"]
+    close = frame["close"]
+    by_symbol = close.groupby(keys, sort=False)
+    prev_close = by_symbol.shift(1)
+
+    # Shared intermediates, computed once per request
+    cache: Dict[str, pd.Series] = {}
+
+    def returns_pct() -> pd.Series:
+        if "returns" not in cache:
+            cache["returns"] = (close / prev_close.where(prev_close != 0) - 1) * 100
+        return cache["returns"]
+
+    def rolling(series: pd.Series, window: int) -> Any:
+        return series.groupby(keys, sort=False).rolling(window, min_periods=window)
+
+    def ema(span: int, min_periods: int = 0) -> pd.Series:
+        key = f"ema:{span}:{min_periods}"
+        if key not in cache:
+            cache[key] = _ewm(close, keys, span=span, min_periods=min_periods)
+        return cache[key]
+
+    columns: Dict[str, pd.Series] = {}
+    for spec in specs:
+        p = [int(v) if float(v).is_integer() else v for v in spec.params]
+
+        if spec.name == "sma":
+            columns[spec.label] = _ungroup(rolling(close, p[0]).mean())
+
+        elif spec.name == "ema":
+            columns[spec.label] = ema(p[0], p[0])
+
+        elif spec.name == "rsi":
+            delta = close - prev_close
+            avg_gain = _wilder(delta.clip(lower=0), keys, p[0])
+            avg_loss = _wilder(-delta.clip(upper=0), keys, p[0])
+            rs = avg_gain / avg_loss.where(avg_loss != 0)
+            rsi = 100 - 100 / (1 + rs)
+            # No losses in the window: 100, or 50 for a flat window
+            flat = np.where(avg_gain > 0, 100.0, 50.0)
+            columns[spec.label] = rsi.where(avg_loss != 0, pd.Series(flat, index=frame.index).where(avg_loss.notna()))
+
+        elif spec.name == "macd":
+            fast, slow, signal_span = p
+            line = ema(fast) - ema(slow, slow)
+            signal = _ewm(line, keys, span=signal_span, min_periods=signal_span)
+            columns[spec.label] = line
+            columns[f"{spec.label}_signal"] = signal
+            columns[f"{spec.label}_hist"] = line - signal
+
+        elif spec.name == "bbands":
+            window, width = p
+            middle = _ungroup(rolling(close, window).mean())
+            std = _ungroup(rolling(close, window).std(ddof=0))
+            columns[f"{spec.label}_upper"] = middle + width * std
+            columns[f"{spec.label}_middle"] = middle
+            columns[f"{spec.label}_lower"] = middle - width * std
+
+        elif spec.name == "atr":
+            true_range = pd.concat(
+                [frame["high"] - frame["low"], (frame["high"] - prev_close).abs(), (frame["low"] - prev_close).abs()],
+                axis=1,
+            ).max(axis=1, skipna=True)
+            columns[spec.label] = _wilder(true_range, keys, p[0])
+
+        elif spec.name == "vwap":
+            ts = frame["ts"]
+            intraday = bool((ts.notna() & (ts != ts.dt.normalize())).any())
+            session = [keys, ts.dt.normalize()] if intraday else keys
+            typical = (frame["high"] + frame["low"] + close) / 3
+            volume = frame["volume"].fillna(0)
+            cum_pv = (typical * volume).groupby(session, sort=False).cumsum()
+            cum_volume = volume.groupby(session, sort=False).cumsum()
+            columns[spec.label] = cum_pv / cum_volume.where(cum_volume > 0)
+
+        elif spec.name == "volatility":
+            columns[spec.label] = _ungroup(rolling(returns_pct(), p[0]).std(ddof=0))
+
+        elif spec.name == "drawdown":
+            peak = by_symbol.cummax()
+            columns[spec.label] = (close / peak.where(peak > 0) - 1) * 100
+
+    computed = pd.DataFrame(columns, index=frame.index)
+    return pd.concat([frame, computed], axis=1)
+
+
+def compute_indicators(
+    bars_by_symbol: Mapping[str, Sequence[Mapping[str, Any]]],
+    indicators: Sequence[Union[str, IndicatorSpec]],
+    start: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Compute indicators for several symbols in one pass.
+
+    Args:
+        bars_by_symbol: Symbol -> OHLCV bars (dicts with date/open/high/low/close/volume)
+        indicators: Indicator specs (see module docstring)
+        start: Drop rows dated before this (bars before it still warm up the indicators)
+        limit: Keep only the newest N rows per symbol
+
+    Returns:
+        Symbol -> rows (newest first) with date, close and one key per
+        indicator output; values are None until an indicator has enough history
+
+    Raises:
+        ValueError: Invalid indicator spec
+    """
+    specs = parse_indicators(indicators)
+    frame = compute_indicator_frame(bars_to_frame(bars_by_symbol), specs)
+    output = ["date", "close", *(column for spec in specs for column in spec.columns)]
+
+    if start:
+        frame = frame[frame["ts"].isna() | (frame["ts"] >= pd.Timestamp(start))]
+    if limit:
+        frame = frame.groupby("symbol", sort=False).tail(limit)
+
+    # NaN -> None and dicts for every symbol in one conversion
+    values = frame[output].astype(object)
+    records = values.where(values.notna(), None).iloc[::-1].to_dict("records")
+
+    results: Dict[str, List[Dict[str, Any]]] = {symbol: [] for symbol in bars_by_symbol}
+    for symbol, record in zip(frame["symbol"].iloc[::-1], records):
+        results[symbol].append(record)
+    return results
+
+
+def price_statistics(bars_by_symbol: Mapping[str, Sequence[Mapping[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Period statistics (OHLC, moving averages, volatility, volume) per symbol.
+
+    Volatility is the population standard deviation of bar-to-bar % returns
+    between consecutive non-null closes. Symbols without closes are omitted.
+    """
+    frame = bars_to_frame(bars_by_symbol)
+    if frame.empty:
+        return {}
+
+    keys = frame["symbol"]
+    grouped = frame.groupby(keys, sort=False)
+    first = grouped.head(1).set_index("symbol")
+    last = grouped.tail(1).set_index("symbol")
+    agg = grouped.agg(
+        period_days=("symbol", "size"),
+        period_high=("high", "max"),
+        period_low=("low", "min"),
+        min_close=("close", "min"),
+        max_close=("close", "max"),
+        avg_volume=("volume", "mean"),
+        total_volume=("volume", "sum"),
+        volume_count=("volume", "count"),
+    )
+
+    closes = frame.loc[frame["close"].notna(), ["symbol", "close"]]
+    close_groups = closes.groupby("symbol", sort=False)["close"]
+    close_count = close_groups.size()
+    prev = close_groups.shift(1)
+    daily_returns = (closes["close"] - prev) / prev.where(prev != 0) * 100
+    volatility = daily_returns.groupby(closes["symbol"], sort=False).std(ddof=0)
+
+    moving_averages = {}
+    for window in (20, 50, 200):
+        mean = closes.groupby("symbol", sort=False).tail(window).groupby("symbol", sort=False)["close"].mean()
+        moving_averages[f"ma_{window}"] = mean.where(close_count >= window)
+
+    def scalar(value: Any) -> Any:
+        if value is None or pd.isna(value):
+            return None
+        return value.item() if hasattr(value, "item") else value
+
+    stats: Dict[str, Dict[str, Any]] = {}
+    for symbol in close_count.index:
+        row = agg.loc[symbol]
+        period_open = scalar(first.at[symbol, "open"])
+        period_close = scalar(last.at[symbol, "close"])
+        total_volume = scalar(row["total_volume"]) if row["volume_count"] else None
+        if total_volume is not None and float(total_volume).is_integer():
+            total_volume = int(total_volume)
+
+        entry = {
+            "symbol": symbol,
+            "period_days": int(row["period_days"]),
+            "start_date": scalar(first.at[symbol, "date"]) or "N/A",
+            "end_date": scalar(last.at[symbol, "date"]) or "N/A",
+            "period_open": period_open,
+            "period_close": period_close,
+            "period_high": scalar(row["period_high"]),
+            "period_low": scalar(row["period_low"]),
+            "min_close": scalar(row["min_close"]),
+            "max_close": scalar(row["max_close"]),
+            "period_change": None,
+            "period_change_pct": None,
+        }
+        if period_open and period_close:
+            entry["period_change"] = period_close - period_open
+            entry["period_change_pct"] = entry["period_change"] / period_open * 100
+        for name, series in moving_averages.items():
+            entry[name] = scalar(series.get(symbol))
+        entry["volatility"] = scalar(volatility.get(symbol))
+        entry["avg_volume"] = scalar(row["avg_volume"]) if row["volume_count"] else None
+        entry["total_volume"] = total_volume
+        stats[symbol] = entry
+    return stats
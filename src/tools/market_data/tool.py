@@ -13,6 +13,7 @@ from .implementations import (
     fetch_company_overview,
     fetch_market_indices,
     fetch_sector_performance,
+    fetch_technical_indicators,
 )
 
 
@@ -211,3 +212,62 @@ async def get_sector_performance(date: Optional[str] = None) -> List[Dict[str, A
             print(f"Best sector: {best['sector']} at {best['changesPercentage']}")
     """
     return await fetch_sector_performance(date)
+
+
+@tool
+async def get_technical_indicators(
+    symbols: List[str],
+    indicators: Optional[List[str]] = None,
+    interval: str = "1day",
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    limit: int = 5,
+) -> str:
+    """
+    Compute technical indicators for one or more stocks.
+
+    Indicators are computed locally from OHLCV price bars in a single pass for
+    all symbols, so asking for many indicators costs no extra data requests.
+    History before the reported window is loaded automatically to warm up
+    moving averages and other lookback-based indicators.
+
+    Args:
+        symbols: Stock or index ticker symbols (max 20), e.g. ["AAPL", "MSFT"]
+        indicators: Indicator specs as "name" or "name:param[:param...]".
+            Supported (defaults in parentheses):
+            - "sma:N": Simple moving average (20)
+            - "ema:N": Exponential moving average (20)
+            - "rsi:N": Relative strength index, Wilder smoothing (14)
+            - "macd:FAST:SLOW:SIGNAL": MACD line, signal and histogram (12:26:9)
+            - "bbands:N:K": Bollinger bands, N bars and K std devs (20:2)
+            - "atr:N": Average true range (14)
+            - "vwap": Volume-weighted average price (per session for intraday bars)
+            - "volatility:N": Rolling std dev of % returns over N bars (20)
+            - "drawdown": % below the running peak close
+            Default: sma:20, sma:50, ema:20, rsi:14, macd, bbands, atr:14,
+            volatility:20, drawdown
+        interval: "1day" (default) or intraday "1min", "5min", "15min",
+            "30min", "1hour", "4hour"
+        start_date: First date to report in YYYY-MM-DD format
+        end_date: Last date to report in YYYY-MM-DD format (default today)
+        limit: Number of most recent rows to report per symbol (default 5)
+
+    Returns:
+        Markdown report with one table per symbol (newest first): date, close
+        and one column per indicator output. Values are N/A until an indicator
+        has enough history.
+
+    Example:
+        # Latest RSI and 50/200-day moving averages for several stocks
+        report = get_technical_indicators(
+            ["AAPL", "MSFT", "NVDA"], indicators=["rsi:14", "sma:50", "sma:200"]
+        )
+
+        # Intraday MACD and VWAP on 5-minute bars
+        report = get_technical_indicators(
+            ["TSLA"], indicators=["macd", "vwap"], interval="5min", limit=12
+        )
+    """
+    return await fetch_technical_indicators(
+        symbols, indicators, interval, start_date, end_date, limit
+    )
@@ -6,6 +6,8 @@ Provides Redis-based caching with:
 - Deterministic key generation
 - TTL management
 - Cache invalidation patterns
+- Optional in-process L1 tier with single-flight loads
+- Pluggable value codec (format + compression)
 """
 
 from src.utils.cache.redis_cache import (
@@ -16,8 +18,18 @@ from src.utils.cache.redis_cache import (
     cache_context,
 )
 
+from src.utils.cache.codec import (
+    CacheCodec,
+)
+
+from src.utils.cache.local_cache import (
+    LocalCache,
+    SingleFlight,
+)
+
 from src.utils.cache.cache_keys import (
     CacheKeyBuilder,
+    VERSIONED_NAMESPACES,
 )
 
 from src.utils.cache.invalidation import (
@@ -32,8 +44,14 @@ __all__ = [
     "init_cache",
     "close_cache",
     "cache_context",
+    # Value codec
+    "CacheCodec",
+    # In-process cache
+    "LocalCache",
+    "SingleFlight",
     # Cache keys
     "CacheKeyBuilder",
+    "VERSIONED_NAMESPACES",
     # Invalidation
     "CacheInvalidator",
     "get_cache_invalidator",
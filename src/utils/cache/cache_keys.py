@@ -9,6 +9,13 @@ import hashlib
 from typing import Any, Dict, Optional
 from urllib.parse import urlencode
 
+# Intraday market data (day-segmented bars and fetcher chunks)
+INTRADAY_NAMESPACE = "fmp:intraday"
+
+# Namespaces whose keys are always built with a generation segment, so
+# bumping the generation invalidates all of them in O(1)
+VERSIONED_NAMESPACES = frozenset({INTRADAY_NAMESPACE})
+
 
 class CacheKeyBuilder:
     """
@@ -19,6 +26,7 @@ class CacheKeyBuilder:
     - Deterministic key generation (sorted params)
     - URL-safe encoding
     - Pattern matching support
+    - Optional namespace generation segment for O(1) invalidation
     """
 
     def __init__(self, namespace: str):
@@ -74,6 +82,7 @@ class CacheKeyBuilder:
         resource: str,
         params: Optional[Dict[str, Any]] = None,
         use_hash: bool = False,
+        version: Optional[int] = None,
     ) -> str:
         """
         Build cache key.
@@ -82,6 +91,8 @@ class CacheKeyBuilder:
             resource: Resource identifier (e.g., "list", "detail")
             params: Query parameters
             use_hash: Whether to hash params for shorter keys
+            version: Namespace generation from RedisCacheClient.get_namespace_version;
+                bumping the generation invalidates every key built with the old one
 
         Returns:
             Cache key string
@@ -90,8 +101,10 @@ class CacheKeyBuilder:
             builder = CacheKeyBuilder("myapp:data")
             key = builder.build("list", {"limit": 20, "filter": "active"})
             # Returns: "myapp:data:list:filter=active&limit=20"
+            key = builder.build("list", {"limit": 20}, version=3)
+            # Returns: "myapp:data:v3:list:limit=20"
         """
-        parts = [self.namespace, resource]
+        parts = [self._versioned_namespace(version), resource]
 
         if params:
             params_str = self._normalize_params(params)
@@ -103,13 +116,19 @@ class CacheKeyBuilder:
 
         return ":".join(parts)
 
-    def pattern(self, resource: Optional[str] = None, prefix: str = "*") -> str:
+    def pattern(
+        self,
+        resource: Optional[str] = None,
+        prefix: str = "*",
+        version: Optional[int] = None,
+    ) -> str:
         """
         Build pattern for matching multiple keys.
 
         Args:
             resource: Resource identifier (None for all resources)
             prefix: Wildcard prefix for params
+            version: Namespace generation (None matches unversioned keys)
 
         Returns:
             Key pattern for Redis SCAN
@@ -119,6 +138,12 @@ class CacheKeyBuilder:
             pattern = builder.pattern("list")
             # Returns: "myapp:data:list:*"
         """
+        namespace = self._versioned_namespace(version)
         if resource:
-            return f"{self.namespace}:{resource}:{prefix}"
-        return f"{self.namespace}:{prefix}"
+            return f"{namespace}:{resource}:{prefix}"
+        return f"{namespace}:{prefix}"
+
+    def _versioned_namespace(self, version: Optional[int]) -> str:
+        if version is None:
+            return self.namespace
+        return f"{self.namespace}:v{version}"
@@ -0,0 +1,440 @@
+"""
+Cache value codecs.
+
+Serializes cached values for Redis with a choice of format and compression:
+- json: legacy text (json.dumps with DateTimeEncoder), written without a header
+- orjson / msgpack: compact encodings
+- columnar: lists of uniform records (e.g. OHLCV bars) packed column-wise,
+  numeric columns as raw little-endian int64/float64 arrays
+- zstd / lz4 compression above a size threshold
+
+Encoded values start with a 3-byte header (0x00, format id, compression id).
+A leading NUL byte never begins JSON text, so headerless legacy entries and
+headered entries coexist and ``decode`` reads both.
+
+orjson, msgpack and lz4 are optional; if not installed the codec falls back
+to json / orjson / zstd (or no compression) and logs a warning. orjson
+values and columnar metadata are plain JSON, so they decode with the
+stdlib when orjson is missing.
+"""
+
+import array
+import json
+import logging
+import struct
+import sys
+import time
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from src.config.settings import get_nested_config
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # Optional dependency
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # Optional dependency
+    lz4_frame = None
+
+
+HEADER_MAGIC = 0x00
+
+FORMAT_IDS = {"json": 1, "orjson": 2, "msgpack": 3, "columnar": 4}
+FORMAT_NAMES = {v: k for k, v in FORMAT_IDS.items()}
+
+COMPRESSION_IDS = {"none": 0, "zstd": 1, "lz4": 2}
+COMPRESSION_NAMES = {v: k for k, v in COMPRESSION_IDS.items()}
+
+# Columnar encoding applies to record lists at least this long
+COLUMNAR_MIN_ROWS = 16
+
+
+class DateTimeEncoder(json.JSONEncoder):
+    """JSON encoder that handles datetime and UUID objects."""
+    def default(self, obj):
+        if isinstance(obj, (datetime, date)):
+            return obj.isoformat()
+        if isinstance(obj, UUID):
+            return str(obj)
+        return super().default(obj)
+
+
+def _msgpack_default(obj: Any) -> Any:
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, cls=DateTimeEncoder).encode("utf-8")
+
+
+def _json_loads(payload: Any) -> Any:
+    # Columnar blobs are memoryview slices, which json.loads does not take
+    return json.loads(bytes(payload))
+
+
+def _orjson_dumps(value: Any) -> bytes:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+
+# JSON helpers for orjson payloads and columnar metadata
+_fast_json_dumps = _orjson_dumps if orjson is not None else _json_dumps
+_fast_json_loads = orjson.loads if orjson is not None else _json_loads
+
+
+class CacheCodec:
+    """
+    Encode/decode cache values with a recorded format and compression.
+
+    Tracks per-codec metrics (count, bytes, time) for encode and decode.
+    """
+
+    def __init__(
+        self,
+        format: str = "json",
+        columnar: bool = False,
+        compression: str = "none",
+        compression_min_bytes: int = 4096,
+        compression_level: int = 3,
+    ):
+        """
+        Initialize codec.
+
+        Args:
+            format: "json" (legacy), "orjson" or "msgpack"
+            columnar: Pack uniform record lists column-wise
+            compression: "none", "zstd" or "lz4"
+            compression_min_bytes: Only compress payloads at least this large
+            compression_level: Compression level passed to zstd/lz4
+        """
+        if format not in ("json", "orjson", "msgpack"):
+            logger.warning(f"Unknown cache codec format '{format}', using json")
+            format = "json"
+        if format == "msgpack" and msgpack is None:
+            logger.warning("msgpack is not installed, cache codec falls back to orjson")
+            format = "orjson"
+        if format == "orjson" and orjson is None:
+            logger.warning("orjson is not installed, cache codec falls back to json")
+            format = "json"
+
+        if compression not in COMPRESSION_IDS:
+            logger.warning(f"Unknown cache compression '{compression}', disabling compression")
+            compression = "none"
+        if compression == "lz4" and lz4_frame is None:
+            logger.warning("lz4 is not installed, cache compression falls back to zstd")
+            compression = "zstd"
+        if compression == "zstd" and zstandard is None:
+            logger.warning("zstandard is not installed, cache compression disabled")
+            compression = "none"
+
+        self.format = format
+        self.columnar = columnar
+        self.compression = compression
+        self.compression_min_bytes = compression_min_bytes
+        self.compression_level = compression_level
+
+        self._zstd_compressor = (
+            zstandard.ZstdCompressor(level=compression_level) if zstandard is not None else None
+        )
+        self._zstd_decompressor = zstandard.ZstdDecompressor() if zstandard is not None else None
+
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+    @classmethod
+    def from_config(cls) -> "CacheCodec":
+        """Create a codec from the ``redis.codec`` section of config.yaml."""
+        return cls(
+            format=str(get_nested_config("redis.codec.format", "json")),
+            columnar=bool(get_nested_config("redis.codec.columnar", False)),
+            compression=str(get_nested_config("redis.codec.compression", "none")),
+            compression_min_bytes=int(get_nested_config("redis.codec.compression_min_bytes", 4096)),
+            compression_level=int(get_nested_config("redis.codec.compression_level", 3)),
+        )
+
+    # ==================== Encode ====================
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Serialize a value for storage.
+
+        Raises:
+            TypeError / ValueError: If the value cannot be serialized
+        """
+        started = time.perf_counter()
+
+        format_name = self.format
+        payload: Optional[bytes] = None
+        if self.columnar:
+            try:
+                payload = _encode_columnar(value, _fast_json_dumps)
+            except TypeError:
+                payload = None
+            if payload is not None:
+                format_name = "columnar"
+        if payload is None:
+            try:
+                payload = self._dumps(value)
+            except TypeError:
+                if format_name != "orjson":
+                    raise
+                # e.g. integers beyond 64 bits; the stdlib encoder handles them
+                format_name = "json"
+                payload = _json_dumps(value)
+
+        compression = "none"
+        raw_size = len(payload)
+        if self.compression != "none" and raw_size >= self.compression_min_bytes:
+            compressed = self._compress(payload)
+            if len(compressed) < raw_size:
+                payload, compression = compressed, self.compression
+
+        if format_name == "json" and compression == "none":
+            # Legacy layout: plain JSON text, readable by older deployments
+            encoded = payload
+        else:
+            encoded = bytes((HEADER_MAGIC, FORMAT_IDS[format_name], COMPRESSION_IDS[compression])) + payload
+
+        self._record("encode", format_name, compression, len(encoded), raw_size, started)
+        return encoded
+
+    def _dumps(self, value: Any) -> bytes:
+        if self.format == "orjson":
+            return _orjson_dumps(value)
+        if self.format == "msgpack":
+            return msgpack.packb(value, use_bin_type=True, default=_msgpack_default)
+        return _json_dumps(value)
+
+    def _compress(self, payload: bytes) -> bytes:
+        if self.compression == "zstd":
+            return self._zstd_compressor.compress(payload)
+        return lz4_frame.compress(payload, compression_level=self.compression_level)
+
+    # ==================== Decode ====================
+
+    def decode(self, raw: bytes) -> Any:
+        """
+        Deserialize a stored value (headered or legacy JSON text).
+
+        Raises:
+            ValueError: If the value is corrupt or uses an unavailable codec
+                (json.JSONDecodeError is a ValueError subclass)
+        """
+        started = time.perf_counter()
+
+        if not raw or raw[0] != HEADER_MAGIC:
+            value = json.loads(raw)
+            self._record("decode", "json", "none", len(raw), len(raw), started)
+            return value
+
+        if len(raw) < 3:
+            raise ValueError("Truncated cache value header")
+        format_name = FORMAT_NAMES.get(raw[1])
+        compression = COMPRESSION_NAMES.get(raw[2])
+        if format_name is None or compression is None:
+            raise ValueError(f"Unknown cache value header {raw[:3]!r}")
+
+        try:
+            payload = self._decompress(raw[3:], compression)
+            value = self._loads(payload, format_name)
+        except ValueError:
+            raise
+        except Exception as e:
+            # Surface codec library errors (zstd, lz4, struct) uniformly
+            raise ValueError(f"Corrupt cache value ({format_name}+{compression}): {e}") from e
+
+        self._record("decode", format_name, compression, len(raw), len(payload), started)
+        return value
+
+    def _decompress(self, payload: bytes, compression: str) -> bytes:
+        if compression == "zstd":
+            if self._zstd_decompressor is None:
+                raise ValueError("zstandard is required to decode this cache value")
+            return self._zstd_decompressor.decompress(payload)
+        if compression == "lz4":
+            if lz4_frame is None:
+                raise ValueError("lz4 is required to decode this cache value")
+            return lz4_frame.decompress(payload)
+        return payload
+
+    @staticmethod
+    def _loads(payload: bytes, format_name: str) -> Any:
+        if format_name == "columnar":
+            return _decode_columnar(payload)
+        if format_name == "msgpack":
+            if msgpack is None:
+                raise ValueError("msgpack is required to decode this cache value")
+            return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+        if format_name == "json":
+            return json.loads(payload)
+        return _fast_json_loads(payload)
+
+    # ==================== Metrics ====================
+
+    def _record(
+        self,
+        op: str,
+        format_name: str,
+        compression: str,
+        stored_bytes: int,
+        raw_bytes: int,
+        started: float,
+    ) -> None:
+        name = format_name if compression == "none" else f"{format_name}+{compression}"
+        entry = self.stats.get(name)
+        if entry is None:
+            entry = self.stats[name] = {
+                "encode_count": 0, "encode_ms": 0.0, "encode_bytes": 0, "encode_raw_bytes": 0,
+                "decode_count": 0, "decode_ms": 0.0, "decode_bytes": 0,
+            }
+        entry[f"{op}_count"] += 1
+        entry[f"{op}_ms"] += (time.perf_counter() - started) * 1000
+        entry[f"{op}_bytes"] += stored_bytes
+        if op == "encode":
+            entry["encode_raw_bytes"] += raw_bytes
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get configuration and per-codec size/time metrics."""
+        codecs = {}
+        for name, entry in self.stats.items():
+            encodes = entry["encode_count"]
+            decodes = entry["decode_count"]
+            codecs[name] = {
+                "encode_count": encodes,
+                "decode_count": decodes,
+                "avg_encoded_bytes": round(entry["encode_bytes"] / encodes, 1) if encodes else 0.0,
+                "compression_ratio": (
+                    round(entry["encode_raw_bytes"] / entry["encode_bytes"], 2)
+                    if entry["encode_bytes"] else 1.0
+                ),
+                "avg_encode_ms": round(entry["encode_ms"] / encodes, 4) if encodes else 0.0,
+                "avg_decode_ms": round(entry["decode_ms"] / decodes, 4) if decodes else 0.0,
+                "decoded_bytes": entry["decode_bytes"],
+            }
+        return {
+            "format": self.format,
+            "columnar": self.columnar,
+            "compression": self.compression,
+            "compression_min_bytes": self.compression_min_bytes,
+            "codecs": codecs,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset per-codec metrics."""
+        self.stats = {}
+
+
+# ==================== Columnar Encoding ====================
+#
+# Layout: u32 meta length | meta (orjson) | column blobs
+# meta = {"n": rows, "keys": [...], "cols": [[kind, nbytes, extra], ...]}
+#   kind "q": int64 array
+#   kind "d": float64 array; extra = row indices whose value was an int
+#   kind "j": orjson-encoded list of the raw values
+
+
+def _column_kind(values: List[Any]) -> Tuple[str, Optional[List[int]]]:
+    has_float = False
+    int_rows: List[int] = []
+    for i, v in enumerate(values):
+        t = type(v)
+        if t is float:
+            has_float = True
+        elif t is int:
+            if not -(2 ** 63) <= v < 2 ** 63:
+                return "j", None
+            int_rows.append(i)
+        else:
+            return "j", None
+    if not has_float:
+        return "q", None
+    # float64 is exact for ints below 2**53; larger ints stay generic
+    if any(abs(values[i]) > 2 ** 53 for i in int_rows):
+        return "j", None
+    return "d", int_rows
+
+
+def _encode_columnar(value: Any, dumps: Callable[[Any], bytes]) -> Optional[bytes]:
+    """Pack a list of same-keyed dicts column-wise, or return None if not applicable."""
+    if not isinstance(value, list) or len(value) < COLUMNAR_MIN_ROWS:
+        return None
+    first = value[0]
+    if not isinstance(first, dict) or not first:
+        return None
+    keys = list(first.keys())
+    if not all(isinstance(k, str) for k in keys):
+        return None
+    for row in value:
+        if type(row) is not dict or len(row) != len(keys) or row.keys() != first.keys():
+            return None
+
+    cols_meta = []
+    blobs = []
+    numeric = False
+    for key in keys:
+        column = [row[key] for row in value]
+        kind, int_rows = _column_kind(column)
+        if kind == "j":
+            blob = dumps(column)
+            cols_meta.append(["j", len(blob), None])
+        else:
+            numeric = True
+            arr = array.array("q" if kind == "q" else "d", column)
+            if sys.byteorder == "big":
+                arr.byteswap()
+            blob = arr.tobytes()
+            cols_meta.append([kind, len(blob), int_rows or None])
+        blobs.append(blob)
+
+    if not numeric:
+        return None
+
+    meta = _fast_json_dumps({"n": len(value), "keys": keys, "cols": cols_meta})
+    return struct.pack("<I", len(meta)) + meta + b"".join(blobs)
+
+
+def _decode_columnar(payload: bytes) -> List[Dict[str, Any]]:
+    (meta_len,) = struct.unpack_from("<I", payload, 0)
+    meta = _fast_json_loads(payload[4:4 + meta_len])
+    rows = meta["n"]
+    offset = 4 + meta_len
+
+    columns = []
+    view = memoryview(payload)
+    for kind, nbytes, extra in meta["cols"]:
+        blob = view[offset:offset + nbytes]
+        offset += nbytes
+        if kind == "j":
+            column = _fast_json_loads(blob)
+        else:
+            arr = array.array(kind)
+            arr.frombytes(blob)
+            if sys.byteorder == "big":
+                arr.byteswap()
+            column = arr.tolist()
+            for i in extra or ():
+                column[i] = int(column[i])
+        if len(column) != rows:
+            raise ValueError("Corrupt columnar cache value")
+        columns.append(column)
+
+    keys = meta["keys"]
+    return [dict(zip(keys, values)) for values in zip(*columns)]
@@ -2,13 +2,16 @@
 Cache invalidation utilities.
 
 Provides basic cache invalidation functionality including:
-- Pattern-based cache deletion
+- Pattern-based cache deletion (batched SCAN + UNLINK, patterns in parallel)
+- Namespace invalidation (O(1) generation bump for versioned namespaces)
 - Bulk cache clearing
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
+from src.utils.cache.cache_keys import VERSIONED_NAMESPACES
 from src.utils.cache.redis_cache import get_cache_client
 
 logger = logging.getLogger(__name__)
@@ -20,6 +23,7 @@ class CacheInvalidator:
 
     Features:
     - Pattern-based bulk deletion
+    - Namespace generation bumps
     - Async operation
     - Error handling and logging
     """
@@ -38,25 +42,75 @@ class CacheInvalidator:
         Returns:
             Dict mapping pattern to number of keys deleted
         """
+        reports = await self.invalidate_patterns_with_report(patterns)
+        return {pattern: report["deleted"] for pattern, report in reports.items()}
+
+    async def invalidate_patterns_with_report(
+        self, patterns: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Invalidate multiple cache key patterns concurrently.
+
+        Args:
+            patterns: List of cache key patterns to delete
+
+        Returns:
+            Dict mapping pattern to its unlink report (deleted, pages,
+            elapsed_ms, keys_per_sec, error)
+        """
         if not self.cache.enabled:
             logger.debug("Cache disabled, skipping invalidation")
             return {}
 
-        results = {}
+        unique = list(dict.fromkeys(patterns))
+        reports = await asyncio.gather(
+            *(self.cache.unlink_pattern(pattern) for pattern in unique),
+            return_exceptions=True,
+        )
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for pattern, report in zip(unique, reports):
+            if isinstance(report, BaseException):
+                logger.error(f"Failed to invalidate pattern {pattern}: {report}")
+                report = {"pattern": pattern, "deleted": 0, "error": str(report)}
+            elif report["deleted"] > 0:
+                logger.debug(
+                    f"Invalidated {report['deleted']} keys matching: {pattern} "
+                    f"({report['keys_per_sec']:.0f} keys/s)"
+                )
+            results[pattern] = report
 
-        for pattern in patterns:
-            try:
-                deleted_count = await self.cache.delete_pattern(pattern)
-                results[pattern] = deleted_count
+        return results
 
-                if deleted_count > 0:
-                    logger.debug(f"Invalidated {deleted_count} keys matching: {pattern}")
+    async def invalidate_namespace(self, namespace: str) -> Dict[str, Any]:
+        """
+        Invalidate every key in a namespace.
 
-            except Exception as e:
-                logger.error(f"Failed to invalidate pattern {pattern}: {e}")
-                results[pattern] = 0
+        Namespaces in VERSIONED_NAMESPACES build all their keys with a
+        generation (CacheKeyBuilder.build(version=...)), so they are
+        invalidated in O(1) by advancing it; old generations expire through
+        their TTLs. Any other namespace is cleared with a pattern delete.
 
-        return results
+        Args:
+            namespace: Key namespace (e.g., "fmp:intraday")
+
+        Returns:
+            {"mode": "generation", "version": int} (-1 if the cache is
+            unavailable) or {"mode": "pattern", **unlink report}
+        """
+        namespace = namespace.rstrip(":*")
+        if namespace in VERSIONED_NAMESPACES:
+            if not self.cache.enabled:
+                logger.debug("Cache disabled, skipping namespace invalidation")
+                return {"mode": "generation", "version": -1}
+            return {
+                "mode": "generation",
+                "version": await self.cache.bump_namespace_version(namespace),
+            }
+
+        pattern = f"{namespace}:*"
+        report = (await self.invalidate_patterns_with_report([pattern])).get(pattern, {})
+        return {"mode": "pattern", "pattern": pattern, "deleted": 0, **report}
 
     async def invalidate_all(self) -> bool:
         """
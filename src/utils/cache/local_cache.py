@@ -0,0 +1,292 @@
+"""
+In-process cache primitives.
+
+Provides the building blocks for the optional L1 tier in front of Redis:
+- LocalCache: bounded LRU cache with per-entry TTL and size-in-bytes accounting
+- SingleFlight: coalesces concurrent loads of the same key into one call
+
+Values held by LocalCache are shared between callers and must be treated
+as read-only.
+"""
+
+import asyncio
+import fnmatch
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Returned by LocalCache.get() on a miss (None is a valid cached value)
+MISSING = object()
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires_at: float
+    origin_expires_at: Optional[float]
+
+
+class LocalCache:
+    """
+    Bounded in-process LRU cache with TTL.
+
+    Features:
+    - Least-recently-used eviction by entry count and total bytes
+    - Per-entry TTL, plus the remaining TTL of the origin (Redis) copy
+    - Glob-pattern invalidation (Redis MATCH syntax)
+    - Epoch counter so in-flight loads can detect invalidations
+    """
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 64 * 1024 * 1024, ttl: float = 5.0):
+        """
+        Initialize local cache.
+
+        Args:
+            max_entries: Maximum number of entries
+            max_bytes: Maximum total size of entries (serialized bytes)
+            ttl: Maximum seconds an entry is served
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+
+        # Bumped on every invalidation; loads started before a bump must not populate
+        self.epoch = 0
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0,
+            "rejected": 0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        """
+        Get a value, refreshing its LRU position.
+
+        Returns:
+            Cached value, or MISSING if absent or expired
+        """
+        entry = self._lookup(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return MISSING
+
+        self.stats["hits"] += 1
+        return entry.value
+
+    def get_entry(self, key: str) -> Tuple[Any, Optional[float]]:
+        """
+        Get a value with the remaining TTL of its origin copy.
+
+        Returns:
+            Tuple of (value or MISSING, origin TTL in seconds or None if no expiry)
+        """
+        entry = self._lookup(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return MISSING, None
+
+        self.stats["hits"] += 1
+        if entry.origin_expires_at is None:
+            return entry.value, None
+        return entry.value, max(0.0, entry.origin_expires_at - time.monotonic())
+
+    def peek_origin_ttl(self, key: str) -> Any:
+        """
+        Get the remaining origin TTL without touching LRU order or stats.
+
+        Returns:
+            Seconds remaining, None if the origin has no expiry, or MISSING
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            return MISSING
+        if entry.origin_expires_at is None:
+            return None
+        return max(0.0, entry.origin_expires_at - time.monotonic())
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        size: int,
+        origin_ttl: Optional[float] = None,
+        epoch: Optional[int] = None,
+    ) -> bool:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store (shared with all readers)
+            size: Accounted size in bytes (typically the serialized length)
+            origin_ttl: Remaining TTL of the origin copy; caps the local TTL
+            epoch: Epoch observed before loading; the value is dropped if an
+                invalidation happened since
+
+        Returns:
+            True if stored
+        """
+        if epoch is not None and epoch != self.epoch:
+            return False
+        if size > self.max_bytes or (origin_ttl is not None and origin_ttl <= 0):
+            self.stats["rejected"] += 1
+            return False
+
+        now = time.monotonic()
+        ttl = self.ttl if origin_ttl is None else min(self.ttl, origin_ttl)
+        self._remove(key)
+        self._entries[key] = _Entry(
+            value=value,
+            size=size,
+            expires_at=now + ttl,
+            origin_expires_at=None if origin_ttl is None else now + origin_ttl,
+        )
+        self._bytes += size
+        self.stats["sets"] += 1
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self.stats["evictions"] += 1
+        return True
+
+    def delete(self, key: str) -> bool:
+        """Invalidate one key. Returns True if it was present."""
+        self.epoch += 1
+        removed = self._remove(key)
+        if removed:
+            self.stats["invalidations"] += 1
+        return removed
+
+    def delete_pattern(self, pattern: str) -> int:
+        """Invalidate all keys matching a glob pattern. Returns the number removed."""
+        self.epoch += 1
+        matched = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+        for key in matched:
+            self._remove(key)
+        self.stats["invalidations"] += len(matched)
+        return len(matched)
+
+    def clear(self) -> None:
+        """Invalidate all entries."""
+        self.epoch += 1
+        self.stats["invalidations"] += len(self._entries)
+        self._entries.clear()
+        self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss/eviction counters and current occupancy."""
+        total = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "total_requests": total,
+            "hit_rate": round(self.stats["hits"] / total * 100, 2) if total else 0.0,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset counters (entries are kept)."""
+        for name in self.stats:
+            self.stats[name] = 0
+
+    def _lookup(self, key: str) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.stats["expirations"] += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _remove(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry.size
+        return True
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent async calls that share a key.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight await the same result (or exception). If the leading
+    caller is cancelled, waiting callers run the function themselves.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls: Dict[str, asyncio.Future] = {}
+        self.stats = {"calls": 0, "coalesced": 0}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn once per key across concurrent callers.
+
+        Args:
+            key: Coalescing key
+            fn: Zero-argument coroutine function
+
+        Returns:
+            Result of the shared call
+        """
+        while True:
+            future = self._calls.get(key)
+            if future is None:
+                break
+
+            self.stats["coalesced"] += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Re-raise our own cancellation; retry if only the leader was cancelled
+                if not future.cancelled():
+                    raise
+                current = asyncio.current_task()
+                if current is not None and current.cancelling():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self.stats["calls"] += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an exception nobody waited for is not logged
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
@@ -3,32 +3,44 @@ Redis cache client.
 
 Provides connection pooling, health checking, and basic cache operations
 with TTL support and pattern-based deletion.
+
+An optional in-process L1 tier (``redis.l1`` in config.yaml) serves hot,
+read-mostly keys without a Redis round trip or JSON decode. Concurrent
+misses are coalesced, and invalidations are broadcast to other replicas
+over Pub/Sub.
 """
 
+import asyncio
 import json
 import logging
 import os
-from datetime import datetime, date
-from typing import Any, Optional, Tuple, Union
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 from contextlib import asynccontextmanager
-from uuid import UUID
 
 import redis.asyncio as redis
 from redis.asyncio.connection import ConnectionPool
 
-from src.config.settings import is_redis_cache_enabled, get_nested_config
+from src.config.settings import (
+    get_nested_config,
+    get_redis_l1_key_prefixes,
+    get_redis_l1_max_bytes,
+    get_redis_l1_max_entries,
+    get_redis_l1_ttl,
+    is_redis_cache_enabled,
+    is_redis_l1_enabled,
+)
+from src.utils.cache.codec import CacheCodec, DateTimeEncoder
+from src.utils.cache.local_cache import MISSING, LocalCache, SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Pub/Sub channel carrying L1 invalidations between replicas
+L1_INVALIDATION_CHANNEL = "cache:l1:invalidate"
 
-class DateTimeEncoder(json.JSONEncoder):
-    """JSON encoder that handles datetime and UUID objects."""
-    def default(self, obj):
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        if isinstance(obj, UUID):
-            return str(obj)
-        return super().default(obj)
+# Key prefix of namespace generation counters
+NAMESPACE_VERSION_PREFIX = "cache:nsver:"
 
 
 class RedisCacheClient:
@@ -40,8 +52,9 @@ class RedisCacheClient:
     - Health checking
     - JSON serialization
     - TTL support
-    - Pattern-based deletion
-    - Namespace support
+    - Pattern-based deletion (batched SCAN + UNLINK)
+    - Namespace support, with O(1) invalidation via generation counters
+    - Optional L1 in-process tier with single-flight loads
     """
 
     def __init__(
@@ -77,6 +90,13 @@ class RedisCacheClient:
         self.pool: Optional[ConnectionPool] = None
         self.client: Optional[redis.Redis] = None
 
+        # Separate pool for blocking reads (created lazily)
+        self.blocking_max_connections = int(
+            get_nested_config('redis.blocking_max_connections', 50)
+        )
+        self.blocking_pool: Optional[ConnectionPool] = None
+        self.blocking_client: Optional[redis.Redis] = None
+
         # Cache statistics
         self.stats = {
             "hits": 0,
@@ -86,6 +106,40 @@ class RedisCacheClient:
             "errors": 0,
         }
 
+        # Optional L1 tier for hot keys (values are shared; callers must not mutate)
+        self.l1: Optional[LocalCache] = None
+        self.l1_key_prefixes: Tuple[str, ...] = ()
+        if is_redis_l1_enabled():
+            self.l1 = LocalCache(
+                max_entries=get_redis_l1_max_entries(),
+                max_bytes=get_redis_l1_max_bytes(),
+                ttl=get_redis_l1_ttl(),
+            )
+            self.l1_key_prefixes = tuple(get_redis_l1_key_prefixes())
+
+        # Value serialization (format/compression from redis.codec)
+        self.codec = CacheCodec.from_config()
+
+        # Coalesces concurrent Redis reads / upstream loads of the same key
+        self._flights = SingleFlight()
+
+        # Namespace generation memo: namespace -> (version, expires_at)
+        self._namespace_versions: Dict[str, Tuple[int, float]] = {}
+        self.namespace_version_ttl = float(
+            get_nested_config('redis.namespace_version_ttl', 1.0)
+        )
+
+        # L1 invalidation Pub/Sub (started in connect())
+        self.node_id = uuid.uuid4().hex
+        self._l1_pubsub = None
+        self._l1_listener: Optional[asyncio.Task] = None
+        self.l1_pubsub_stats = {"published": 0, "received": 0, "errors": 0}
+
+        # Per-tier accounting: requests answered via the L1 path, and the
+        # Redis reads it issued on L1 misses (used to derive Redis tier stats)
+        self._l1_path_stats = {"hits": 0, "misses": 0}
+        self._l1_load_stats = {"hits": 0, "misses": 0}
+
         if not self.enabled:
             logger.warning("Redis cache is disabled in configuration")
 
@@ -108,6 +162,9 @@ class RedisCacheClient:
             await self.client.ping()
             logger.info(f"Redis cache connected: {self.url}")
 
+            if self.l1 is not None:
+                await self._start_l1_listener()
+
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}")
             self.enabled = False
@@ -115,6 +172,8 @@ class RedisCacheClient:
 
     async def disconnect(self) -> None:
         """Close Redis connection pool."""
+        await self._stop_l1_listener()
+
         if self.client:
             await self.client.aclose()
             logger.info("Redis cache disconnected")
@@ -122,6 +181,14 @@ class RedisCacheClient:
         if self.pool:
             await self.pool.disconnect()
 
+        if self.blocking_client:
+            await self.blocking_client.aclose()
+            self.blocking_client = None
+
+        if self.blocking_pool:
+            await self.blocking_pool.disconnect()
+            self.blocking_pool = None
+
     async def health_check(self) -> bool:
         """
         Check Redis connection health.
@@ -152,6 +219,15 @@ class RedisCacheClient:
         if not self.enabled or not self.client:
             return None
 
+        if self._l1_eligible(key):
+            value = self.l1.get(key)
+            if value is not MISSING:
+                logger.debug(f"Cache HIT (L1): {key}")
+            else:
+                value, _ = await self._flights.do(f"get:{key}", lambda: self._load_into_l1(key))
+            self._count_l1_path(value)
+            return value
+
         try:
             value = await self.client.get(key)
 
@@ -163,10 +239,9 @@ class RedisCacheClient:
             self.stats["hits"] += 1
             logger.debug(f"Cache HIT: {key}")
 
-            # Deserialize JSON
-            return json.loads(value)
+            return self.codec.decode(value)
 
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             logger.error(f"Failed to deserialize cache value for {key}: {e}")
             self.stats["errors"] += 1
             return None
@@ -196,8 +271,8 @@ class RedisCacheClient:
             return False
 
         try:
-            # Serialize to JSON with datetime support
-            serialized = json.dumps(value, ensure_ascii=False, cls=DateTimeEncoder)
+            # Serialize with the configured codec (datetime support included)
+            serialized = self.codec.encode(value)
 
             # Set with optional TTL
             if ttl:
@@ -207,6 +282,9 @@ class RedisCacheClient:
 
             self.stats["sets"] += 1
             logger.debug(f"Cache SET: {key} (TTL: {ttl}s)")
+
+            if self._l1_eligible(key):
+                await self._invalidate_l1(keys=[key])
             return True
 
         except (TypeError, ValueError) as e:
@@ -235,6 +313,9 @@ class RedisCacheClient:
             deleted = await self.client.delete(key)
             self.stats["deletes"] += 1
 
+            if self._l1_eligible(key):
+                await self._invalidate_l1(keys=[key])
+
             if deleted:
                 logger.debug(f"Cache DELETE: {key}")
                 return True
@@ -249,7 +330,8 @@ class RedisCacheClient:
         """
         Delete all keys matching pattern.
 
-        Uses SCAN for safe iteration over large keysets.
+        Uses SCAN for safe iteration over large keysets and UNLINK so
+        values are freed off the Redis main thread (see unlink_pattern).
 
         Args:
             pattern: Key pattern (e.g., "cache:results:*")
@@ -257,26 +339,169 @@ class RedisCacheClient:
         Returns:
             Number of keys deleted
         """
+        report = await self.unlink_pattern(pattern)
+        return report["deleted"]
+
+    async def unlink_pattern(
+        self,
+        pattern: str,
+        batch_size: int = 1000,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        progress_every: int = 10000,
+    ) -> Dict[str, Any]:
+        """
+        Delete all keys matching pattern, reporting progress and throughput.
+
+        Each SCAN page is removed with a single UNLINK, pipelined together
+        with the SCAN for the next page, so a namespace costs one round
+        trip per page instead of one per key.
+
+        Args:
+            pattern: Key pattern (e.g., "cache:results:*")
+            batch_size: SCAN COUNT hint (keys examined per page)
+            progress_callback: Called with the running report every
+                ``progress_every`` deleted keys and once at the end
+            progress_every: Deleted-key interval between progress reports
+
+        Returns:
+            Dict with pattern, deleted, pages, elapsed_ms, keys_per_sec and
+            error (None on success; ``deleted`` counts keys removed before it)
+        """
+        report: Dict[str, Any] = {
+            "pattern": pattern,
+            "deleted": 0,
+            "pages": 0,
+            "elapsed_ms": 0.0,
+            "keys_per_sec": 0.0,
+            "error": None,
+        }
         if not self.enabled or not self.client:
-            return 0
+            return report
 
-        try:
-            deleted_count = 0
+        started = time.perf_counter()
+        next_report = progress_every
 
-            # Use SCAN to iterate safely
-            async for key in self.client.scan_iter(match=pattern, count=100):
-                await self.client.delete(key)
-                deleted_count += 1
+        def update() -> None:
+            elapsed = time.perf_counter() - started
+            report["elapsed_ms"] = round(elapsed * 1000, 1)
+            report["keys_per_sec"] = round(report["deleted"] / elapsed, 1) if elapsed > 0 else 0.0
 
-            self.stats["deletes"] += deleted_count
-            logger.debug(f"Cache DELETE pattern '{pattern}': {deleted_count} keys")
-            return deleted_count
+        try:
+            cursor, keys = await self.client.scan(0, match=pattern, count=batch_size)
+            while True:
+                report["pages"] += 1
+                if keys:
+                    pipe = self.client.pipeline(transaction=False)
+                    pipe.unlink(*keys)
+                    if cursor != 0:
+                        pipe.scan(cursor, match=pattern, count=batch_size)
+                    replies = await pipe.execute()
+                    report["deleted"] += int(replies[0] or 0)
+                    if cursor == 0:
+                        break
+                    cursor, keys = replies[1]
+                else:
+                    if cursor == 0:
+                        break
+                    cursor, keys = await self.client.scan(cursor, match=pattern, count=batch_size)
+
+                if report["deleted"] >= next_report:
+                    next_report = report["deleted"] + progress_every
+                    update()
+                    logger.info(
+                        f"Cache UNLINK pattern '{pattern}': {report['deleted']} keys "
+                        f"({report['keys_per_sec']:.0f} keys/s)"
+                    )
+                    if progress_callback:
+                        progress_callback(dict(report))
 
         except Exception as e:
             logger.error(f"Cache delete pattern error for {pattern}: {e}")
             self.stats["errors"] += 1
+            report["error"] = str(e)
+
+        update()
+        self.stats["deletes"] += report["deleted"]
+        logger.debug(
+            f"Cache DELETE pattern '{pattern}': {report['deleted']} keys in "
+            f"{report['pages']} pages, {report['elapsed_ms']}ms"
+        )
+        if progress_callback:
+            progress_callback(dict(report))
+
+        if self.l1 is not None:
+            await self._invalidate_l1(pattern=pattern)
+        return report
+
+    # ==================== Namespace Versioning ====================
+
+    @staticmethod
+    def _namespace_version_key(namespace: str) -> str:
+        return f"{NAMESPACE_VERSION_PREFIX}{namespace}"
+
+    async def get_namespace_version(self, namespace: str) -> int:
+        """
+        Get the current generation of a key namespace.
+
+        Keys built with this generation (see CacheKeyBuilder.build(version=...))
+        become unreachable when the namespace is bumped. Generations are
+        memoized in-process for ``redis.namespace_version_ttl`` seconds.
+
+        Args:
+            namespace: Key namespace (e.g., "fmp:intraday")
+
+        Returns:
+            Current generation (0 if never bumped or cache unavailable)
+        """
+        if not self.enabled or not self.client:
             return 0
 
+        memo = self._namespace_versions.get(namespace)
+        now = time.monotonic()
+        if memo is not None and memo[1] > now:
+            return memo[0]
+
+        try:
+            raw = await self.client.get(self._namespace_version_key(namespace))
+            version = int(raw) if raw is not None else 0
+        except Exception as e:
+            logger.error(f"Namespace version read error for {namespace}: {e}")
+            self.stats["errors"] += 1
+            return memo[0] if memo is not None else 0
+
+        self._namespace_versions[namespace] = (version, now + self.namespace_version_ttl)
+        return version
+
+    async def bump_namespace_version(self, namespace: str) -> int:
+        """
+        Invalidate a whole namespace in O(1) by advancing its generation.
+
+        Entries of older generations are no longer addressed and expire
+        through their own TTLs; nothing is scanned or deleted.
+
+        Args:
+            namespace: Key namespace (e.g., "fmp:intraday")
+
+        Returns:
+            New generation, or -1 on failure
+        """
+        if not self.enabled or not self.client:
+            return -1
+
+        try:
+            version = int(await self.client.incr(self._namespace_version_key(namespace)))
+        except Exception as e:
+            logger.error(f"Namespace version bump error for {namespace}: {e}")
+            self.stats["errors"] += 1
+            return -1
+
+        self._namespace_versions[namespace] = (version, time.monotonic() + self.namespace_version_ttl)
+        logger.info(f"Cache namespace '{namespace}' advanced to generation {version}")
+
+        if self.l1 is not None:
+            await self._invalidate_l1(pattern=f"{namespace}:*")
+        return version
+
     async def exists(self, key: str) -> bool:
         """
         Check if key exists in cache.
@@ -309,12 +534,35 @@ class RedisCacheClient:
         if not self.enabled or not self.client:
             return -2
 
+        if self._l1_eligible(key):
+            remaining = self.l1.peek_origin_ttl(key)
+            if remaining is not MISSING:
+                return -1 if remaining is None else int(remaining)
+
         try:
             return await self.client.ttl(key)
         except Exception as e:
             logger.error(f"Cache TTL error for {key}: {e}")
             return -2
 
+    def pipeline(self, transaction: bool = True) -> Optional[Any]:
+        """
+        Create a command pipeline for batching operations into one round trip.
+
+        Commands queued on the returned pipeline are sent together when
+        ``await pipe.execute()`` is called. Callers own error handling.
+
+        Args:
+            transaction: Wrap queued commands in MULTI/EXEC when True
+
+        Returns:
+            Redis pipeline, or None if cache is disabled or not connected
+        """
+        if not self.enabled or not self.client:
+            return None
+
+        return self.client.pipeline(transaction=transaction)
+
     # ==================== Stale-While-Revalidate Operations ====================
 
     async def get_with_swr(
@@ -344,6 +592,22 @@ class RedisCacheClient:
         if not self.enabled or not self.client:
             return None, True
 
+        if self._l1_eligible(key):
+            # The L1 entry remembers when its Redis copy expires, so no TTL round trip
+            value, remaining_ttl = self.l1.get_entry(key)
+            if value is MISSING:
+                value, remaining_ttl = await self._flights.do(
+                    f"get:{key}", lambda: self._load_into_l1(key)
+                )
+            self._count_l1_path(value)
+            if value is None:
+                return None, True
+            needs_refresh = (
+                remaining_ttl is not None
+                and remaining_ttl < original_ttl * soft_ttl_ratio
+            )
+            return value, needs_refresh
+
         try:
             # Get value
             value = await self.client.get(key)
@@ -355,10 +619,9 @@ class RedisCacheClient:
 
             self.stats["hits"] += 1
 
-            # Deserialize JSON
             try:
-                deserialized = json.loads(value)
-            except json.JSONDecodeError as e:
+                deserialized = self.codec.decode(value)
+            except ValueError as e:
                 logger.error(f"Failed to deserialize cache value for {key}: {e}")
                 self.stats["errors"] += 1
                 return None, True
@@ -389,6 +652,177 @@ class RedisCacheClient:
             self.stats["errors"] += 1
             return None, True
 
+    # ==================== Batch Operations ====================
+
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Get many values in one round trip.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Values (JSON deserialized) in key order, None where missing
+        """
+        return [value for value, _ in await self._get_many(keys, need_ttl=False)]
+
+    async def mset(
+        self,
+        mapping: Dict[str, Any],
+        ttl: Optional[int] = None,
+    ) -> bool:
+        """
+        Set many values in one round trip.
+
+        Args:
+            mapping: Cache key -> value (will be JSON serialized)
+            ttl: Time-to-live in seconds applied to every key (optional)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.enabled or not self.client:
+            return False
+        if not mapping:
+            return True
+
+        try:
+            # SET per key rather than MSET so each key gets its TTL
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                serialized = self.codec.encode(value)
+                if ttl:
+                    pipe.setex(key, ttl, serialized)
+                else:
+                    pipe.set(key, serialized)
+            await pipe.execute()
+
+            self.stats["sets"] += len(mapping)
+            logger.debug(f"Cache MSET: {len(mapping)} keys (TTL: {ttl}s)")
+
+        except (TypeError, ValueError) as e:
+            logger.error(f"Failed to serialize values for MSET: {e}")
+            self.stats["errors"] += 1
+            return False
+        except Exception as e:
+            logger.error(f"Cache mset error: {e}")
+            self.stats["errors"] += 1
+            return False
+
+        l1_keys = [key for key in mapping if self._l1_eligible(key)]
+        if l1_keys:
+            await self._invalidate_l1(keys=l1_keys)
+        return True
+
+    async def get_many_with_swr(
+        self,
+        keys: List[str],
+        original_ttl: int,
+        soft_ttl_ratio: float = 0.6,
+    ) -> List[Tuple[Optional[Any], bool]]:
+        """
+        Batch form of get_with_swr: values and refresh hints for many keys.
+
+        Values and remaining TTLs are read in a single pipelined round trip
+        (MGET plus PTTL per key) instead of a GET and a TTL call per key.
+
+        Args:
+            keys: Cache keys
+            original_ttl: Original TTL when the keys were set
+            soft_ttl_ratio: Ratio of TTL at which data becomes stale (see get_with_swr)
+
+        Returns:
+            List of (value, needs_refresh) tuples in key order
+        """
+        soft_threshold = original_ttl * soft_ttl_ratio
+        return [
+            (None, True) if value is None
+            else (value, remaining is not None and remaining < soft_threshold)
+            for value, remaining in await self._get_many(keys, need_ttl=True)
+        ]
+
+    async def _get_many(
+        self,
+        keys: List[str],
+        need_ttl: bool,
+    ) -> List[Tuple[Optional[Any], Optional[float]]]:
+        """
+        Resolve keys from L1, then read the rest from Redis in one round trip.
+
+        Returns:
+            List of (value or None, remaining TTL in seconds or None if no expiry)
+        """
+        results: List[Tuple[Optional[Any], Optional[float]]] = [(None, None)] * len(keys)
+        if not keys or not self.enabled or not self.client:
+            return results
+
+        pending: List[int] = []
+        for i, key in enumerate(keys):
+            if self._l1_eligible(key):
+                value, remaining = self.l1.get_entry(key)
+                if value is not MISSING:
+                    self._count_l1_path(value)
+                    results[i] = (value, remaining)
+                    continue
+            pending.append(i)
+
+        if not pending:
+            return results
+
+        pending_keys = [keys[i] for i in pending]
+        # PTTL is also needed to bound how long L1 may keep what we read
+        with_ttl = need_ttl or any(self._l1_eligible(key) for key in pending_keys)
+        epoch = self.l1.epoch if self.l1 is not None else None
+
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.mget(pending_keys)
+            if with_ttl:
+                for key in pending_keys:
+                    pipe.pttl(key)
+            replies = await pipe.execute()
+        except Exception as e:
+            logger.error(f"Cache batch get error for {len(pending_keys)} keys: {e}")
+            self.stats["errors"] += 1
+            return results
+
+        raws = replies[0]
+        pttls = replies[1:] if with_ttl else [None] * len(pending_keys)
+
+        for i, key, raw, pttl in zip(pending, pending_keys, raws, pttls):
+            eligible = self._l1_eligible(key)
+            value = None
+            if raw is not None:
+                try:
+                    value = self.codec.decode(raw)
+                except ValueError as e:
+                    logger.error(f"Failed to deserialize cache value for {key}: {e}")
+                    self.stats["errors"] += 1
+
+            outcome = "hits" if value is not None else "misses"
+            if eligible:
+                self._l1_load_stats[outcome] += 1
+                self._count_l1_path(value)
+            else:
+                self.stats[outcome] += 1
+
+            if value is None:
+                continue
+
+            # PTTL -1: no expiry; -2: expired since MGET (treat as due for refresh)
+            if pttl is None or pttl == -1:
+                remaining = None
+            else:
+                remaining = max(0, pttl) / 1000
+            if eligible and remaining != 0:
+                self.l1.set(key, value, len(raw), origin_ttl=remaining, epoch=epoch)
+            results[i] = (value, remaining)
+
+        logger.debug(
+            f"Cache batch GET: {len(keys)} keys, {len(pending_keys)} from Redis"
+        )
+        return results
+
     # ==================== List Operations ====================
 
     async def list_append(
@@ -504,6 +938,116 @@ class RedisCacheClient:
             self.stats["errors"] += 1
             return 0
 
+    # ==================== Stream Operations ====================
+
+    @staticmethod
+    def _decode_stream_entries(entries: list) -> list:
+        """Decode raw stream entries into (id, fields) tuples of strings."""
+        result = []
+        for entry_id, fields in entries or []:
+            if isinstance(entry_id, bytes):
+                entry_id = entry_id.decode('utf-8')
+            decoded = {}
+            for field, value in fields.items():
+                field_str = field.decode('utf-8') if isinstance(field, bytes) else field
+                value_str = value.decode('utf-8') if isinstance(value, bytes) else value
+                decoded[field_str] = value_str
+            result.append((entry_id, decoded))
+        return result
+
+    def _get_blocking_client(self) -> Optional[redis.Redis]:
+        """
+        Get the client used for blocking reads (XREAD BLOCK).
+
+        Blocking reads hold a connection for the whole block timeout, so they
+        use a separate pool to avoid starving regular cache operations.
+        """
+        if not self.enabled or not self.client:
+            return None
+
+        if self.blocking_client is None:
+            self.blocking_pool = ConnectionPool.from_url(
+                self.url,
+                max_connections=self.blocking_max_connections,
+                decode_responses=False,
+            )
+            self.blocking_client = redis.Redis(connection_pool=self.blocking_pool)
+
+        return self.blocking_client
+
+    async def stream_range(
+        self,
+        key: str,
+        min_id: str = "-",
+        max_id: str = "+",
+        count: Optional[int] = None,
+    ) -> list:
+        """
+        Get entries from a Redis stream by ID range (XRANGE).
+
+        Args:
+            key: Redis stream key
+            min_id: Start ID (inclusive; prefix with "(" for exclusive)
+            max_id: End ID (inclusive)
+            count: Optional max number of entries
+
+        Returns:
+            List of (entry_id, fields) tuples with string values
+        """
+        if not self.enabled or not self.client:
+            return []
+
+        try:
+            entries = await self.client.xrange(key, min=min_id, max=max_id, count=count)
+
+            if not entries:
+                self.stats["misses"] += 1
+                return []
+
+            self.stats["hits"] += 1
+            return self._decode_stream_entries(entries)
+
+        except Exception as e:
+            logger.error(f"Stream range error for {key}: {e}")
+            self.stats["errors"] += 1
+            return []
+
+    async def stream_read(
+        self,
+        key: str,
+        last_id: str = "$",
+        block_ms: Optional[int] = None,
+        count: Optional[int] = None,
+    ) -> list:
+        """
+        Read entries newer than last_id from a Redis stream (XREAD).
+
+        Args:
+            key: Redis stream key
+            last_id: Return entries with ID greater than this ("$" = only new entries)
+            block_ms: Block up to this many milliseconds waiting for entries
+            count: Optional max number of entries
+
+        Returns:
+            List of (entry_id, fields) tuples with string values (empty on timeout)
+        """
+        client = self._get_blocking_client() if block_ms is not None else self.client
+        if not self.enabled or not client:
+            return []
+
+        try:
+            response = await client.xread({key: last_id}, count=count, block=block_ms)
+            if not response:
+                return []
+
+            _, entries = response[0]
+            return self._decode_stream_entries(entries)
+
+        except Exception as e:
+            logger.error(f"Stream read error for {key}: {e}")
+            self.stats["errors"] += 1
+            return []
+
     # ==================== Hash Operations ====================
 
     async def hash_set(
@@ -642,6 +1186,10 @@ class RedisCacheClient:
         try:
             await self.client.flushdb()
             logger.warning("Cache cleared (FLUSHDB)")
+            self._namespace_versions.clear()
+
+            if self.l1 is not None:
+                await self._invalidate_l1(pattern="*")
             return True
         except Exception as e:
             logger.error(f"Cache clear error: {e}")
@@ -651,8 +1199,11 @@ class RedisCacheClient:
         """
         Get cache statistics.
 
+        Top-level counters are per request, whichever tier answered it;
+        ``tiers`` breaks them down per tier.
+
         Returns:
-            Dict with hits, misses, sets, deletes, errors, hit_rate
+            Dict with hits, misses, sets, deletes, errors, hit_rate, tiers
         """
         total_requests = self.stats["hits"] + self.stats["misses"]
         hit_rate = (
@@ -661,11 +1212,34 @@ class RedisCacheClient:
             else 0.0
         )
 
+        # Redis tier: requests that bypass L1, plus reads issued on L1 misses
+        redis_hits = self.stats["hits"] - self._l1_path_stats["hits"] + self._l1_load_stats["hits"]
+        redis_misses = self.stats["misses"] - self._l1_path_stats["misses"] + self._l1_load_stats["misses"]
+        redis_requests = redis_hits + redis_misses
+        redis_tier = {
+            "hits": redis_hits,
+            "misses": redis_misses,
+            "total_requests": redis_requests,
+            "hit_rate": round(redis_hits / redis_requests * 100, 2) if redis_requests else 0.0,
+        }
+        if self.l1 is not None:
+            l1_tier = {
+                "enabled": True,
+                **self.l1.get_stats(),
+                "key_prefixes": list(self.l1_key_prefixes),
+                "pubsub": dict(self.l1_pubsub_stats),
+            }
+        else:
+            l1_tier = {"enabled": False}
+
         return {
             **self.stats,
             "total_requests": total_requests,
             "hit_rate": round(hit_rate, 2),
             "enabled": self.enabled,
+            "tiers": {"l1": l1_tier, "redis": redis_tier},
+            "single_flight": {**self._flights.stats, "in_flight": len(self._flights)},
+            "codec": self.codec.get_stats(),
         }
 
     def reset_stats(self) -> None:
@@ -677,8 +1251,211 @@ class RedisCacheClient:
             "deletes": 0,
             "errors": 0,
         }
+        if self.l1 is not None:
+            self.l1.reset_stats()
+        self.l1_pubsub_stats = {"published": 0, "received": 0, "errors": 0}
+        self._l1_path_stats = {"hits": 0, "misses": 0}
+        self._l1_load_stats = {"hits": 0, "misses": 0}
+        self._flights.stats = {"calls": 0, "coalesced": 0}
+        self.codec.reset_stats()
         logger.info("Cache statistics reset")
 
+    # ==================== L1 Tier and Single-Flight ====================
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+    ) -> Optional[Any]:
+        """
+        Get a value, loading and caching it on a miss.
+
+        Concurrent misses on the same key share a single loader call, so
+        only one caller hits the upstream source. A None result is
+        returned but not cached. Loader exceptions propagate to every
+        waiting caller.
+
+        Args:
+            key: Cache key
+            loader: Zero-argument coroutine function producing the value
+            ttl: Time-to-live in seconds for the loaded value
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+        return await self.coalesced_load(key, loader, ttl=ttl)
+
+    async def coalesced_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+    ) -> Optional[Any]:
+        """
+        Load a value and cache it, sharing one loader call among concurrent callers.
+
+        Use after a cache read has already missed (e.g. ``get_with_swr``).
+
+        Args:
+            key: Cache key
+            loader: Zero-argument coroutine function producing the value
+            ttl: Time-to-live in seconds for the loaded value
+
+        Returns:
+            Loaded value
+        """
+        async def load() -> Any:
+            loaded = await loader()
+            if loaded is not None:
+                await self.set(key, loaded, ttl=ttl)
+            return loaded
+
+        return await self._flights.do(f"load:{key}", load)
+
+    def _l1_eligible(self, key: str) -> bool:
+        """Whether a key is served through the L1 tier."""
+        return self.l1 is not None and key.startswith(self.l1_key_prefixes)
+
+    def _count_l1_path(self, value: Any) -> None:
+        outcome = "hits" if value is not None else "misses"
+        self.stats[outcome] += 1
+        self._l1_path_stats[outcome] += 1
+
+    async def _load_into_l1(self, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        """
+        Read a key and its remaining TTL from Redis in one round trip and populate L1.
+
+        Returns:
+            Tuple of (value or None, remaining TTL in seconds or None if no expiry)
+        """
+        epoch = self.l1.epoch
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.get(key)
+            pipe.pttl(key)
+            raw, pttl = await pipe.execute()
+        except Exception as e:
+            logger.error(f"Cache get error for {key}: {e}")
+            self.stats["errors"] += 1
+            return None, None
+
+        if raw is None:
+            self._l1_load_stats["misses"] += 1
+            logger.debug(f"Cache MISS: {key}")
+            return None, None
+
+        self._l1_load_stats["hits"] += 1
+        logger.debug(f"Cache HIT: {key}")
+
+        try:
+            value = self.codec.decode(raw)
+        except ValueError as e:
+            logger.error(f"Failed to deserialize cache value for {key}: {e}")
+            self.stats["errors"] += 1
+            return None, None
+
+        origin_ttl = pttl / 1000 if pttl is not None and pttl >= 0 else None
+        self.l1.set(key, value, len(raw), origin_ttl=origin_ttl, epoch=epoch)
+        return value, origin_ttl
+
+    async def _invalidate_l1(
+        self,
+        keys: Optional[list] = None,
+        pattern: Optional[str] = None,
+    ) -> None:
+        """Drop keys (or a glob pattern) from L1 here and on every other replica."""
+        if self.l1 is None:
+            return
+
+        for key in keys or ():
+            self.l1.delete(key)
+        if pattern is not None:
+            self.l1.delete_pattern(pattern)
+
+        if not self.client:
+            return
+
+        payload = json.dumps({"node": self.node_id, "keys": keys or [], "pattern": pattern})
+        try:
+            await self.client.publish(L1_INVALIDATION_CHANNEL, payload)
+            self.l1_pubsub_stats["published"] += 1
+        except Exception as e:
+            self.l1_pubsub_stats["errors"] += 1
+            logger.debug(f"L1 invalidation publish failed: {e}")
+
+    async def _start_l1_listener(self) -> None:
+        """Subscribe to L1 invalidations from other replicas."""
+        if self._l1_listener is not None and not self._l1_listener.done():
+            return
+
+        try:
+            self._l1_pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            await self._l1_pubsub.subscribe(L1_INVALIDATION_CHANNEL)
+        except Exception as e:
+            # Without invalidations, replicas could serve stale L1 entries
+            logger.warning(f"L1 invalidation subscribe failed, disabling L1 cache: {e}")
+            self.l1 = None
+            self._l1_pubsub = None
+            return
+
+        self._l1_listener = asyncio.create_task(self._listen_l1_invalidations())
+        logger.info(
+            f"L1 cache enabled for prefixes {list(self.l1_key_prefixes)} "
+            f"(node={self.node_id[:8]})"
+        )
+
+    async def _stop_l1_listener(self) -> None:
+        """Stop the invalidation listener and close its Pub/Sub connection."""
+        if self._l1_listener and not self._l1_listener.done():
+            self._l1_listener.cancel()
+            try:
+                await self._l1_listener
+            except asyncio.CancelledError:
+                pass
+        self._l1_listener = None
+
+        if self._l1_pubsub is not None:
+            try:
+                await self._l1_pubsub.aclose()
+            except Exception as e:
+                logger.debug(f"Error closing L1 Pub/Sub: {e}")
+            self._l1_pubsub = None
+
+    async def _listen_l1_invalidations(self) -> None:
+        """Apply invalidations published by other replicas to the local L1."""
+        while True:
+            try:
+                message = await self._l1_pubsub.get_message(timeout=1.0)
+                if not message or message.get("type") != "message" or self.l1 is None:
+                    continue
+
+                data = message["data"]
+                if isinstance(data, bytes):
+                    data = data.decode("utf-8")
+                payload = json.loads(data)
+                if payload.get("node") == self.node_id:
+                    continue
+
+                self.l1_pubsub_stats["received"] += 1
+                for key in payload.get("keys") or ():
+                    self.l1.delete(key)
+                if payload.get("pattern") is not None:
+                    self.l1.delete_pattern(payload["pattern"])
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                # Invalidations may have been missed; start from an empty L1
+                self.l1_pubsub_stats["errors"] += 1
+                logger.error(f"L1 invalidation listener error: {e}")
+                if self.l1 is not None:
+                    self.l1.clear()
+                await asyncio.sleep(1.0)
+
 
 # Global cache client instance
 _cache_client: Optional[RedisCacheClient] = None
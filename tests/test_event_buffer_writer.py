@@ -0,0 +1,109 @@
+"""Tests for the batched Redis event writer.
+
+Covers stream-mode state across failed flushes using a fake cache client
+whose pipeline records queued commands.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add repo root to path to enable importing src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("redis")
+
+from src.server.services import event_buffer_writer
+from src.server.services.event_buffer_writer import EventBufferWriter
+
+
+class FakePipeline:
+    """Records queued commands; execute() fails while the client says so."""
+
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+        return queue
+
+    async def execute(self):
+        self.client.executed.append(self.commands)
+        if self.client.failures:
+            self.client.failures -= 1
+            raise ConnectionError("connection reset")
+        return [0] * len(self.commands)
+
+
+class FakeCacheClient:
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.executed = []
+        self.stats = {"errors": 0, "sets": 0}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+def sse(event_id):
+    return f'id: {event_id}\nevent: message_chunk\ndata: {{"content": "t{event_id}"}}\n\n'
+
+
+def commands(pipeline_commands, name):
+    return [cmd for cmd in pipeline_commands if cmd[0] == name]
+
+
+@pytest.fixture
+def cache():
+    client = FakeCacheClient(failures=1)
+    with patch.object(event_buffer_writer, "get_cache_client", return_value=client):
+        yield client
+
+
+class TestStreamStateOnFailedFlush:
+    """A failed pipeline must not advance the stream reset flag or entry IDs."""
+
+    @pytest.mark.asyncio
+    async def test_retry_after_failed_first_flush(self, cache):
+        failed = []
+
+        async def on_failure(batch):
+            failed.extend(batch)
+
+        writer = EventBufferWriter(
+            "thread-1", max_size=100, ttl=60, window_ms=0,
+            storage="stream", on_failure=on_failure,
+        )
+
+        await writer.append(sse(1))
+        assert failed == [sse(1)]
+        assert cache.stats["errors"] == 1
+
+        # Retry the same events, as the failure fallback replays them
+        await writer.append(sse(1))
+        await writer.append(sse(2))
+
+        first, retry, second = cache.executed
+        assert len(commands(first, "delete")) == 1
+        assert len(commands(retry, "delete")) == 1
+        assert commands(second, "delete") == []
+        assert [cmd[2]["id"] for cmd in commands(retry, "xadd")] == ["1-0"]
+        assert [cmd[2]["id"] for cmd in commands(second, "xadd")] == ["2-0"]
+
+    @pytest.mark.asyncio
+    async def test_end_marker_retry_after_failed_write(self, cache):
+        writer = EventBufferWriter(
+            "thread-1", max_size=100, ttl=60, window_ms=0, storage="stream",
+        )
+
+        assert await writer.write_end_marker("completed") is False
+        assert await writer.write_end_marker("completed") is True
+
+        first, retry = cache.executed
+        for pipeline_commands in (first, retry):
+            assert len(commands(pipeline_commands, "delete")) == 1
+            assert [cmd[2]["id"] for cmd in commands(pipeline_commands, "xadd")] == ["0-1"]
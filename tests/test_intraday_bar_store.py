@@ -0,0 +1,121 @@
+"""Tests for the day-segmented intraday bar store.
+
+Uses an in-memory fake cache client and a fake FMP fetch whose default
+range (no ``from``) is the last DEFAULT_DAYS trading days ending at ``to``.
+"""
+
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add repo root to path to enable importing src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("redis")
+
+from src.server.services import intraday_bar_store
+from src.server.services.intraday_bar_store import MARKET_TZ, IntradayBarStore
+
+DEFAULT_DAYS = 3
+
+
+class FakeCacheClient:
+    def __init__(self):
+        self.data = {}
+
+    async def get_namespace_version(self, namespace):
+        return 0
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    async def mset(self, mapping, ttl=None):
+        self.data.update(mapping)
+
+
+class FakeFMP:
+    """Intraday chart endpoint: one bar per weekday, newest first."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, symbol, from_date, to_date, interactive):
+        self.calls.append((from_date, to_date))
+        end = date.fromisoformat(to_date) if to_date else datetime.now(MARKET_TZ).date()
+        if from_date:
+            start = date.fromisoformat(from_date)
+            days = intraday_bar_store._weekdays(start, end)
+        else:
+            days = intraday_bar_store._weekdays(end - timedelta(days=14), end)[-DEFAULT_DAYS:]
+        return [{"date": f"{day.isoformat()} 09:30:00", "close": 1.0} for day in reversed(days)]
+
+
+def last_weekday(before: date) -> date:
+    day = before
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return day
+
+
+@pytest.fixture
+def cache():
+    client = FakeCacheClient()
+    with patch.object(intraday_bar_store, "get_cache_client", return_value=client):
+        yield client
+
+
+@pytest.fixture
+def store():
+    return IntradayBarStore(refresh_ttl=60, soft_ttl_ratio=0.5, history_ttl=604800, open_day_ttl=86400)
+
+
+def bar_days(result):
+    return sorted({bar["date"][:10] for bar in result.bars})
+
+
+class TestToOnlyRequests:
+    """Requests with ``to`` but no ``from`` serve FMP's default range ending at ``to``."""
+
+    @pytest.mark.asyncio
+    async def test_past_to_date_is_passed_upstream(self, cache, store):
+        fmp = FakeFMP()
+        to_day = last_weekday(datetime.now(MARKET_TZ).date() - timedelta(days=30))
+
+        results = await store.get_many(["AAPL"], False, "1min", None, to_day.isoformat(), fmp)
+
+        assert fmp.calls == [(None, to_day.isoformat())]
+        days = bar_days(results["AAPL"])
+        assert len(days) == DEFAULT_DAYS
+        assert days[-1] == to_day.isoformat()
+        assert results["AAPL"].error is None
+
+    @pytest.mark.asyncio
+    async def test_past_to_date_after_latest_range_was_cached(self, cache, store):
+        fmp = FakeFMP()
+        to_day = last_weekday(datetime.now(MARKET_TZ).date() - timedelta(days=30))
+
+        await store.get_many(["AAPL"], False, "1min", None, None, fmp)
+        results = await store.get_many(["AAPL"], False, "1min", None, to_day.isoformat(), fmp)
+
+        assert fmp.calls[-1] == (None, to_day.isoformat())
+        days = bar_days(results["AAPL"])
+        assert len(days) == DEFAULT_DAYS
+        assert days[-1] == to_day.isoformat()
+
+    @pytest.mark.asyncio
+    async def test_repeated_to_only_request_is_served_from_cache(self, cache, store):
+        fmp = FakeFMP()
+        to_day = last_weekday(datetime.now(MARKET_TZ).date() - timedelta(days=30))
+
+        first = await store.get_many(["AAPL"], False, "1min", None, to_day.isoformat(), fmp)
+        second = await store.get_many(["AAPL"], False, "1min", None, to_day.isoformat(), fmp)
+
+        assert len(fmp.calls) == 1
+        assert second["AAPL"].cached
+        assert bar_days(second["AAPL"]) == bar_days(first["AAPL"])
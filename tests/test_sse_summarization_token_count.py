@@ -0,0 +1,144 @@
+"""Tests for cached per-message token counting in the summarization middleware.
+
+The tiktoken encoder is replaced with a whitespace tokenizer that records
+which texts it was asked to encode.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add repo root and src to path (the middleware imports both src.* and ptc_agent.*)
+repo_root = Path(__file__).parent.parent
+sys.path.insert(0, str(repo_root))
+sys.path.insert(0, str(repo_root / "src"))
+
+pytest.importorskip("tiktoken")
+pytest.importorskip("langchain")
+pytest.importorskip("langgraph")
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+# Load the app package first, as server.py does (avoids a circular import
+# through src.server.utils.checkpoint_helpers)
+import src.server.app  # noqa: F401
+from ptc_agent.agent.middleware.summarization import sse_summarization
+from ptc_agent.agent.middleware.summarization.sse_summarization import (
+    _MessageTokenCountCache,
+    _message_text,
+    count_tokens_tiktoken,
+)
+
+
+class FakeEncoder:
+    """Whitespace tokenizer recording every text it encodes."""
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, text):
+        self.encoded.append(text)
+        return text.split()
+
+    def encode_batch(self, texts):
+        return [self.encode(text) for text in texts]
+
+
+@pytest.fixture
+def encoder():
+    fake = FakeEncoder()
+    with patch.object(sse_summarization, "_get_tiktoken_encoder", return_value=fake), \
+            patch.object(sse_summarization, "_token_count_cache", _MessageTokenCountCache(maxsize=100)):
+        yield fake
+
+
+def uncached_count(messages):
+    return sum(len(_message_text(msg).split()) + 3 for msg in messages)
+
+
+def history(n):
+    messages = []
+    for i in range(n):
+        cls = HumanMessage if i % 2 == 0 else AIMessage
+        messages.append(cls(content=f"message {i} " + "word " * i, id=f"msg-{i}"))
+    return messages
+
+
+class TestCountTokensTiktoken:
+    """count_tokens_tiktoken with the per-message count cache."""
+
+    def test_unchanged_messages_hit_the_cache(self, encoder):
+        messages = history(4)
+        first = count_tokens_tiktoken(messages)
+        encoder.encoded.clear()
+
+        assert count_tokens_tiktoken(messages) == first
+        assert encoder.encoded == []
+
+    def test_growing_history_encodes_only_new_messages(self, encoder):
+        messages = history(6)
+        count_tokens_tiktoken(messages[:5])
+        encoder.encoded.clear()
+
+        count_tokens_tiktoken(messages)
+        assert encoder.encoded == [_message_text(messages[5])]
+
+    def test_edited_content_with_same_id_is_recounted(self, encoder):
+        original = AIMessage(content="short answer", id="msg-1")
+        edited = AIMessage(content="a much longer revised answer", id="msg-1")
+
+        assert count_tokens_tiktoken([original]) == 2 + 3
+        assert count_tokens_tiktoken([edited]) == 5 + 3
+        assert encoder.encoded == ["short answer", "a much longer revised answer"]
+
+    @pytest.mark.parametrize("n", [3, 20])  # below and above the encode_batch threshold
+    def test_total_matches_uncached_count(self, encoder, n):
+        messages = history(n)
+        expected = uncached_count(messages)
+
+        assert count_tokens_tiktoken(messages) == expected
+        assert count_tokens_tiktoken(messages) == expected
+        assert count_tokens_tiktoken(messages[: n // 2]) == uncached_count(messages[: n // 2])
+
+    def test_dict_messages_are_converted(self, encoder):
+        messages = [{"role": "user", "content": "hello there"}]
+        assert count_tokens_tiktoken(messages) == 2 + 3
+
+
+class TestMessageTokenCountCache:
+    """Bounded LRU behavior of _MessageTokenCountCache."""
+
+    def test_evicts_least_recently_used(self):
+        cache = _MessageTokenCountCache(maxsize=3)
+        cache.put_many([(("a",), 1), (("b",), 2), (("c",), 3)])
+
+        assert cache.get(("a",)) == 1  # "a" becomes most recent
+        cache.put_many([(("d",), 4)])
+
+        assert cache.get(("b",)) is None
+        assert [cache.get((k,)) for k in "acd"] == [1, 3, 4]
+
+    def test_size_stays_bounded(self):
+        cache = _MessageTokenCountCache(maxsize=10)
+        cache.put_many(((i,), i) for i in range(25))
+
+        assert len(cache._counts) == 10
+        assert cache.get((14,)) is None
+        assert cache.get((24,)) == 24
+
+    def test_evicted_messages_are_recounted(self, encoder):
+        sse_summarization._token_count_cache.maxsize = 2
+        messages = history(3)
+        count_tokens_tiktoken(messages)
+        encoder.encoded.clear()
+
+        assert count_tokens_tiktoken(messages) == uncached_count(messages)
+        assert _message_text(messages[0]) in encoder.encoded
+
+    def test_clear(self):
+        cache = _MessageTokenCountCache(maxsize=3)
+        cache.put_many([(("a",), 1)])
+        cache.clear()
+        assert cache.get(("a",)) is None